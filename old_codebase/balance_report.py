@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Balance Report
+Runs the vectorized Monte Carlo balance simulator from a save's current state
+and prints survival, failure, crisis and victory statistics.
+
+Usage:
+    python balance_report.py [context_dir] [civilizations] [turns] [seed]
+
+Needs NumPy (the "balance" extra: poetry install -E balance). The save itself is never modified.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.balance_simulator import BalanceSimulator, format_balance_report
+
+
+def main():
+    context_dir = sys.argv[1] if len(sys.argv) > 1 else 'context'
+    n_civs = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    turns = int(sys.argv[3]) if len(sys.argv) > 3 else 200
+    seed = int(sys.argv[4]) if len(sys.argv) > 4 else None
+
+    # Load through a throwaway copy so the save is left untouched
+    sim = TurnSimulator.from_save(context_dir)
+    balance = BalanceSimulator.from_game_state(sim.game_state, n_civs, seed=seed)
+    sim.close()
+
+    print("\n" + "=" * 72)
+    print(f"BALANCE REPORT  (from turn {sim.game_state.turn_number}, seed {seed})")
+    print("=" * 72)
+    print(format_balance_report(balance.run(turns)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,472 @@
+# engines/balance_simulator.py
+"""
+Balance Simulator Module
+
+Monte Carlo balance simulation over thousands of civilizations at once.
+
+Each civilization is a row in a set of NumPy arrays (population, food, wealth,
+happiness, buildings, infrastructure, leader age...). Every turn applies the same formulas as
+the scalar turn pipeline (resource_engine, leader effectiveness, crisis
+detection, victory/failure checks) to all rows in one vectorized pass, with
+random outcome deltas standing in for the AI's event outcomes.
+
+The result is a BalanceReport: survival curve, failure causes, crisis
+frequencies and time-to-victory distribution, for 10^4-10^5 civilizations in
+seconds. Use it to tune resource_engine tables, crisis thresholds and faction
+multipliers before checking individual games with TurnSimulator.
+
+Simplifications (documented so results are read correctly):
+- Constructed buildings and legacy infrastructure are counts with an average
+  maintenance cost each; new buildings complete immediately when built
+- Bonus engine totals (buildings, characters, traits) become a constant
+  rate plus a per-building rate (the starting buildings' average bonus,
+  after diminishing returns) taken from the starting state
+- Successions happen automatically once the leader is past the succession
+  crisis age, with a random new leader
+
+NumPy is only needed for this module (the "balance" extra: poetry install -E balance).
+
+Usage:
+    sim = BalanceSimulator.from_game_state(game_state, n_civs=20000, seed=1)
+    report = sim.run(200)
+    print(format_balance_report(report))
+"""
+
+import time
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover - optional dependency
+    raise ImportError("The balance simulator needs NumPy (poetry install -E balance)") from e
+
+from engines.resource_engine import (
+    ERA_FOOD_EFFICIENCY, FARMER_PERCENTAGE, ERA_PRODUCTIVITY, TRADER_PERCENTAGE,
+    HAPPINESS_PRODUCTIVITY, REBELLION_PRODUCTIVITY
+)
+from engines.victory_engine import ERA_VICTORY_VALUES
+from engines.crisis_rules import CRISIS_TYPES, CRISIS_PARAMS, CrisisRules
+
+ERAS = ['stone_age', 'bronze_age', 'iron_age', 'classical', 'medieval', 'renaissance', 'industrial', 'modern']
+
+FAILURE_TYPES = ['starvation', 'extinction', 'collapse']
+VICTORY_TYPES = ['cultural', 'technological']
+
+# Scenario parameters: balance knobs and the random outcome model
+DEFAULT_BALANCE_PARAMS = {
+    # Crisis thresholds and cascade chances (crisis_rules.CRISIS_RULES)
+    **CRISIS_PARAMS,
+    # Faction approval effects (faction_manager.get_faction_bonuses)
+    'faction_wealth_multiplier': 1.0,
+    'faction_happiness_modifier': 0,
+    # Consumption (resource_engine)
+    'food_per_person_divisor': 4,
+    'food_scaling_per_infrastructure': 0.005,
+    'maintenance_per_building': 10,
+    'maintenance_per_infrastructure': 10,
+    'maintenance_scaling_per_building': 0.05,
+    'starvation_deaths_per_food': 5,
+    'food_decay_threshold': 500,
+    'food_decay_high': 0.10,
+    'food_decay_low': 0.05,
+    # Per-turn bonus engine rates (constant + per building)
+    'food_bonus': 0, 'food_bonus_per_building': 0,
+    'wealth_bonus': 0, 'wealth_bonus_per_building': 0,
+    'science_bonus': 0, 'science_per_building': 1,
+    'culture_bonus': 0, 'culture_per_building': 1,
+    # Progression costs (tech tree default cost, placeholder civic cost)
+    'tech_cost': 999,
+    'civic_cost': 30,
+    # Random outcome model standing in for AI event outcomes
+    'population_growth_mean': 0.01,
+    'population_growth_sd': 0.03,
+    'food_delta_sd': 20,
+    'wealth_delta_sd': 30,
+    'happiness_delta_sd': 3,
+    'build_probability': 0.1,
+    'building_cost': 100,
+    'successor_age_min': 25,
+    'successor_age_max': 45,
+    'successor_trait_chance': 0.3,
+}
+
+
+def _era_table(table, default):
+    return np.array([table.get(era, default) for era in ERAS], dtype=np.float64)
+
+
+def leader_effectiveness(age, life_expectancy, wise, charismatic, ancient):
+    """Vectorized calculate_leader_effectiveness (without crisis momentum)."""
+    age_percent = (age / life_expectancy) * 100
+    effectiveness = np.select(
+        [age_percent < 30, age_percent < 60, age_percent < 80, age_percent < 90, age_percent < 100],
+        [0.90, 1.10, 1.05, 0.95, 0.80],
+        default=0.70
+    ) * 1.0
+    effectiveness = np.where(wise, effectiveness * 1.05, effectiveness)
+    effectiveness = np.where(charismatic, effectiveness * 1.05, effectiveness)
+    effectiveness = np.where(ancient, effectiveness * 0.9, effectiveness)
+    return np.clip(effectiveness, 0.5, 1.5)
+
+
+def happiness_multiplier(happiness):
+    """Vectorized happiness_productivity_multiplier."""
+    return np.select([happiness >= minimum for minimum, _ in HAPPINESS_PRODUCTIVITY],
+                     [multiplier for _, multiplier in HAPPINESS_PRODUCTIVITY],
+                     default=REBELLION_PRODUCTIVITY)
+
+
+class BalanceSimulator:
+    """
+    Vectorized Monte Carlo simulation of many civilizations.
+
+    Usage:
+        sim = BalanceSimulator(10000, start={'population': 150, 'food': 200, 'wealth': 300})
+        report = sim.run(300)
+    """
+
+    def __init__(self, n_civs, start=None, params=None, seed=None, noise=True):
+        """
+        Args:
+            n_civs: Number of civilizations
+            start: Dict of starting values (population, food, wealth, happiness,
+                buildings, infrastructure, leader_age, life_expectancy, era, wise, charismatic,
+                ancient, values, traditions, discoveries, diplomatic_reputation)
+            params: Overrides for DEFAULT_BALANCE_PARAMS
+            seed: Random seed (runs with the same seed are identical)
+            noise: Apply the random outcome model (False = pure mechanics)
+        """
+        start = start or {}
+        self.n = n_civs
+        self.params = dict(DEFAULT_BALANCE_PARAMS, **(params or {}))
+        self.crisis_rules = CrisisRules(params=self.params)
+        self.rng = np.random.default_rng(seed)
+        self.noise = noise
+
+        def full(key, default, dtype=np.int64):
+            return np.full(n_civs, start.get(key, default), dtype=dtype)
+
+        self.population = full('population', 150)
+        self.food = full('food', 200)
+        self.wealth = full('wealth', 300)
+        self.happiness = full('happiness', 70)
+        self.buildings = full('buildings', 0)
+        self.infrastructure = full('infrastructure', 0)
+        self.leader_age = full('leader_age', 30)
+        self.life_expectancy = full('life_expectancy', 35)
+        self.wise = full('wise', False, bool)
+        self.charismatic = full('charismatic', False, bool)
+        self.ancient = full('ancient', False, bool)
+        self.values = full('values', 3)
+        self.traditions = full('traditions', 0)
+        self.discoveries = full('discoveries', 0)
+        self.diplomatic_reputation = full('diplomatic_reputation', 0)
+        self.science_points = full('science_points', 0)
+        self.culture_points = full('culture_points', 0)
+
+        era_index = ERAS.index(start.get('era', 'stone_age')) if start.get('era', 'stone_age') in ERAS else 0
+        self.era = np.full(n_civs, era_index, dtype=np.int64)
+
+        self.alive = np.ones(n_civs, dtype=bool)
+        self.failure = np.full(n_civs, -1, dtype=np.int64)       # index into FAILURE_TYPES
+        self.failure_turn = np.full(n_civs, -1, dtype=np.int64)
+        self.victory = np.full(n_civs, -1, dtype=np.int64)       # index into VICTORY_TYPES
+        self.victory_turn = np.full(n_civs, -1, dtype=np.int64)
+        self.crisis_counts = np.zeros((len(CRISIS_TYPES), n_civs), dtype=np.int64)
+        self.turn = 0
+
+        self._farmers = _era_table(FARMER_PERCENTAGE, 0.3)
+        self._traders = _era_table(TRADER_PERCENTAGE, 0.2)
+        self._productivity = _era_table(ERA_PRODUCTIVITY, 1)
+        self._food_efficiency = _era_table(ERA_FOOD_EFFICIENCY, 1.0)
+        self._era_victory = np.array([ERA_VICTORY_VALUES[era] for era in ERAS], dtype=np.int64)
+
+    @classmethod
+    def from_game_state(cls, game_state, n_civs, params=None, **kwargs):
+        """
+        Start every civilization from one game's current state.
+
+        Bonus totals of that state are split into constant and per-building
+        rates, so buildings completed during the run add bonuses too; faction
+        effects become constant rates (explicit params still override them).
+        """
+        from engines.bonus_engine import BonusEngine
+        from engines.bonus_definitions import BonusType
+        from engines.bonus_tables import (
+            ROLE_TABLE, BUILDING_TABLE, TECHNOLOGY_TABLE, TRAIT_TABLE, BONUS_TYPE_INDEX, aggregate_totals
+        )
+
+        civ = game_state.civilization
+        leader = civ.get('leader', {})
+        traits = leader.get('traits', [])
+        infrastructure = game_state.technology.get('infrastructure', [])
+        constructed = getattr(game_state, 'buildings', {}).get('constructed_buildings', [])
+        start = {
+            'population': civ.get('population', 0),
+            'food': civ.get('resources', {}).get('food', 0),
+            'wealth': civ.get('resources', {}).get('wealth', 0),
+            'happiness': game_state.population_happiness,
+            'buildings': len(constructed),
+            'infrastructure': len(infrastructure),
+            'leader_age': leader.get('age', 30),
+            'life_expectancy': leader.get('life_expectancy', 60),
+            'era': civ.get('meta', {}).get('era', 'stone_age'),
+            'wise': 'Wise' in traits or 'Scholar' in traits,
+            'charismatic': 'Charismatic' in traits,
+            'ancient': 'Ancient' in traits,
+            'values': len(game_state.culture.get('values', [])),
+            'traditions': len(game_state.culture.get('traditions', [])),
+            'discoveries': len(game_state.technology.get('discoveries', [])),
+            'diplomatic_reputation': civ.get('consequences', {}).get('reputation', {}).get('diplomatic', 0),
+            'science_points': game_state.technology.get('science_points', 0),
+            'culture_points': game_state.culture.get('culture_points', 0),
+        }
+
+        from engines.bonus_definitions import BUILDING_BONUSES
+        building_maintenance = [BUILDING_BONUSES.get(b.get('id'), {}).get('maintenance_cost', 10) for b in constructed]
+        infrastructure_maintenance = [BUILDING_BONUSES.get(name, {}).get('maintenance_cost', 10) for name in infrastructure]
+
+        # Dense source counts over the compiled bonus tables (same sources as BonusEngine)
+        roles = [leader.get('role')] + [c.get('role') for c in getattr(game_state, 'inner_circle_manager', [])]
+        building_ids = [b.get('id') for b in constructed]
+        totals = aggregate_totals(
+            ROLE_TABLE.count_vector(roles),
+            BUILDING_TABLE.count_vector(building_ids + infrastructure),
+            TECHNOLOGY_TABLE.count_vector(game_state.technology.get('discoveries', [])),
+            TRAIT_TABLE.count_vector(traits),
+        )
+        # Average bonus of one constructed building; the constant rate keeps the starting totals exact
+        building_totals = aggregate_totals(building_counts=BUILDING_TABLE.count_vector(building_ids))
+
+        derived = {
+            'maintenance_per_building': (sum(building_maintenance) / len(building_maintenance)
+                                         if building_maintenance else 10),
+            'maintenance_per_infrastructure': (sum(infrastructure_maintenance) / len(infrastructure_maintenance)
+                                               if infrastructure_maintenance else 10),
+        }
+        for constant_key, per_building_key, bonus_type in (
+                ('food_bonus', 'food_bonus_per_building', BonusType.FOOD_PER_TURN),
+                ('wealth_bonus', 'wealth_bonus_per_building', BonusType.WEALTH_PER_TURN),
+                ('science_bonus', 'science_per_building', BonusType.SCIENCE_PER_TURN),
+                ('culture_bonus', 'culture_per_building', BonusType.CULTURE_PER_TURN)):
+            column = BONUS_TYPE_INDEX[bonus_type]
+            per_building = building_totals[column] // len(constructed) if constructed else 0
+            derived[per_building_key] = per_building
+            derived[constant_key] = totals[column] - per_building * len(constructed)
+        if hasattr(game_state, 'faction_manager'):
+            bonus_engine = BonusEngine()
+            faction_bonuses = bonus_engine.get_faction_bonuses(game_state)
+            derived['faction_wealth_multiplier'] = faction_bonuses['wealth_multiplier']
+            derived['faction_happiness_modifier'] = faction_bonuses['happiness_modifier']
+        derived.update(params or {})
+        return cls(n_civs, start=start, params=derived, **kwargs)
+
+    def _apply_outcomes(self, active):
+        """Random event outcome deltas (stand-in for AI outcomes)."""
+        p, rng, n = self.params, self.rng, self.n
+        growth = rng.normal(p['population_growth_mean'], p['population_growth_sd'], n)
+        self.population = np.where(active, np.maximum(0, self.population + np.rint(self.population * growth).astype(np.int64)), self.population)
+        self.food = np.where(active, np.maximum(0, self.food + np.rint(rng.normal(0, p['food_delta_sd'], n)).astype(np.int64)), self.food)
+        self.wealth = np.where(active, np.maximum(0, self.wealth + np.rint(rng.normal(0, p['wealth_delta_sd'], n)).astype(np.int64)), self.wealth)
+        self.happiness = np.where(active, np.clip(self.happiness + np.rint(rng.normal(0, p['happiness_delta_sd'], n)).astype(np.int64), 0, 100), self.happiness)
+
+        builds = active & (rng.random(n) < p['build_probability']) & (self.wealth >= p['building_cost'])
+        self.buildings = self.buildings + builds
+        self.wealth = self.wealth - builds * p['building_cost']
+
+    def _apply_mechanics(self, active):
+        """One vectorized pass of apply_turn_mechanics."""
+        p = self.params
+        pop, era = self.population, self.era
+
+        # Passive generation
+        effectiveness = leader_effectiveness(self.leader_age, self.life_expectancy, self.wise, self.charismatic, self.ancient)
+        effectiveness = effectiveness * happiness_multiplier(self.happiness)
+        farmers = np.floor(pop * self._farmers[era])
+        traders = np.floor(pop * self._traders[era])
+        base_food = np.floor(farmers * self._productivity[era])
+        base_wealth = np.floor(traders * self._productivity[era] / 2)
+        food_gain = np.floor(base_food * effectiveness)
+        wealth_gain = np.floor(np.floor(base_wealth * effectiveness) * p['faction_wealth_multiplier'])
+        food_gain += p['food_bonus'] + p['food_bonus_per_building'] * self.buildings
+        wealth_gain += p['wealth_bonus'] + p['wealth_bonus_per_building'] * self.buildings
+        food = self.food + food_gain.astype(np.int64)
+        wealth = self.wealth + wealth_gain.astype(np.int64)
+
+        # Consumption
+        food_use = np.floor((pop // p['food_per_person_divisor']) * self._food_efficiency[era]
+                            * (1 + self.infrastructure * p['food_scaling_per_infrastructure'])).astype(np.int64)
+        structures = self.buildings + self.infrastructure
+        maintenance = (self.buildings * p['maintenance_per_building']
+                       + self.infrastructure * p['maintenance_per_infrastructure'])
+        wealth_use = np.where(structures == 0, 0,
+                              np.floor(maintenance * (1 + structures * p['maintenance_scaling_per_building']))).astype(np.int64)
+        new_food = food - food_use
+        new_wealth = wealth - wealth_use
+        food = np.maximum(0, new_food)
+        wealth = np.maximum(0, new_wealth)
+
+        starving = new_food < 0
+        pop = np.where(starving, np.maximum(50, pop - np.abs(new_food) * p['starvation_deaths_per_food']), pop)
+        # Bankruptcy decays legacy infrastructure
+        infrastructure = np.where(new_wealth < 0, self.infrastructure - np.minimum(self.infrastructure, 2), self.infrastructure)
+
+        decay_rate = np.where(food > p['food_decay_threshold'], p['food_decay_high'], p['food_decay_low'])
+        food = np.maximum(0, food - np.floor(food * decay_rate).astype(np.int64))
+
+        # Happiness (resource scarcity, then faction approval)
+        food_per_capita = food / np.maximum(pop, 1)
+        impact = np.select([food_per_capita < 0.3, food_per_capita < 0.6, food_per_capita < 1.0], [-20, -10, -5], default=0)
+        impact += np.select([wealth < 50, wealth < 200, wealth < 500], [-15, -8, -3], default=0)
+        impact += np.where((food_per_capita > 5.0) & (wealth > 2000), 5, 0)
+        happiness = np.clip(self.happiness + impact, 0, 100)
+        happiness = np.clip(happiness + p['faction_happiness_modifier'], 0, 100)
+
+        # Aging (leaders past 90% of their life expectancy become Ancient) and progression
+        leader_age = self.leader_age + 1
+        ancient = self.ancient | ((leader_age / self.life_expectancy) * 100 > 90)
+        science = p['science_bonus'] + p['science_per_building'] * self.buildings
+        culture = p['culture_bonus'] + p['culture_per_building'] * self.buildings
+        science_points = self.science_points + np.maximum(0, science)
+        culture_points = self.culture_points + np.maximum(0, culture)
+        discoveries = self.discoveries + (science_points // p['tech_cost'] - self.science_points // p['tech_cost'])
+        traditions = self.traditions + (culture_points // p['civic_cost'] - self.culture_points // p['civic_cost'])
+
+        for name, value in (('population', pop), ('food', food), ('wealth', wealth), ('infrastructure', infrastructure),
+                            ('happiness', happiness), ('leader_age', leader_age), ('ancient', ancient), ('science_points', science_points),
+                            ('culture_points', culture_points), ('discoveries', discoveries), ('traditions', traditions)):
+            setattr(self, name, np.where(active, value, getattr(self, name)))
+
+    def _detect_crises(self, active):
+        """Vectorized detect_crisis (the compiled crisis rules); counts each civilization's crisis for the turn."""
+        crisis = self.crisis_rules.evaluate_batch({
+            'population': self.population, 'food': self.food, 'wealth': self.wealth,
+            'happiness': self.happiness, 'leader_age': self.leader_age,
+            'life_expectancy': self.life_expectancy,
+        }, self.rng)
+
+        crisis = np.where(active, crisis, -1)
+        for index in range(len(CRISIS_TYPES)):
+            self.crisis_counts[index] += crisis == index
+        return crisis
+
+    def _succeed_leaders(self, crisis, active):
+        """Leaders past the succession age are replaced by a random successor."""
+        p, rng, n = self.params, self.rng, self.n
+        replace = active & (crisis == CRISIS_TYPES.index('succession_crisis'))
+        new_age = rng.integers(p['successor_age_min'], p['successor_age_max'] + 1, n)
+        self.leader_age = np.where(replace, new_age, self.leader_age)
+        self.wise = np.where(replace, rng.random(n) < p['successor_trait_chance'], self.wise)
+        self.charismatic = np.where(replace, rng.random(n) < p['successor_trait_chance'], self.charismatic)
+        self.ancient = np.where(replace, False, self.ancient)
+
+    def _check_endings(self, active):
+        """Vectorized check_failure / check_victory; ended civilizations stop."""
+        starvation = (self.population < 100) & (self.food <= 0)
+        extinction = self.population <= 50
+        collapse = (self.wealth <= 0) & (self.infrastructure == 0) & (self.population < 200)
+        failure = np.select([starvation, extinction, collapse], [0, 1, 2], default=-1)
+        failed = active & (failure >= 0)
+        self.failure = np.where(failed, failure, self.failure)
+        self.failure_turn = np.where(failed, self.turn, self.failure_turn)
+
+        cultural = (np.minimum(self.values * 3, 30) + np.minimum(self.traditions * 4, 40)
+                    + np.minimum(self.diplomatic_reputation // 3, 30))
+        technological = (np.minimum(self.discoveries * 2, 40) + np.minimum(self.infrastructure * 3, 30)
+                         + self._era_victory[self.era])
+        victory = np.select([cultural >= 100, technological >= 100], [0, 1], default=-1)
+        won = active & ~failed & (victory >= 0)
+        self.victory = np.where(won, victory, self.victory)
+        self.victory_turn = np.where(won, self.turn, self.victory_turn)
+
+        self.alive &= ~(failed | won)
+
+    def step(self):
+        """Advance every ongoing civilization by one turn."""
+        active = self.alive.copy()
+        self.turn += 1
+        if self.noise:
+            self._apply_outcomes(active)
+        self._apply_mechanics(active)
+        crisis = self._detect_crises(active)
+        self._succeed_leaders(crisis, active)
+        self._check_endings(active)
+
+    def run(self, turns):
+        """
+        Simulate N turns and summarize them.
+
+        Returns:
+            BalanceReport dict (see format_balance_report)
+        """
+        started = time.perf_counter()
+        ongoing = [1.0]
+        surviving = [1.0]
+        for _ in range(turns):
+            self.step()
+            ongoing.append(float(self.alive.mean()))
+            surviving.append(float((self.failure < 0).mean()))
+        return self.report(ongoing, surviving, time.perf_counter() - started)
+
+    def report(self, ongoing, surviving, elapsed):
+        civ_turns = max(1, int(sum(ongoing[:-1]) * self.n))
+        won = self.victory >= 0
+        victory_turns = self.victory_turn[won]
+        failed = self.failure >= 0
+        return {
+            'civilizations': self.n,
+            'turns': self.turn,
+            'seconds': elapsed,
+            'survival_curve': surviving,
+            'ongoing_curve': ongoing,
+            'failures': {name: int((self.failure == i).sum()) for i, name in enumerate(FAILURE_TYPES)},
+            'median_failure_turn': float(np.median(self.failure_turn[failed])) if failed.any() else None,
+            'crisis_frequency': {name: float(self.crisis_counts[i].sum() / civ_turns) for i, name in enumerate(CRISIS_TYPES)},
+            'crisis_reach': {name: float((self.crisis_counts[i] > 0).mean()) for i, name in enumerate(CRISIS_TYPES)},
+            'victories': {name: int((self.victory == i).sum()) for i, name in enumerate(VICTORY_TYPES)},
+            'victory_rate': float(won.mean()),
+            'time_to_victory': {
+                'p10': float(np.percentile(victory_turns, 10)),
+                'p50': float(np.percentile(victory_turns, 50)),
+                'p90': float(np.percentile(victory_turns, 90)),
+            } if won.any() else None,
+            'final_median': {
+                'population': float(np.median(self.population)),
+                'food': float(np.median(self.food)),
+                'wealth': float(np.median(self.wealth)),
+                'happiness': float(np.median(self.happiness)),
+                'buildings': float(np.median(self.buildings)),
+                'infrastructure': float(np.median(self.infrastructure)),
+            },
+        }
+
+
+def format_balance_report(report, curve_points=10):
+    """Render a BalanceReport as text for the console."""
+    lines = [
+        f"{report['civilizations']:,} civilizations x {report['turns']} turns in {report['seconds']:.2f}s",
+        "",
+        "Survival curve (share not failed):",
+    ]
+    curve = report['survival_curve']
+    step = max(1, (len(curve) - 1) // curve_points)
+    for turn in range(0, len(curve), step):
+        lines.append(f"  turn {turn:>5}: {curve[turn] * 100:6.2f}%  {'#' * int(curve[turn] * 40)}")
+
+    lines += ["", "Failures:"]
+    lines += [f"  {name:<12} {count:>8,}" for name, count in report['failures'].items()]
+    if report['median_failure_turn'] is not None:
+        lines.append(f"  median failure turn: {report['median_failure_turn']:.0f}")
+
+    lines += ["", "Crises (per civilization-turn / share of civilizations ever hit):"]
+    for name, frequency in sorted(report['crisis_frequency'].items(), key=lambda item: -item[1]):
+        lines.append(f"  {name:<22} {frequency * 100:6.2f}%  {report['crisis_reach'][name] * 100:6.2f}%")
+
+    lines += ["", f"Victories: {report['victory_rate'] * 100:.2f}% "
+                  + ", ".join(f"{name} {count:,}" for name, count in report['victories'].items())]
+    if report['time_to_victory']:
+        ttv = report['time_to_victory']
+        lines.append(f"  time to victory: p10 {ttv['p10']:.0f}, median {ttv['p50']:.0f}, p90 {ttv['p90']:.0f} turns")
+
+    final = report['final_median']
+    lines += ["", "Final medians: " + ", ".join(f"{key} {value:,.0f}" for key, value in final.items())]
+    return "\n".join(lines)
@@ -145,21 +145,23 @@ class BonusType:
     MILITARY_EFFECTIVENESS_MULTIPLIER = 'military_effectiveness_multiplier'
     RELIGIOUS_INFLUENCE = 'religious_influence'
 
+# Every bonus type the BonusEngine computes
+ALL_BONUS_TYPES = [
+    BonusType.FOOD_PER_TURN,
+    BonusType.WEALTH_PER_TURN,
+    BonusType.SCIENCE_PER_TURN,
+    BonusType.CULTURE_PER_TURN,
+    BonusType.POPULATION_GROWTH,
+    BonusType.HAPPINESS,
+    BonusType.FOOD_MULTIPLIER,
+    BonusType.WEALTH_MULTIPLIER,
+    BonusType.MILITARY_STRENGTH,
+    BonusType.MILITARY_EFFECTIVENESS_MULTIPLIER,
+    BonusType.RELIGIOUS_INFLUENCE
+]
+
 # Helper to validate bonus types
 def is_valid_bonus_type(bonus_type):
     """Check if bonus type is valid."""
-    valid_types = [
-        BonusType.FOOD_PER_TURN,
-        BonusType.WEALTH_PER_TURN,
-        BonusType.SCIENCE_PER_TURN,
-        BonusType.CULTURE_PER_TURN,
-        BonusType.POPULATION_GROWTH,
-        BonusType.HAPPINESS,
-        BonusType.FOOD_MULTIPLIER,
-        BonusType.WEALTH_MULTIPLIER,
-        BonusType.MILITARY_STRENGTH,
-        BonusType.MILITARY_EFFECTIVENESS_MULTIPLIER,
-        BonusType.RELIGIOUS_INFLUENCE
-    ]
-    return bonus_type in valid_types
+    return bonus_type in ALL_BONUS_TYPES
 
@@ -1,16 +1,63 @@
 """
 BonusEngine - Centralized bonus calculation and aggregation.
 Collects bonuses from characters, buildings, technologies, and leader traits.
+
+All bonus types (and the faction approval effects) are computed together into
+a bonus ledger stored on the GameState. The ledger is rebuilt only when its
+inputs change: characters, buildings, infrastructure, discoveries, leader
+traits or faction approvals. Resource, population and happiness changes (and
+the version bumps they cause) keep the ledger. The inputs are compared by
+signature rather than by game_state.version because turn mechanics complete
+buildings and add traits without bumping the version.
 """
 
 from engines.bonus_definitions import (
-    CHARACTER_ROLE_BONUSES,
-    BUILDING_BONUSES,
-    TECHNOLOGY_BONUSES,
-    LEADER_TRAIT_BONUSES,
+    ALL_BONUS_TYPES,
     BonusType,
     is_valid_bonus_type
 )
+from engines.bonus_tables import (
+    ROLE_TABLE,
+    BUILDING_TABLE,
+    TECHNOLOGY_TABLE,
+    TRAIT_TABLE,
+    building_row
+)
+
+# Faction effects when the state has no faction manager
+NEUTRAL_FACTION_BONUSES = {
+    'wealth_multiplier': 1.0,
+    'military_effectiveness': 1.0,
+    'happiness_modifier': 0
+}
+
+
+def bonus_inputs_signature(game_state):
+    """
+    Hashable snapshot of everything bonuses depend on.
+
+    Returns:
+        Tuple of leader role/name/traits, characters, constructed buildings,
+        infrastructure, discoveries and faction approvals
+    """
+    leader = game_state.civilization.get('leader', {}) or {}
+    characters = ()
+    if hasattr(game_state, 'inner_circle_manager'):
+        characters = tuple((c.get('name'), c.get('role')) for c in game_state.inner_circle_manager)
+    constructed = ()
+    if hasattr(game_state, 'buildings'):
+        constructed = tuple((b.get('id'), b.get('name'))
+                            for b in game_state.buildings.get('constructed_buildings', []))
+    factions = ()
+    if hasattr(game_state, 'faction_manager'):
+        factions = tuple((f.get('id', ''), f.get('approval', 60)) for f in game_state.faction_manager)
+    return (
+        leader.get('role'), leader.get('name'), tuple(leader.get('traits', [])),
+        characters, constructed,
+        tuple(game_state.technology.get('infrastructure', [])),
+        tuple(game_state.technology.get('discoveries', [])),
+        factions,
+    )
 
 
 class BonusEngine:
@@ -33,6 +80,9 @@ class BonusEngine:
         """
         Calculate total bonuses for a given type from all sources.
 
+        Served from the state's bonus ledger; the returned dict is shared
+        and must be treated as read-only.
+
         Args:
             game_state: GameState instance
             bonus_type: Bonus type string (use BonusType constants)
@@ -47,63 +97,87 @@ class BonusEngine:
             print(f"Warning: Invalid bonus type '{bonus_type}'")
             return {'total': 0, 'sources': [], 'multipliers': []}
 
-        bonuses = {
-            'total': 0,
-            'sources': [],
-            'multipliers': []
-        }
+        return self.get_ledger(game_state)['bonuses'][bonus_type]
 
-        # Collect bonuses from all sources
-        self._add_character_bonuses(game_state, bonus_type, bonuses)
-        self._add_building_bonuses(game_state, bonus_type, bonuses)
-        self._add_technology_bonuses(game_state, bonus_type, bonuses)
-        self._add_leader_trait_bonuses(game_state, bonus_type, bonuses)
-        self._add_faction_bonuses(game_state, bonus_type, bonuses)
+    def get_faction_bonuses(self, game_state):
+        """
+        Faction approval effects (wealth_multiplier, military_effectiveness,
+        happiness_modifier) from the bonus ledger. Read-only.
+        """
+        return self.get_ledger(game_state)['faction_bonuses']
 
-        # Sum up all bonuses
-        bonuses['total'] = sum(value for _, _, value in bonuses['sources'])
+    def get_ledger(self, game_state):
+        """
+        Get the bonus ledger for a game state, rebuilding it if its inputs changed.
 
-        return bonuses
+        Returns:
+            Dictionary with:
+            - 'signature': Inputs the ledger was built from
+            - 'bonuses': bonus_type -> calculate_bonuses result, for every bonus type
+            - 'faction_bonuses': Faction approval effects
+        """
+        signature = bonus_inputs_signature(game_state)
+        ledger = vars(game_state).get('_bonus_ledger') if hasattr(game_state, '__dict__') else None
+        if ledger is None or ledger['signature'] != signature:
+            ledger = self._build_ledger(game_state, signature)
+            if hasattr(game_state, '__dict__'):
+                game_state._bonus_ledger = ledger
+        return ledger
+
+    def _build_ledger(self, game_state, signature):
+        """
+        Compute every bonus type and the faction effects in one go.
 
-    def _add_character_bonuses(self, game_state, bonus_type, bonuses):
-        """Add bonuses from inner circle characters and the civilization leader."""
+        Sources are gathered once as rows of the compiled bonus tables
+        (engines/bonus_tables.py); each bonus type is then one column read
+        across those rows.
+        """
+        faction_bonuses = dict(NEUTRAL_FACTION_BONUSES)
+        if hasattr(game_state, 'faction_manager'):
+            faction_bonuses = game_state.faction_manager.get_faction_bonuses(game_state)
+
+        sources = []
+        self._add_character_bonuses(game_state, sources)
+        self._add_building_bonuses(game_state, sources)
+        multipliers = self._add_technology_bonuses(game_state, sources)
+        self._add_leader_trait_bonuses(game_state, sources)
+
+        ledger = {'signature': signature, 'bonuses': {}, 'faction_bonuses': faction_bonuses}
+        for column, bonus_type in enumerate(ALL_BONUS_TYPES):
+            bonuses = {
+                'total': 0,
+                'sources': [(source_type, name, row[column]) for source_type, name, row in sources if row[column] > 0],
+                'multipliers': [(source_type, name, row[column]) for source_type, name, row in multipliers if row[column] > 0]
+            }
+            self._add_faction_bonuses(faction_bonuses, bonus_type, bonuses)
+
+            # Sum up all bonuses
+            bonuses['total'] = sum(value for _, _, value in bonuses['sources'])
+            ledger['bonuses'][bonus_type] = bonuses
+
+        return ledger
+
+    def _add_character_bonuses(self, game_state, sources):
+        """Add bonus rows for inner circle characters and the civilization leader."""
         # Check civilization leader first
         leader = game_state.civilization.get('leader', {})
         if leader:
-            leader_role = leader.get('role')
-            if leader_role:
-                role_bonuses = CHARACTER_ROLE_BONUSES.get(leader_role, {})
-                bonus_value = role_bonuses.get(bonus_type, 0)
-
-                if bonus_value > 0:
-                    bonuses['sources'].append((
-                        'leader',
-                        leader.get('name', 'Unknown Leader'),
-                        bonus_value
-                    ))
+            row = ROLE_TABLE.row(leader.get('role'))
+            if row:
+                sources.append(('leader', leader.get('name', 'Unknown Leader'), row))
 
         # Check inner circle characters
         if not hasattr(game_state, 'inner_circle_manager'):
             return
 
         for character in game_state.inner_circle_manager:
-            role = character.get('role')
-            if not role:
-                continue
-
-            role_bonuses = CHARACTER_ROLE_BONUSES.get(role, {})
-            bonus_value = role_bonuses.get(bonus_type, 0)
-
-            if bonus_value > 0:
-                bonuses['sources'].append((
-                    'character',
-                    character.get('name', 'Unknown'),
-                    bonus_value
-                ))
+            row = ROLE_TABLE.row(character.get('role'))
+            if row:
+                sources.append(('character', character.get('name', 'Unknown'), row))
 
-    def _add_building_bonuses(self, game_state, bonus_type, bonuses):
+    def _add_building_bonuses(self, game_state, sources):
         """
-        Add bonuses from constructed buildings with diminishing returns.
+        Add bonus rows for constructed buildings with diminishing returns.
 
         BALANCE CHANGE (2025-01): Duplicate buildings provide reduced bonuses.
         Formula: 1 / (1 + (count - 1) * 0.3)
@@ -113,116 +187,62 @@ class BonusEngine:
         - 5th building: 45% effectiveness
 
         This encourages diversification over spamming one building type.
+        The summed effectiveness per count comes from DIMINISHING_PREFIX.
         """
-        # Count buildings by type
+        # Count buildings by type, remembering the first display name
         building_counts = {}
-        building_base_bonuses = {}
+        building_names = {}
 
         # Phase 4: Use buildings from game state
         if hasattr(game_state, 'buildings'):
-            constructed = game_state.buildings.get('constructed_buildings', [])
-
-            for building in constructed:
+            for building in game_state.buildings.get('constructed_buildings', []):
                 building_id = building.get('id')
-                building_name = building.get('name', building_id)
-
-                # Count this building type
                 building_counts[building_id] = building_counts.get(building_id, 0) + 1
-
-                # Store base bonus for this type
-                if building_id not in building_base_bonuses:
-                    building_bonuses_def = BUILDING_BONUSES.get(building_id, {})
-                    building_base_bonuses[building_id] = {
-                        'bonus': building_bonuses_def.get(bonus_type, 0),
-                        'name': building_name
-                    }
+                building_names.setdefault(building_id, building.get('name', building_id))
 
         # Legacy: Also check infrastructure (backward compatibility)
-        infrastructure = game_state.technology.get('infrastructure', [])
-        for building_name in infrastructure:
+        for building_name in game_state.technology.get('infrastructure', []):
             building_counts[building_name] = building_counts.get(building_name, 0) + 1
+            building_names.setdefault(building_name, building_name)
 
-            if building_name not in building_base_bonuses:
-                building_bonuses_def = BUILDING_BONUSES.get(building_name, {})
-                building_base_bonuses[building_name] = {
-                    'bonus': building_bonuses_def.get(bonus_type, 0),
-                    'name': building_name
-                }
-
-        # Apply diminishing returns and add to bonuses
         for building_id, count in building_counts.items():
-            base_data = building_base_bonuses.get(building_id, {})
-            base_bonus = base_data.get('bonus', 0)
-
-            if base_bonus > 0:
-                # Calculate total bonus with diminishing returns
-                total_bonus = 0
-                for i in range(count):
-                    diminishing_factor = 1.0 / (1 + i * 0.3)
-                    total_bonus += base_bonus * diminishing_factor
-
-                total_bonus = int(total_bonus)
-
-                # Format name to show count
-                display_name = base_data.get('name', building_id)
-                if count > 1:
-                    display_name = f"{display_name} (x{count})"
-
-                bonuses['sources'].append((
-                    'building',
-                    display_name,
-                    total_bonus
-                ))
-
-    def _add_technology_bonuses(self, game_state, bonus_type, bonuses):
-        """Add bonuses from discovered technologies."""
-        discoveries = game_state.technology.get('discoveries', [])
-
-        for tech_name in discoveries:
-            tech_bonuses = TECHNOLOGY_BONUSES.get(tech_name, {})
-            bonus_value = tech_bonuses.get(bonus_type, 0)
+            base_row = BUILDING_TABLE.row(building_id)
+            if not base_row:
+                continue
 
-            if bonus_value > 0:
-                bonuses['sources'].append((
-                    'technology',
-                    tech_name,
-                    bonus_value
-                ))
+            # Format name to show count
+            display_name = building_names[building_id]
+            if count > 1:
+                display_name = f"{display_name} (x{count})"
 
-            # Handle multipliers (e.g., +20% food production)
-            multiplier_key = bonus_type.replace('_per_turn', '_multiplier')
-            multiplier_value = tech_bonuses.get(multiplier_key, 0)
+            sources.append(('building', display_name, building_row(base_row, count)))
 
-            if multiplier_value > 0:
-                bonuses['multipliers'].append((
-                    'technology',
-                    tech_name,
-                    multiplier_value
-                ))
+    def _add_technology_bonuses(self, game_state, sources):
+        """
+        Add bonus rows for discovered technologies.
 
-    def _add_leader_trait_bonuses(self, game_state, bonus_type, bonuses):
-        """Add bonuses from leader traits."""
+        Returns:
+            List of (source_type, name, multiplier_row) for technology multipliers
+            (e.g. +20% food production)
+        """
+        multipliers = []
+        for tech_name in game_state.technology.get('discoveries', []):
+            row = TECHNOLOGY_TABLE.row(tech_name)
+            if row:
+                sources.append(('technology', tech_name, row))
+                multipliers.append(('technology', tech_name, TECHNOLOGY_TABLE.multiplier_row(tech_name)))
+        return multipliers
+
+    def _add_leader_trait_bonuses(self, game_state, sources):
+        """Add bonus rows for leader traits."""
         leader = game_state.civilization.get('leader', {})
-        traits = leader.get('traits', [])
-
-        for trait in traits:
-            trait_bonuses = LEADER_TRAIT_BONUSES.get(trait, {})
-            bonus_value = trait_bonuses.get(bonus_type, 0)
+        for trait in leader.get('traits', []):
+            row = TRAIT_TABLE.row(trait)
+            if row:
+                sources.append(('leader_trait', trait, row))
 
-            if bonus_value > 0:
-                bonuses['sources'].append((
-                    'leader_trait',
-                    trait,
-                    bonus_value
-                ))
-
-    def _add_faction_bonuses(self, game_state, bonus_type, bonuses):
+    def _add_faction_bonuses(self, faction_bonuses, bonus_type, bonuses):
         """Add bonuses/multipliers from faction approval levels."""
-        if not hasattr(game_state, 'faction_manager'):
-            return
-
-        faction_bonuses = game_state.faction_manager.get_faction_bonuses(game_state)
-
         # Check if this is the military effectiveness multiplier
         if bonus_type == BonusType.MILITARY_EFFECTIVENESS_MULTIPLIER:
             multiplier_value = faction_bonuses.get('military_effectiveness', 1.0)
@@ -251,9 +271,10 @@ class BonusEngine:
             BonusType.HAPPINESS
         ]
 
+        ledger = self.get_ledger(game_state)
         active_bonuses = {}
         for bonus_type in all_bonus_types:
-            result = self.calculate_bonuses(game_state, bonus_type)
+            result = ledger['bonuses'][bonus_type]
             if result['total'] > 0 or result['sources']:
                 active_bonuses[bonus_type] = result
 
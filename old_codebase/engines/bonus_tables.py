@@ -0,0 +1,147 @@
+# engines/bonus_tables.py
+"""
+Bonus Tables Module
+
+bonus_definitions.py compiled at import time into dense, integer-indexed
+tables:
+
+- Every bonus type has a column (BONUS_TYPE_INDEX, in ALL_BONUS_TYPES order)
+- Every source (role, building, technology, trait) has a row in its
+  category's BonusTable, holding its value for each column. Only positive
+  values count, as in BonusEngine, so non-positive entries compile to 0.
+- Technologies also have a multiplier row (the '<type>_multiplier' entry for
+  each '<type>_per_turn' column, resolved once here)
+- DIMINISHING_PREFIX[n] is the summed effectiveness of n duplicate buildings,
+  sum(1 / (1 + i * BUILDING_DIMINISHING_RATE) for i < n)
+
+Aggregating bonuses is then a weighted sum of rows: characters and traits
+weighted by their count, buildings by DIMINISHING_PREFIX[count].
+BonusEngine reads the rows source by source to keep its per-source
+breakdown; aggregate_totals() sums dense count vectors (count_vector()) into
+totals only, which BalanceSimulator.from_game_state() uses to derive its
+constant and per-building rates.
+"""
+
+from engines.bonus_definitions import (
+    CHARACTER_ROLE_BONUSES,
+    BUILDING_BONUSES,
+    TECHNOLOGY_BONUSES,
+    LEADER_TRAIT_BONUSES,
+    ALL_BONUS_TYPES
+)
+
+# Effectiveness lost per duplicate building: the i-th copy gives 1 / (1 + i * rate)
+BUILDING_DIMINISHING_RATE = 0.3
+
+# Building counts covered by the precomputed prefix table (larger counts are computed)
+DIMINISHING_PREFIX_SIZE = 64
+
+BONUS_TYPE_INDEX = {bonus_type: i for i, bonus_type in enumerate(ALL_BONUS_TYPES)}
+
+# Multiplier key for each bonus type column (e.g. food_per_turn -> food_multiplier)
+MULTIPLIER_KEYS = [bonus_type.replace('_per_turn', '_multiplier') for bonus_type in ALL_BONUS_TYPES]
+
+
+def _compile_prefix(size):
+    prefix = [0.0]
+    for i in range(size):
+        prefix.append(prefix[-1] + 1.0 / (1 + i * BUILDING_DIMINISHING_RATE))
+    return prefix
+
+
+DIMINISHING_PREFIX = _compile_prefix(DIMINISHING_PREFIX_SIZE)
+
+
+def diminishing_total(count):
+    """Summed effectiveness of `count` copies of one building."""
+    if count < len(DIMINISHING_PREFIX):
+        return DIMINISHING_PREFIX[count]
+    return _compile_prefix(count)[count]
+
+
+class BonusTable:
+    """One source category compiled to rows of per-bonus-type values."""
+
+    def __init__(self, definitions, with_multipliers=False):
+        """
+        Args:
+            definitions: Dict of source name -> {bonus_type: value, ...}
+            with_multipliers: Also compile a multiplier row per source
+        """
+        self.names = list(definitions)
+        self.index = {name: i for i, name in enumerate(self.names)}
+        self.rows = [self._row(definition, ALL_BONUS_TYPES) for definition in definitions.values()]
+        self.multiplier_rows = None
+        if with_multipliers:
+            self.multiplier_rows = [self._row(definition, MULTIPLIER_KEYS) for definition in definitions.values()]
+
+    @staticmethod
+    def _row(definition, keys):
+        row = []
+        for key in keys:
+            value = definition.get(key, 0)
+            row.append(value if isinstance(value, (int, float)) and value > 0 else 0)
+        return row
+
+    def row(self, name):
+        """Values row for a source, or None for sources without bonuses."""
+        i = self.index.get(name)
+        return self.rows[i] if i is not None else None
+
+    def multiplier_row(self, name):
+        """Multiplier row for a source, or None."""
+        i = self.index.get(name)
+        return self.multiplier_rows[i] if i is not None and self.multiplier_rows else None
+
+    def count_vector(self, names):
+        """Dense count vector (one slot per row) for an iterable of source names."""
+        counts = [0] * len(self.names)
+        for name in names:
+            i = self.index.get(name)
+            if i is not None:
+                counts[i] += 1
+        return counts
+
+
+ROLE_TABLE = BonusTable(CHARACTER_ROLE_BONUSES)
+BUILDING_TABLE = BonusTable(BUILDING_BONUSES)
+TECHNOLOGY_TABLE = BonusTable(TECHNOLOGY_BONUSES, with_multipliers=True)
+TRAIT_TABLE = BonusTable(LEADER_TRAIT_BONUSES)
+
+
+def building_row(base_row, count):
+    """Bonus row of `count` copies of one building, after diminishing returns."""
+    factor = diminishing_total(count)
+    return [int(value * factor) if value else 0 for value in base_row]
+
+
+def aggregate_totals(role_counts=(), building_counts=(), tech_counts=(), trait_counts=()):
+    """
+    Total of every bonus type for dense source count vectors.
+
+    Args:
+        role_counts: Characters (leader included) per ROLE_TABLE row
+        building_counts: Buildings per BUILDING_TABLE row
+        tech_counts: Discoveries per TECHNOLOGY_TABLE row
+        trait_counts: Leader traits per TRAIT_TABLE row
+        (omitted categories contribute nothing)
+
+    Returns:
+        List of totals in ALL_BONUS_TYPES order
+    """
+    totals = [0] * len(ALL_BONUS_TYPES)
+    weighted = [
+        (ROLE_TABLE.rows, role_counts),
+        (TECHNOLOGY_TABLE.rows, tech_counts),
+        (TRAIT_TABLE.rows, trait_counts),
+    ]
+    for rows, counts in weighted:
+        for row, count in zip(rows, counts):
+            if count:
+                for t, value in enumerate(row):
+                    totals[t] += value * count
+    for row, count in zip(BUILDING_TABLE.rows, building_counts):
+        if count:
+            for t, value in enumerate(building_row(row, count)):
+                totals[t] += value
+    return totals
@@ -7,6 +7,7 @@ import json
 from json import JSONDecodeError
 from model_config import TEXT_MODEL
 from engines.building_manager import BuildingManager
+from engines.prompt_budget import render_prompt
 
 
 def generate_building_event(game_state):
@@ -49,9 +50,10 @@ def generate_building_event(game_state):
         return fallback_data
 
     # Select 2-3 buildings to offer as choices
-    import random
+    from engines.rng_service import get_rng
+    rng = get_rng(game_state).stream('buildings')
     num_choices = min(3, len(available_buildings))
-    selected_buildings = random.sample(available_buildings, num_choices)
+    selected_buildings = rng.sample(available_buildings, num_choices)
 
     # Build context for AI
     civ_name = game_state.civilization.get('meta', {}).get('name', 'Your civilization')
@@ -94,66 +96,21 @@ def generate_building_event(game_state):
     else:
         pop_context = "a grand city"
 
-    prompt = f"""You are the master storyteller for a civilization simulation game. Generate a building construction event with a clear character voice - the Master Architect or Chief Builder addressing the leader.
-
-**NARRATIVE PURPOSE:** Make infrastructure construction feel meaningful and strategic. This isn't just spending resources - it's shaping the civilization's future. The player should feel the weight of choosing which building to prioritize.
-
-**CHARACTER VOICE:** Embody the voice of the civilization's Master Architect or Chief Builder. They should:
-- Speak with expertise and passion about construction
-- Reference the civilization's specific needs (population growth, defense, culture, etc.)
-- Show urgency or opportunity that makes NOW the right time to build
-
-<CONTEXT>
-Civilization: {civ_name} (Era: {era}, {pop_context})
-Leader: {leader_name}
-Population: {population:,} souls
-Current Wealth: {wealth_context}
-
-Available Buildings for Construction:
-{chr(10).join(building_descriptions)}
-</CONTEXT>
-
-<TASK>
-Create an event where the Master Architect or Chief Builder presents construction proposals to {leader_name}.
-
-**REACTIVITY REQUIREMENTS:**
-1. **Contextualize the opportunity**: Why is construction being discussed NOW?
-   - Is population growing and needs housing/infrastructure?
-   - Is wealth accumulated and burning a hole in the treasury?
-   - Is there a specific need (defense, culture, economy)?
-   - Does the {era} era make certain buildings particularly valuable?
-
-2. **Give the architect personality**: Don't just list options - have them ADVOCATE
-   - "My Lord, I have studied the plans for months..."
-   - "The master masons stand ready, but we must choose wisely..."
-   - "Our {pop_context} has outgrown its current infrastructure..."
-
-3. **Connect buildings to civilization values/needs**:
-   - If a Temple is available: "Our people's faith in [religion] grows stronger - a temple would honor this devotion"
-   - If Military building: "Our defenses must match the ambitions of our enemies"
-   - If Economic building: "Trade routes flourish, but we need the infrastructure to capitalize"
-
-Output ONLY valid JSON:
-{{
-  "title": "A short, evocative title about construction (3-6 words)",
-  "narrative": "2-3 sentences from the Master Architect presenting the opportunity. Address {leader_name} directly. Show expertise and urgency. Reference specific civilization context (population, wealth, era, needs).",
-  "investigation_options": [
-    "Ask the architect about the strategic benefits of [specific building type]",
-    "Inquire which building addresses the most urgent need"
-  ],
-  "decision_options": [
-    "Construct {selected_buildings[0]['name']} (exact building name - show the benefit)",
-    "Construct {selected_buildings[1]['name'] if len(selected_buildings) > 1 else selected_buildings[0]['name']} (exact building name - show the benefit)"
-  ]
-}}
-
-CRITICAL:
-- Decision options MUST include exact building names from the available list
-- Each decision should reference a different building
-- Investigation options should be SPECIFIC (not generic "learn more")
-- The narrative should make the player CARE about which building they choose
-- Reference the civilization's current state: {pop_context}, wealth of {wealth}, {era} era technology
-</TASK>"""
+    # Fill the prompt template within its token budget
+    prompt = render_prompt(
+        'events/building_proposal',
+        trim_order=['building_descriptions'],
+        civ_name=civ_name,
+        era=era,
+        pop_context=pop_context,
+        leader_name=leader_name,
+        population=population,
+        wealth_context=wealth_context,
+        wealth=wealth,
+        building_descriptions="\n".join(building_descriptions),
+        first_building=selected_buildings[0]['name'],
+        second_building=selected_buildings[1]['name'] if len(selected_buildings) > 1 else selected_buildings[0]['name']
+    )
 
     try:
         response = model.generate_content(
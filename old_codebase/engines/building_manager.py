@@ -1,9 +1,15 @@
 """
 BuildingManager - Manages building construction, requirements, and availability.
+
+Building definitions come from the process-wide BuildingRegistry
+(engines/building_registry.py), so creating a manager is cheap.
 """
 
-import json
-import os
+from engines.building_registry import (
+    DEFAULT_BUILDING_TYPES_PATH,
+    get_building_registry,
+    get_building_availability
+)
 
 
 class BuildingManager:
@@ -18,25 +24,10 @@ class BuildingManager:
         manager.process_turn(game_state)
     """
 
-    def __init__(self, building_types_path='data/building_types.json'):
-        """Initialize the building manager and load building definitions."""
-        self.building_types = self._load_building_types(building_types_path)
-
-    def _load_building_types(self, path):
-        """Load building type definitions from JSON file."""
-        if not os.path.exists(path):
-            print(f"Warning: Building types file not found at {path}")
-            return {}
-
-        with open(path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-
-        # Convert list to dict keyed by building id
-        building_dict = {}
-        for building in data.get('buildings', []):
-            building_dict[building['id']] = building
-
-        return building_dict
+    def __init__(self, building_types_path=DEFAULT_BUILDING_TYPES_PATH):
+        """Initialize the building manager with the shared building definitions."""
+        self.registry = get_building_registry(building_types_path)
+        self.building_types = self.registry.building_types
 
     def get_available(self, game_state):
         """
@@ -48,36 +39,9 @@ class BuildingManager:
         Returns:
             List of building definitions that can be constructed
         """
-        available = []
-        current_era = game_state.civilization.get('meta', {}).get('era', 'stone_age')
-        discovered_techs = game_state.civilization.get('discovered_technologies', [])
-        constructed_ids = [b.get('id') for b in game_state.buildings.get('constructed_buildings', [])]
-
-        # Era progression for comparison
-        era_order = ['stone_age', 'bronze_age', 'iron_age', 'classical', 'medieval']
-        current_era_index = era_order.index(current_era) if current_era in era_order else 0
-
-        for building_id, building in self.building_types.items():
-            # Skip if already constructed
-            if building_id in constructed_ids:
-                continue
-
-            # Check era requirement
-            required_era = building.get('requirements', {}).get('era', 'stone_age')
-            required_era_index = era_order.index(required_era) if required_era in era_order else 0
-
-            if current_era_index < required_era_index:
-                continue
-
-            # Check technology requirements
-            required_techs = building.get('requirements', {}).get('technologies', [])
-            if required_techs:
-                if not all(tech in discovered_techs for tech in required_techs):
-                    continue
-
-            available.append(building)
-
-        return available
+        availability = get_building_availability(game_state, self.registry)
+        building_ids = availability.unlocked - availability.constructed_ids
+        return [self.building_types[building_id] for building_id in self.registry.sorted_ids(building_ids)]
 
     def can_construct(self, building_id, game_state):
         """
@@ -95,19 +59,18 @@ class BuildingManager:
         if not building:
             return (False, f"Unknown building: {building_id}")
 
+        availability = get_building_availability(game_state, self.registry)
+
         # Check if already constructed
-        constructed_ids = [b.get('id') for b in game_state.buildings.get('constructed_buildings', [])]
-        if building_id in constructed_ids:
+        if building_id in availability.constructed_ids:
             return (False, f"{building['name']} already constructed")
 
         # Check if already in construction queue
-        in_progress_ids = [b.get('id') for b in game_state.buildings.get('available_buildings', [])]
-        if building_id in in_progress_ids:
+        if building_id in availability.in_progress_ids:
             return (False, f"{building['name']} already under construction")
 
         # Check if available (era/tech requirements)
-        available_buildings = self.get_available(game_state)
-        if building not in available_buildings:
+        if building_id not in availability.unlocked:
             return (False, f"{building['name']} not yet available (check era/technology requirements)")
 
         # Check wealth cost
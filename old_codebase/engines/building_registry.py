@@ -0,0 +1,201 @@
+# engines/building_registry.py
+"""
+Building Registry Module
+
+data/building_types.json is loaded once per process into a BuildingRegistry
+(get_building_registry()), which indexes building definitions by required
+era and by each prerequisite technology.
+
+Each game state gets a BuildingAvailability (get_building_availability()):
+the set of building IDs its era and discovered technologies unlock, plus
+hash sets of constructed and in-progress IDs. Availability is updated
+incrementally: a new era unlocks that era's buildings, a new technology
+re-checks only the buildings that require it. Losing an era or technology
+(rare: loads, timeskips) rebuilds the set.
+"""
+
+import json
+import os
+import threading
+
+DEFAULT_BUILDING_TYPES_PATH = 'data/building_types.json'
+
+# Era progression for building requirements (unknown eras count as the first)
+ERA_ORDER = ['stone_age', 'bronze_age', 'iron_age', 'classical', 'medieval']
+
+
+def era_index(era):
+    """Position of an era in ERA_ORDER (0 for unknown eras)."""
+    return ERA_ORDER.index(era) if era in ERA_ORDER else 0
+
+
+def _list_changed(source, items):
+    """True if items is not the (list, length) a cached set was built from."""
+    source_list, length = source
+    return source_list is not items or length != len(items)
+
+
+class BuildingRegistry:
+    """Building definitions with era and technology indexes."""
+
+    def __init__(self, building_types_path=DEFAULT_BUILDING_TYPES_PATH):
+        """
+        Args:
+            building_types_path: Path to the building types JSON file
+        """
+        self.building_types = self._load_building_types(building_types_path)
+        # Definition order, so availability lists keep the file's order
+        self.order = {building_id: i for i, building_id in enumerate(self.building_types)}
+
+        self.required_era = {}
+        self.required_techs = {}
+        self.by_era = {}
+        self.by_technology = {}
+        for building_id, building in self.building_types.items():
+            requirements = building.get('requirements', {})
+            required_era = era_index(requirements.get('era', 'stone_age'))
+            required_techs = frozenset(requirements.get('technologies', []))
+            self.required_era[building_id] = required_era
+            self.required_techs[building_id] = required_techs
+            self.by_era.setdefault(required_era, []).append(building_id)
+            for tech in required_techs:
+                self.by_technology.setdefault(tech, []).append(building_id)
+
+    def _load_building_types(self, path):
+        """Load building type definitions from JSON file."""
+        if not os.path.exists(path):
+            print(f"Warning: Building types file not found at {path}")
+            return {}
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        # Convert list to dict keyed by building id
+        building_dict = {}
+        for building in data.get('buildings', []):
+            building_dict[building['id']] = building
+
+        return building_dict
+
+    def meets_requirements(self, building_id, current_era_index, techs):
+        """True if a building's era and technology requirements are met."""
+        return (self.required_era[building_id] <= current_era_index
+                and self.required_techs[building_id] <= techs)
+
+    def unlocked(self, current_era_index, techs):
+        """All building IDs unlocked at an era index with a set of technologies."""
+        unlocked = set()
+        for required_era, building_ids in self.by_era.items():
+            if required_era <= current_era_index:
+                unlocked.update(b for b in building_ids if self.required_techs[b] <= techs)
+        return unlocked
+
+    def sorted_ids(self, building_ids):
+        """Building IDs in definition order."""
+        return sorted(building_ids, key=self.order.__getitem__)
+
+
+class BuildingAvailability:
+    """Unlocked, constructed and in-progress building IDs for one game state."""
+
+    def __init__(self, registry):
+        self.registry = registry
+        self.era_index = None
+        self.techs = frozenset()
+        self.unlocked = set()
+        self.constructed_ids = set()
+        self.in_progress_ids = set()
+        # (list, length) the sets were built from; the list itself is held so
+        # a replacement list is never mistaken for it (ids of freed lists are reused)
+        self._constructed_source = (None, 0)
+        self._in_progress_source = (None, 0)
+        self._tech_source = (None, 0)
+        self._lock = threading.RLock()
+
+    def refresh(self, game_state):
+        """
+        Bring the sets up to date with the game state.
+
+        Era and technology changes update the unlocked set incrementally; the
+        constructed/in-progress sets are rebuilt only when their lists change
+        (the lists are append-only, or replaced, in normal play).
+
+        Returns:
+            self
+        """
+        with self._lock:
+            civ = game_state.civilization
+            self._refresh_unlocked(
+                era_index(civ.get('meta', {}).get('era', 'stone_age')),
+                civ.get('discovered_technologies', [])
+            )
+
+            constructed = game_state.buildings.get('constructed_buildings', [])
+            if _list_changed(self._constructed_source, constructed):
+                self.constructed_ids = {b.get('id') for b in constructed}
+                self._constructed_source = (constructed, len(constructed))
+
+            in_progress = game_state.buildings.get('available_buildings', [])
+            if _list_changed(self._in_progress_source, in_progress):
+                self.in_progress_ids = {b.get('id') for b in in_progress}
+                self._in_progress_source = (in_progress, len(in_progress))
+        return self
+
+    def _refresh_unlocked(self, current_era_index, discovered):
+        registry = self.registry
+        if current_era_index == self.era_index and not _list_changed(self._tech_source, discovered):
+            return
+        techs = frozenset(discovered)
+        self._tech_source = (discovered, len(discovered))
+
+        if self.era_index is None or current_era_index < self.era_index or not self.techs <= techs:
+            # First use, or an era/technology was lost: rebuild
+            self.unlocked = registry.unlocked(current_era_index, techs)
+        else:
+            # New eras: their buildings, where technologies allow
+            for required_era in range(self.era_index + 1, current_era_index + 1):
+                self.unlocked.update(b for b in registry.by_era.get(required_era, [])
+                                     if registry.required_techs[b] <= techs)
+            # New technologies: only the buildings that require them
+            for tech in techs - self.techs:
+                self.unlocked.update(b for b in registry.by_technology.get(tech, [])
+                                     if registry.meets_requirements(b, current_era_index, techs))
+        self.era_index = current_era_index
+        self.techs = techs
+
+
+# Global registries, one per building types file
+_building_registries = {}
+_registry_lock = threading.Lock()
+
+
+def get_building_registry(building_types_path=DEFAULT_BUILDING_TYPES_PATH):
+    """Get the process-wide registry for a building types file (loaded on first use)."""
+    key = os.path.abspath(building_types_path)
+    with _registry_lock:
+        registry = _building_registries.get(key)
+        if registry is None:
+            registry = BuildingRegistry(building_types_path)
+            _building_registries[key] = registry
+        return registry
+
+
+def get_building_availability(game_state, registry=None):
+    """
+    Get the up-to-date building availability of a game state.
+
+    The tracker lives on the game state and is recreated if the registry changes.
+
+    Args:
+        game_state: GameState instance
+        registry: BuildingRegistry (default: the global one)
+
+    Returns:
+        BuildingAvailability, refreshed
+    """
+    registry = registry or get_building_registry()
+    availability = vars(game_state).get('_building_availability')
+    if availability is None or availability.registry is not registry:
+        availability = BuildingAvailability(registry)
+        game_state._building_availability = availability
+    return availability.refresh(game_state)
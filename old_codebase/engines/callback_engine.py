@@ -7,7 +7,7 @@ Makes the world feel alive and reactive.
 import google.generativeai as genai
 import json
 from model_config import TEXT_MODEL
-from engines.prompt_loader import load_prompt
+from engines.prompt_budget import render_prompt
 
 def generate_callback_event(game_state, callback_type, callback_data):
     """
@@ -25,16 +25,9 @@ def generate_callback_event(game_state, callback_type, callback_data):
     event_year = callback_data.get('year', current_year - 10)
     years_passed = current_year - event_year
 
-    # Load callback prompt templates (cached after first load)
-    callback_prompts = {
-        'broken_promise': load_prompt('callbacks/broken_promise'),
-        'enemy_revenge': load_prompt('callbacks/enemy_revenge'),
-        'ally_request': load_prompt('callbacks/ally_request'),
-        'debt_collection': load_prompt('callbacks/debt_collection')
-    }
-
-    # Select the appropriate template
-    template = callback_prompts.get(callback_type, callback_prompts['broken_promise'])
+    # Select the appropriate template (templates are cached after first load)
+    callback_types = ['broken_promise', 'enemy_revenge', 'ally_request', 'debt_collection']
+    template_path = f"callbacks/{callback_type if callback_type in callback_types else 'broken_promise'}"
 
     # Build format kwargs based on callback type
     format_kwargs = {
@@ -71,7 +64,13 @@ def generate_callback_event(game_state, callback_type, callback_data):
         format_kwargs['debt_description'] = callback_data.get('description', 'Unknown debt')
         format_kwargs['debt_event'] = callback_data.get('event', 'Unknown event')
 
-    prompt = template.format(**format_kwargs)
+    # Fill the template within its token budget (recorded event text is trimmed first)
+    prompt = render_prompt(
+        template_path,
+        trim_order=['promise_event', 'enemy_event', 'ally_event', 'debt_event',
+                    'promise_text', 'debt_description'],
+        **format_kwargs
+    )
 
     try:
         response = model.generate_content(
@@ -1,7 +1,12 @@
 import json
 import google.generativeai as genai
 from model_config import TEXT_MODEL
-from engines.prompt_loader import load_prompt
+from engines.prompt_budget import render_prompt
+from engines.state_encoding import encode_state, with_state_legend
+from engines.memory_store import recall_memories
+
+# Token budget for recalled memories in a character vignette
+VIGNETTE_MEMORY_TOKENS = 200
 
 def generate_character_vignette(game_state, character_id):
     """
@@ -57,10 +62,16 @@ def generate_character_vignette(game_state, character_id):
         relationship_desc = "deeply trusting"
 
     # Load and format the character vignette prompt
-    character_json = json.dumps(character, indent=2)
+    # Long-term memories most relevant to this meeting replace the raw history
+    recent_titles = " ".join(e.get('title', '') for e in game_state.history_long.get('events', [])[-3:])
+    memories = recall_memories(game_state, character, f"{char_role} {civ_name} {recent_titles}",
+                               VIGNETTE_MEMORY_TOKENS, fallback=5)
+    character_json = encode_state(dict(character, history=memories), list_limits={'history': len(memories)})
     personality_traits = ', '.join(character.get('personality_traits', []))
 
-    prompt = load_prompt('characters/character_vignette').format(
+    prompt = with_state_legend(render_prompt(
+        'characters/character_vignette',
+        trim_order=['character_json'],
         char_name=char_name,
         char_role=char_role,
         civ_name=civ_name,
@@ -68,7 +79,7 @@ def generate_character_vignette(game_state, character_id):
         relationship_desc=relationship_desc,
         character_json=character_json,
         personality_traits=personality_traits
-    )
+    ))
 
     try:
         model = genai.GenerativeModel(TEXT_MODEL)
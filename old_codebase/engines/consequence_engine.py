@@ -309,33 +309,34 @@ def check_for_callback_opportunity(game_state):
     """
     initialize_consequences(game_state)
     conseq = game_state.civilization['consequences']
-    import random
+    from engines.rng_service import get_rng
+    rng = get_rng(game_state).stream('callbacks')
 
     # BALANCE_OVERHAUL: Broken promise callback - dramatically increased
     active_promises = [p for p in conseq['promises'] if not p.get('fulfilled', False)]
     if len(active_promises) >= 2:
         # Old promises (5+ turns) have 70% callback chance
         old_promises = [p for p in active_promises if game_state.turn_number - p.get('turn', 0) >= 5]
-        if old_promises and random.random() < 0.70:  # Increased from 0.30
+        if old_promises and rng.random() < 0.70:  # Increased from 0.30
             return True, 'broken_promise', old_promises[0]
 
     # BALANCE_OVERHAUL: Enemy revenge - increased
     hostile_enemies = [e for e in conseq['enemies'] if e.get('hostility', 0) > 60]
     if hostile_enemies:
-        if random.random() < 0.40:  # Increased from 0.25
+        if rng.random() < 0.40:  # Increased from 0.25
             return True, 'enemy_revenge', hostile_enemies[0]
 
     # BALANCE_OVERHAUL: Ally request - increased
     strong_allies = [a for a in conseq['alliances'] if a.get('strength', 0) > 50]
     if strong_allies:
-        if random.random() < 0.35:  # Increased from 0.20
+        if rng.random() < 0.35:  # Increased from 0.20
             return True, 'ally_request', strong_allies[0]
 
     # BALANCE_OVERHAUL: Debt collection - increased
     unpaid_debts = [d for d in conseq['debts'] if not d.get('repaid', False)]
     if unpaid_debts:
         old_debts = [d for d in unpaid_debts if game_state.turn_number - d.get('turn', 0) >= 3]
-        if old_debts and random.random() < 0.50:  # Increased from 0.30
+        if old_debts and rng.random() < 0.50:  # Increased from 0.30
             return True, 'debt_collection', old_debts[0]
 
     return False, None, None
@@ -2,8 +2,52 @@
 """
 Centralized context management for AI prompts.
 Reduces token usage and provides smart, targeted context for each engine.
+
+Builders that take a GameState are memoized per game_state.version: repeated
+calls within a request, and across requests that don't change the state, are
+served from cache. Returned contexts are shared and must be treated as read-only.
 """
 import json
+import functools
+
+
+def cached_for_version(game_state, key, compute):
+    """
+    Return compute() cached for the current game_state.version.
+
+    The cache lives on the GameState and is dropped as soon as the version
+    changes. Objects without a version (e.g. test doubles) are never cached.
+
+    Args:
+        game_state: GameState (anything with a 'version' attribute)
+        key: Hashable cache key
+        compute: Zero-argument callable producing the value
+
+    Returns:
+        The cached or freshly computed value
+    """
+    version = getattr(game_state, 'version', None)
+    if version is None:
+        return compute()
+
+    cache = getattr(game_state, '_derived_cache', None)
+    if cache is None or cache['version'] != version:
+        cache = {'version': version, 'entries': {}}
+        game_state._derived_cache = cache
+
+    entries = cache['entries']
+    if key not in entries:
+        entries[key] = compute()
+    return entries[key]
+
+
+def memoize_per_version(func):
+    """Decorator: cache func(game_state, *args, **kwargs) per game_state.version."""
+    @functools.wraps(func)
+    def wrapper(game_state, *args, **kwargs):
+        key = (func.__name__,) + args + tuple(sorted(kwargs.items()))
+        return cached_for_version(game_state, key, lambda: func(game_state, *args, **kwargs))
+    return wrapper
 
 def get_recent_history_summary(history_long, num_events=5):
     """
@@ -13,6 +57,38 @@ def get_recent_history_summary(history_long, num_events=5):
     events = history_long.get("events", [])[-num_events:]
     return {"events": events}
 
+@memoize_per_version
+def get_relevant_history(game_state, query, k=None, recent=0):
+    """
+    Returns the events most relevant to a query, plus the last few for continuity.
+
+    Uses the local BM25 index over events, compressed eras and decrees
+    (see history_index), so older but related history reaches the prompt at a
+    fixed cost instead of only the last N events.
+
+    Args:
+        game_state: GameState
+        query: Free text (event title, narrative, player action...)
+        k: Number of relevant entries (default HISTORY_RETRIEVAL_K)
+        recent: Number of most recent events always included
+
+    Returns:
+        {"events": [...]} with relevant entries oldest first, then recent events
+    """
+    from engines.history_index import get_history_index
+    from model_config import HISTORY_RETRIEVAL_K
+
+    index = get_history_index(game_state)
+    events = game_state.history_long.get("events", [])
+    recent_positions = range(max(0, len(events) - recent), len(events))
+
+    relevant = index.search(query, k=k or HISTORY_RETRIEVAL_K,
+                            exclude={f"event:{position}" for position in recent_positions})
+    relevant.sort(key=lambda entry: entry.get('year') if isinstance(entry.get('year'), (int, float)) else 0)
+    latest = [index.get(f"event:{position}") for position in recent_positions]
+    return {"events": relevant + [entry for entry in latest if entry]}
+
+@memoize_per_version
 def get_civilization_snapshot(game_state):
     """Returns core civilization data without redundancies."""
     return {
@@ -22,6 +98,7 @@ def get_civilization_snapshot(game_state):
         "resources": game_state.civilization['resources']
     }
 
+@memoize_per_version
 def get_cultural_context(game_state):
     """Returns streamlined cultural data."""
     return {
@@ -31,6 +108,7 @@ def get_cultural_context(game_state):
         "social_structure": game_state.culture.get('social_structure', 'Unknown')
     }
 
+@memoize_per_version
 def get_religious_context(game_state):
     """Returns streamlined religious data."""
     return {
@@ -41,6 +119,7 @@ def get_religious_context(game_state):
         "influence": game_state.religion.get('influence', 'moderate')
     }
 
+@memoize_per_version
 def get_technology_context(game_state):
     """Returns technology state without redundancy."""
     return {
@@ -53,6 +132,7 @@ def get_world_context(game_state):
     """Returns world/geography context."""
     return game_state.world
 
+@memoize_per_version
 def build_event_context(game_state):
     """
     Builds optimized context for event generation.
@@ -67,6 +147,7 @@ def build_event_context(game_state):
         "recent_history": get_recent_history_summary(game_state.history_long, num_events=6)
     }
 
+@memoize_per_version
 def build_action_context(game_state):
     """
     Builds optimized context for action processing.
@@ -80,19 +161,25 @@ def build_action_context(game_state):
         "world": get_world_context(game_state)
     }
 
+@memoize_per_version
 def build_timeskip_context(game_state):
     """
     Builds context for timeskip (needs more history for 500-year jump).
+    History is the last 6 events plus the 6 entries most relevant to the
+    civilization's values and decrees, so defining moments survive long games.
     """
+    decrees = game_state.civilization.get('permanent_decrees', [])
+    themes = " ".join(game_state.culture.get('values', [])[:5] + [d.get('title', '') for d in decrees])
     return {
         "civilization": get_civilization_snapshot(game_state),
         "culture": get_cultural_context(game_state),
         "religion": get_religious_context(game_state),
         "technology": get_technology_context(game_state),
         "world": get_world_context(game_state),
-        "recent_history": get_recent_history_summary(game_state.history_long, num_events=12)
+        "recent_history": get_relevant_history(game_state, themes, 6, 6)
     }
 
+@memoize_per_version
 def build_image_context(game_state):
     """
     Builds context for image generation.
@@ -138,3 +225,18 @@ def get_recent_event_titles(history_long, num=3):
     """
     events = history_long.get("events", [])[-num:]
     return [event.get("title", "") for event in events]
+
+@memoize_per_version
+def get_player_tendency(game_state, num_events=5):
+    """
+    Returns (primary, secondary) player tendency from recent history.
+    Memoized per state version; see tendency_analyzer.analyze_player_tendency.
+    """
+    from engines.tendency_analyzer import analyze_player_tendency
+    return analyze_player_tendency(game_state.history_long, num_events=num_events)
+
+@memoize_per_version
+def get_leader_tags(game_state):
+    """Returns the current leader's event tags, memoized per state version."""
+    from engines.leader_engine import get_leader_event_tags
+    return get_leader_event_tags(game_state.civilization['leader'])
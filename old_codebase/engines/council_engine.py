@@ -1,7 +1,36 @@
 import json
 import google.generativeai as genai
-from model_config import TEXT_MODEL
-from engines.prompt_loader import load_prompt
+from model_config import TEXT_MODEL, COUNCIL_CONTEXT_TOKENS, ADVISOR_MEMORY_TOKENS
+from engines.prompt_budget import render_prompt
+from engines.token_budget import fit_to_budget, truncate_text
+from engines.state_encoding import encode_state, with_state_legend
+from engines.prompt_session import session_for
+from engines.memory_store import recall_memories
+from engines.history_summary import get_story_so_far
+
+# Role title keywords -> advisor focus (titles vary by era and world)
+ROLE_FOCUS_KEYWORDS = {
+    'military': ['war', 'commander', 'marshal', 'strategos', 'general', 'warlord', 'captain'],
+    'intelligence': ['scout', 'eyes', 'spy', 'whispers', 'secrets', 'intelligence'],
+    'spiritual': ['shaman', 'priest', 'hierophant', 'cleric', 'archbishop', 'oracle', 'elder'],
+    'economic': ['chancellor', 'treasurer', 'steward', 'merchant', 'vizier'],
+    'scholarly': ['scholar', 'sage', 'scribe', 'philosopher'],
+}
+
+# Memories per advisor in the council context when there is no memory store
+COUNCIL_MEMORY_LIMIT = 3
+
+# Recent chronicle entries included in the council context
+COUNCIL_HISTORY_LIMIT = 3
+
+# Council context lists sorted most-important (or most recent) first: encoding elides their tail
+COUNCIL_HEAD_LISTS = ('factions', 'recent_history')
+
+# List limits for the full-state encoding used by the first turn briefing
+FIRST_BRIEFING_LIST_LIMITS = {'events': 5, 'eras': 3, 'history': 3}
+
+# Sent with every council meeting in session mode so meetings do not repeat
+COUNCIL_SESSION_TURN_INPUT = "Generate the NEXT council meeting: a new dilemma, different from earlier meetings in this session."
 
 
 def normalize_options(options, option_type="option"):
@@ -71,12 +100,158 @@ def normalize_options(options, option_type="option"):
     return normalized
 
 
+def advisor_focus(role):
+    """Map an advisor's role title to a focus area ('general' if unknown)."""
+    role_lower = (role or '').lower()
+    for focus, keywords in ROLE_FOCUS_KEYWORDS.items():
+        if any(keyword in role_lower for keyword in keywords):
+            return focus
+    return 'general'
+
+
+def _role_stats(focus, game_state):
+    """Stats an advisor with the given focus would cite in their report."""
+    civ = game_state.civilization
+    resources = civ.get('resources', {})
+    victory = civ.get('victory_progress', {})
+
+    if focus == 'military':
+        known_peoples = game_state.world.get('known_peoples', [])
+        return {
+            'population': civ.get('population', 0),
+            'food': resources.get('food', 0),
+            'military_progress': victory.get('military', 0),
+            'hostile_neighbors': [p.get('name') for p in known_peoples
+                                  if isinstance(p, dict) and p.get('relationship') in ('hostile', 'unfriendly', 'wary')]
+        }
+    if focus == 'intelligence':
+        return {
+            'diplomatic_progress': victory.get('diplomatic', 0),
+            'wealth': resources.get('wealth', 0)
+        }
+    if focus == 'spiritual':
+        return {
+            'religion': game_state.religion.get('name'),
+            'religious_influence': game_state.religion.get('influence'),
+            'happiness': game_state.population_happiness,
+            'spiritual_progress': victory.get('spiritual', 0),
+            'values': game_state.culture.get('values', [])[:3]
+        }
+    if focus == 'economic':
+        return {
+            'wealth': resources.get('wealth', 0),
+            'food': resources.get('food', 0),
+            'population': civ.get('population', 0)
+        }
+    if focus == 'scholarly':
+        return {
+            'tech_tier': game_state.technology.get('current_tier'),
+            'discoveries': len(game_state.technology.get('discoveries', [])),
+            'technological_progress': victory.get('technological', 0)
+        }
+    return {
+        'population': civ.get('population', 0),
+        'happiness': game_state.population_happiness
+    }
+
+
+def build_council_context(game_state, max_tokens=COUNCIL_CONTEXT_TOKENS):
+    """
+    Build the council meeting context from targeted slices of the game state.
+
+    Each advisor gets the stats relevant to their role, their recent memories
+    and the standing of their faction, alongside a short realm summary. The
+    encoded context is trimmed to stay under max_tokens.
+
+    Args:
+        game_state: The current GameState
+        max_tokens: Token ceiling for the encoded context
+
+    Returns:
+        Canonical encoded state string (see state_encoding)
+    """
+    civ = game_state.civilization
+    meta = civ.get('meta', {})
+
+    factions = game_state.faction_manager.get_all() if hasattr(game_state, 'faction_manager') else []
+    factions_by_name = {f.get('name'): f for f in factions}
+    advisors = game_state.inner_circle_manager.get_all() if hasattr(game_state, 'inner_circle_manager') else []
+
+    recent_events = game_state.history_long.get('events', [])[-COUNCIL_HISTORY_LIMIT:]
+    situation = " ".join(f"{e.get('title', '')} {e.get('action', '')}" for e in recent_events)
+
+    advisor_slices = []
+    for advisor in advisors:
+        focus = advisor_focus(advisor.get('role'))
+        faction = factions_by_name.get(advisor.get('faction_link'))
+        advisor_slices.append({
+            'name': advisor.get('name'),
+            'role': advisor.get('role'),
+            'focus': focus,
+            'metrics': advisor.get('metrics', {}),
+            'stats': _role_stats(focus, game_state),
+            'faction': {
+                'name': faction.get('name'),
+                'approval': faction.get('approval'),
+                'status': faction.get('status')
+            } if faction else None,
+            # Most relevant and important memories for this role and the latest events
+            'memories': recall_memories(
+                game_state, advisor, f"{advisor.get('role', '')} {focus} {situation}",
+                ADVISOR_MEMORY_TOKENS, fallback=COUNCIL_MEMORY_LIMIT
+            )
+        })
+
+    known_peoples = game_state.world.get('known_peoples', [])
+
+    sections = {
+        'realm': {
+            'name': meta.get('name'),
+            'year': meta.get('year'),
+            'era': meta.get('era'),
+            'turn': game_state.turn_number,
+            'population': civ.get('population', 0),
+            'happiness': game_state.population_happiness,
+            'resources': civ.get('resources', {}),
+            'active_policy': game_state.active_policy
+        },
+        'advisors': advisor_slices,
+        'factions': [
+            {'name': f.get('name'), 'approval': f.get('approval'), 'support_percentage': f.get('support_percentage')}
+            for f in sorted(factions, key=lambda f: f.get('support_percentage', 0), reverse=True)
+        ],
+        'neighbors': [
+            {'name': p.get('name'), 'relationship': p.get('relationship', 'neutral')}
+            for p in known_peoples if isinstance(p, dict)
+        ],
+        # Most recent first so trimming drops the oldest
+        'recent_history': [
+            {'year': e.get('year'), 'title': e.get('title'), 'summary': truncate_text(e.get('narrative', ''), 60)}
+            for e in reversed(recent_events)
+        ]
+    }
+
+    # Fixed-size rolling summary of the whole chronicle, once one exists
+    story_so_far = get_story_so_far(game_state)
+    if story_so_far:
+        sections['story_so_far'] = story_so_far
+
+    context_json, tokens, _ = fit_to_budget(
+        sections,
+        max_tokens,
+        trim_order=['recent_history', 'neighbors', 'story_so_far', 'factions', 'advisors'],
+        encoder=lambda sections: encode_state(sections, keep_head=COUNCIL_HEAD_LISTS)
+    )
+    print(f"  Council context: ~{tokens} tokens")
+    return context_json
+
+
 def generate_council_meeting(game_state):
     """
     Generates a council meeting event by calling the AI model.
 
     The prompt instructs the AI to:
-    1. Analyze the entire game_state.
+    1. Analyze the council context (realm summary and per-advisor slices).
     2. Generate 2-3 "advisor reports" summarizing key stats.
     3. Synthesize these reports into 2-3 "pressing matters" for the player to address as a new policy.
 
@@ -86,15 +261,14 @@ def generate_council_meeting(game_state):
     Returns:
         dict: The generated council meeting event as a JSON object.
     """
-    game_state_dict = game_state.to_dict()
-    game_state_json = json.dumps(game_state_dict, indent=2)
+    council_context = build_council_context(game_state)
 
     # Parse some key context for narrative enhancement
-    game_dict = game_state.to_dict()
-    pop = game_dict.get('civilization', {}).get('population', 0)
-    food = game_dict.get('civilization', {}).get('resources', {}).get('food', 0)
-    wealth = game_dict.get('civilization', {}).get('resources', {}).get('wealth', 0)
-    leader_name = game_dict.get('civilization', {}).get('leader', {}).get('name', 'Leader')
+    civ = game_state.civilization
+    pop = civ.get('population', 0)
+    food = civ.get('resources', {}).get('food', 0)
+    wealth = civ.get('resources', {}).get('wealth', 0)
+    leader_name = civ.get('leader', {}).get('name', 'Leader')
 
     # Get inner circle advisors for more accurate personas
     advisor_names = []
@@ -120,31 +294,40 @@ def generate_council_meeting(game_state):
         for a in advisor_details
     ]) if advisor_details else "No memories available"
 
-    # Pre-calculate formatted values
-    pop_formatted = f"{pop:,}"
-    food_formatted = f"{food:,}"
-    wealth_formatted = f"{wealth:,}"
     food_per_capita = food / max(pop, 1)
 
-    # Load prompt template and fill in variables
-    prompt_template = load_prompt('council/council_meeting')
-    prompt = prompt_template.format(
+    # Fill this turn's details within their token budget (the template applies number formatting)
+    session = session_for(game_state, 'council')
+    turn_details = render_prompt(
+        'council/council_meeting_turn',
+        trim_order=['advisor_memories', 'advisor_context'],
         leader_name=leader_name,
-        game_state_json=game_state_json,
+        # In session mode the state is sent ahead of the details (full or as a delta)
+        council_context="(see the state given above)" if session is not None else council_context,
         advisor_context=advisor_context,
         advisor_memories=advisor_memories,
-        population=pop_formatted,
-        food=food_formatted,
-        wealth=wealth_formatted,
+        population=pop,
+        food=food,
+        wealth=wealth,
         food_per_capita=food_per_capita
     )
+    # Static instructions; a session sends them once, the details every turn
+    instructions = render_prompt('council/council_meeting')
+    generation_config = {"response_mime_type": "application/json"}
     try:
-        model = genai.GenerativeModel(TEXT_MODEL)
-        response = model.generate_content(
-            prompt,
-            generation_config={"response_mime_type": "application/json"},
-        )
-        council_meeting_data = json.loads(response.text)
+        if session is not None:
+            response_text = session.send(
+                game_state.turn_number, council_context, instructions, 'council_meeting',
+                turn_input=f"{turn_details}\n\n{COUNCIL_SESSION_TURN_INPUT}",
+                generation_config=generation_config
+            )
+        else:
+            model = genai.GenerativeModel(TEXT_MODEL)
+            response_text = model.generate_content(
+                with_state_legend(f"{turn_details}\n\n{instructions}"),
+                generation_config=generation_config,
+            ).text
+        council_meeting_data = json.loads(response_text)
 
         # Normalize options to ensure they're arrays of strings
         council_meeting_data['investigation_options'] = normalize_options(
@@ -179,10 +362,10 @@ def generate_first_turn_briefing(game_state):
     Generates a special one-time "First Council Briefing" event for turn 0.
     Introduces the player to their council and presents the first major choice.
     """
-    game_state_json = json.dumps(game_state.to_dict(), indent=2)
+    game_dict = game_state.to_dict()
+    game_state_json = encode_state(game_dict, list_limits=FIRST_BRIEFING_LIST_LIMITS)
 
     # Extract key context from game state
-    game_dict = json.loads(game_state_json)
     civ_name = game_dict.get('civilization', {}).get('meta', {}).get('name', 'Your Civilization')
     leader_name = game_dict.get('civilization', {}).get('leader', {}).get('name', 'Leader')
     era = game_dict.get('civilization', {}).get('meta', {}).get('era', 'ancient times')
@@ -194,9 +377,10 @@ def generate_first_turn_briefing(game_state):
     wealth_formatted = f"{game_dict.get('civilization', {}).get('resources', {}).get('wealth', 0):,}"
     culture_values_str = ', '.join(culture_values[:3]) if culture_values else 'being forged'
 
-    # Load prompt template and fill in variables
-    prompt_template = load_prompt('council/first_turn_briefing')
-    prompt = prompt_template.format(
+    # Fill the prompt template within its token budget (the full state is trimmed first)
+    prompt = with_state_legend(render_prompt(
+        'council/first_turn_briefing',
+        trim_order=['game_state_json', 'culture_values'],
         leader_name=leader_name,
         civ_name=civ_name,
         era=era,
@@ -205,7 +389,7 @@ def generate_first_turn_briefing(game_state):
         population=population_formatted,
         food=food_formatted,
         wealth=wealth_formatted
-    )
+    ))
     try:
         model = genai.GenerativeModel(TEXT_MODEL)
         response = model.generate_content(
@@ -7,86 +7,38 @@ Triggers special events when civilization is in danger.
 import google.generativeai as genai
 import json
 from model_config import TEXT_MODEL
-from engines.prompt_loader import load_prompt
+from engines.prompt_budget import render_prompt
+from engines.crisis_rules import CRISIS_TYPES
 
 def detect_crisis(game_state):
     """
     Detect if civilization is in a crisis state.
+
+    Evaluates the declarative crisis rules (engines/crisis_rules.py), applies
+    the fired rule's momentum effect and records which rule fired in the
+    crisis telemetry.
+
     Returns crisis type or None.
     """
+    from engines.crisis_rules import base_metrics, get_crisis_rules, get_crisis_telemetry
+    from engines.rng_service import get_rng
+
     # BALANCE_OVERHAUL: Initialize crisis momentum tracking if not present
     if not hasattr(game_state, 'crisis_momentum'):
         game_state.crisis_momentum = 0
     if not hasattr(game_state, 'crisis_recovery_timer'):
         game_state.crisis_recovery_timer = 0
 
-    population = game_state.civilization['population']
-    food = game_state.civilization['resources']['food']
-    wealth = game_state.civilization['resources']['wealth']
+    explanation = get_crisis_rules().evaluate(base_metrics(game_state), get_rng(game_state).stream('crisis'))
+    get_crisis_telemetry().record(explanation, turn=getattr(game_state, 'turn_number', None))
 
-    # Calculate food per capita
-    food_per_capita = food / max(population, 1)
-
-    # BALANCE_OVERHAUL: Tightened crisis thresholds with earlier warnings
-    # Crisis priority (most severe first)
-    crisis_type = None
-
-    if food <= 0 or food_per_capita < 0.5:
-        crisis_type = 'famine'  # Catastrophic - severe malnutrition
-    elif wealth <= 0:
-        crisis_type = 'economic_collapse'
-    elif food_per_capita < 0.8:
-        crisis_type = 'severe_food_shortage'  # Active crisis tier
-    elif food_per_capita < 1.8:
-        crisis_type = 'food_shortage'  # Warning tier (increased from 1.0)
-    elif wealth < 100:
-        crisis_type = 'economic_crisis'
-    elif wealth < 300:
-        crisis_type = 'economic_warning'  # New warning tier
-
-    # Check leader age crisis
-    leader = game_state.civilization.get('leader', {})
-    if leader.get('age', 0) > leader.get('life_expectancy', 60) + 10:
-        crisis_type = 'succession_crisis'
-
-    # If a crisis was detected by thresholds, track momentum and return it
+    crisis_type = explanation['crisis']
     if crisis_type:
-        game_state.crisis_momentum += 1
-        game_state.crisis_recovery_timer = 0
+        if explanation['momentum']:
+            game_state.crisis_momentum += 1
+            game_state.crisis_recovery_timer = 0
         return crisis_type
 
-    # BALANCE_OVERHAUL: CRISIS CASCADING - Multiple crises increase probability of others
-    active_crises = []
-
-    # Detect all active crisis conditions
-    if food_per_capita < 1.8:
-        active_crises.append('food_crisis')
-    if wealth < 300:
-        active_crises.append('economic_crisis')
-    if game_state.population_happiness < 40:
-        active_crises.append('happiness_crisis')
-
-    # Cascade logic: if multiple crises, increase severity
-    if len(active_crises) >= 2:
-        import random
-
-        # Food crisis increases economic crisis chance
-        if 'food_crisis' in active_crises and wealth < 500:
-            if random.random() < 0.40:  # 40% cascade chance
-                return 'economic_crisis'
-
-        # Economic crisis increases food shortage chance
-        if 'economic_crisis' in active_crises and food_per_capita < 2.0:
-            if random.random() < 0.30:  # 30% cascade chance
-                return 'food_shortage'
-
-        # Multiple crises trigger faction betrayal checks
-        if len(active_crises) >= 2:
-            if random.random() < 0.25:  # 25% compound crisis
-                game_state.crisis_momentum += 1
-                game_state.crisis_recovery_timer = 0
-                return 'compound_crisis'  # New crisis type - multi-system failure
-
     # BALANCE_OVERHAUL: No crisis - decrement recovery timer
     if game_state.crisis_recovery_timer < 5:
         game_state.crisis_recovery_timer += 1
@@ -145,25 +97,14 @@ def generate_crisis_event(game_state, crisis_type):
     food_per_capita = food / max(population, 1)
     days_of_food = int(food_per_capita * 30) if food > 0 else 0
 
-    # Load crisis prompt templates (cached after first load)
-    crisis_prompts = {
-        'famine': load_prompt('crises/famine'),
-        'food_shortage': load_prompt('crises/food_shortage'),
-        'severe_food_shortage': load_prompt('crises/severe_food_shortage'),
-        'economic_collapse': load_prompt('crises/economic_collapse'),
-        'economic_crisis': load_prompt('crises/economic_crisis'),
-        'economic_warning': load_prompt('crises/economic_warning'),
-        'succession_crisis': load_prompt('crises/succession_crisis'),
-        'compound_crisis': load_prompt('crises/compound_crisis')
-    }
-
-    # Get the appropriate prompt template
-    prompt_template = crisis_prompts.get(crisis_type, crisis_prompts['famine'])
+    # Crisis prompt template (templates are cached after first load)
+    template_path = f"crises/{crisis_type if crisis_type in CRISIS_TYPES else 'famine'}"
 
-    # Format the prompt with variable substitution
+    # Fill the template within its token budget (only short scalar fields, so nothing to trim)
     # For succession_crisis, we need leader-specific variables
     if crisis_type == 'succession_crisis':
-        prompt = prompt_template.format(
+        prompt = render_prompt(
+            template_path,
             civ_name=civ_name,
             leader_name=leader_name,
             leader_age=game_state.civilization['leader']['age'],
@@ -172,7 +113,8 @@ def generate_crisis_event(game_state, crisis_type):
             era=era
         )
     elif crisis_type == 'compound_crisis':
-        prompt = prompt_template.format(
+        prompt = render_prompt(
+            template_path,
             civ_name=civ_name,
             leader_name=leader_name,
             population=population,
@@ -182,7 +124,8 @@ def generate_crisis_event(game_state, crisis_type):
         )
     elif crisis_type in ['economic_collapse', 'economic_crisis', 'economic_warning']:
         # Economic crises don't need population/food variables
-        prompt = prompt_template.format(
+        prompt = render_prompt(
+            template_path,
             civ_name=civ_name,
             leader_name=leader_name,
             wealth=wealth,
@@ -190,7 +133,8 @@ def generate_crisis_event(game_state, crisis_type):
         )
     else:
         # Food-related crises need all standard variables
-        prompt = prompt_template.format(
+        prompt = render_prompt(
+            template_path,
             civ_name=civ_name,
             leader_name=leader_name,
             population=population,
@@ -235,33 +179,19 @@ def generate_crisis_event(game_state, crisis_type):
 def should_generate_crisis(game_state):
     """
     Determine if next event should be a crisis event.
-    Returns (bool, crisis_type or None)
-    """
-    crisis_type = detect_crisis(game_state)
 
-    if crisis_type:
-        # Crisis events have high priority
-        # Catastrophic crises trigger 100%
-        if crisis_type in ['famine', 'economic_collapse', 'succession_crisis', 'compound_crisis']:
-            return True, crisis_type
-        # Active crisis tier: high trigger rates
-        # Severe food shortage: 90% chance (active suffering)
-        elif crisis_type == 'severe_food_shortage':
-            import random
-            return random.random() < 0.90, crisis_type
-        # Warning tier: increased trigger rates to enforce new balance
-        # Food shortage: 85% chance, Economic crisis: 80% chance
-        elif crisis_type == 'food_shortage':
-            import random
-            return random.random() < 0.85, crisis_type
-        elif crisis_type == 'economic_crisis':
-            import random
-            return random.random() < 0.80, crisis_type
-        # Early warning tier: lower but significant rates
-        # Economic warning: 75% chance (early warning)
-        elif crisis_type == 'economic_warning':
-            import random
-            return random.random() < 0.75, crisis_type
+    Catastrophic crises always trigger; lower tiers trigger with the chances
+    in crisis_rules.CRISIS_TRIGGER_CHANCE.
 
-    return False, None
+    Returns (bool, crisis_type or None)
+    """
+    from engines.crisis_rules import CRISIS_TRIGGER_CHANCE
+    from engines.rng_service import get_rng
 
+    crisis_type = detect_crisis(game_state)
+    chance = CRISIS_TRIGGER_CHANCE.get(crisis_type)
+    if chance is None:
+        return False, None
+    if chance >= 1.0:
+        return True, crisis_type
+    return get_rng(game_state).stream('crisis').random() < chance, crisis_type
@@ -0,0 +1,318 @@
+# engines/crisis_rules.py
+"""
+Crisis Rules Module
+
+Crisis detection as declarative rules compiled into one evaluator.
+
+A rule names the crisis it raises and its conditions over derived metrics
+(food_per_capita, leader_overage, pressures... computed once per
+evaluation). Conditions are (metric, op, threshold) clauses; thresholds and
+chances may name a CRISIS_PARAMS key so balance scenarios can retune them.
+
+Rules run in two stages:
+- threshold: the lowest-priority-number rule whose conditions hold fires
+- cascade: only if no threshold rule fired; each matching rule rolls its
+  chance in order and the first success fires
+
+A rule's 'momentum' says whether firing it advances crisis momentum (and
+resets the recovery timer). The same compiled rules evaluate one game state
+(evaluate(), returning an explanation of the rule that fired) or a batch of
+NumPy arrays (evaluate_batch(), used by the balance simulator). Scalar
+evaluations are recorded in CrisisTelemetry (get_crisis_telemetry()).
+"""
+
+import operator
+import threading
+from collections import deque
+from functools import reduce
+
+# Crisis types, in the index order used by batch evaluation
+CRISIS_TYPES = ['famine', 'economic_collapse', 'severe_food_shortage', 'food_shortage',
+                'economic_crisis', 'economic_warning', 'succession_crisis', 'compound_crisis']
+
+# Tunable thresholds and chances referenced by name from the rules
+CRISIS_PARAMS = {
+    'famine_food_per_capita': 0.5,
+    'severe_shortage_food_per_capita': 0.8,
+    'shortage_food_per_capita': 1.8,
+    'economic_crisis_wealth': 100,
+    'economic_warning_wealth': 300,
+    'succession_age_margin': 10,
+    'unrest_happiness': 40,
+    'cascade_economic_wealth': 500,
+    'cascade_food_food_per_capita': 2.0,
+    'cascade_economic_chance': 0.40,
+    'cascade_food_chance': 0.30,
+    'compound_crisis_chance': 0.25,
+}
+
+# Chance that a detected crisis becomes a crisis event (crisis_engine.should_generate_crisis)
+CRISIS_TRIGGER_CHANCE = {
+    'famine': 1.0,
+    'economic_collapse': 1.0,
+    'succession_crisis': 1.0,
+    'compound_crisis': 1.0,
+    'severe_food_shortage': 0.90,
+    'food_shortage': 0.85,
+    'economic_crisis': 0.80,
+    'economic_warning': 0.75,
+}
+
+# 'all' clauses must all hold; if 'any' is given, at least one of its clauses must too
+CRISIS_RULES = [
+    # Overrides every other threshold crisis
+    {'name': 'succession', 'crisis': 'succession_crisis', 'stage': 'threshold', 'priority': 0,
+     'all': [('leader_overage', '>', 'succession_age_margin')], 'momentum': True},
+    {'name': 'famine', 'crisis': 'famine', 'stage': 'threshold', 'priority': 1,
+     'any': [('food', '<=', 0), ('food_per_capita', '<', 'famine_food_per_capita')], 'momentum': True},
+    {'name': 'economic_collapse', 'crisis': 'economic_collapse', 'stage': 'threshold', 'priority': 2,
+     'all': [('wealth', '<=', 0)], 'momentum': True},
+    {'name': 'severe_food_shortage', 'crisis': 'severe_food_shortage', 'stage': 'threshold', 'priority': 3,
+     'all': [('food_per_capita', '<', 'severe_shortage_food_per_capita')], 'momentum': True},
+    {'name': 'food_shortage', 'crisis': 'food_shortage', 'stage': 'threshold', 'priority': 4,
+     'all': [('food_per_capita', '<', 'shortage_food_per_capita')], 'momentum': True},
+    {'name': 'economic_crisis', 'crisis': 'economic_crisis', 'stage': 'threshold', 'priority': 5,
+     'all': [('wealth', '<', 'economic_crisis_wealth')], 'momentum': True},
+    {'name': 'economic_warning', 'crisis': 'economic_warning', 'stage': 'threshold', 'priority': 6,
+     'all': [('wealth', '<', 'economic_warning_wealth')], 'momentum': True},
+    # Cascades: two or more pressures (food, economy, unrest) make further crises likely
+    {'name': 'cascade_economic', 'crisis': 'economic_crisis', 'stage': 'cascade',
+     'all': [('pressures', '>=', 2), ('food_pressure', '==', 1), ('wealth', '<', 'cascade_economic_wealth')],
+     'chance': 'cascade_economic_chance', 'momentum': False},
+    {'name': 'cascade_food', 'crisis': 'food_shortage', 'stage': 'cascade',
+     'all': [('pressures', '>=', 2), ('economic_pressure', '==', 1),
+             ('food_per_capita', '<', 'cascade_food_food_per_capita')],
+     'chance': 'cascade_food_chance', 'momentum': False},
+    {'name': 'compound', 'crisis': 'compound_crisis', 'stage': 'cascade',
+     'all': [('pressures', '>=', 2)], 'chance': 'compound_crisis_chance', 'momentum': True},
+]
+
+_OPERATORS = {'<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge, '==': operator.eq}
+
+
+def base_metrics(game_state):
+    """The raw values crisis rules are derived from, read from a game state."""
+    civ = game_state.civilization
+    leader = civ.get('leader', {})
+    return {
+        'population': civ['population'],
+        'food': civ['resources']['food'],
+        'wealth': civ['resources']['wealth'],
+        'happiness': game_state.population_happiness,
+        'leader_age': leader.get('age', 0),
+        'life_expectancy': leader.get('life_expectancy', 60),
+    }
+
+
+def _compile_clause(clause, params):
+    """(metric, op, threshold) -> (metric, description, predicate)"""
+    metric, op, threshold = clause
+    if op not in _OPERATORS:
+        raise ValueError(f"Unknown operator {op!r} in crisis rule clause {clause}")
+    value = params[threshold] if isinstance(threshold, str) else threshold
+    compare = _OPERATORS[op]
+    return metric, f"{metric} {op} {value}", lambda metrics: compare(metrics[metric], value)
+
+
+class CompiledRule:
+    """One crisis rule with its clauses bound to parameter values."""
+
+    def __init__(self, rule, params):
+        self.name = rule['name']
+        self.crisis = rule['crisis']
+        self.crisis_index = CRISIS_TYPES.index(rule['crisis'])
+        self.stage = rule['stage']
+        self.priority = rule.get('priority', 0)
+        self.momentum = rule.get('momentum', False)
+        chance = rule.get('chance')
+        self.chance = params[chance] if isinstance(chance, str) else chance
+        self.all_clauses = [_compile_clause(c, params) for c in rule.get('all', [])]
+        self.any_clauses = [_compile_clause(c, params) for c in rule.get('any', [])]
+
+    def matches(self, metrics):
+        """
+        Evaluate the conditions; works on scalars and on NumPy arrays alike.
+
+        Returns:
+            bool, or a boolean array
+        """
+        result = reduce(operator.and_, (predicate(metrics) for _, _, predicate in self.all_clauses), True)
+        if self.any_clauses:
+            result = result & reduce(operator.or_, (predicate(metrics) for _, _, predicate in self.any_clauses))
+        return result
+
+    def matched_clauses(self, metrics):
+        """Descriptions of the clauses that hold for scalar metrics."""
+        return [description for _, description, predicate in self.all_clauses + self.any_clauses
+                if predicate(metrics)]
+
+
+class CrisisRules:
+    """CRISIS_RULES compiled against a set of parameters."""
+
+    def __init__(self, rules=None, params=None):
+        """
+        Args:
+            rules: Rule definitions (default: CRISIS_RULES)
+            params: Overrides for CRISIS_PARAMS (extra keys are ignored)
+
+        Raises:
+            ValueError: A rule has an unknown stage, crisis type or operator
+        """
+        self.params = dict(CRISIS_PARAMS, **(params or {}))
+        compiled = []
+        for rule in (rules if rules is not None else CRISIS_RULES):
+            if rule.get('stage') not in ('threshold', 'cascade'):
+                raise ValueError(f"Crisis rule {rule.get('name')} has unknown stage {rule.get('stage')!r}")
+            if rule.get('crisis') not in CRISIS_TYPES:
+                raise ValueError(f"Crisis rule {rule.get('name')} raises unknown crisis {rule.get('crisis')!r}")
+            compiled.append(CompiledRule(rule, self.params))
+        # Stable sort: equal priorities keep definition order
+        self.threshold_rules = sorted((r for r in compiled if r.stage == 'threshold'), key=lambda r: r.priority)
+        self.cascade_rules = [r for r in compiled if r.stage == 'cascade']
+
+    def derive(self, base, maximum=max):
+        """
+        Add derived metrics to the base metrics.
+
+        Args:
+            base: Dict from base_metrics() (scalars) or of equally sized arrays
+            maximum: Elementwise max (max for scalars, np.maximum for arrays)
+
+        Returns:
+            New dict with food_per_capita, leader_overage and the pressure flags
+        """
+        p = self.params
+        metrics = dict(base)
+        metrics['food_per_capita'] = base['food'] / maximum(base['population'], 1)
+        metrics['leader_overage'] = base['leader_age'] - base['life_expectancy']
+        metrics['food_pressure'] = 1 * (metrics['food_per_capita'] < p['shortage_food_per_capita'])
+        metrics['economic_pressure'] = 1 * (base['wealth'] < p['economic_warning_wealth'])
+        metrics['unrest_pressure'] = 1 * (base['happiness'] < p['unrest_happiness'])
+        metrics['pressures'] = metrics['food_pressure'] + metrics['economic_pressure'] + metrics['unrest_pressure']
+        return metrics
+
+    def evaluate(self, base, rng):
+        """
+        Evaluate one game's metrics.
+
+        Cascade chances are rolled (rng.random()) only for cascade rules whose
+        conditions hold, in rule order.
+
+        Args:
+            base: Dict from base_metrics()
+            rng: random.Random-like stream for cascade rolls
+
+        Returns:
+            Explanation dict: crisis (or None), rule, stage, momentum,
+            matched clauses, cascade rolls, metrics
+        """
+        metrics = self.derive(base)
+        explanation = {'crisis': None, 'rule': None, 'stage': None, 'momentum': False,
+                       'matched': [], 'rolls': [], 'metrics': metrics}
+
+        fired = next((rule for rule in self.threshold_rules if rule.matches(metrics)), None)
+        if fired is None:
+            for rule in self.cascade_rules:
+                if not rule.matches(metrics):
+                    continue
+                roll = rng.random()
+                explanation['rolls'].append({'rule': rule.name, 'roll': roll, 'chance': rule.chance})
+                if roll < rule.chance:
+                    fired = rule
+                    break
+
+        if fired is not None:
+            explanation.update(crisis=fired.crisis, rule=fired.name, stage=fired.stage,
+                               momentum=fired.momentum, matched=fired.matched_clauses(metrics))
+        return explanation
+
+    def evaluate_batch(self, base, rng):
+        """
+        Evaluate a batch of states held in NumPy arrays.
+
+        Each cascade rule draws rng.random(n) for the whole batch, in rule order.
+
+        Args:
+            base: Dict of base metrics as equally sized arrays
+            rng: numpy.random.Generator
+
+        Returns:
+            Int array of CRISIS_TYPES indices (-1 for no crisis)
+        """
+        import numpy as np
+
+        metrics = self.derive(base, maximum=np.maximum)
+        n = len(np.asarray(base['population']))
+        crisis = np.full(n, -1, dtype=np.int64)
+        for rule in self.threshold_rules:
+            crisis = np.where((crisis == -1) & rule.matches(metrics), rule.crisis_index, crisis)
+
+        open_slots = crisis == -1
+        for rule in self.cascade_rules:
+            fired = open_slots & rule.matches(metrics) & (rng.random(n) < rule.chance)
+            crisis = np.where(fired, rule.crisis_index, crisis)
+            open_slots &= ~fired
+        return crisis
+
+
+class CrisisTelemetry:
+    """Counts of the rules that fired, plus the most recent explanations."""
+
+    def __init__(self, max_recent=50):
+        self._counts = {}
+        self._evaluations = 0
+        self._recent = deque(maxlen=max_recent)
+        self._lock = threading.Lock()
+
+    def record(self, explanation, turn=None):
+        with self._lock:
+            self._evaluations += 1
+            rule = explanation['rule'] or 'none'
+            self._counts[rule] = self._counts.get(rule, 0) + 1
+            self._recent.append({
+                'turn': turn,
+                'crisis': explanation['crisis'],
+                'rule': explanation['rule'],
+                'matched': explanation['matched'],
+                'rolls': explanation['rolls'],
+                'metrics': {k: round(v, 3) if isinstance(v, float) else v
+                            for k, v in explanation['metrics'].items()},
+            })
+
+    def get_stats(self):
+        """Evaluations and how often each rule fired ('none' for no crisis)."""
+        with self._lock:
+            return {'evaluations': self._evaluations, 'rules': dict(self._counts)}
+
+    def recent(self, limit=10):
+        """The most recent explanations, newest last."""
+        with self._lock:
+            return list(self._recent)[-limit:]
+
+    def reset(self):
+        with self._lock:
+            self._counts = {}
+            self._evaluations = 0
+            self._recent.clear()
+
+
+# Global compiled rules (default parameters) and telemetry
+_crisis_rules = None
+_crisis_telemetry = None
+
+
+def get_crisis_rules():
+    """Get CRISIS_RULES compiled with the default parameters."""
+    global _crisis_rules
+    if _crisis_rules is None:
+        _crisis_rules = CrisisRules()
+    return _crisis_rules
+
+
+def get_crisis_telemetry():
+    """Get the global crisis rule telemetry."""
+    global _crisis_telemetry
+    if _crisis_telemetry is None:
+        _crisis_telemetry = CrisisTelemetry()
+    return _crisis_telemetry
@@ -12,10 +12,11 @@ import google.generativeai as genai
 import json
 from json import JSONDecodeError
 import time
-from engines.context_builder import build_event_context
-from engines.tendency_analyzer import analyze_player_tendency, get_tendency_description
+from engines.context_builder import build_event_context, get_player_tendency, get_leader_tags
+from engines.tendency_analyzer import get_tendency_description
 from model_config import TEXT_MODEL
-from engines.prompt_loader import load_prompt
+from engines.prompt_budget import render_prompt
+from engines.event_transcript import render_transcript, get_transcript_summaries
 
 def api_call_with_retry(func, max_retries=3, initial_delay=1.0):
     """
@@ -154,14 +155,14 @@ def generate_event(game_state):
     context = build_event_context(game_state)
 
     # Enhanced tendency analysis
-    primary_tendency, secondary_tendency = analyze_player_tendency(game_state.history_long)
+    primary_tendency, secondary_tendency = get_player_tendency(game_state)
     tendency_desc = get_tendency_description(primary_tendency, secondary_tendency)
     print(f"--- Player Tendency: {primary_tendency.upper()} (secondary: {secondary_tendency}) ---")
 
     # Get leader traits and event tags
-    from engines.leader_engine import get_leader_event_tags, TRAIT_EFFECTS
+    from engines.leader_engine import TRAIT_EFFECTS
 
-    leader_tags = get_leader_event_tags(context['civilization']['leader'])
+    leader_tags = get_leader_tags(game_state)
     trait_descriptions = []
     leader_traits = context['civilization']['leader'].get('traits', [])
     for trait in leader_traits:
@@ -253,9 +254,10 @@ def generate_event(game_state):
     else:
         last_event_str = "This is the first event."
 
-    # Load prompt template and fill in variables
-    prompt_template = load_prompt('events/generate_event')
-    prompt = prompt_template.format(
+    # Fill the prompt template within its token budget (lowest-priority fields trimmed first)
+    prompt = render_prompt(
+        'events/generate_event',
+        trim_order=['last_event', 'recent_titles', 'trait_descriptions', 'tendency_desc'],
         era=context['civilization']['meta']['era'],
         civ_name=context['civilization']['meta']['name'],
         year=context['civilization']['meta']['year'],
@@ -347,11 +349,11 @@ def generate_event_stage(game_state, player_response):
     # Check if this is a council meeting
     is_council = game_state.current_event.get('event_type') == 'council_meeting'
 
-    # Build conversation history
-    conversation_history = "\n".join([
-        f"Player: {entry['player']}\nResponse: {entry['ai']}"
-        for entry in game_state.event_conversation
-    ])
+    # Build conversation history (older exchanges summarized, recent ones verbatim)
+    conversation_history = render_transcript(
+        game_state.event_conversation,
+        "Player: {player}\nResponse: {ai}"
+    )
 
     # Contextualize resources for stage generation
     pop = context['civilization']['population']
@@ -380,9 +382,10 @@ def generate_event_stage(game_state, player_response):
         central_dilemma = game_state.current_event.get('central_dilemma', 'Strategic decision needed')
         conversation_history_str = conversation_history if conversation_history else "This is the first question."
 
-        # Load prompt template and fill in variables
-        prompt_template = load_prompt('events/generate_event_stage_council')
-        prompt = prompt_template.format(
+        # Fill the prompt template within its token budget
+        prompt = render_prompt(
+            'events/generate_event_stage_council',
+            trim_order=['conversation_history', 'advisor_list', 'central_dilemma'],
             central_dilemma=central_dilemma,
             advisor_list=advisor_list,
             conversation_history=conversation_history_str,
@@ -405,9 +408,10 @@ def generate_event_stage(game_state, player_response):
         religion_influence = context['religion']['influence']
         conversation_history_str = conversation_history if conversation_history else "This is the first interaction."
 
-        # Load prompt template and fill in variables
-        prompt_template = load_prompt('events/generate_event_stage_regular')
-        prompt = prompt_template.format(
+        # Fill the prompt template within its token budget
+        prompt = render_prompt(
+            'events/generate_event_stage_regular',
+            trim_order=['conversation_history', 'event_narrative', 'player_response'],
             event_title=event_title,
             event_narrative=event_narrative,
             current_stage=current_stage,
@@ -475,6 +479,9 @@ def generate_event_stage(game_state, player_response):
         })
         game_state.event_stage += 1
 
+        # Fold older exchanges while the player reads this stage
+        get_transcript_summaries().prefetch(game_state.event_conversation)
+
         # Validate we have all required fields
         if "investigation_options" not in stage_data or len(stage_data.get("investigation_options", [])) < 2:
             print("WARNING: Missing investigation_options. Adding fallback.")
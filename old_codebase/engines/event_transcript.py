@@ -0,0 +1,228 @@
+# engines/event_transcript.py
+"""
+Event Transcript Module
+
+Keeps investigation transcripts of multi-stage events inside a token budget.
+
+game_state.event_conversation still records every exchange, but prompts embed
+it through render_transcript():
+- the last TRANSCRIPT_VERBATIM_EXCHANGES exchanges are kept verbatim
+  (each reply capped at TRANSCRIPT_EXCHANGE_TOKENS)
+- older exchanges are folded into a rolling summary written in the background
+  by SUMMARY_MODEL, one exchange at a time on top of the previous summary
+
+Rendering never waits for the model: until a summary is ready a short local
+digest is used instead. Summaries are keyed by the content of the exchanges
+they cover, so resetting a conversation can never pick up a stale summary.
+"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from engines.token_budget import truncate_text
+from model_config import (
+    SUMMARY_MODEL, TRANSCRIPT_VERBATIM_EXCHANGES,
+    TRANSCRIPT_EXCHANGE_TOKENS, TRANSCRIPT_SUMMARY_TOKENS
+)
+
+# Summaries kept in memory (one per folded prefix)
+MAX_CACHED_SUMMARIES = 64
+
+# Token caps for the local digest used until a summary is ready
+DIGEST_PLAYER_TOKENS = 20
+DIGEST_REPLY_TOKENS = 40
+
+
+def _prefix_key(exchanges):
+    """Content key for a list of exchanges."""
+    raw = json.dumps([[e.get('player', ''), e.get('ai', '')] for e in exchanges], ensure_ascii=False)
+    return hashlib.sha1(raw.encode('utf-8')).hexdigest()
+
+
+def _format_exchanges(exchanges):
+    return "\n".join(f"Player: {e.get('player', '')}\nResponse: {e.get('ai', '')}" for e in exchanges)
+
+
+def summarize_with_model(previous_summary, exchanges):
+    """
+    Fold exchanges into the previous summary with SUMMARY_MODEL.
+
+    Args:
+        previous_summary: Summary of earlier exchanges, or None
+        exchanges: New exchanges to fold in (oldest first)
+
+    Returns:
+        Updated summary text
+    """
+    import google.generativeai as genai
+    from engines.prompt_budget import render_prompt
+
+    prompt = render_prompt(
+        'events/summarize_investigation',
+        trim_order=['exchanges', 'previous_summary'],
+        previous_summary=previous_summary or "None",
+        exchanges=_format_exchanges(exchanges),
+        max_words=int(TRANSCRIPT_SUMMARY_TOKENS * 0.75)
+    )
+    response = genai.GenerativeModel(SUMMARY_MODEL).generate_content(
+        prompt,
+        generation_config={"temperature": 0.2}
+    )
+    return truncate_text(response.text.strip(), TRANSCRIPT_SUMMARY_TOKENS)
+
+
+def local_digest(exchanges, max_tokens=TRANSCRIPT_SUMMARY_TOKENS):
+    """
+    Cheap extractive digest of exchanges, newest kept first under the budget.
+
+    Used while the model summary is still being written (or if it failed).
+    """
+    lines = []
+    used = 0
+    for entry in reversed(exchanges):
+        line = (f"{truncate_text(entry.get('player', ''), DIGEST_PLAYER_TOKENS)} → "
+                f"{truncate_text(entry.get('ai', ''), DIGEST_REPLY_TOKENS)}")
+        cost = DIGEST_PLAYER_TOKENS + DIGEST_REPLY_TOKENS
+        if used + cost > max_tokens:
+            break
+        lines.insert(0, line)
+        used += cost
+    omitted = len(exchanges) - len(lines)
+    if omitted:
+        lines.insert(0, f"({omitted} earlier exchange(s) omitted)")
+    return "\n".join(lines)
+
+
+class TranscriptSummaries:
+    """
+    Background rolling summaries of investigation transcripts.
+
+    Usage:
+        summaries = TranscriptSummaries()
+        summaries.prefetch(game_state.event_conversation)   # after each stage
+        text = summaries.summary_for(older_exchanges)       # never blocks
+    """
+
+    def __init__(self, summarize=summarize_with_model, max_workers=1):
+        self.summarize = summarize
+        self._summaries = OrderedDict()  # prefix key -> (length, summary)
+        self._pending = {}  # prefix key -> Future
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="transcript")
+
+    def get(self, exchanges):
+        """Return the finished summary of exactly these exchanges, or None."""
+        with self._lock:
+            cached = self._summaries.get(_prefix_key(exchanges))
+            return cached[1] if cached else None
+
+    def _store(self, key, length, summary):
+        with self._lock:
+            self._summaries[key] = (length, summary)
+            self._summaries.move_to_end(key)
+            while len(self._summaries) > MAX_CACHED_SUMMARIES:
+                self._summaries.popitem(last=False)
+
+    def _fold(self, exchanges):
+        """Summarize exchanges, starting from the longest prefix already summarized."""
+        start, previous = 0, None
+        for length in range(len(exchanges) - 1, 0, -1):
+            previous = self.get(exchanges[:length])
+            if previous is not None:
+                start = length
+                break
+        try:
+            summary = self.summarize(previous, exchanges[start:])
+        except Exception as e:
+            print(f"  ⚠️ Transcript summary failed, using local digest: {e}")
+            summary = local_digest(exchanges)
+        self._store(_prefix_key(exchanges), len(exchanges), summary)
+        return summary
+
+    def schedule(self, exchanges):
+        """
+        Start summarizing exchanges in the background if not done or in flight.
+
+        Returns:
+            Future for the summary, or None if it is already cached
+        """
+        exchanges = [dict(e) for e in exchanges]
+        key = _prefix_key(exchanges)
+        with self._lock:
+            if key in self._summaries:
+                return None
+            future = self._pending.get(key)
+            if future is None:
+                future = self._executor.submit(self._fold, exchanges)
+                self._pending[key] = future
+                future.add_done_callback(lambda _f, k=key: self._pending.pop(k, None))
+            return future
+
+    def prefetch(self, conversation, keep=TRANSCRIPT_VERBATIM_EXCHANGES):
+        """
+        Fold everything but the last `keep` exchanges ahead of the next stage.
+
+        Returns:
+            Future for the summary, or None if nothing needs folding
+        """
+        if len(conversation) <= keep:
+            return None
+        return self.schedule(conversation[:-keep] if keep else conversation)
+
+    def summary_for(self, exchanges):
+        """Summary of exchanges: the model summary if ready, otherwise a local digest."""
+        summary = self.get(exchanges)
+        if summary is not None:
+            return summary
+        self.schedule(exchanges)
+        return local_digest(exchanges)
+
+
+# Global summaries instance
+_transcript_summaries = None
+
+
+def get_transcript_summaries():
+    """Get the global transcript summaries instance."""
+    global _transcript_summaries
+    if _transcript_summaries is None:
+        _transcript_summaries = TranscriptSummaries()
+    return _transcript_summaries
+
+
+def render_transcript(conversation, line_format, empty_text="", keep=TRANSCRIPT_VERBATIM_EXCHANGES, summaries=None):
+    """
+    Render an investigation transcript for a prompt within a bounded size.
+
+    Args:
+        conversation: List of {'player': ..., 'ai': ...} exchanges
+        line_format: Format string for verbatim exchanges using {player} and {ai}
+        empty_text: Returned when there are no exchanges
+        keep: Number of most recent exchanges kept verbatim
+        summaries: TranscriptSummaries to use (defaults to the global instance)
+
+    Returns:
+        Transcript text: a summary of older exchanges followed by the recent ones
+    """
+    if not conversation:
+        return empty_text
+
+    older = conversation[:-keep] if keep else list(conversation)
+    recent = conversation[-keep:] if keep else []
+
+    parts = []
+    if older:
+        summaries = summaries or get_transcript_summaries()
+        parts.append(f"Earlier in this investigation ({len(older)} exchange(s), summarized):\n"
+                     f"{summaries.summary_for(older)}")
+    parts.extend(
+        line_format.format(
+            player=truncate_text(entry.get('player', ''), DIGEST_PLAYER_TOKENS * 3),
+            ai=truncate_text(entry.get('ai', ''), TRANSCRIPT_EXCHANGE_TOKENS)
+        )
+        for entry in recent
+    )
+    return "\n".join(parts)
@@ -1,7 +1,7 @@
 import json
 import google.generativeai as genai
 from model_config import TEXT_MODEL
-from engines.prompt_loader import load_prompt
+from engines.prompt_budget import render_prompt
 
 
 def apply_faction_decision_consequences(game_state, chosen_faction, affected_factions):
@@ -110,7 +110,9 @@ def generate_faction_audience(game_state):
         faction_list += f"- {fc['name']}:\n"
         faction_list += f"  - Goals: {fc['goals']}\n"
         faction_list += f"  - Approval: {fc['approval_desc']}\n"
-    prompt = load_prompt('factions/faction_audience').format(
+    prompt = render_prompt(
+        'factions/faction_audience',
+        trim_order=['faction_list'],
         faction_list=faction_list
     )
 
@@ -0,0 +1,223 @@
+# engines/history_index.py
+"""
+History Index Module
+
+Local BM25 full-text index over the chronicle, so engines can ask for the
+events most relevant to the current event or action instead of just the
+last N.
+
+Indexed documents:
+- history_long events (title, action, narrative)
+- compressed eras (name, character, defining events)
+- civilization-defining moments archived in compressed history
+- permanent decrees
+
+The index is incremental: only documents appended since the last sync are
+tokenized, and it rebuilds itself if the underlying lists are replaced
+(load, new game). One index is kept per GameState.
+"""
+
+import math
+import re
+from collections import Counter
+
+from engines.token_budget import truncate_text
+
+# BM25 parameters (standard defaults)
+BM25_K1 = 1.5
+BM25_B = 0.75
+
+# Token allowance per retrieved narrative in prompts
+SNIPPET_TOKENS = 60
+
+STOPWORDS = {
+    'the', 'and', 'for', 'with', 'that', 'this', 'from', 'was', 'were', 'are', 'but',
+    'not', 'all', 'his', 'her', 'their', 'they', 'them', 'its', 'our', 'your', 'has',
+    'have', 'had', 'into', 'onto', 'over', 'who', 'what', 'when', 'where', 'which',
+    'will', 'would', 'been', 'being', 'than', 'then', 'there', 'these', 'those',
+    'out', 'one', 'you', 'she', 'him', 'about', 'upon', 'while', 'each', 'more'
+}
+
+_WORD_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    """Lowercase word tokens without stopwords or very short words."""
+    return [w for w in _WORD_RE.findall((text or '').lower()) if len(w) > 2 and w not in STOPWORDS]
+
+
+class BM25Index:
+    """
+    Incremental BM25 index over small text documents.
+
+    Usage:
+        index = BM25Index()
+        index.add('event:0', "Flood on the river", {'title': 'Flood'})
+        hits = index.search("river flood", k=3)   # [(score, doc_id, payload)]
+    """
+
+    def __init__(self):
+        self.term_freqs = {}    # doc_id -> Counter
+        self.lengths = {}       # doc_id -> token count
+        self.payloads = {}      # doc_id -> payload
+        self.doc_freqs = Counter()
+        self.total_length = 0
+
+    def __len__(self):
+        return len(self.term_freqs)
+
+    def add(self, doc_id, text, payload):
+        """Index (or re-index) a document."""
+        if doc_id in self.term_freqs:
+            self.remove(doc_id)
+        tokens = tokenize(text)
+        counts = Counter(tokens)
+        self.term_freqs[doc_id] = counts
+        self.lengths[doc_id] = len(tokens)
+        self.payloads[doc_id] = payload
+        self.doc_freqs.update(counts.keys())
+        self.total_length += len(tokens)
+
+    def remove(self, doc_id):
+        """Drop a document from the index."""
+        counts = self.term_freqs.pop(doc_id, None)
+        if counts is None:
+            return
+        self.doc_freqs.subtract(counts.keys())
+        self.total_length -= self.lengths.pop(doc_id)
+        self.payloads.pop(doc_id, None)
+
+    def search(self, query, k=5, exclude=None):
+        """
+        Score documents against a query.
+
+        Args:
+            query: Free text
+            k: Maximum number of hits
+            exclude: Optional set of doc ids to skip
+
+        Returns:
+            List of (score, doc_id, payload), best first; only positive scores
+        """
+        terms = set(tokenize(query))
+        if not terms or not self.term_freqs:
+            return []
+        exclude = exclude or set()
+        n_docs = len(self.term_freqs)
+        avg_length = self.total_length / n_docs if n_docs else 0
+
+        idf = {}
+        for term in terms:
+            df = self.doc_freqs.get(term, 0)
+            if df > 0:
+                idf[term] = math.log(1 + (n_docs - df + 0.5) / (df + 0.5))
+
+        hits = []
+        for doc_id, counts in self.term_freqs.items():
+            if doc_id in exclude:
+                continue
+            norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths[doc_id] / max(avg_length, 1))
+            score = 0.0
+            for term, weight in idf.items():
+                tf = counts.get(term, 0)
+                if tf:
+                    score += weight * tf * (BM25_K1 + 1) / (tf + norm)
+            if score > 0:
+                hits.append((score, doc_id, self.payloads[doc_id]))
+
+        hits.sort(key=lambda hit: hit[0], reverse=True)
+        return hits[:k]
+
+
+def _event_document(event):
+    text = " ".join(str(event.get(key, '')) for key in ('title', 'action', 'narrative'))
+    payload = {
+        'year': event.get('year'),
+        'title': event.get('title', 'Unknown Event'),
+        'action': truncate_text(event.get('action', ''), SNIPPET_TOKENS // 2),
+        'narrative': truncate_text(event.get('narrative', ''), SNIPPET_TOKENS)
+    }
+    return text, payload
+
+
+def _era_document(era):
+    defining = era.get('defining_events', [])
+    text = " ".join([era.get('name', ''), era.get('era_character', '')] +
+                    [f"{e.get('title', '')} {e.get('summary', '')}" for e in defining])
+    payload = {
+        'year': era.get('start_year'),
+        'era': era.get('name', 'Unnamed era'),
+        'years': f"{era.get('start_year')}-{era.get('end_year')}",
+        'summary': truncate_text(era.get('era_character', ''), SNIPPET_TOKENS)
+    }
+    return text, payload
+
+
+def _decree_document(decree):
+    body = decree.get('declaration_text') or decree.get('summary', '')
+    text = " ".join([decree.get('title', ''), decree.get('type', ''), body])
+    payload = {
+        'year': decree.get('declared_year', decree.get('year')),
+        'decree': decree.get('title', 'Decree'),
+        'summary': truncate_text(body, SNIPPET_TOKENS)
+    }
+    return text, payload
+
+
+class HistoryIndex:
+    """BM25 index over one game's chronicle, synced incrementally from the GameState."""
+
+    def __init__(self):
+        self.index = BM25Index()
+        self._sources = {}  # source name -> (list object, number indexed)
+
+    def _sync_list(self, name, items, make_document, key=None):
+        items = items if isinstance(items, list) else []
+        source_list, indexed = self._sources.get(name, (None, 0))
+        if source_list is not items or indexed > len(items):
+            # List replaced (load/new game) or shrunk: re-index this source
+            for doc_id in [d for d in self.index.payloads if d.startswith(f"{name}:")]:
+                self.index.remove(doc_id)
+            indexed = 0
+        for position in range(indexed, len(items)):
+            item = items[position]
+            if not isinstance(item, dict):
+                continue
+            text, payload = make_document(item)
+            doc_key = item.get(key, position) if key else position
+            self.index.add(f"{name}:{doc_key}", text, payload)
+        self._sources[name] = (items, len(items))
+
+    def sync(self, game_state):
+        """Index anything appended to the chronicle since the last sync."""
+        history_long = getattr(game_state, 'history_long', None) or {}
+        compressed = getattr(game_state, 'history_compressed', None) or {}
+        civilization = getattr(game_state, 'civilization', None) or {}
+
+        self._sync_list('event', history_long.get('events'), _event_document)
+        self._sync_list('era', compressed.get('eras'), _era_document)
+        self._sync_list('moment', compressed.get('civilization_defining_moments'), _decree_document)
+        self._sync_list('decree', civilization.get('permanent_decrees'), _decree_document, key='id')
+        return self
+
+    def get(self, doc_id):
+        """Payload of an indexed document (e.g. 'event:12'), or None."""
+        return self.index.payloads.get(doc_id)
+
+    def search(self, query, k=5, exclude=None):
+        """Top-k payloads for a query (see BM25Index.search)."""
+        return [payload for _, _, payload in self.index.search(query, k=k, exclude=exclude)]
+
+
+def get_history_index(game_state):
+    """
+    Get the history index for a game, synced to its current chronicle.
+
+    The index is kept on the GameState (like the context cache) so it lives
+    and dies with the game it describes.
+    """
+    index = getattr(game_state, '_history_index', None)
+    if index is None:
+        index = HistoryIndex()
+        game_state._history_index = index
+    return index.sync(game_state)
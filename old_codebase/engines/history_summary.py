@@ -0,0 +1,300 @@
+# engines/history_summary.py
+"""
+Rolling History Summary Module
+
+Keeps a hierarchical summary of the chronicle up to date in the background:
+
+    turn events -> decade summaries -> era summaries -> "story so far"
+
+Every HISTORY_SUMMARY_INTERVAL turns a background job summarizes the decades
+that have closed since the last run (one cheap SUMMARY_MODEL call each),
+refreshes the summary of each era those decades belong to, and rebuilds a
+"story so far" of at most STORY_SO_FAR_TOKENS. Results are cached in
+history_compressed['rolling_summary'] and saved with the game, so prompts can
+include the whole story at a fixed size without re-sending history.
+
+Each decade is filed under the era its events were logged in. Events without
+an era (older saves) use the era recorded at the first summary run after
+them: every run extends an era timeline (rolling_summary['era_timeline']),
+so a timeskip that closes centuries at once doesn't relabel them all with
+the new era.
+
+Nothing on the request path waits for the model: prompts use whatever summary
+is cached, and summaries fall back to a local digest if the model call fails.
+The result is handed back under the game's save lock.
+"""
+
+import copy
+import threading
+from contextlib import nullcontext
+from concurrent.futures import ThreadPoolExecutor
+
+from engines.token_budget import estimate_tokens, truncate_text
+from model_config import SUMMARY_MODEL, HISTORY_SUMMARY_INTERVAL, STORY_SO_FAR_TOKENS
+
+# Years per decade bucket (one turn is one year)
+DECADE_YEARS = 10
+
+# Size of each level of the hierarchy (estimated tokens)
+DECADE_SUMMARY_TOKENS = 80
+ERA_SUMMARY_TOKENS = 120
+
+
+def _decade_start(year):
+    return (year // DECADE_YEARS) * DECADE_YEARS
+
+
+def _generate(prompt_path, max_tokens, trim_order, **values):
+    """One SUMMARY_MODEL call for a history prompt (within its token budget)."""
+    import google.generativeai as genai
+    from engines.prompt_budget import render_prompt
+
+    prompt = render_prompt(prompt_path, trim_order=trim_order, max_words=int(max_tokens * 0.75), **values)
+    response = genai.GenerativeModel(SUMMARY_MODEL).generate_content(
+        prompt,
+        generation_config={"temperature": 0.3}
+    )
+    return truncate_text(response.text.strip(), max_tokens)
+
+
+def summarize_decade_with_model(civ_name, start_year, end_year, events):
+    """Summarize one decade of events with SUMMARY_MODEL."""
+    lines = "\n".join(
+        f"- {e.get('year')}: {e.get('title', '')} — {truncate_text(e.get('action', ''), 40)} → "
+        f"{truncate_text(e.get('narrative', ''), 80)}"
+        for e in events
+    )
+    return _generate('history/summarize_decade', DECADE_SUMMARY_TOKENS, ['events'],
+                     civ_name=civ_name, start_year=start_year, end_year=end_year, events=lines)
+
+
+def summarize_era_with_model(civ_name, era, start_year, end_year, decade_summaries):
+    """Summarize an era from its decade summaries with SUMMARY_MODEL."""
+    return _generate('history/summarize_era', ERA_SUMMARY_TOKENS, ['decades'],
+                     civ_name=civ_name, era=era, start_year=start_year, end_year=end_year,
+                     decades="\n".join(f"- {s}" for s in decade_summaries))
+
+
+def local_decade_summary(events):
+    """Digest of a decade from event titles (used when the model is unavailable)."""
+    return truncate_text("; ".join(e.get('title', 'Unknown event') for e in events), DECADE_SUMMARY_TOKENS)
+
+
+def local_era_summary(decade_summaries):
+    """Digest of an era from its decade summaries (used when the model is unavailable)."""
+    per_decade = max(10, ERA_SUMMARY_TOKENS // max(1, len(decade_summaries)))
+    return truncate_text(" ".join(truncate_text(s, per_decade) for s in decade_summaries), ERA_SUMMARY_TOKENS)
+
+
+def empty_rolling_summary():
+    return {'decades': [], 'eras': [], 'era_timeline': [], 'story_so_far': ''}
+
+
+def record_era(era_timeline, year, era):
+    """Extend the era timeline with the era seen at a summary run."""
+    if era_timeline and era_timeline[-1]['era'] == era:
+        era_timeline[-1]['last_year'] = max(era_timeline[-1]['last_year'], year)
+    else:
+        era_timeline.append({'era': era, 'first_year': year, 'last_year': year})
+
+
+def decade_era(events, era_timeline, default):
+    """
+    Era a decade belongs to.
+
+    The era of its latest event that records one; otherwise the era seen at
+    the first summary run on or after its last event (default if none).
+    """
+    for event in reversed(events):
+        if event.get('era'):
+            return event['era']
+    last_year = max(event['year'] for event in events)
+    for entry in era_timeline:
+        if entry['last_year'] >= last_year:
+            return entry['era']
+    return default
+
+
+def build_story_so_far(eras, max_tokens=STORY_SO_FAR_TOKENS):
+    """
+    Join era summaries into a story of at most max_tokens.
+
+    The founding era and the most recent eras are kept; eras in between are
+    dropped (with a marker) once the budget is reached.
+    """
+    lines = [f"{era['era']} ({era['start_year']} to {era['end_year']}): {era['summary']}" for era in eras]
+    if estimate_tokens("\n".join(lines)) <= max_tokens:
+        return "\n".join(lines)
+
+    first, rest = lines[0], lines[1:]
+    kept = []
+    for line in reversed(rest):
+        candidate = [first, "(…)"] + [line] + kept
+        if estimate_tokens("\n".join(candidate)) > max_tokens:
+            break
+        kept.insert(0, line)
+    omitted = len(rest) - len(kept)
+    story = [first] + ([f"({omitted} era(s) omitted)"] if omitted else []) + kept
+    return truncate_text("\n".join(story), max_tokens)
+
+
+class HistorySummarizer:
+    """
+    Background maintainer of the rolling history summary.
+
+    Usage:
+        summarizer = HistorySummarizer()
+        summarizer.schedule(game_state)        # after each turn; runs every N turns
+        get_story_so_far(game_state)           # cached text for prompts
+    """
+
+    def __init__(self, summarize_decade=summarize_decade_with_model, summarize_era=summarize_era_with_model,
+                 interval=HISTORY_SUMMARY_INTERVAL):
+        self.summarize_decade = summarize_decade
+        self.summarize_era = summarize_era
+        self.interval = interval
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="history-summary")
+
+    def update(self, snapshot):
+        """
+        Extend a rolling summary with the decades closed since it was last updated.
+
+        Args:
+            snapshot: Dict with civ_name, era, current_year, events and
+                the existing rolling summary ('rolling', may be None)
+
+        Returns:
+            The new rolling summary dict
+        """
+        rolling = copy.deepcopy(snapshot.get('rolling')) or empty_rolling_summary()
+        rolling.pop('summarized_turn', None)  # no longer kept
+        decades, eras = rolling['decades'], rolling['eras']
+        era_timeline = rolling.setdefault('era_timeline', [])
+        record_era(era_timeline, snapshot['current_year'], snapshot['era'])
+        last_end = decades[-1]['end_year'] if decades else None
+        current_decade = _decade_start(snapshot['current_year'])
+
+        # Group events of closed, not yet summarized decades
+        closed = {}
+        for event in snapshot['events']:
+            year = event.get('year')
+            if not isinstance(year, int):
+                continue
+            start = _decade_start(year)
+            if start < current_decade and (last_end is None or start > last_end):
+                closed.setdefault(start, []).append(event)
+
+        touched_eras = []
+        for start in sorted(closed):
+            events = closed[start]
+            end = start + DECADE_YEARS - 1
+            try:
+                summary = self.summarize_decade(snapshot['civ_name'], start, end, events)
+            except Exception as e:
+                print(f"  ⚠️ Decade summary failed, using local digest: {e}")
+                summary = local_decade_summary(events)
+            era = decade_era(events, era_timeline, snapshot['era'])
+            decades.append({'start_year': start, 'end_year': end, 'era': era,
+                            'events': len(events), 'summary': summary})
+
+            # Decades of the same era extend its entry; a new era label starts a new one
+            if eras and eras[-1]['era'] == era:
+                eras[-1]['end_year'] = end
+                eras[-1]['decades'] += 1
+            else:
+                eras.append({'era': era, 'start_year': start, 'end_year': end,
+                             'decades': 1, 'summary': ''})
+            if eras[-1] not in touched_eras:
+                touched_eras.append(eras[-1])
+
+        for era in touched_eras:
+            era_decades = [d['summary'] for d in decades
+                           if d['era'] == era['era'] and era['start_year'] <= d['start_year'] <= era['end_year']]
+            try:
+                era['summary'] = self.summarize_era(snapshot['civ_name'], era['era'], era['start_year'],
+                                                    era['end_year'], era_decades)
+            except Exception as e:
+                print(f"  ⚠️ Era summary failed, using local digest: {e}")
+                era['summary'] = local_era_summary(era_decades)
+
+        if touched_eras or not rolling['story_so_far']:
+            rolling['story_so_far'] = build_story_so_far(eras)
+        if closed:
+            print(f"  📖 History summary: +{len(closed)} decade(s), {len(eras)} era(s)")
+        return rolling
+
+    def schedule(self, game_state, force=False):
+        """
+        Refresh the game's rolling summary in the background (every N turns).
+
+        Args:
+            game_state: GameState
+            force: Run regardless of the turn interval (e.g. after a timeskip)
+
+        Returns:
+            Future for the new rolling summary, or None if nothing was scheduled
+        """
+        turn = getattr(game_state, 'turn_number', 0)
+        if not force and (self.interval <= 0 or turn % self.interval != 0):
+            return None
+
+        target = game_state.history_compressed
+        if not isinstance(target, dict):
+            return None
+        snapshot = {
+            'civ_name': game_state.civilization.get('meta', {}).get('name', 'the civilization'),
+            'era': game_state.civilization.get('meta', {}).get('era', 'unknown era'),
+            'current_year': game_state.civilization.get('meta', {}).get('year', 0),
+            'events': list(game_state.history_long.get('events', [])),
+            'rolling': target.get('rolling_summary')
+        }
+
+        key = id(target)
+        with self._lock:
+            if key in self._pending:
+                return self._pending[key]
+
+            def _run():
+                rolling = self.update(snapshot)
+                # Write into the history this snapshot came from, even if a new game started
+                # meanwhile, and never while that game is being saved
+                with getattr(game_state, 'save_lock', None) or nullcontext():
+                    target['rolling_summary'] = rolling
+                return rolling
+
+            future = self._executor.submit(_run)
+            self._pending[key] = future
+
+        # Outside the lock: the callback runs right away if the job already finished
+        future.add_done_callback(lambda _f: self._release(key))
+        return future
+
+    def _release(self, key):
+        with self._lock:
+            self._pending.pop(key, None)
+
+
+# Global summarizer instance
+_history_summarizer = None
+
+
+def get_history_summarizer():
+    """Get the global history summarizer instance."""
+    global _history_summarizer
+    if _history_summarizer is None:
+        _history_summarizer = HistorySummarizer()
+    return _history_summarizer
+
+
+def get_story_so_far(game_state, empty_text=""):
+    """
+    The cached "story so far" for prompts (never waits for the model).
+
+    Returns:
+        Story text (at most STORY_SO_FAR_TOKENS), or empty_text if none yet
+    """
+    compressed = getattr(game_state, 'history_compressed', None) or {}
+    rolling = compressed.get('rolling_summary') or {}
+    return rolling.get('story_so_far') or empty_text
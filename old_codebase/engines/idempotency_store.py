@@ -0,0 +1,148 @@
+# engines/idempotency_store.py
+"""
+Idempotency Store Module
+
+Stores the committed response of turn-committing endpoints (/api/action,
+/api/timeskip, /api/choose_successor) per client-supplied idempotency key.
+
+When a client retries a request after a network hiccup, the stored response
+is returned without re-running the turn, so a retry never costs another model
+call, consumes resources twice, ages the leader twice or logs a second history
+entry. Entries expire after a bounded window and the store is size-capped.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+from engines.request_coalescer import SingleFlight
+
+# How long a committed response is kept for replay (seconds)
+DEFAULT_TTL_SECONDS = 15 * 60
+
+# Maximum number of stored responses (oldest are evicted first)
+DEFAULT_MAX_ENTRIES = 256
+
+
+class IdempotencyStore:
+    """
+    Bounded, time-limited store of committed responses keyed by idempotency key.
+
+    Usage:
+        store = IdempotencyStore()
+        payload, status, replayed = store.run(('action', game_id, key), execute)
+
+    Only successful (2xx, non-error) responses are stored. Failed requests are
+    not committed, so a retry after an error executes normally.
+    """
+
+    def __init__(self, ttl_seconds=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        # Retries that arrive while the original is still running wait for it
+        self._in_flight = SingleFlight()
+
+    def get(self, key):
+        """
+        Get the stored response for a key.
+
+        Returns:
+            Tuple (payload, status) or None if missing or expired
+        """
+        with self._lock:
+            self._evict_expired()
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            return entry['payload'], entry['status']
+
+    def put(self, key, payload, status=200):
+        """Store a committed response for a key."""
+        with self._lock:
+            self._entries[key] = {
+                'payload': payload,
+                'status': status,
+                'stored_at': time.monotonic()
+            }
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key):
+        """
+        Forget the stored response for a key so the next retry executes again.
+
+        Used when a response was committed before its work finished, e.g. the
+        202 of a background job that later failed.
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def run(self, key, func):
+        """
+        Execute func once per key and replay the committed result afterwards.
+
+        Args:
+            key: Hashable key (usually (scope, game_id, client_key))
+            func: Zero-argument callable returning (payload, status)
+
+        Returns:
+            Tuple (payload, status, replayed)
+        """
+        stored = self.get(key)
+        if stored is not None:
+            print(f"  ♻️ Idempotent replay for {key[0] if isinstance(key, tuple) else key}")
+            return stored[0], stored[1], True
+
+        def _execute_and_commit():
+            # Re-check inside the flight: an earlier call may have just committed
+            committed = self.get(key)
+            if committed is not None:
+                return committed[0], committed[1], True
+
+            payload, status = func()
+            if _is_committed(payload, status):
+                self.put(key, payload, status)
+            return payload, status, False
+
+        (payload, status, replayed), shared = self._in_flight.do(key, _execute_and_commit)
+        return payload, status, replayed or shared
+
+    def clear(self):
+        """Remove all stored responses (useful for testing or new games)."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            self._evict_expired()
+            return len(self._entries)
+
+    def _evict_expired(self):
+        """Drop entries older than the TTL. Caller must hold the lock."""
+        cutoff = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            oldest_key, oldest = next(iter(self._entries.items()))
+            if oldest['stored_at'] >= cutoff:
+                break
+            self._entries.pop(oldest_key)
+
+
+def _is_committed(payload, status):
+    """A response is committed when it succeeded and the turn was applied."""
+    if not 200 <= status < 300:
+        return False
+    if isinstance(payload, dict) and payload.get('status') == 'error':
+        return False
+    return True
+
+
+# Global store shared by all turn-committing routes
+_store = IdempotencyStore()
+
+
+def get_idempotency_store():
+    """Get the global idempotency store."""
+    return _store
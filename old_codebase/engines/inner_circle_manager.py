@@ -3,12 +3,14 @@ InnerCircleManager - Centralized character access and relationship tracking.
 """
 
 class InnerCircleManager:
-    def __init__(self, characters_data):
+    def __init__(self, characters_data, memory_store=None):
         """
         Initialize inner circle manager.
 
         Args:
             characters_data: List of character dicts OR dict with 'characters' key
+            memory_store: Optional AdvisorMemoryStore keeping every memory long-term
+                (character records then only keep a small hot window)
         """
         # Handle both list and dict formats
         if isinstance(characters_data, dict):
@@ -21,6 +23,12 @@ class InnerCircleManager:
         # Build name index for fast lookups
         self._name_index = {char['name']: char for char in self._characters}
 
+        # Long-term memories (older saves: import existing histories once)
+        self.memory_store = memory_store
+        if memory_store is not None:
+            for char in self._characters:
+                memory_store.seed_from_history(char)
+
     def get_by_name(self, character_name):
         """
         Get character by name.
@@ -97,14 +105,18 @@ class InnerCircleManager:
 
         return True
 
-    def add_memory(self, character_name, memory_text, turn_number):
+    def add_memory(self, character_name, memory_text, turn_number, importance=None):
         """
         Add memory to character history for context indexing.
 
+        With a memory store the memory is kept long-term there and the
+        character record only keeps the latest HOT_MEMORY_WINDOW entries.
+
         Args:
             character_name: Character name
             memory_text: Description of the memory/event
             turn_number: Current turn number for indexing
+            importance: Optional 1-10 importance (scored from the text if None)
 
         Returns:
             True if added, False if character not found
@@ -117,9 +129,15 @@ class InnerCircleManager:
         memory = f"Turn {turn_number}: {memory_text}"
         history.append(memory)
 
-        # Keep last 10 memories to avoid JSON bloat
-        if len(history) > 10:
-            character['history'] = history[-10:]
+        if self.memory_store is not None:
+            from engines.memory_store import HOT_MEMORY_WINDOW
+            self.memory_store.add(character_name, memory_text, turn_number, importance)
+            window = HOT_MEMORY_WINDOW
+        else:
+            window = 10  # Keep last 10 memories to avoid JSON bloat
+
+        if len(history) > window:
+            character['history'] = history[-window:]
 
         return True
 
@@ -0,0 +1,192 @@
+# engines/job_runner.py
+"""
+Job Runner Module
+
+Runs long operations (world generation, new game setup, timeskips) on a small
+background thread pool so HTTP requests return immediately with a job id.
+
+Each job reports per-stage progress ("World generated", "Advisor portraits 3/6")
+which clients read by polling /api/jobs/<id> or by subscribing to the
+/api/jobs/<id>/stream event stream.
+"""
+
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+# Background workers for long jobs (image and text generation are I/O bound)
+DEFAULT_MAX_WORKERS = 2
+
+# Finished jobs are kept this long so clients can read the result (seconds)
+FINISHED_JOB_TTL_SECONDS = 30 * 60
+
+
+class Job:
+    """
+    A single long-running operation and its progress.
+
+    Status moves from 'queued' to 'running' to 'succeeded' or 'failed'.
+    """
+
+    def __init__(self, kind):
+        self.id = uuid.uuid4().hex
+        self.kind = kind
+        self.status = 'queued'
+        self.stage = 'Queued'
+        self.stages = []
+        self.progress = None
+        self.result = None
+        self.error = None
+        self.created_at = time.time()
+        self.finished_at = None
+        # Bumped on every change so event streams can wait for updates
+        self.version = 0
+        self._changed = threading.Condition()
+
+    def report(self, stage, done=None, total=None):
+        """
+        Record progress for the current stage.
+
+        Args:
+            stage: Human-readable stage name (e.g. "Generating advisor portraits")
+            done: Optional number of completed items in this stage
+            total: Optional total number of items in this stage
+        """
+        with self._changed:
+            if stage != self.stage:
+                self.stages.append({'stage': stage, 'started_at': time.time()})
+            self.stage = stage
+            self.progress = {'done': done, 'total': total} if total else None
+            self.version += 1
+            self._changed.notify_all()
+
+        if total:
+            print(f"  ⏳ [{self.kind} {self.id[:8]}] {stage} ({done}/{total})")
+        else:
+            print(f"  ⏳ [{self.kind} {self.id[:8]}] {stage}")
+
+    def _finish(self, status, result=None, error=None):
+        with self._changed:
+            self.status = status
+            self.result = result
+            self.error = error
+            self.stage = 'Complete' if status == 'succeeded' else 'Failed'
+            self.progress = None
+            self.finished_at = time.time()
+            self.version += 1
+            self._changed.notify_all()
+
+    def _start(self):
+        with self._changed:
+            self.status = 'running'
+            self.version += 1
+            self._changed.notify_all()
+
+    @property
+    def finished(self):
+        return self.status in ('succeeded', 'failed')
+
+    def wait_for_change(self, since_version, timeout=15):
+        """
+        Block until the job changes past since_version or timeout elapses.
+
+        Returns:
+            The current version
+        """
+        with self._changed:
+            self._changed.wait_for(lambda: self.version > since_version or self.finished, timeout=timeout)
+            return self.version
+
+    def to_dict(self):
+        """Serialize the job for API responses."""
+        with self._changed:
+            data = {
+                'job_id': self.id,
+                'kind': self.kind,
+                'status': self.status,
+                'stage': self.stage,
+                'stages': [s['stage'] for s in self.stages],
+                'progress': self.progress,
+                'version': self.version
+            }
+            if self.status == 'succeeded':
+                data['result'] = self.result
+            elif self.status == 'failed':
+                data['error'] = self.error
+            return data
+
+
+class JobRunner:
+    """
+    Bounded background executor for long jobs.
+
+    Usage:
+        runner = JobRunner()
+        job = runner.submit('new_game', lambda job: build_game(job))
+        runner.get(job.id).to_dict()
+
+    The submitted function receives the Job so it can call job.report(...).
+    Its return value becomes job.result; an exception marks the job failed.
+    """
+
+    def __init__(self, max_workers=DEFAULT_MAX_WORKERS):
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='job')
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, kind, func):
+        """
+        Queue func to run in the background.
+
+        Args:
+            kind: Job type label (e.g. 'new_game', 'custom_game', 'timeskip')
+            func: Callable taking the Job and returning a JSON-serializable result
+
+        Returns:
+            The queued Job
+        """
+        job = Job(kind)
+        with self._lock:
+            self._prune_finished()
+            self._jobs[job.id] = job
+
+        self._executor.submit(self._run, job, func)
+        return job
+
+    def get(self, job_id):
+        """Get a job by id, or None if unknown or expired."""
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def _run(self, job, func):
+        job._start()
+        try:
+            result = func(job)
+            job._finish('succeeded', result=result)
+            print(f"  ✓ Job {job.kind} {job.id[:8]} finished")
+        except Exception as e:
+            print(f"ERROR in job {job.kind} {job.id[:8]}: {e}")
+            import traceback
+            traceback.print_exc()
+            job._finish('failed', error=str(e))
+
+    def _prune_finished(self):
+        """Forget finished jobs older than the TTL. Caller must hold the lock."""
+        cutoff = time.time() - FINISHED_JOB_TTL_SECONDS
+        expired = [job_id for job_id, job in self._jobs.items()
+                   if job.finished_at is not None and job.finished_at < cutoff]
+        for job_id in expired:
+            del self._jobs[job_id]
+
+
+# Global runner shared by all API routes
+_runner = None
+
+
+def get_job_runner():
+    """Get or create the global job runner."""
+    global _runner
+    if _runner is None:
+        _runner = JobRunner()
+    return _runner
@@ -349,6 +349,9 @@ class LawEngine:
         Generate events showing resistance or support for a decree
         Returns None if no significant events, or a narrative string
         """
+        from engines.rng_service import get_rng
+        rng = get_rng(self.game_state).stream('laws')
+
         resistance = decree.get('resistance_level', 0)
         support = decree.get('support_level', 100)
         enforcement = decree.get('enforcement_level', 'absolute')
@@ -361,8 +364,7 @@ class LawEngine:
                 f"Factions splinter over disagreement with '{decree['title']}'",
                 f"A rebellion is brewing among those opposed to '{decree['title']}'"
             ]
-            import random
-            return random.choice(events)
+            return rng.choice(events)
 
         # High support + weakening enforcement = calls for renewal
         if support > 70 and enforcement in ['weakening', 'nominal']:
@@ -371,8 +373,7 @@ class LawEngine:
                 f"Traditionalists demand the ancient decree '{decree['title']}' be upheld",
                 f"A movement forms to restore the sacred law '{decree['title']}'"
             ]
-            import random
-            return random.choice(events)
+            return rng.choice(events)
 
         return None
 
@@ -290,7 +290,8 @@ def generate_successor_candidates(game_state):
     Generate 3 potential successors with different trait combinations.
     Player will choose during succession event.
     """
-    import random
+    from engines.rng_service import get_rng
+    rng = get_rng(game_state).stream('succession')
 
     current_leader = game_state.civilization['leader']
     civ_name = game_state.civilization['meta']['name']
@@ -335,7 +336,7 @@ def generate_successor_candidates(game_state):
     ]
 
     # Select 3 random archetypes
-    selected = random.sample(archetypes, 3)
+    selected = rng.sample(archetypes, 3)
 
     # Name pools (simple for now)
     name_pool = [
@@ -347,14 +348,14 @@ def generate_successor_candidates(game_state):
 
     for archetype in selected:
         # Generate random name
-        name = random.choice([n for n in name_pool if n != current_leader.get('name')])
+        name = rng.choice([n for n in name_pool if n != current_leader.get('name')])
 
         # Random age in range
-        age = random.randint(*archetype['age_range'])
+        age = rng.randint(*archetype['age_range'])
 
         # Select 2-3 traits from archetype
-        trait_count = random.randint(2, 3)
-        traits = random.sample(archetype['traits'], trait_count)
+        trait_count = rng.randint(2, 3)
+        traits = rng.sample(archetype['traits'], trait_count)
 
         candidates.append({
             'name': name,
@@ -371,7 +372,8 @@ def trigger_succession_crisis(game_state):
     BALANCE_OVERHAUL: Generate high-stakes succession event with faction-backed candidates.
     This is a political crisis, not a menu choice.
     """
-    import random
+    from engines.rng_service import get_rng
+    rng = get_rng(game_state).stream('succession')
 
     print("=" * 60)
     print("SUCCESSION CRISIS: THE THRONE LIES EMPTY")
@@ -386,7 +388,7 @@ def trigger_succession_crisis(game_state):
     # Candidate 1: Merchant-backed (economic focus)
     merchant_faction = next((f for f in factions if 'merchant' in f.get('id', '').lower()), None)
     candidates.append({
-        'name': random.choice(['Aldric the Wealthy', 'Beatrix the Prosperous', 'Cedric the Trader']),
+        'name': rng.choice(['Aldric the Wealthy', 'Beatrix the Prosperous', 'Cedric the Trader']),
         'archetype': 'Merchant',
         'traits': ['Mercantile', 'Charismatic'],
         'backing_faction': merchant_faction.get('name') if merchant_faction else 'Merchant Guild',
@@ -402,7 +404,7 @@ def trigger_succession_crisis(game_state):
     # Candidate 2: Warrior-backed (military focus)
     warrior_faction = next((f for f in factions if 'warrior' in f.get('id', '').lower() or 'military' in f.get('id', '').lower()), None)
     candidates.append({
-        'name': random.choice(['Diana the Bold', 'Hector the Conqueror', 'Thora the Fierce']),
+        'name': rng.choice(['Diana the Bold', 'Hector the Conqueror', 'Thora the Fierce']),
         'archetype': 'Warrior',
         'traits': ['Warrior', 'Brave'],
         'backing_faction': warrior_faction.get('name') if warrior_faction else 'Warrior Caste',
@@ -418,7 +420,7 @@ def trigger_succession_crisis(game_state):
     # Candidate 3: Priest-backed (spiritual focus)
     priest_faction = next((f for f in factions if 'priest' in f.get('id', '').lower() or 'religious' in f.get('id', '').lower()), None)
     candidates.append({
-        'name': random.choice(['Elara the Devout', 'Silas the Blessed', 'Maya the Prophet']),
+        'name': rng.choice(['Elara the Devout', 'Silas the Blessed', 'Maya the Prophet']),
         'archetype': 'Priest',
         'traits': ['Pious', 'Visionary'],
         'backing_faction': priest_faction.get('name') if priest_faction else 'Priest Order',
@@ -434,7 +436,7 @@ def trigger_succession_crisis(game_state):
     # Candidate 4: People's candidate (if happiness low)
     if game_state.population_happiness < 50:
         candidates.append({
-            'name': random.choice(['Finn the Common', 'Kira the Voice', 'Orin the Just']),
+            'name': rng.choice(['Finn the Common', 'Kira the Voice', 'Orin the Just']),
             'archetype': 'Populist',
             'traits': ['Just', 'Charismatic'],
             'backing_faction': 'The Common People',
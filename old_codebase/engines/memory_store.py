@@ -0,0 +1,249 @@
+# engines/memory_store.py
+"""
+Advisor Memory Store
+
+Append-only long-term memory for Inner Circle characters.
+
+Every memory an advisor forms is kept (turn, text, importance) in an
+append-only JSON Lines file next to the other context files, while the
+character record in inner_circle.json only carries a small hot window of
+the latest memories. Prompts ask for memories through recall(), which picks
+the most relevant and important ones for the current situation within a
+token budget, instead of just the last few.
+
+New memories are buffered in memory and appended to disk on GameState.save(),
+so an unsaved turn never leaves memories behind. Likewise a reset for a new
+game only clears the file on the next save.
+"""
+
+import json
+import os
+import re
+
+from engines.history_index import BM25Index
+from engines.token_budget import estimate_tokens
+
+# Memories kept on the character record (hot window)
+HOT_MEMORY_WINDOW = 3
+
+# Keywords that mark a memory as significant (+2 importance each, capped)
+IMPORTANCE_KEYWORDS = [
+    'betray', 'death', 'died', 'killed', 'war', 'oath', 'swore', 'promise', 'decree',
+    'exile', 'rebellion', 'crisis', 'famine', 'plague', 'succession', 'humiliat',
+    'reward', 'honor', 'insult', 'threat', 'alliance', 'defeat', 'victory'
+]
+
+# Recall weights: relevance to the query, importance, recency
+RELEVANCE_WEIGHT = 0.5
+IMPORTANCE_WEIGHT = 0.35
+RECENCY_WEIGHT = 0.15
+
+# Turns over which recency decays to half
+RECENCY_HALF_LIFE = 20
+
+_TURN_PREFIX = re.compile(r"^Turn (\d+):\s*")
+
+
+def score_importance(memory_text, magnitude=0):
+    """
+    Score a memory from 1 (routine) to 10 (defining).
+
+    Args:
+        memory_text: Memory description
+        magnitude: Size of the metric change that came with it (e.g. |loyalty| + |opinion|)
+
+    Returns:
+        Integer importance 1-10
+    """
+    text = (memory_text or '').lower()
+    keyword_score = min(6, 2 * sum(1 for keyword in IMPORTANCE_KEYWORDS if keyword in text))
+    magnitude_score = min(3, int(abs(magnitude)) // 3)
+    return max(1, min(10, 1 + keyword_score + magnitude_score))
+
+
+def format_memory(memory):
+    """Render a stored memory the way character histories show them."""
+    return f"Turn {memory['turn']}: {memory['text']}"
+
+
+def parse_memory(entry):
+    """Parse a legacy 'Turn N: text' history string into (turn, text)."""
+    match = _TURN_PREFIX.match(entry or '')
+    if match:
+        return int(match.group(1)), entry[match.end():]
+    return 0, entry or ''
+
+
+class AdvisorMemoryStore:
+    """
+    Append-only per-character memory log with relevance retrieval.
+
+    Usage:
+        store = AdvisorMemoryStore('context/advisor_memories.jsonl')
+        store.add('Ramesses', 'The leader ignored my warning about the floods', turn=12)
+        store.recall('Ramesses', 'flood relief for the delta', max_tokens=120)
+        store.flush()   # on save
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self._memories = {}   # character name -> list of memory dicts (in turn order)
+        self._indexes = {}    # character name -> BM25Index over that character's memories
+        self._pending = []
+        # Set by reset(): the next flush rewrites the log instead of appending
+        self._truncate_on_flush = False
+        self._load()
+
+    def _load(self):
+        if not self.path or not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    self._remember(json.loads(line))
+                except json.JSONDecodeError:
+                    print(f"  ⚠️ Skipping unreadable memory record in {self.path}")
+
+    def _remember(self, memory):
+        memories = self._memories.setdefault(memory['character'], [])
+        memory_id = len(memories)
+        memories.append(memory)
+        index = self._indexes.setdefault(memory['character'], BM25Index())
+        index.add(memory_id, memory['text'], memory_id)
+
+    def add(self, character_name, memory_text, turn, importance=None):
+        """
+        Append a memory.
+
+        Args:
+            character_name: Character name
+            memory_text: Description of the memory
+            turn: Turn number the memory was formed on
+            importance: 1-10 (scored from the text if None)
+
+        Returns:
+            The stored memory dict
+        """
+        memory = {
+            'character': character_name,
+            'turn': turn,
+            'text': memory_text,
+            'importance': importance if importance is not None else score_importance(memory_text)
+        }
+        self._remember(memory)
+        self._pending.append(memory)
+        return memory
+
+    def get_all(self, character_name):
+        """All memories of a character, oldest first."""
+        return list(self._memories.get(character_name, []))
+
+    def seed_from_history(self, character):
+        """
+        Import a character's existing history list (older saves) if the store
+        has nothing for them yet.
+        """
+        name = character.get('name')
+        if not name or name in self._memories:
+            return
+        for entry in character.get('history', []):
+            turn, text = parse_memory(entry)
+            self.add(name, text, turn)
+
+    def recall(self, character_name, query, max_tokens, current_turn=None, exclude_latest=0):
+        """
+        Pick the memories that matter most for a prompt, within a token budget.
+
+        Memories are ranked by a mix of relevance to the query (BM25),
+        importance and recency, then returned oldest first.
+
+        Args:
+            character_name: Character name
+            query: Text describing the current situation
+            max_tokens: Token budget for the returned memories
+            current_turn: Current turn (defaults to the latest memory's turn)
+            exclude_latest: Skip this many newest memories (already shown elsewhere)
+
+        Returns:
+            List of 'Turn N: text' strings
+        """
+        memories = self._memories.get(character_name, [])
+        if exclude_latest:
+            memories = memories[:-exclude_latest]
+        if not memories:
+            return []
+
+        current_turn = current_turn if current_turn is not None else max(m['turn'] for m in memories)
+        hits = self._indexes[character_name].search(query, k=len(memories))
+        top_score = hits[0][0] if hits else 0
+        relevance = {memory_id: score / top_score for score, memory_id, _ in hits} if top_score else {}
+
+        def _score(memory_id):
+            memory = memories[memory_id]
+            age = max(0, current_turn - memory['turn'])
+            recency = 0.5 ** (age / RECENCY_HALF_LIFE)
+            return (RELEVANCE_WEIGHT * relevance.get(memory_id, 0)
+                    + IMPORTANCE_WEIGHT * memory['importance'] / 10
+                    + RECENCY_WEIGHT * recency)
+
+        chosen = []
+        used = 0
+        for memory_id in sorted(range(len(memories)), key=_score, reverse=True):
+            text = format_memory(memories[memory_id])
+            cost = estimate_tokens(text)
+            if used + cost > max_tokens:
+                continue
+            chosen.append(memory_id)
+            used += cost
+
+        return [format_memory(memories[memory_id]) for memory_id in sorted(chosen)]
+
+    def flush(self):
+        """
+        Append memories added since the last flush to the log file.
+
+        After a reset the log is rewritten from scratch instead, so the old
+        game's memories only disappear once the new game is saved.
+        """
+        if not self.path or not (self._pending or self._truncate_on_flush):
+            self._pending = []
+            return
+        with open(self.path, 'w' if self._truncate_on_flush else 'a', encoding='utf-8') as f:
+            for memory in self._pending:
+                f.write(json.dumps(memory, ensure_ascii=False) + "\n")
+        self._pending = []
+        self._truncate_on_flush = False
+
+    def reset(self):
+        """Forget everything (new game); the log file is truncated on the next flush."""
+        self._memories = {}
+        self._indexes = {}
+        self._pending = []
+        self._truncate_on_flush = True
+
+
+def recall_memories(game_state, character, query, max_tokens, fallback=HOT_MEMORY_WINDOW):
+    """
+    Memories of a character for a prompt.
+
+    Uses the game's memory store when there is one; otherwise (test doubles,
+    the leader, older callers) falls back to the last few history entries.
+
+    Args:
+        game_state: GameState
+        character: Character dict
+        query: Text describing the current situation
+        max_tokens: Token budget for the memories
+        fallback: Number of history entries used without a store
+
+    Returns:
+        List of 'Turn N: text' strings, oldest first
+    """
+    store = getattr(game_state, 'memory_store', None)
+    name = character.get('name')
+    if store is None or not store.get_all(name):
+        return character.get('history', [])[-fallback:]
+    return store.recall(name, query, max_tokens, current_turn=getattr(game_state, 'turn_number', None))
@@ -0,0 +1,197 @@
+# engines/prompt_budget.py
+"""
+Prompt Budget Module
+
+Per-template token budgets, enforced before a prompt is dispatched.
+
+Every template has a budget in PROMPT_BUDGETS (model_config.py; templates not
+listed use DEFAULT_PROMPT_BUDGET). render_prompt() fills a template, measures
+it with the local estimator from token_budget.py and, if it is over budget,
+shrinks the variable fields named by the caller from lowest to highest
+priority until it fits. The template text itself (instructions, output
+format) is never cut.
+
+Multi-line fields (lists, transcripts, tagged blocks) lose whole lines from
+the middle, so their opening/closing lines and most recent entries survive;
+single-line fields are truncated with an ellipsis.
+
+Every over-budget prompt is logged, trimmed or not, so a long game can never
+silently produce a pathological call.
+
+Every text-model prompt goes through render_prompt(); the only exceptions
+are listed in BUDGET_EXEMPT_PROMPTS.
+"""
+
+import threading
+
+from engines.token_budget import estimate_tokens, truncate_text
+from engines.prompt_loader import load_prompt
+
+# Smallest size a trimmed field is cut down to (estimated tokens)
+MIN_FIELD_TOKENS = 20
+
+# Templates deliberately filled without render_prompt(), and why
+BUDGET_EXEMPT_PROMPTS = {
+    'visuals/leader_portrait': "image model prompt; short descriptive fields only",
+    'visuals/advisor_portrait': "image model prompt; short descriptive fields only",
+    'visuals/crisis_illustration': "image model prompt; era and terrain only",
+    'visuals/settlement_evolution': "image model prompt; short descriptive fields only",
+    'trees/generate_tech_tree': "unused: engines/tree_generator.py is not imported anywhere",
+    'trees/generate_civics_tree': "unused: engines/tree_generator.py is not imported anywhere",
+    'image_engine (inline settlement prompt)': "image model prompt; short descriptive fields only",
+}
+
+
+def get_budget(template_path):
+    """Token budget for a prompt template."""
+    from model_config import PROMPT_BUDGETS, DEFAULT_PROMPT_BUDGET
+    return PROMPT_BUDGETS.get(template_path, DEFAULT_PROMPT_BUDGET)
+
+
+def shrink_text(text, max_tokens):
+    """
+    Shrink a prompt field to roughly max_tokens.
+
+    Multi-line text keeps lines alternately from the start and the end and
+    replaces the middle with an omission marker; single lines are truncated.
+
+    Args:
+        text: Field value (non-strings are converted with str())
+        max_tokens: Token allowance for the field
+
+    Returns:
+        The shrunk text
+    """
+    text = text if isinstance(text, str) else str(text)
+    if estimate_tokens(text) <= max_tokens:
+        return text
+
+    lines = text.split("\n")
+    if len(lines) < 3:
+        return truncate_text(text, max_tokens)
+
+    head, tail = [], []
+    used = estimate_tokens(f"(… {len(lines)} line(s) omitted …)")
+    low, high = 0, len(lines) - 1
+    take_head = True
+    while low <= high:
+        line = lines[low] if take_head else lines[high]
+        cost = estimate_tokens(line) + 1
+        if used + cost > max_tokens:
+            break
+        if take_head:
+            head.append(line)
+            low += 1
+        else:
+            tail.insert(0, line)
+            high -= 1
+        used += cost
+        take_head = not take_head
+
+    omitted = high - low + 1
+    if not head and not tail:
+        return truncate_text(text, max_tokens)
+    return "\n".join(head + [f"(… {omitted} line(s) omitted …)"] + tail)
+
+
+class PromptBudgetLog:
+    """Running record of budget violations per template."""
+
+    def __init__(self):
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def record(self, template_path, budget, tokens_before, tokens_after, trimmed):
+        with self._lock:
+            stats = self._stats.setdefault(template_path, {
+                'budget': budget, 'violations': 0, 'still_over': 0, 'largest': 0, 'trimmed_fields': {}
+            })
+            stats['budget'] = budget
+            stats['violations'] += 1
+            stats['largest'] = max(stats['largest'], tokens_before)
+            if tokens_after > budget:
+                stats['still_over'] += 1
+            for field in trimmed:
+                stats['trimmed_fields'][field] = stats['trimmed_fields'].get(field, 0) + 1
+
+    def get_stats(self):
+        """Copy of the per-template violation stats."""
+        with self._lock:
+            return {path: dict(stats, trimmed_fields=dict(stats['trimmed_fields']))
+                    for path, stats in self._stats.items()}
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+
+
+# Global budget log
+_prompt_budget_log = None
+
+
+def get_prompt_budget_log():
+    """Get the global prompt budget log."""
+    global _prompt_budget_log
+    if _prompt_budget_log is None:
+        _prompt_budget_log = PromptBudgetLog()
+    return _prompt_budget_log
+
+
+def fit_prompt(template_path, template, values, trim_order=(), budget=None):
+    """
+    Fill a template and shrink its fields until the prompt fits its budget.
+
+    Args:
+        template_path: Template name used for the budget lookup and logging
+        template: Template text with {variables}
+        values: Dict of template variables
+        trim_order: Field names from lowest to highest priority.
+            Fields not listed are never trimmed.
+        budget: Token budget (defaults to the template's configured budget)
+
+    Returns:
+        Tuple (prompt, estimated_tokens, trimmed_fields)
+    """
+    budget = budget if budget is not None else get_budget(template_path)
+    values = dict(values)
+    prompt = template.format(**values)
+    tokens = tokens_before = estimate_tokens(prompt)
+    if tokens <= budget:
+        return prompt, tokens, []
+
+    trimmed = []
+    for field in trim_order:
+        if tokens <= budget:
+            break
+        current = estimate_tokens(str(values.get(field, '')))
+        if current <= MIN_FIELD_TOKENS:
+            continue
+        values[field] = shrink_text(values[field], max(MIN_FIELD_TOKENS, current - (tokens - budget)))
+        trimmed.append(field)
+        prompt = template.format(**values)
+        tokens = estimate_tokens(prompt)
+
+    get_prompt_budget_log().record(template_path, budget, tokens_before, tokens, trimmed)
+    if tokens > budget:
+        print(f"  ⚠️ Prompt '{template_path}' over budget: ~{tokens} tokens (budget {budget}) "
+              f"after trimming {', '.join(trimmed) or 'nothing'}")
+    else:
+        print(f"  ✂️ Prompt '{template_path}' trimmed from ~{tokens_before} to ~{tokens} tokens "
+              f"(budget {budget}): {', '.join(trimmed)}")
+    return prompt, tokens, trimmed
+
+
+def render_prompt(template_path, trim_order=(), budget=None, **values):
+    """
+    Load a prompt template, fill it and enforce its token budget.
+
+    Example:
+        prompt = render_prompt('events/generate_event_stage_regular',
+                               trim_order=['conversation_history', 'event_narrative'],
+                               event_title=title, ...)
+
+    Returns:
+        The prompt text, within budget unless the untrimmable parts exceed it
+    """
+    prompt, _, _ = fit_prompt(template_path, load_prompt(template_path), values, trim_order, budget)
+    return prompt
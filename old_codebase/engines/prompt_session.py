@@ -0,0 +1,226 @@
+# engines/prompt_session.py
+"""
+Prompt Session Module
+
+Optional session mode for recurring engines (world turns, council meetings).
+
+Instead of re-sending the whole projected world every turn, each game keeps a
+rolling chat session per engine:
+- the first message seeds the session with the full canonical state and the
+  instructions for the request kind
+- later messages carry only the state delta since the previous turn (plus any
+  per-turn input such as a council conversation), and refer back to
+  instructions already given
+- the session is re-seeded when its transcript exceeds a size budget, when
+  a delta would not be smaller than the full state, or when the game moves
+  backwards (new game, reload)
+
+Enable with PROMPT_SESSION_MODE in model_config.py.
+"""
+
+import json
+import threading
+
+from engines.token_budget import estimate_tokens
+from engines.state_encoding import with_state_legend
+
+# Marker for keys removed since the previous turn
+REMOVED = None
+
+
+def _keyed(value):
+    """Lists of named dicts are diffed by name; anything else is compared whole."""
+    if isinstance(value, list) and value and all(isinstance(v, dict) and 'name' in v for v in value):
+        return {v['name']: v for v in value}
+    return value
+
+
+def state_delta(previous, current):
+    """
+    Compute the changes between two canonical state dicts.
+
+    Nested dicts (and lists of named dicts, keyed by name) are compared
+    recursively; other values are replaced whole. Removed keys map to None.
+
+    Args:
+        previous: State sent on the previous turn
+        current: State for this turn
+
+    Returns:
+        Dict with only the changed keys (empty if nothing changed)
+    """
+    delta = {}
+    for key in set(previous) | set(current):
+        if key not in current:
+            delta[key] = REMOVED
+            continue
+        old, new = _keyed(previous.get(key)), _keyed(current[key])
+        if key in previous and old == new:
+            continue
+        if isinstance(old, dict) and isinstance(new, dict):
+            delta[key] = state_delta(old, new)
+        else:
+            delta[key] = current[key]
+    return delta
+
+
+def _encode(data):
+    return json.dumps(data, sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+class PromptSession:
+    """
+    A rolling chat session for one engine of one game.
+
+    Usage:
+        session = PromptSession('world_turns', max_tokens=12000)
+        text = session.send(turn, context_json, instructions, kind='standard')
+    """
+
+    def __init__(self, engine, max_tokens):
+        self.engine = engine
+        self.max_tokens = max_tokens
+        self.chat = None
+        self.last_state = None
+        self.last_turn = None
+        self.instructions_sent = set()
+        self.transcript_tokens = 0
+        self.seeds = 0
+
+    def needs_reseed(self, turn):
+        """True if the next message must carry the full state."""
+        if self.chat is None or self.last_state is None:
+            return True
+        if self.last_turn is not None and turn is not None and turn < self.last_turn:
+            return True
+        return self.transcript_tokens > self.max_tokens
+
+    def build_message(self, turn, context_json, instructions, kind, turn_input=''):
+        """
+        Build the message for this turn (full seed or delta).
+
+        Args:
+            turn: Current turn number (a lower number than last time forces a reseed)
+            context_json: Canonical encoded state for this turn
+            instructions: Static instructions for this request kind
+            kind: Name of the request kind (instructions are sent once per kind)
+            turn_input: Per-turn text that is always sent (e.g. a conversation)
+
+        Returns:
+            Tuple (message, is_seed)
+        """
+        state = json.loads(context_json)
+        parts = []
+        is_seed = self.needs_reseed(turn)
+
+        if not is_seed:
+            delta_json = _encode(state_delta(self.last_state, state))
+            if estimate_tokens(delta_json) >= estimate_tokens(context_json):
+                is_seed = True
+            else:
+                parts.append(
+                    "STATE CHANGES since the previous turn (omitted keys unchanged, null = removed):\n"
+                    + delta_json
+                )
+
+        if is_seed:
+            self.instructions_sent = set()
+            parts.append(f"CURRENT STATE:\n{context_json}")
+
+        if turn_input:
+            parts.append(turn_input)
+
+        if kind in self.instructions_sent:
+            parts.append(f"Follow the same {kind} instructions and respond with the same JSON structure as before.")
+        else:
+            parts.append(instructions)
+
+        message = "\n\n".join(parts)
+        if is_seed:
+            message = with_state_legend(message)
+        return message, is_seed
+
+    def start_chat(self, model_name=None):
+        """Open a fresh chat with the model (empty history)."""
+        import google.generativeai as genai
+        from model_config import TEXT_MODEL
+        return genai.GenerativeModel(model_name or TEXT_MODEL).start_chat(history=[])
+
+    def send(self, turn, context_json, instructions, kind, turn_input='', generation_config=None, model_name=None):
+        """
+        Send this turn's message on the session and return the reply text.
+
+        The session is dropped on API errors so the next turn re-seeds.
+
+        Returns:
+            Response text from the model
+        """
+        message, is_seed = self.build_message(turn, context_json, instructions, kind, turn_input)
+        if is_seed:
+            self.chat = self.start_chat(model_name)
+            self.transcript_tokens = 0
+            self.seeds += 1
+            print(f"  🧵 {self.engine} session seeded with full state (~{estimate_tokens(message)} tokens)")
+        else:
+            print(f"  🧵 {self.engine} session delta (~{estimate_tokens(message)} tokens)")
+
+        try:
+            response = self.chat.send_message(message, generation_config=generation_config)
+        except Exception:
+            self.chat = None
+            self.last_state = None
+            raise
+
+        self.last_state = json.loads(context_json)
+        self.last_turn = turn
+        self.instructions_sent.add(kind)
+        self.transcript_tokens += estimate_tokens(message) + estimate_tokens(response.text)
+        return response.text
+
+
+class PromptSessions:
+    """Per-game, per-engine registry of prompt sessions."""
+
+    def __init__(self):
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def get(self, game_id, engine, max_tokens):
+        """Get (or create) the session for a game's engine."""
+        with self._lock:
+            key = (game_id, engine)
+            if key not in self._sessions:
+                self._sessions[key] = PromptSession(engine, max_tokens)
+            return self._sessions[key]
+
+    def end(self, game_id):
+        """Drop all sessions of a game (new game, custom world)."""
+        with self._lock:
+            for key in [k for k in self._sessions if k[0] == game_id]:
+                del self._sessions[key]
+
+
+# Global session registry
+_prompt_sessions = None
+
+
+def get_prompt_sessions():
+    """Get the global prompt session registry."""
+    global _prompt_sessions
+    if _prompt_sessions is None:
+        _prompt_sessions = PromptSessions()
+    return _prompt_sessions
+
+
+def session_for(game_state, engine):
+    """
+    Get the prompt session for an engine if session mode is enabled.
+
+    Returns:
+        PromptSession, or None when PROMPT_SESSION_MODE is off
+    """
+    from model_config import PROMPT_SESSION_MODE, PROMPT_SESSION_MAX_TOKENS
+    if not PROMPT_SESSION_MODE:
+        return None
+    from engines.request_coalescer import game_key
+    return get_prompt_sessions().get(game_key(game_state), engine, PROMPT_SESSION_MAX_TOKENS)
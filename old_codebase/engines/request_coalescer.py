@@ -0,0 +1,110 @@
+# engines/request_coalescer.py
+"""
+Request Coalescer Module
+
+Single-flight coalescing for expensive AI-backed requests.
+
+When several identical requests arrive while one is already being generated
+(double clicks, client retries after a slow response, multiple open tabs),
+only the first one calls the model. The others wait for that in-flight call
+and receive exactly the same result, so duplicate model spend disappears and
+game.current_event is only written once.
+"""
+
+import threading
+
+
+class _InFlightCall:
+    """A single in-progress call that duplicate requests can attach to."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share the same key.
+
+    Usage:
+        coalescer = SingleFlight()
+        result, shared = coalescer.do(('event', game_id, turn), lambda: generate_event(game))
+
+    Only calls that overlap in time are coalesced. Once the leading call has
+    finished, the key is released and the next request starts a fresh call.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = {}
+
+    def do(self, key, func):
+        """
+        Run func once for all concurrent callers using the same key.
+
+        Args:
+            key: Hashable key identifying the logical operation
+            func: Zero-argument callable performing the work
+
+        Returns:
+            Tuple (result, shared) - shared is True when this caller attached
+            to a call that was already in flight
+
+        Raises:
+            Whatever func raised, re-raised in every attached caller
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is not None:
+                call.waiters += 1
+                is_leader = False
+            else:
+                call = _InFlightCall()
+                self._calls[key] = call
+                is_leader = True
+
+        if is_leader:
+            try:
+                call.result = func()
+            except BaseException as e:
+                call.error = e
+            finally:
+                with self._lock:
+                    self._calls.pop(key, None)
+                call.done.set()
+
+            if call.waiters:
+                print(f"  🔗 Coalesced {call.waiters} duplicate request(s) for {key[0] if isinstance(key, tuple) else key}")
+        else:
+            call.done.wait()
+
+        if call.error is not None:
+            raise call.error
+
+        return call.result, not is_leader
+
+    def in_flight(self):
+        """Return the keys currently being generated. Useful for debugging."""
+        with self._lock:
+            return list(self._calls.keys())
+
+
+# Global coalescer instance shared by all API routes
+_coalescer = SingleFlight()
+
+
+def get_coalescer():
+    """Get the global request coalescer."""
+    return _coalescer
+
+
+def game_key(game_state):
+    """
+    Identify a game for coalescing purposes.
+
+    Games are keyed by their context directory, so two GameState objects
+    pointing at the same save are treated as the same game.
+    """
+    return getattr(game_state, 'context_dir', None) or id(game_state)
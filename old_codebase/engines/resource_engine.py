@@ -4,6 +4,75 @@ Resource management and consumption mechanics.
 Handles food/wealth depletion, crisis detection, and resource constraints.
 """
 
+# Era affects efficiency (better eras consume less per capita due to tech)
+# Stone age is harsh subsistence living, players should want to advance
+ERA_FOOD_EFFICIENCY = {
+    'stone_age': 2.0,      # CHANGED: Restored harsh inefficiency (was 1.8)
+    'bronze_age': 1.7,     # CHANGED: Still inefficient (was 1.5)
+    'iron_age': 1.4,       # CHANGED: Improving (was 1.3)
+    'classical': 1.2,      # CHANGED: Getting better (was 1.1)
+    'medieval': 1.0,       # CHANGED: Efficient (was 1.0)
+    'renaissance': 0.9,    # CHANGED: Advanced techniques (was 0.9)
+    'industrial': 0.8,     # CHANGED: Mechanization (was 0.8)
+    'modern': 0.7         # CHANGED: High-tech (was 0.7)
+}
+
+# Food production from population (farmers)
+# Stone age is subsistence society - higher farmer percentage
+FARMER_PERCENTAGE = {
+    'stone_age': 0.45,      # 45% farmers (subsistence)
+    'bronze_age': 0.40,     # 40% farmers
+    'iron_age': 0.35,       # 35% farmers
+    'classical': 0.30,      # 30% farmers
+    'medieval': 0.30,
+    'renaissance': 0.25,
+    'industrial': 0.20,
+    'modern': 0.15
+}
+
+# Era affects productivity (rebalanced for stone age)
+ERA_PRODUCTIVITY = {
+    'stone_age': 1.5,       # Increased from 1 to 1.5 for survivability
+    'bronze_age': 2,
+    'iron_age': 3,
+    'classical': 4,
+    'medieval': 5,
+    'renaissance': 7,
+    'industrial': 10,
+    'modern': 15
+}
+
+# Wealth production from trade/economy (share of population trading)
+TRADER_PERCENTAGE = {
+    'stone_age': 0.25,      # Increased from 0.20 for better wealth generation
+    'bronze_age': 0.25,
+    'iron_age': 0.30,
+    'classical': 0.35,
+    'medieval': 0.35,
+    'renaissance': 0.40,
+    'industrial': 0.45,
+    'modern': 0.50
+}
+
+# Happiness productivity bands (minimum happiness, multiplier), highest first;
+# below the last band productivity is halved
+HAPPINESS_PRODUCTIVITY = [
+    (80, 1.15),  # Thriving: +15% productivity
+    (60, 1.0),   # Content: normal productivity
+    (40, 0.85),  # Discontent: -15% productivity
+    (20, 0.65),  # Unrest: -35% productivity
+]
+REBELLION_PRODUCTIVITY = 0.5  # Rebellion: -50% productivity
+
+
+def happiness_productivity_multiplier(happiness):
+    """Productivity multiplier for a happiness level (0-100)."""
+    for minimum, multiplier in HAPPINESS_PRODUCTIVITY:
+        if happiness >= minimum:
+            return multiplier
+    return REBELLION_PRODUCTIVITY
+
+
 def calculate_consumption(game_state):
     """
     Calculate per-turn resource consumption based on population and infrastructure.
@@ -21,20 +90,7 @@ def calculate_consumption(game_state):
     # Base food consumption: 1 food per 4 people (was 1 per 10)
     base_food_consumption = population // 4  # CHANGED: 2.5x increase
 
-    # Era affects efficiency (better eras consume less per capita due to tech)
-    # Stone age is harsh subsistence living, players should want to advance
-    era_efficiency = {
-        'stone_age': 2.0,      # CHANGED: Restored harsh inefficiency (was 1.8)
-        'bronze_age': 1.7,     # CHANGED: Still inefficient (was 1.5)
-        'iron_age': 1.4,       # CHANGED: Improving (was 1.3)
-        'classical': 1.2,      # CHANGED: Getting better (was 1.1)
-        'medieval': 1.0,       # CHANGED: Efficient (was 1.0)
-        'renaissance': 0.9,    # CHANGED: Advanced techniques (was 0.9)
-        'industrial': 0.8,     # CHANGED: Mechanization (was 0.8)
-        'modern': 0.7         # CHANGED: High-tech (was 0.7)
-    }
-
-    efficiency_multiplier = era_efficiency.get(era, 1.0)
+    efficiency_multiplier = ERA_FOOD_EFFICIENCY.get(era, 1.0)
 
     # Infrastructure scaling: more buildings = larger urban population = more consumption
     infrastructure_count = len(game_state.technology.get('infrastructure', []))
@@ -216,46 +272,13 @@ def generate_resource_production(game_state):
     era = game_state.civilization.get('meta', {}).get('era', 'stone_age')
 
     # Food production from population (farmers)
-    # Stone age is subsistence society - higher farmer percentage
-    farmer_percentage = {
-        'stone_age': 0.45,      # 45% farmers (subsistence)
-        'bronze_age': 0.40,     # 40% farmers
-        'iron_age': 0.35,       # 35% farmers
-        'classical': 0.30,      # 30% farmers
-        'medieval': 0.30,
-        'renaissance': 0.25,
-        'industrial': 0.20,
-        'modern': 0.15
-    }
-    farmers = int(population * farmer_percentage.get(era, 0.3))
-
-    # Era affects productivity (rebalanced for stone age)
-    era_productivity = {
-        'stone_age': 1.5,       # Increased from 1 to 1.5 for survivability
-        'bronze_age': 2,
-        'iron_age': 3,
-        'classical': 4,
-        'medieval': 5,
-        'renaissance': 7,
-        'industrial': 10,
-        'modern': 15
-    }
+    farmers = int(population * FARMER_PERCENTAGE.get(era, 0.3))
 
-    food_production = int(farmers * era_productivity.get(era, 1))
-
-    # Wealth production from trade/economy (remaining population)
-    trader_percentage = {
-        'stone_age': 0.25,      # Increased from 0.20 for better wealth generation
-        'bronze_age': 0.25,
-        'iron_age': 0.30,
-        'classical': 0.35,
-        'medieval': 0.35,
-        'renaissance': 0.40,
-        'industrial': 0.45,
-        'modern': 0.50
-    }
-    traders = int(population * trader_percentage.get(era, 0.2))
-    wealth_production = traders * era_productivity.get(era, 1) // 2
+    food_production = int(farmers * ERA_PRODUCTIVITY.get(era, 1))
+
+    # Wealth production from trade/economy
+    traders = int(population * TRADER_PERCENTAGE.get(era, 0.2))
+    wealth_production = traders * ERA_PRODUCTIVITY.get(era, 1) // 2
 
     return {
         'food': food_production,
@@ -274,17 +297,7 @@ def apply_passive_generation(game_state):
     # BALANCE_OVERHAUL: Apply happiness productivity penalty
     # Low happiness mechanically hurts economy, not just narrative flavor
     # Updated thresholds and multipliers (2025-01 balance changes)
-    happiness = game_state.population_happiness
-    if happiness >= 80:
-        happiness_multiplier = 1.15  # Thriving: +15% productivity
-    elif happiness >= 60:
-        happiness_multiplier = 1.0   # Content: normal productivity
-    elif happiness >= 40:
-        happiness_multiplier = 0.85  # Discontent: -15% productivity
-    elif happiness >= 20:
-        happiness_multiplier = 0.65  # Unrest: -35% productivity
-    else:
-        happiness_multiplier = 0.5   # Rebellion: -50% productivity
+    happiness_multiplier = happiness_productivity_multiplier(game_state.population_happiness)
 
     effectiveness = effectiveness * happiness_multiplier
 
@@ -292,21 +305,19 @@ def apply_passive_generation(game_state):
     final_food = int(production['food'] * effectiveness)
     final_wealth = int(production['wealth'] * effectiveness)
 
-    # BALANCE_OVERHAUL: Apply faction approval bonuses/penalties
-    if hasattr(game_state, 'faction_manager'):
-        faction_bonuses = game_state.faction_manager.get_faction_bonuses(game_state)
-        final_wealth = int(final_wealth * faction_bonuses['wealth_multiplier'])
-
-    # BONUS_ENGINE_INTEGRATION: Add bonuses from characters, buildings, etc.
+    # BONUS_ENGINE_INTEGRATION: Faction effects and bonuses from characters,
+    # buildings, etc. all come from the cached bonus ledger
     from engines.bonus_engine import BonusEngine
     from engines.bonus_definitions import BonusType
 
-    bonus_engine = BonusEngine()
-    food_bonuses = bonus_engine.calculate_bonuses(game_state, BonusType.FOOD_PER_TURN)
-    wealth_bonuses = bonus_engine.calculate_bonuses(game_state, BonusType.WEALTH_PER_TURN)
+    ledger = BonusEngine().get_ledger(game_state)
+
+    # BALANCE_OVERHAUL: Apply faction approval bonuses/penalties
+    if hasattr(game_state, 'faction_manager'):
+        final_wealth = int(final_wealth * ledger['faction_bonuses']['wealth_multiplier'])
 
-    final_food += food_bonuses['total']
-    final_wealth += wealth_bonuses['total']
+    final_food += ledger['bonuses'][BonusType.FOOD_PER_TURN]['total']
+    final_wealth += ledger['bonuses'][BonusType.WEALTH_PER_TURN]['total']
 
     game_state.civilization['resources']['food'] += final_food
     game_state.civilization['resources']['wealth'] += final_wealth
@@ -0,0 +1,137 @@
+# engines/rng_service.py
+"""
+RNG Service Module
+
+Every game owns a GameRNG: one seed and a set of named sub-streams
+(random.Random instances), each seeded from the game seed and its own name.
+Game systems draw from their own stream instead of the global `random`
+module, so:
+
+- The same seed and the same inputs replay a game draw for draw
+- Streams are independent: an extra crisis roll doesn't shift succession
+  candidates or law events
+- The seed and every stream's position are saved in game_metadata.json and
+  restored on load, so a reloaded (or copied) save continues the same sequence
+
+Streams:
+    worldgen    World generation and new-game randomization
+    crisis      Crisis cascades and crisis event triggers
+    callbacks   Consequence callbacks (broken promises, revenge, ...)
+    succession  Successor candidates and succession crises
+    laws        Decree resistance/support events
+    buildings   Building event choices
+
+Usage:
+    rng = get_rng(game_state).stream('crisis')
+    if rng.random() < 0.4: ...
+"""
+
+import base64
+import hashlib
+import random
+import secrets
+import struct
+import threading
+
+RNG_STREAMS = ('worldgen', 'crisis', 'callbacks', 'succession', 'laws', 'buildings')
+
+
+def _stream_seed(seed, name):
+    """Stable 64-bit seed for a named stream (independent of PYTHONHASHSEED)."""
+    digest = hashlib.sha256(f"{seed}:{name}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def _encode_state(state):
+    """random.Random state as a compact JSON-safe dict."""
+    version, internal, gauss_next = state
+    packed = struct.pack(f'<{len(internal)}I', *internal)
+    return {'version': version, 'state': base64.b64encode(packed).decode('ascii'), 'gauss_next': gauss_next}
+
+
+def _decode_state(data):
+    packed = base64.b64decode(data['state'])
+    internal = struct.unpack(f'<{len(packed) // 4}I', packed)
+    return (data['version'], internal, data.get('gauss_next'))
+
+
+class GameRNG:
+    """A game's seed and its named random streams."""
+
+    def __init__(self, seed=None):
+        """
+        Args:
+            seed: Integer game seed (None = pick a fresh random seed)
+        """
+        self.seed = int(seed) if seed is not None else secrets.randbits(32)
+        self._streams = {}
+        self._lock = threading.Lock()
+
+    def stream(self, name):
+        """
+        Get a named stream, creating it from the game seed on first use.
+
+        Args:
+            name: One of RNG_STREAMS
+
+        Returns:
+            random.Random for the stream
+
+        Raises:
+            ValueError: Unknown stream name
+        """
+        if name not in RNG_STREAMS:
+            raise ValueError(f"Unknown RNG stream '{name}' (expected one of {', '.join(RNG_STREAMS)})")
+        with self._lock:
+            rng = self._streams.get(name)
+            if rng is None:
+                rng = random.Random(_stream_seed(self.seed, name))
+                self._streams[name] = rng
+            return rng
+
+    def to_dict(self):
+        """Seed and the position of every stream used so far (for game_metadata.json)."""
+        with self._lock:
+            return {
+                'seed': self.seed,
+                'streams': {name: _encode_state(rng.getstate()) for name, rng in self._streams.items()}
+            }
+
+    @classmethod
+    def from_dict(cls, data):
+        """Restore a GameRNG saved by to_dict(); unused streams start fresh from the seed."""
+        rng = cls(data.get('seed'))
+        for name, state in data.get('streams', {}).items():
+            if name in RNG_STREAMS:
+                rng.stream(name).setstate(_decode_state(state))
+        return rng
+
+
+# Fallback RNG for callers without a game state
+_default_rng = None
+
+
+def get_rng(game_state=None):
+    """
+    Get the GameRNG for a game state.
+
+    Game states loaded from a save carry their own (game_state.rng). Other
+    objects get one attached on first use; without a game state a shared,
+    randomly seeded fallback is returned.
+
+    Args:
+        game_state: GameState (or None)
+
+    Returns:
+        GameRNG instance
+    """
+    global _default_rng
+    rng = getattr(game_state, 'rng', None)
+    if rng is not None:
+        return rng
+    if game_state is not None:
+        game_state.rng = GameRNG()
+        return game_state.rng
+    if _default_rng is None:
+        _default_rng = GameRNG()
+    return _default_rng
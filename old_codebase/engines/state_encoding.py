@@ -0,0 +1,143 @@
+# engines/state_encoding.py
+"""
+Canonical compact encoding of game state for prompt embedding.
+
+Every engine that sends structured state to the model encodes it here so the
+format is identical everywhere:
+- stable key ordering (sorted) and no whitespace
+- abbreviated key names, explained once by STATE_LEGEND in the static prompt prefix
+- long lists elided to their last N items with a leading "…+K" marker
+  (or, for lists the caller sorted most-important-first, to their first N
+  items with a trailing marker)
+- floats rounded where extra precision carries no meaning
+- keys that mean nothing to the model (portrait filenames) dropped
+
+Use with_state_legend(prompt) to put the legend at the start of a prompt.
+"""
+
+import json
+
+# Long key -> abbreviation. Only keys that recur in prompts are worth shortening.
+KEY_ABBREVIATIONS = {
+    'civilization': 'civ',
+    'population': 'pop',
+    'resources': 'res',
+    'happiness': 'hap',
+    'approval': 'appr',
+    'support_percentage': 'sup',
+    'relationship': 'rel',
+    'influence': 'inf',
+    'loyalty': 'loy',
+    'metrics': 'm',
+    'memories': 'mem',
+    'history': 'hist',
+    'personality_traits': 'traits',
+    'faction_link': 'fac',
+    'factions': 'facs',
+    'advisors': 'advs',
+    'neighbors': 'nbrs',
+    'description': 'desc',
+    'discoveries': 'disc',
+    'infrastructure': 'infra',
+    'life_expectancy': 'life_exp',
+    'years_ruled': 'ruled',
+    'victory_progress': 'vict',
+    'active_policy': 'policy',
+    'recent_history': 'recent',
+    'narrative': 'narr',
+    'dialogue_sample': 'voice',
+}
+
+# Keys dropped from encoded state (no meaning to the model)
+DROPPED_KEYS = {'portrait', 'portrait_generated'}
+
+# Default number of trailing items kept per list
+DEFAULT_LIST_LIMIT = 10
+
+STATE_LEGEND = (
+    "STATE ENCODING: game state below is compact JSON with abbreviated keys: "
+    + ", ".join(f"{short}={long}" for long, short in sorted(KEY_ABBREVIATIONS.items(), key=lambda kv: kv[1]))
+    + ". A leading \"…+N\" list item means N older items were omitted;"
+    " a trailing one means N less important items were omitted."
+)
+
+
+def _round_number(value):
+    """Round floats to the precision that matters for narrative prompts."""
+    if isinstance(value, bool) or not isinstance(value, float):
+        return value
+    if abs(value) >= 100:
+        return int(round(value))
+    if abs(value) >= 10:
+        return round(value, 1)
+    return round(value, 2)
+
+
+def canonicalize(data, list_limit=DEFAULT_LIST_LIMIT, list_limits=None, keep_head=()):
+    """
+    Convert data into its canonical compact form (before JSON encoding).
+
+    Args:
+        data: Any JSON-compatible value
+        list_limit: Default number of trailing items kept in each list
+        list_limits: Optional dict of original key name -> list limit overrides
+        keep_head: Original key names whose lists are sorted most-important-first;
+            these keep their first items instead of their last
+
+    Returns:
+        Canonical value with abbreviated keys, elided lists and rounded numbers
+    """
+    list_limits = list_limits or {}
+
+    def _convert(value, limit, head=False):
+        if isinstance(value, dict):
+            result = {}
+            for key, item in value.items():
+                if key in DROPPED_KEYS:
+                    continue
+                result[KEY_ABBREVIATIONS.get(key, key)] = _convert(
+                    item, list_limits.get(key, list_limit), key in keep_head)
+            return result
+        if isinstance(value, (list, tuple)):
+            items = list(value)
+            omitted = len(items) - limit if limit is not None else 0
+            if omitted > 0:
+                items = (items[:limit] if head else items[-limit:]) if limit else []
+            converted = [_convert(item, list_limit) for item in items]
+            if omitted > 0:
+                marker = f"…+{omitted}"
+                if head:
+                    converted.append(marker)
+                else:
+                    converted.insert(0, marker)
+            return converted
+        return _round_number(value)
+
+    return _convert(data, list_limit)
+
+
+def encode_state(data, list_limit=DEFAULT_LIST_LIMIT, list_limits=None, keep_head=()):
+    """
+    Encode state for embedding in a prompt.
+
+    Args:
+        data: Any JSON-compatible value (dict projections, to_dict() output)
+        list_limit: Default number of trailing items kept in each list
+        list_limits: Optional dict of original key name -> list limit overrides
+        keep_head: Original key names whose lists are sorted most-important-first
+
+    Returns:
+        Compact JSON string with sorted keys and no whitespace
+    """
+    return json.dumps(
+        canonicalize(data, list_limit, list_limits, keep_head),
+        sort_keys=True,
+        separators=(',', ':'),
+        ensure_ascii=False,
+        default=str
+    )
+
+
+def with_state_legend(prompt):
+    """Prefix a prompt with the encoding legend (static, so it caches as a prefix)."""
+    return f"{STATE_LEGEND}\n\n{prompt}"
@@ -10,6 +10,7 @@ Refactored from event_engine.py for better maintainability and separation of con
 
 import re
 from engines.state_validator import validate_updates
+from engines.memory_store import score_importance
 
 def calculate_life_expectancy(era):
     """Calculate realistic life expectancy based on civilization era."""
@@ -25,7 +26,7 @@ def calculate_life_expectancy(era):
     }
     return era_life_expectancy.get(era.lower(), 50)
 
-def apply_updates(game_state, updates, is_timeskip=False):
+def apply_updates(game_state, updates, is_timeskip=False, visual_updates=True):
     """
     Robustly applies updates from the AI to the game state using dot notation,
     including list indices and a custom '.append' syntax.
@@ -36,6 +37,8 @@ def apply_updates(game_state, updates, is_timeskip=False):
         updates: Dictionary of updates to apply
         is_timeskip: If True, numeric values are treated as absolute replacements,
                      not incremental changes. Also allows list replacements.
+        visual_updates: If False, never trigger background image generation
+                        (headless simulation)
     """
     mode = "Timeskip" if is_timeskip else "Turn"
     print(f"--- Applying AI {mode} Updates ---")
@@ -163,7 +166,7 @@ def apply_updates(game_state, updates, is_timeskip=False):
 
     # Check if settlement image should be updated (after all updates applied)
     from engines.image_update_manager import should_update_settlement_image
-    should_update, reason = should_update_settlement_image(game_state)
+    should_update, reason = should_update_settlement_image(game_state) if visual_updates else (False, None)
     if should_update:
         print(f"  🎨 Updating settlement image: {reason}")
         # Trigger background settlement update
@@ -172,6 +175,8 @@ def apply_updates(game_state, updates, is_timeskip=False):
 
     # Prune lists to prevent infinite growth
     prune_cultural_lists(game_state)
+    if hasattr(game_state, 'bump_version'):
+        game_state.bump_version()
     print("------------------------------------")
 
 def prune_cultural_lists(game_state):
@@ -260,7 +265,8 @@ def apply_world_turn_updates(game_state, world_updates):
                         mem_success = game_state.inner_circle_manager.add_memory(
                             char_name,
                             update['memory'],
-                            game_state.turn_number
+                            game_state.turn_number,
+                            importance=score_importance(update['memory'], abs(loyalty_change) + abs(opinion_change))
                         )
                         if mem_success:
                             print(f"  📝 Added memory for '{char_name}': {update['memory']}")
@@ -314,3 +320,5 @@ def apply_world_turn_updates(game_state, world_updates):
                     else:
                         print(f"  - Warning: Civilization '{civ_name}' not found in known_peoples")
 
+    if hasattr(game_state, 'bump_version'):
+        game_state.bump_version()
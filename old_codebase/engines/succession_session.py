@@ -0,0 +1,120 @@
+# engines/succession_session.py
+"""
+Succession Session Module
+
+Keeps the succession crisis generated by /api/die (candidates, their rendered
+portraits and crisis parameters) so /api/choose_successor resolves the
+player's choice against exactly what was shown, instead of re-rolling new
+candidates and painting the new leader a second time.
+
+Sessions are stored per game and expire after a bounded window.
+"""
+
+import threading
+import time
+
+# How long a succession stays open for the player's choice (seconds)
+DEFAULT_TTL_SECONDS = 30 * 60
+
+
+class SuccessionSessions:
+    """
+    Per-game store of open succession crises.
+
+    Usage:
+        sessions = SuccessionSessions()
+        sessions.start(game_id, succession_data)
+        chosen, succession_data = sessions.resolve(game_id, {'successor_index': 1})
+    """
+
+    def __init__(self, ttl_seconds=DEFAULT_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._sessions = {}
+        self._lock = threading.Lock()
+
+    def start(self, game_id, succession_data):
+        """
+        Open (or replace) the succession session for a game.
+
+        Args:
+            game_id: Game identifier (see request_coalescer.game_key)
+            succession_data: Result of trigger_succession_crisis with candidate portraits filled in
+        """
+        with self._lock:
+            self._sessions[game_id] = {
+                'succession_data': succession_data,
+                'started_at': time.monotonic()
+            }
+
+    def get(self, game_id):
+        """
+        Get the open succession for a game.
+
+        Returns:
+            succession_data dict, or None if no session or it expired
+        """
+        with self._lock:
+            session = self._sessions.get(game_id)
+            if session is None:
+                return None
+            if time.monotonic() - session['started_at'] > self.ttl_seconds:
+                del self._sessions[game_id]
+                return None
+            return session['succession_data']
+
+    def resolve(self, game_id, selection):
+        """
+        Resolve the player's choice against the stored candidates.
+
+        Args:
+            game_id: Game identifier
+            selection: Request data with 'successor_index' or a 'successor' dict/name
+
+        Returns:
+            Tuple (chosen_candidate, succession_data), or (None, succession_data)
+            if the choice does not match a candidate. succession_data is None
+            when there is no open session.
+        """
+        succession_data = self.get(game_id)
+        if succession_data is None:
+            return None, None
+        return find_candidate(succession_data.get('candidates', []), selection), succession_data
+
+    def end(self, game_id):
+        """Close the succession session for a game once a successor is crowned."""
+        with self._lock:
+            self._sessions.pop(game_id, None)
+
+
+def find_candidate(candidates, selection):
+    """
+    Find the chosen candidate by index or name.
+
+    Args:
+        candidates: List of candidate dicts
+        selection: Dict with 'successor_index' (int) or 'successor' (candidate dict or name)
+
+    Returns:
+        The matching candidate dict or None
+    """
+    index = selection.get('successor_index')
+    if index is not None:
+        if isinstance(index, int) and 0 <= index < len(candidates):
+            return candidates[index]
+        return None
+
+    successor = selection.get('successor')
+    name = successor.get('name') if isinstance(successor, dict) else successor
+    for candidate in candidates:
+        if candidate.get('name') == name:
+            return candidate
+    return None
+
+
+# Global session store shared by the succession routes
+_sessions = SuccessionSessions()
+
+
+def get_succession_sessions():
+    """Get the global succession session store."""
+    return _sessions
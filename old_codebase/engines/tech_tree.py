@@ -0,0 +1,184 @@
+# engines/tech_tree.py
+"""
+Tech Tree Module
+
+data/tech_tree.json loaded once (and again only when the file changes) into
+a DAG:
+
+- nodes: tech id -> tech definition
+- prerequisites / dependents: edges in both directions
+- unlocked_by: building id -> tech ids whose 'unlocks_buildings' list it
+- order: a topological order (prerequisites first, file order otherwise)
+
+Each game state gets a ResearchFrontier (get_research_frontier()): the
+techs that are researchable now (not discovered, every prerequisite
+discovered). A new discovery removes itself from the frontier and checks
+only its dependents; losing a discovery (loads, timeskips) rebuilds it.
+"""
+
+import json
+import os
+import threading
+from collections import deque
+
+TECH_TREE_PATH = os.path.join('data', 'tech_tree.json')
+
+# Research cost for technologies without one
+DEFAULT_TECH_COST = 999
+
+
+class TechTree:
+    """Technology definitions as a DAG with forward and reverse indexes."""
+
+    def __init__(self, technologies):
+        """
+        Args:
+            technologies: List of tech definitions (id, name, prerequisites, unlocks_buildings, ...)
+
+        Raises:
+            ValueError: The prerequisites contain a cycle
+        """
+        self.nodes = {tech.get('id'): tech for tech in technologies}
+        self.prerequisites = {}
+        self.dependents = {tech_id: [] for tech_id in self.nodes}
+        self.unlocked_by = {}
+
+        for tech_id, tech in self.nodes.items():
+            prerequisites = tuple(tech.get('prerequisites', []))
+            unknown = [p for p in prerequisites if p not in self.nodes]
+            if unknown:
+                print(f"Warning: {tech_id} requires unknown technologies {unknown} (never researchable)")
+            self.prerequisites[tech_id] = prerequisites
+            for prerequisite in prerequisites:
+                self.dependents.setdefault(prerequisite, []).append(tech_id)
+            for building_id in tech.get('unlocks_buildings', []):
+                self.unlocked_by.setdefault(building_id, []).append(tech_id)
+
+        self.order = self._topological_order()
+        self.position = {tech_id: i for i, tech_id in enumerate(self.order)}
+
+    def _topological_order(self):
+        """Kahn's algorithm over known prerequisites, keeping file order among ready techs."""
+        remaining = {tech_id: sum(1 for p in prereqs if p in self.nodes)
+                     for tech_id, prereqs in self.prerequisites.items()}
+        ready = deque(tech_id for tech_id in self.nodes if remaining[tech_id] == 0)
+        order = []
+        while ready:
+            tech_id = ready.popleft()
+            order.append(tech_id)
+            for dependent in self.dependents.get(tech_id, []):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    ready.append(dependent)
+        if len(order) != len(self.nodes):
+            cycle = sorted(tech_id for tech_id, count in remaining.items() if count > 0)
+            raise ValueError(f"Tech tree prerequisites contain a cycle: {cycle}")
+        return order
+
+    def get(self, tech_id):
+        """Tech definition by id, or None."""
+        return self.nodes.get(tech_id)
+
+    def cost(self, tech_id):
+        """Research cost of a tech."""
+        return self.nodes[tech_id].get('cost', DEFAULT_TECH_COST)
+
+    def is_researchable(self, tech_id, discovered):
+        """True if a tech is undiscovered and all its prerequisites are in `discovered`."""
+        return (tech_id in self.nodes and tech_id not in discovered
+                and all(p in discovered for p in self.prerequisites[tech_id]))
+
+    def researchable(self, discovered):
+        """All techs researchable with a set of discovered tech ids."""
+        return {tech_id for tech_id in self.nodes if self.is_researchable(tech_id, discovered)}
+
+    def sorted_ids(self, tech_ids):
+        """Tech ids in topological order."""
+        return sorted(tech_ids, key=self.position.__getitem__)
+
+
+# Global tech trees: path -> (mtime, TechTree)
+_tech_trees = {}
+_EMPTY_TREE = TechTree([])
+_tech_tree_lock = threading.Lock()
+
+
+def get_tech_tree(path=TECH_TREE_PATH):
+    """
+    Get the tech tree for a file (re-read only when the file changes).
+
+    Returns:
+        TechTree (empty if the file is missing)
+    """
+    if not os.path.exists(path):
+        return _EMPTY_TREE
+    mtime = os.path.getmtime(path)
+    with _tech_tree_lock:
+        cached = _tech_trees.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        with open(path, 'r', encoding='utf-8') as f:
+            tree = TechTree(json.load(f).get('technologies', []))
+        _tech_trees[path] = (mtime, tree)
+        return tree
+
+
+class ResearchFrontier:
+    """Techs researchable now for one game state, maintained incrementally."""
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.discovered = frozenset()
+        self.frontier = set()
+        # (list, length) the sets were built from; the list itself is held so
+        # a replacement list is never mistaken for it (ids of freed lists are reused)
+        self._source = None
+        self._source_length = 0
+        self._lock = threading.Lock()
+
+    def refresh(self, game_state):
+        """Bring the frontier up to date with civilization['discovered_technologies']."""
+        discovered_list = game_state.civilization.get('discovered_technologies', [])
+        with self._lock:
+            if discovered_list is self._source and len(discovered_list) == self._source_length:
+                return self
+            discovered = frozenset(discovered_list)
+            tree = self.tree
+            if self._source is None or not self.discovered <= discovered:
+                # First use, or a discovery was lost: rebuild
+                self.frontier = tree.researchable(discovered)
+            else:
+                for tech_id in discovered - self.discovered:
+                    self.frontier.discard(tech_id)
+                    for dependent in tree.dependents.get(tech_id, []):
+                        if tree.is_researchable(dependent, discovered):
+                            self.frontier.add(dependent)
+            self.discovered = discovered
+            self._source = discovered_list
+            self._source_length = len(discovered_list)
+        return self
+
+    def available(self):
+        """Researchable tech definitions in topological order."""
+        return [self.tree.nodes[tech_id] for tech_id in self.tree.sorted_ids(self.frontier)]
+
+
+def get_research_frontier(game_state, tree=None):
+    """
+    Get the up-to-date research frontier of a game state.
+
+    The frontier lives on the game state and is recreated when the tree is reloaded.
+
+    Args:
+        game_state: GameState instance
+        tree: TechTree (default: the global one)
+
+    Returns:
+        ResearchFrontier, refreshed
+    """
+    tree = tree or get_tech_tree()
+    frontier = vars(game_state).get('_research_frontier')
+    if frontier is None or frontier.tree is not tree:
+        frontier = ResearchFrontier(tree)
+        game_state._research_frontier = frontier
+    return frontier.refresh(game_state)
@@ -4,11 +4,12 @@ import json
 from json import JSONDecodeError
 import re
 from engines.image_engine import generate_settlement_image
-from engines.context_builder import build_timeskip_context
-from engines.tendency_analyzer import analyze_player_tendency, get_tendency_description
+from engines.context_builder import build_timeskip_context, get_player_tendency
+from engines.history_summary import get_story_so_far
+from engines.tendency_analyzer import get_tendency_description
 from engines.state_validator import validate_updates
 from engines.state_updater import apply_updates, calculate_life_expectancy
-from engines.prompt_loader import load_prompt
+from engines.prompt_budget import render_prompt
 from model_config import TIMESKIP_MODEL
 
 def perform_timeskip(game_state):
@@ -21,11 +22,11 @@ def perform_timeskip(game_state):
     print("--- Performing 500-Year Timeskip via Gemini API ---")
     model = genai.GenerativeModel(TIMESKIP_MODEL)
 
-    # Build expanded context for 500-year jump (12 events)
+    # Build expanded context for 500-year jump (recent + relevant history)
     context = build_timeskip_context(game_state)
 
     # Analyze trajectory
-    primary_tendency, secondary_tendency = analyze_player_tendency(game_state.history_long, num_events=10)
+    primary_tendency, secondary_tendency = get_player_tendency(game_state, 10)
     tendency_desc = get_tendency_description(primary_tendency, secondary_tendency)
     print(f"--- Civilization Trajectory: {tendency_desc} ---")
 
@@ -36,13 +37,15 @@ def perform_timeskip(game_state):
     print(f"--- Active Permanent Decrees: {len(law_engine.get_active_decrees())} ---")
 
     # Extract key narrative elements from player's history
-    recent_events = context['recent_history']['events'][-8:]
-    event_themes = [e.get('title', 'Unknown') for e in recent_events]
+    recent_events = context['recent_history']['events']
+    event_themes = [e.get('title') or e.get('era') or e.get('decree') or 'Unknown' for e in recent_events]
 
     # Determine dominant cultural values that should continue
     primary_values = ', '.join(context['culture']['values'][:3]) if context['culture']['values'] else 'survival and strength'
 
-    prompt = load_prompt('timeskip/timeskip_500_years').format(
+    prompt = render_prompt(
+        'timeskip/timeskip_500_years',
+        trim_order=['event_themes', 'decrees_summary', 'story_so_far'],
         civ_name=context['civilization']['meta']['name'],
         civ_year=context['civilization']['meta']['year'],
         civ_era=context['civilization']['meta']['era'],
@@ -58,7 +61,8 @@ def perform_timeskip(game_state):
         primary_tendency=primary_tendency,
         tendency_desc=tendency_desc,
         event_themes='\n'.join([f"• {title}" for title in event_themes]),
-        decrees_summary=decrees_summary
+        decrees_summary=decrees_summary,
+        story_so_far=get_story_so_far(game_state, "The chronicle is still young.")
     )
 
     try:
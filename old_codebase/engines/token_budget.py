@@ -0,0 +1,126 @@
+# engines/token_budget.py
+"""
+Token Budget Module
+
+Helpers for keeping prompt context inside a hard token budget.
+
+Token counts are estimated locally (about 4 characters per token for English
+and JSON), which is close enough to enforce a ceiling without an extra API
+round trip per prompt.
+"""
+
+import json
+
+# Average characters per token for Gemini models on English/JSON text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(text):
+    """
+    Estimate the number of tokens in a string.
+
+    Args:
+        text: Prompt text (None counts as empty)
+
+    Returns:
+        Estimated token count (int)
+    """
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def compact_json(data):
+    """Encode data as JSON without indentation or extra whitespace."""
+    return json.dumps(data, separators=(',', ':'), ensure_ascii=False, default=str)
+
+
+def truncate_text(text, max_tokens):
+    """
+    Cut text down to roughly max_tokens, marking the cut with an ellipsis.
+
+    Args:
+        text: Any value (non-strings are converted with str())
+        max_tokens: Token allowance for the text
+
+    Returns:
+        The text, shortened if needed
+    """
+    text = text if isinstance(text, str) else str(text)
+    max_chars = max(0, max_tokens * CHARS_PER_TOKEN)
+    if len(text) <= max_chars:
+        return text
+    return text[:max(0, max_chars - 1)].rstrip() + "…"
+
+
+def fit_to_budget(sections, max_tokens, trim_order, encoder=compact_json):
+    """
+    Shrink a context projection until its compact JSON fits the budget.
+
+    Trimming happens in passes, lowest priority first:
+      1. Nested lists inside list entries (e.g. advisor memories) lose their oldest item
+      2. List sections lose their last (least important) entry
+      3. Whole sections are dropped
+
+    Callers order list sections by importance so the tail is what gets cut.
+
+    Args:
+        sections: Dict of section name -> value (lists, dicts or scalars)
+        max_tokens: Hard token ceiling for the encoded result
+        trim_order: Section names from lowest to highest priority.
+            Sections not listed are never trimmed.
+        encoder: Callable turning the sections into the prompt string
+            (defaults to compact_json)
+
+    Returns:
+        Tuple (encoded_json, estimated_tokens, trimmed) where trimmed is a list
+        of human-readable notes about what was cut
+    """
+    sections = json.loads(compact_json(sections))  # private deep copy
+    trimmed = []
+
+    def _encoded():
+        text = encoder(sections)
+        return text, estimate_tokens(text)
+
+    text, tokens = _encoded()
+
+    # Pass 1: shorten nested lists inside list entries (oldest first)
+    for name in trim_order:
+        while tokens > max_tokens:
+            entries = sections.get(name)
+            if not isinstance(entries, list):
+                break
+            longest = None
+            for entry in entries:
+                if not isinstance(entry, dict):
+                    continue
+                for key, value in entry.items():
+                    if isinstance(value, list) and len(value) > 1:
+                        if longest is None or len(value) > len(longest[0][longest[1]]):
+                            longest = (entry, key)
+            if longest is None:
+                break
+            longest[0][longest[1]].pop(0)
+            trimmed.append(f"{name}.{longest[1]}")
+            text, tokens = _encoded()
+
+    # Pass 2: drop trailing entries of list sections
+    for name in trim_order:
+        while tokens > max_tokens and isinstance(sections.get(name), list) and sections[name]:
+            sections[name].pop()
+            trimmed.append(name)
+            text, tokens = _encoded()
+
+    # Pass 3: drop whole sections
+    for name in trim_order:
+        if tokens <= max_tokens:
+            break
+        if name in sections:
+            del sections[name]
+            trimmed.append(f"{name} (dropped)")
+            text, tokens = _encoded()
+
+    if trimmed:
+        print(f"  ✂️ Context trimmed to ~{tokens} tokens (budget {max_tokens}): {len(trimmed)} cut(s)")
+    return text, tokens, trimmed
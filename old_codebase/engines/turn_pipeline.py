@@ -0,0 +1,303 @@
+# engines/turn_pipeline.py
+"""
+Turn Pipeline Module
+
+A turn is a list of named, ordered phases. Each phase declares what it reads
+and writes: context keys (values produced by earlier phases, e.g. 'prompt',
+'outcome') or game state sections ('state.factions', 'state.history'...;
+'state.*' stands for every section).
+
+The pipeline:
+- checks at construction that every context key a phase reads is a pipeline
+  input or written by an earlier phase
+- skips phases whose condition is false, or that the caller asks to skip
+  (a run is rejected up front if a later phase would read a context key
+  that only a skipped phase writes and the caller did not provide)
+- runs adjacent phases marked concurrent on a small thread pool when their
+  declared reads and writes don't overlap
+- times every phase; each run returns a per-phase report and the running
+  totals are kept in TurnPipelineStats (get_turn_pipeline_stats())
+
+A phase may raise PipelineHalt(result) to end the turn early with a result
+(e.g. an error outcome). Exceptions in guarded phases are turned into a halt
+by the pipeline's on_error handler; unguarded exceptions propagate.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+# Workers for phases that run concurrently
+PHASE_WORKERS = 4
+
+STATE_PREFIX = 'state.'
+ALL_STATE = 'state.*'
+
+
+def _overlaps(keys, others):
+    """True if two sets of declared keys share a key ('state.*' matches every state section)."""
+    if keys & others:
+        return True
+    if ALL_STATE in keys:
+        return any(key.startswith(STATE_PREFIX) for key in others)
+    if ALL_STATE in others:
+        return any(key.startswith(STATE_PREFIX) for key in keys)
+    return False
+
+
+class PipelineHalt(Exception):
+    """Raised by a phase to end the pipeline with a result."""
+
+    def __init__(self, result):
+        super().__init__("pipeline halted")
+        self.result = result
+
+
+class Phase:
+    """One named step of a pipeline."""
+
+    def __init__(self, name, run, reads=(), writes=(), when=None, concurrent=False, guarded=True):
+        """
+        Args:
+            name: Phase name (unique within the pipeline)
+            run: Callable run(ctx); the context is a dict shared by all phases
+            reads: Context keys and 'state.*' sections the phase reads
+            writes: Context keys and 'state.*' sections the phase writes
+            when: Optional predicate when(ctx); the phase is skipped when it returns False
+                (errors raised by the predicate are handled like errors in the phase)
+            concurrent: May run alongside adjacent concurrent phases it doesn't conflict with
+            guarded: Errors go to the pipeline's on_error handler instead of propagating
+        """
+        self.name = name
+        self.run = run
+        self.reads = frozenset(reads)
+        self.writes = frozenset(writes)
+        self.when = when
+        self.concurrent = concurrent
+        self.guarded = guarded
+
+    def conflicts_with(self, other):
+        """True if either phase writes something the other reads or writes."""
+        return _overlaps(self.writes, other.reads | other.writes) or _overlaps(other.writes, self.reads)
+
+
+class TurnPipelineStats:
+    """Running per-phase counts and timings, plus the most recent turn's report."""
+
+    def __init__(self):
+        self._stats = {}
+        self._last = {}
+        self._lock = threading.Lock()
+
+    def record(self, report):
+        with self._lock:
+            self._last[report['pipeline']] = report
+            for entry in report['phases']:
+                key = f"{report['pipeline']}.{entry['phase']}"
+                stats = self._stats.setdefault(key, {
+                    'runs': 0, 'skipped': 0, 'failed': 0, 'total_ms': 0.0, 'max_ms': 0.0
+                })
+                if entry['status'] == 'skipped':
+                    stats['skipped'] += 1
+                    continue
+                stats['runs'] += 1
+                if entry['status'] in ('failed', 'halted'):
+                    stats['failed'] += 1
+                stats['total_ms'] += entry['ms']
+                stats['max_ms'] = max(stats['max_ms'], entry['ms'])
+
+    def get_stats(self):
+        """Copy of the per-phase stats with mean times."""
+        with self._lock:
+            return {
+                key: dict(stats, mean_ms=stats['total_ms'] / stats['runs'] if stats['runs'] else 0.0)
+                for key, stats in self._stats.items()
+            }
+
+    def last_report(self, pipeline):
+        """The most recent run's report for a pipeline, or None."""
+        with self._lock:
+            return self._last.get(pipeline)
+
+    def reset(self):
+        with self._lock:
+            self._stats = {}
+            self._last = {}
+
+
+# Global pipeline stats and worker pool
+_turn_pipeline_stats = None
+_phase_executor = None
+_executor_lock = threading.Lock()
+
+
+def get_turn_pipeline_stats():
+    """Get the global turn pipeline stats."""
+    global _turn_pipeline_stats
+    if _turn_pipeline_stats is None:
+        _turn_pipeline_stats = TurnPipelineStats()
+    return _turn_pipeline_stats
+
+
+def _get_phase_executor():
+    global _phase_executor
+    with _executor_lock:
+        if _phase_executor is None:
+            _phase_executor = ThreadPoolExecutor(max_workers=PHASE_WORKERS, thread_name_prefix='turn-phase')
+        return _phase_executor
+
+
+class TurnPipeline:
+    """
+    Ordered phases run against a shared context dict.
+
+    Usage:
+        pipeline = TurnPipeline('action', [Phase('prompt', build_prompt, reads=['action'], writes=['prompt']), ...],
+                                inputs=['game_state', 'action'])
+        report = pipeline.run(ctx)
+        result = ctx.get('result')  # set if a phase halted the turn
+    """
+
+    def __init__(self, name, phases, inputs=(), on_error=None):
+        """
+        Args:
+            name: Pipeline name (used in stats)
+            phases: Ordered list of Phase
+            inputs: Context keys the caller provides
+            on_error: on_error(ctx, phase, exc) -> result, for errors in guarded phases
+
+        Raises:
+            ValueError: Duplicate phase names or reads of keys nothing provides
+        """
+        self.name = name
+        self.phases = list(phases)
+        self.on_error = on_error
+
+        available = set(inputs)
+        names = set()
+        for phase in self.phases:
+            if phase.name in names:
+                raise ValueError(f"Duplicate phase '{phase.name}' in pipeline '{name}'")
+            names.add(phase.name)
+            missing = {key for key in phase.reads if not key.startswith(STATE_PREFIX)} - available
+            if missing:
+                raise ValueError(f"Phase '{phase.name}' reads {sorted(missing)} before any phase writes it")
+            available |= phase.writes
+
+        self.groups = self._group_phases()
+
+    def _group_phases(self):
+        """Batch adjacent concurrent phases that don't conflict with each other."""
+        groups = []
+        for phase in self.phases:
+            last = groups[-1] if groups else None
+            if (phase.concurrent and last and last[0].concurrent
+                    and not any(phase.conflicts_with(other) for other in last)):
+                last.append(phase)
+            else:
+                groups.append([phase])
+        return groups
+
+    def phase_names(self):
+        return [phase.name for phase in self.phases]
+
+    def run(self, ctx, skip=()):
+        """
+        Run the phases in order.
+
+        Args:
+            ctx: Context dict holding the pipeline inputs; phases add their outputs
+            skip: Names of phases to skip this run. The caller provides in ctx
+                whatever a skipped phase would have written for later phases.
+
+        Returns:
+            Report dict: pipeline, phases (list of {phase, status, ms}), total_ms,
+            halted_by (phase name or None). If a phase halted the turn, its
+            result is in ctx['result'].
+
+        Raises:
+            ValueError: Unknown phase names in skip, or a phase that would read a
+                context key only a skipped phase writes (checked before any phase runs)
+        """
+        self._check_skips(ctx, skip)
+        started = time.perf_counter()
+        report = {'pipeline': self.name, 'phases': [], 'total_ms': 0.0, 'halted_by': None}
+        try:
+            for group in self.groups:
+                runnable = []
+                for phase in group:
+                    if phase.name in skip:
+                        report['phases'].append({'phase': phase.name, 'status': 'skipped', 'ms': 0.0})
+                    else:
+                        runnable.append(phase)
+                if not runnable:
+                    continue
+
+                if len(runnable) == 1:
+                    entries = [self._run_phase(runnable[0], ctx)]
+                else:
+                    executor = _get_phase_executor()
+                    futures = [executor.submit(self._run_phase, phase, ctx) for phase in runnable]
+                    entries = [future.result() for future in futures]
+
+                for entry in entries:
+                    report['phases'].append(entry['report'])
+                for entry in entries:
+                    if entry['error'] is not None:
+                        raise entry['error']
+                halt = next((entry['halt'] for entry in entries if entry['halt'] is not None), None)
+                if halt is not None:
+                    ctx['result'] = halt.result
+                    report['halted_by'] = next(entry['report']['phase'] for entry in entries if entry['halt'] is halt)
+                    break
+        finally:
+            report['total_ms'] = (time.perf_counter() - started) * 1000
+            get_turn_pipeline_stats().record(report)
+        return report
+
+    def _check_skips(self, ctx, skip):
+        """Reject skips that would leave a later phase without a context key it reads."""
+        if not skip:
+            return
+        unknown = set(skip) - set(self.phase_names())
+        if unknown:
+            raise ValueError(f"Cannot skip unknown phases {sorted(unknown)} in pipeline '{self.name}'")
+
+        available = set(ctx)
+        for phase in self.phases:
+            if phase.name in skip:
+                continue
+            missing = {key for key in phase.reads if not key.startswith(STATE_PREFIX)} - available
+            if missing:
+                raise ValueError(f"Phase '{phase.name}' reads {sorted(missing)}, which skipped phases "
+                                 f"would have written; provide them in the context or don't skip")
+            available |= phase.writes
+
+    def _run_phase(self, phase, ctx):
+        """Run one phase; returns its report entry and any halt or error to re-raise."""
+        started = time.perf_counter()
+        status, halt, error = 'ran', None, None
+        try:
+            if phase.when is not None and not phase.when(ctx):
+                status = 'skipped'
+            else:
+                phase.run(ctx)
+        except PipelineHalt as h:
+            status, halt = 'halted', h
+        except Exception as e:
+            status = 'failed'
+            if phase.guarded and self.on_error is not None:
+                halt = PipelineHalt(self.on_error(ctx, phase, e))
+            else:
+                error = e
+        elapsed = (time.perf_counter() - started) * 1000 if status != 'skipped' else 0.0
+        return {'report': {'phase': phase.name, 'status': status, 'ms': elapsed}, 'halt': halt, 'error': error}
+
+
+def format_phase_report(report, limit=5):
+    """One-line summary of the slowest phases in a report."""
+    ran = sorted((entry for entry in report['phases'] if entry['status'] != 'skipped'),
+                 key=lambda entry: -entry['ms'])
+    parts = [f"{entry['phase']} {entry['ms']:.0f}ms" for entry in ran[:limit]]
+    skipped = sum(1 for entry in report['phases'] if entry['status'] == 'skipped')
+    return f"{report['total_ms']:.0f}ms total ({', '.join(parts)}; {skipped} skipped)"
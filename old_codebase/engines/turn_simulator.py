@@ -0,0 +1,347 @@
+# engines/turn_simulator.py
+"""
+Turn Simulator Module
+
+The deterministic, model-free part of a turn, and a headless simulator that
+runs it for many turns in a row.
+
+apply_turn_mechanics() is the end-of-turn pipeline used by
+process_player_action once the AI outcome has been applied:
+
+    passive generation -> consumption -> happiness (resources, factions)
+    -> construction -> aging/calendar -> science/culture progression
+
+TurnSimulator runs that pipeline in isolation from any saved state, with
+scripted outcome deltas standing in for the model, so the economy can be
+profiled, regression-tested and balanced without spending tokens.
+
+Usage:
+    sim = TurnSimulator.from_save('context', script=[{'civilization.resources.food': 5}])
+    reports = sim.run(1000)
+"""
+
+import contextlib
+import os
+import shutil
+import tempfile
+import time
+
+# Placeholder civic until a civics tree exists (see advance_civics)
+PLACEHOLDER_CIVIC_COST = 30
+PLACEHOLDER_CIVIC_NAME = "Tribal Code"
+
+
+def advance_research(game_state, science_income, outcome):
+    """Add science points and progress the current research; records unlocks in outcome."""
+    if science_income <= 0:
+        return
+    # Initialize science_points if not present (backwards compatibility)
+    if 'science_points' not in game_state.technology:
+        game_state.technology['science_points'] = 0
+
+    game_state.technology['science_points'] += science_income
+    print(f"  🔬 Science: +{science_income} points (Total: {game_state.technology['science_points']})")
+
+    current_research_id = game_state.technology.get('current_research_id')
+    if not current_research_id:
+        return
+    try:
+        from engines.tech_tree import get_tech_tree
+        tree = get_tech_tree()
+        current_tech = tree.get(current_research_id)
+        if not current_tech:
+            return
+        tech_cost = tree.cost(current_research_id)
+        game_state.technology['research_progress'] += science_income
+
+        print(f"  📖 Researching '{current_tech['name']}': {game_state.technology['research_progress']}/{tech_cost}")
+
+        if game_state.technology['research_progress'] >= tech_cost:
+            # Technology unlocked!
+            tech_name = current_tech['name']
+            print(f"  ✨ TECHNOLOGY UNLOCKED: {tech_name}!")
+
+            # Add to discoveries if not already present
+            if tech_name not in game_state.technology.get('discoveries', []):
+                game_state.technology['discoveries'].append(tech_name)
+            # Record the id so dependent techs and buildings unlock
+            discovered_ids = game_state.civilization.setdefault('discovered_technologies', [])
+            if current_research_id not in discovered_ids:
+                discovered_ids.append(current_research_id)
+
+            # Clear current research
+            game_state.technology['current_research_id'] = None
+            game_state.technology['research_progress'] = 0
+
+            # Add to outcome for visibility
+            outcome['tech_unlocked'] = tech_name
+    except Exception as e:
+        print(f"  ⚠️ Error processing tech progression: {e}")
+
+
+def advance_civics(game_state, culture_income, outcome):
+    """Add culture points and progress the current civic; records adoptions in outcome."""
+    if culture_income <= 0:
+        return
+    # Initialize culture_points if not present (backwards compatibility)
+    if 'culture_points' not in game_state.culture:
+        game_state.culture['culture_points'] = 0
+
+    game_state.culture['culture_points'] += culture_income
+    print(f"  🎭 Culture: +{culture_income} points (Total: {game_state.culture['culture_points']})")
+
+    current_civic_id = game_state.culture.get('current_civic_id')
+    if not current_civic_id:
+        return
+    # For MVP, use a placeholder cost since civics tree doesn't exist yet
+    # In future, this will load from data/civics_tree.json
+    civic_cost = PLACEHOLDER_CIVIC_COST
+    civic_name = PLACEHOLDER_CIVIC_NAME
+
+    game_state.culture['civic_progress'] += culture_income
+
+    print(f"  📜 Adopting '{civic_name}': {game_state.culture['civic_progress']}/{civic_cost}")
+
+    if game_state.culture['civic_progress'] >= civic_cost:
+        # Civic unlocked!
+        print(f"  ✨ CIVIC ADOPTED: {civic_name}!")
+
+        # Add to traditions if not already present
+        if civic_name not in game_state.culture.get('traditions', []):
+            game_state.culture['traditions'].append(civic_name)
+
+        # Clear current civic
+        game_state.culture['current_civic_id'] = None
+        game_state.culture['civic_progress'] = 0
+
+        # Add to outcome for visibility
+        outcome['civic_adopted'] = civic_name
+
+
+def apply_turn_mechanics(game_state, outcome=None, building_manager=None, bonus_engine=None):
+    """
+    Run the deterministic end-of-turn pipeline (no model calls).
+
+    Args:
+        game_state: GameState (or a compatible object)
+        outcome: Outcome dict; warnings, completed buildings and unlocks are added to it
+        building_manager: BuildingManager to reuse (created if None)
+        bonus_engine: BonusEngine to reuse (created if None)
+
+    Returns:
+        Dict report: production, consumption, happiness_change, completed_buildings,
+        aging_changes, science, culture
+    """
+    from engines.resource_engine import (
+        apply_consumption, apply_passive_generation, calculate_resource_happiness_impact
+    )
+    from engines.leader_engine import apply_aging_effects
+    from engines.bonus_definitions import BonusType
+
+    outcome = outcome if outcome is not None else {}
+    happiness_before = game_state.population_happiness
+
+    # First, apply passive generation (civilization produces resources)
+    production = apply_passive_generation(game_state)
+    print(f"  📈 Passive production: +{production['food']} food, +{production['wealth']} wealth")
+
+    # Then apply consumption
+    consumption_status = apply_consumption(game_state)
+    print(f"  📉 Consumption: -{consumption_status['food_consumed']} food, -{consumption_status['wealth_consumed']} wealth")
+
+    # Apply automatic happiness changes from resource scarcity (Fix #6)
+    happiness_impact = calculate_resource_happiness_impact(game_state)
+    if happiness_impact != 0:
+        game_state.population_happiness = max(0, min(100, game_state.population_happiness + happiness_impact))
+        if happiness_impact < 0:
+            print(f"  😞 Happiness decreased by {abs(happiness_impact)} (resource scarcity)")
+        else:
+            print(f"  😊 Happiness increased by {happiness_impact} (prosperity)")
+
+    if bonus_engine is None:
+        from engines.bonus_engine import BonusEngine
+        bonus_engine = BonusEngine()
+
+    # Apply faction approval happiness modifier
+    if hasattr(game_state, 'faction_manager'):
+        faction_bonuses = bonus_engine.get_faction_bonuses(game_state)
+        game_state.population_happiness += faction_bonuses['happiness_modifier']
+        game_state.population_happiness = max(0, min(100, game_state.population_happiness))
+        if faction_bonuses['happiness_modifier'] != 0:
+            print(f"  🙂 Faction approval changed happiness by {faction_bonuses['happiness_modifier']:+d}")
+
+    # Add consumption warnings to outcome if any
+    if consumption_status['warnings']:
+        outcome['resource_warnings'] = consumption_status['warnings']
+        outcome['consumption_effects'] = {}
+
+        if 'starvation_deaths' in consumption_status:
+            outcome['consumption_effects']['population_loss'] = consumption_status['starvation_deaths']
+            print(f"  ☠️ Starvation! Population loss: -{consumption_status['starvation_deaths']}")
+
+        if 'infrastructure_lost' in consumption_status:
+            outcome['consumption_effects']['infrastructure_lost'] = consumption_status['infrastructure_lost']
+            print(f"  🏚️ Bankruptcy! Infrastructure lost: {', '.join(consumption_status['infrastructure_lost'])}")
+
+    # Process building construction (Phase 4)
+    if building_manager is None:
+        from engines.building_manager import BuildingManager
+        building_manager = BuildingManager()
+    completed_buildings = building_manager.process_turn(game_state)
+    if completed_buildings:
+        for building_name in completed_buildings:
+            print(f"  🏛️ Construction complete: {building_name}")
+        outcome['construction_complete'] = completed_buildings
+
+    # Automatic state progression
+    game_state.civilization['leader']['age'] += 1
+    game_state.civilization['leader']['years_ruled'] += 1
+    game_state.civilization['meta']['year'] += 1
+    game_state.turn_number += 1
+
+    # Apply aging effects and trait changes
+    aging_changes = apply_aging_effects(game_state)
+    for change in aging_changes:
+        print(f"  👤 Leader {change}")
+
+    # Process science and culture progression
+    science_income = int(bonus_engine.calculate_bonuses(game_state, BonusType.SCIENCE_PER_TURN)['total'])
+    culture_income = int(bonus_engine.calculate_bonuses(game_state, BonusType.CULTURE_PER_TURN)['total'])
+    advance_research(game_state, science_income, outcome)
+    advance_civics(game_state, culture_income, outcome)
+
+    return {
+        'production': production,
+        'consumption': consumption_status,
+        'happiness_change': game_state.population_happiness - happiness_before,
+        'completed_buildings': completed_buildings,
+        'aging_changes': aging_changes,
+        'science': science_income,
+        'culture': culture_income,
+    }
+
+
+class _NullWriter:
+    """stdout sink for quiet simulation runs."""
+
+    def write(self, text):
+        return len(text)
+
+    def flush(self):
+        pass
+
+
+class TurnSimulator:
+    """
+    Headless runner for the mechanical turn pipeline.
+
+    Scripts stand in for the model's outcome: either a list of update dicts
+    (dot-notation deltas, as the AI returns them; cycled) or a callable
+    script(turn_index, game_state) returning an update dict or None.
+
+    Usage:
+        sim = TurnSimulator(game_state, script=lambda i, gs: {'population_happiness': -1})
+        reports = sim.run(500)
+        sim.turns_per_second
+    """
+
+    def __init__(self, game_state, script=None, quiet=True):
+        from engines.building_manager import BuildingManager
+        from engines.bonus_engine import BonusEngine
+
+        self.game_state = game_state
+        self.script = script
+        self.quiet = quiet
+        self.building_manager = BuildingManager()
+        self.bonus_engine = BonusEngine()
+        self.turns_run = 0
+        self.elapsed = 0.0
+        self._temp_dir = None
+
+    @classmethod
+    def from_save(cls, context_dir='context', **kwargs):
+        """
+        Start a simulation from a saved game without touching the save.
+
+        The context files are copied to a temporary directory and loaded from
+        there, so nothing the simulation does can write back to the save.
+        """
+        from game_state import GameState
+
+        temp_dir = tempfile.mkdtemp(prefix='turn_sim_')
+        for name in os.listdir(context_dir):
+            source = os.path.join(context_dir, name)
+            if os.path.isfile(source):
+                shutil.copy2(source, temp_dir)
+        with cls._silenced(kwargs.get('quiet', True)):
+            game_state = GameState(temp_dir)
+        simulator = cls(game_state, **kwargs)
+        simulator._temp_dir = temp_dir
+        return simulator
+
+    @staticmethod
+    def _silenced(quiet):
+        return contextlib.redirect_stdout(_NullWriter()) if quiet else contextlib.nullcontext()
+
+    def _scripted_updates(self, turn_index):
+        if self.script is None:
+            return None
+        if callable(self.script):
+            return self.script(turn_index, self.game_state)
+        if not self.script:
+            return None
+        return self.script[turn_index % len(self.script)]
+
+    def step(self):
+        """
+        Run one turn: scripted outcome deltas, then the turn mechanics.
+
+        Returns:
+            Report dict from apply_turn_mechanics plus turn, outcome and key metrics
+        """
+        from engines.state_updater import apply_updates
+
+        game_state = self.game_state
+        outcome = {'updates': self._scripted_updates(self.turns_run) or {}}
+        if outcome['updates']:
+            apply_updates(game_state, dict(outcome['updates']), visual_updates=False)
+        report = apply_turn_mechanics(game_state, outcome, self.building_manager, self.bonus_engine)
+
+        civ = game_state.civilization
+        report.update({
+            'turn': game_state.turn_number,
+            'outcome': outcome,
+            'population': civ.get('population', 0),
+            'food': civ.get('resources', {}).get('food', 0),
+            'wealth': civ.get('resources', {}).get('wealth', 0),
+            'happiness': game_state.population_happiness,
+        })
+        self.turns_run += 1
+        return report
+
+    def run(self, turns):
+        """
+        Run N turns (quietly unless quiet=False).
+
+        Returns:
+            List of per-turn reports
+        """
+        reports = []
+        started = time.perf_counter()
+        with self._silenced(self.quiet):
+            for _ in range(turns):
+                reports.append(self.step())
+        self.elapsed += time.perf_counter() - started
+        if hasattr(self.game_state, 'bump_version'):
+            self.game_state.bump_version()
+        return reports
+
+    @property
+    def turns_per_second(self):
+        return self.turns_run / self.elapsed if self.elapsed else 0.0
+
+    def close(self):
+        """Remove the temporary copy of the save (from_save only)."""
+        if self._temp_dir:
+            shutil.rmtree(self._temp_dir, ignore_errors=True)
+            self._temp_dir = None
@@ -2,8 +2,30 @@
 """
 Victory condition and failure state detection.
 Tracks progress toward different win conditions and checks for game-ending failures.
+
+Victory progress is maintained incrementally by a VictoryTracker kept on the
+GameState. Each input (values, traditions, discoveries, era, reputation...)
+is reduced to a cheap key; only the inputs whose key changed recompute their
+contribution, and only their tracks are re-summed and written back.
+Crossing a milestone (VICTORY_MILESTONES) emits a milestone event. Reads for
+an unchanged game_state.version (check_victory, /api/victory_status polls)
+return the tracked progress without touching the state.
 """
 
+import threading
+from collections import deque
+
+# Progress levels (0-100) that emit milestone events when crossed
+VICTORY_MILESTONES = (25, 50, 75, 100)
+
+# Era bonus toward technological victory (progression through ages)
+ERA_VICTORY_VALUES = {
+    'stone_age': 0, 'bronze_age': 10, 'iron_age': 20, 'classical': 30,
+    'medieval': 40, 'renaissance': 50, 'industrial': 60, 'modern': 80
+}
+
+VICTORY_TRACKS = ['cultural', 'technological', 'military', 'spiritual', 'diplomatic']
+
 def initialize_victory_tracking(game_state):
     """Initialize victory tracking if not present."""
     if 'victory_progress' not in game_state.civilization:
@@ -15,89 +37,194 @@ def initialize_victory_tracking(game_state):
             'diplomatic': 0     # 0-100 (bonus path)
         }
 
-def calculate_victory_progress(game_state):
-    """
-    Calculate progress toward each victory condition.
-    Returns dict with progress percentages and thresholds.
-    """
-    initialize_victory_tracking(game_state)
+def _consequences(game_state):
+    return game_state.civilization.get('consequences', {})
 
-    progress = game_state.civilization['victory_progress']
-    population = game_state.civilization['population']
-    era = game_state.civilization['meta']['era']
 
-    # Cultural Victory: Based on traditions, values, cultural influence
-    cultural_factors = 0
-    cultural_factors += min(len(game_state.culture.get('values', [])) * 3, 30)  # Max 30 from values
-    cultural_factors += min(len(game_state.culture.get('traditions', [])) * 4, 40)  # Max 40 from traditions
-    cultural_factors += min(game_state.civilization.get('consequences', {}).get('reputation', {}).get('diplomatic', 0) // 3, 30)  # Max 30 from reputation
+def _reputation(game_state, kind):
+    return _consequences(game_state).get('reputation', {}).get(kind, 0)
 
-    progress['cultural'] = min(100, cultural_factors)
 
-    # Technological Victory: Based on discoveries, infrastructure, era
-    tech_factors = 0
-    tech_factors += min(len(game_state.technology.get('discoveries', [])) * 2, 40)  # Max 40 from discoveries
-    tech_factors += min(len(game_state.technology.get('infrastructure', [])) * 3, 30)  # Max 30 from infrastructure
-
-    # Era bonus (progression through ages)
-    era_values = {
-        'stone_age': 0, 'bronze_age': 10, 'iron_age': 20, 'classical': 30,
-        'medieval': 40, 'renaissance': 50, 'industrial': 60, 'modern': 80
-    }
-    tech_factors += era_values.get(era, 0)
+# Victory inputs: (name, key(game_state), {track: contribution(key)})
+VICTORY_INPUTS = [
+    # Cultural Victory: Based on traditions, values, cultural influence
+    ('values', lambda gs: len(gs.culture.get('values', [])),
+     {'cultural': lambda n: min(n * 3, 30)}),                       # Max 30 from values
+    ('traditions', lambda gs: len(gs.culture.get('traditions', [])),
+     {'cultural': lambda n: min(n * 4, 40)}),                       # Max 40 from traditions
+    ('diplomatic_reputation', lambda gs: _reputation(gs, 'diplomatic'),
+     {'cultural': lambda rep: min(rep // 3, 30),                    # Max 30 from reputation
+      'diplomatic': lambda rep: min(rep // 2, 50)}),                # Max 50 from diplomatic reputation
 
-    progress['technological'] = min(100, tech_factors)
+    # Technological Victory: Based on discoveries, infrastructure, era
+    ('discoveries', lambda gs: len(gs.technology.get('discoveries', [])),
+     {'technological': lambda n: min(n * 2, 40)}),                  # Max 40 from discoveries
+    ('infrastructure', lambda gs: len(gs.technology.get('infrastructure', [])),
+     {'technological': lambda n: min(n * 3, 30)}),                  # Max 30 from infrastructure
+    ('era', lambda gs: gs.civilization['meta']['era'],
+     {'technological': lambda era: ERA_VICTORY_VALUES.get(era, 0)}),
 
     # Military Victory: Based on enemies defeated, military reputation, population strength
-    military_factors = 0
-    enemies = game_state.civilization.get('consequences', {}).get('enemies', [])
-    military_factors += min(len(enemies) * 15, 45)  # Max 45 from having enemies (shows conflict)
-
-    military_rep = game_state.civilization.get('consequences', {}).get('reputation', {}).get('military', 0)
-    military_factors += min(military_rep // 2, 50)  # Max 50 from military reputation
-
-    # Population shows strength
-    if population > 5000:
-        military_factors += 10
-
-    progress['military'] = min(100, military_factors)
+    ('enemies', lambda gs: len(_consequences(gs).get('enemies', [])),
+     {'military': lambda n: min(n * 15, 45)}),                      # Max 45 from having enemies (shows conflict)
+    ('military_reputation', lambda gs: _reputation(gs, 'military'),
+     {'military': lambda rep: min(rep // 2, 50)}),                  # Max 50 from military reputation
+    ('population', lambda gs: gs.civilization['population'] > 5000,
+     {'military': lambda strong: 10 if strong else 0}),             # Population shows strength
 
     # Spiritual Victory: Based on religious influence, holy sites, religious reputation
-    spiritual_factors = 0
-    spiritual_factors += min(len(game_state.religion.get('holy_sites', [])) * 15, 45)  # Max 45 from holy sites
-    spiritual_factors += min(len(game_state.religion.get('practices', [])) * 5, 25)  # Max 25 from practices
+    ('holy_sites', lambda gs: len(gs.religion.get('holy_sites', [])),
+     {'spiritual': lambda n: min(n * 15, 45)}),                     # Max 45 from holy sites
+    ('practices', lambda gs: len(gs.religion.get('practices', [])),
+     {'spiritual': lambda n: min(n * 5, 25)}),                      # Max 25 from practices
+    ('religious_reputation', lambda gs: _reputation(gs, 'religious'),
+     {'spiritual': lambda rep: min(rep // 3, 30)}),                 # Max 30 from religious reputation
 
-    religious_rep = game_state.civilization.get('consequences', {}).get('reputation', {}).get('religious', 0)
-    spiritual_factors += min(religious_rep // 3, 30)  # Max 30 from religious reputation
+    # Diplomatic Victory: Based on alliances, promises kept, diplomatic reputation
+    ('strong_alliances', lambda gs: sum(1 for a in _consequences(gs).get('alliances', []) if a.get('strength', 0) > 70),
+     {'diplomatic': lambda n: min(n * 20, 40)}),                    # Max 40 from strong alliances
+    ('broken_promises', lambda gs: len(_consequences(gs).get('broken_promises', [])),
+     {'diplomatic': lambda n: -n * 10}),                            # Penalty for broken promises
+]
 
-    progress['spiritual'] = min(100, spiritual_factors)
 
-    # Diplomatic Victory: Based on alliances, promises kept, diplomatic reputation
-    diplomatic_factors = 0
-    alliances = game_state.civilization.get('consequences', {}).get('alliances', [])
-    strong_alliances = [a for a in alliances if a.get('strength', 0) > 70]
-    diplomatic_factors += min(len(strong_alliances) * 20, 40)  # Max 40 from strong alliances
+def _track_score(track, total):
+    """Clamp a track's summed contributions (only diplomatic can be penalized below 0)."""
+    if track == 'diplomatic':
+        return max(0, min(100, total))
+    return min(100, total)
 
-    diplomatic_rep = game_state.civilization.get('consequences', {}).get('reputation', {}).get('diplomatic', 0)
-    diplomatic_factors += min(diplomatic_rep // 2, 50)  # Max 50 from diplomatic reputation
 
-    # Penalty for broken promises
-    broken_promises = len(game_state.civilization.get('consequences', {}).get('broken_promises', []))
-    diplomatic_factors -= broken_promises * 10
+class VictoryTracker:
+    """
+    Incrementally maintained victory progress for one game.
+
+    Usage:
+        tracker = get_victory_tracker(game_state)
+        tracker.add_listener(lambda event: print(event))
+        progress = tracker.refresh(game_state)
+    """
 
-    progress['diplomatic'] = max(0, min(100, diplomatic_factors))
+    def __init__(self):
+        self.progress = {track: 0 for track in VICTORY_TRACKS}
+        self.milestones = deque(maxlen=20)  # Recent milestone events
+        self._inputs = {}
+        self._components = {track: {} for track in VICTORY_TRACKS}
+        self._version = None
+        self._civilization = None
+        self._listeners = []
+        self._lock = threading.RLock()
+
+    def add_listener(self, callback):
+        """Call callback(event) for every milestone event."""
+        self._listeners.append(callback)
+
+    def refresh(self, game_state):
+        """
+        Bring progress up to date unless the state version is unchanged.
+
+        Returns:
+            Dict of track -> progress (0-100); shared, treat as read-only
+        """
+        version = getattr(game_state, 'version', None)
+        if version is None or version != self._version or game_state.civilization is not self._civilization:
+            self.sync(game_state)
+        return self.progress
+
+    def sync(self, game_state):
+        """
+        Compare every input key with the last sync and update the affected tracks.
+
+        Returns:
+            List of milestone events emitted by this sync
+        """
+        with self._lock:
+            # A new or reloaded civilization starts a fresh baseline without events
+            baseline = game_state.civilization is not self._civilization
+            if baseline:
+                self._inputs = {}
+                self._components = {track: {} for track in VICTORY_TRACKS}
+                self._civilization = game_state.civilization
+
+            dirty = set()
+            for name, key_of, contributions in VICTORY_INPUTS:
+                key = key_of(game_state)
+                if name in self._inputs and self._inputs[name] == key:
+                    continue
+                self._inputs[name] = key
+                for track, contribution in contributions.items():
+                    self._components[track][name] = contribution(key)
+                    dirty.add(track)
+
+            events = []
+            initialize_victory_tracking(game_state)
+            stored = game_state.civilization['victory_progress']
+            for track in VICTORY_TRACKS:
+                if track not in dirty:
+                    continue
+                old = self.progress[track]
+                new = _track_score(track, sum(self._components[track].values()))
+                self.progress[track] = new
+                stored[track] = new
+                if not baseline:
+                    events.extend(self._crossings(game_state, track, old, new))
+
+            self._version = getattr(game_state, 'version', None)
+
+        for event in events:
+            self.milestones.append(event)
+            arrow = "🏆" if event['direction'] == 'reached' else "📉"
+            print(f"  {arrow} Victory milestone: {event['track']} progress {event['direction']} "
+                  f"{event['threshold']} ({event['progress']}/100)")
+            for listener in self._listeners:
+                listener(event)
+        return events
+
+    @staticmethod
+    def _crossings(game_state, track, old, new):
+        events = []
+        for threshold in VICTORY_MILESTONES:
+            if old < threshold <= new:
+                direction = 'reached'
+            elif new < threshold <= old:
+                direction = 'lost'
+            else:
+                continue
+            events.append({
+                'type': 'victory_milestone',
+                'track': track,
+                'threshold': threshold,
+                'direction': direction,
+                'progress': new,
+                'turn': getattr(game_state, 'turn_number', None),
+            })
+        return events
+
+
+def get_victory_tracker(game_state):
+    """Get the VictoryTracker kept on a game state (created on first use)."""
+    tracker = vars(game_state).get('_victory_tracker')
+    if tracker is None:
+        tracker = VictoryTracker()
+        game_state._victory_tracker = tracker
+    return tracker
 
-    # Save progress
-    game_state.civilization['victory_progress'] = progress
 
-    return progress
+def calculate_victory_progress(game_state):
+    """
+    Calculate progress toward each victory condition.
+    Returns dict with progress percentages (0-100) per victory type.
+    """
+    tracker = get_victory_tracker(game_state)
+    tracker.sync(game_state)
+    return game_state.civilization['victory_progress']
 
 def check_victory(game_state):
     """
     Check if any victory condition has been met.
     Returns (bool, victory_type, description) or (False, None, None)
     """
-    progress = calculate_victory_progress(game_state)
+    progress = get_victory_tracker(game_state).refresh(game_state)
 
     # Check each victory type (threshold: 100)
     for victory_type, score in progress.items():
@@ -149,7 +276,8 @@ def get_victory_status_summary(game_state):
     """
     Get a summary of current victory progress for UI display.
     """
-    progress = calculate_victory_progress(game_state)
+    tracker = get_victory_tracker(game_state)
+    progress = dict(tracker.refresh(game_state))
 
     # Find closest to victory
     sorted_progress = sorted(progress.items(), key=lambda x: x[1], reverse=True)
@@ -158,6 +286,7 @@ def get_victory_status_summary(game_state):
         'closest_victory': sorted_progress[0][0],
         'closest_progress': sorted_progress[0][1],
         'all_progress': progress,
+        'milestones': list(tracker.milestones),
         'recommendations': []
     }
 
@@ -621,6 +621,106 @@ def generate_advisor_portrait(advisor, civilization_context):
         }
 
 
+# ============================================================================
+# PARALLEL PORTRAIT FAN-OUT
+# ============================================================================
+
+# Maximum portraits rendered at once (image calls are I/O bound)
+PORTRAIT_MAX_WORKERS = 6
+
+# How long a batch waits before returning placeholders for stragglers (seconds)
+PORTRAIT_BATCH_DEADLINE_SECONDS = 60
+
+_portrait_executor = None
+
+
+def _get_portrait_executor():
+    """Shared bounded pool so stragglers keep rendering after a batch returns."""
+    global _portrait_executor
+    if _portrait_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _portrait_executor = ThreadPoolExecutor(max_workers=PORTRAIT_MAX_WORKERS,
+                                                thread_name_prefix='portrait')
+    return _portrait_executor
+
+
+def _placeholder_result(error):
+    return {
+        "image_path": "static/placeholder.png",
+        "filename": "placeholder.png",
+        "success": False,
+        "error": error
+    }
+
+
+def generate_portraits_parallel(portrait_requests, on_result=None,
+                                deadline=PORTRAIT_BATCH_DEADLINE_SECONDS):
+    """
+    Render a batch of portraits concurrently with a per-batch deadline.
+
+    Batch latency is bounded by the slowest single portrait (or the deadline)
+    instead of the sum of all of them. Portraits still rendering at the
+    deadline get a placeholder result with 'pending': True; they keep running
+    and on_result is called when they land so callers can fill them in.
+
+    Args:
+        portrait_requests: List of (generate_fn, subject, civilization_context),
+            e.g. (generate_advisor_portrait, advisor, civ_context)
+        on_result: Optional callback(index, result, late) called as each portrait completes
+        deadline: Seconds to wait for the batch before returning placeholders
+
+    Returns:
+        List of results in request order
+    """
+    import threading
+    from concurrent.futures import wait
+
+    executor = _get_portrait_executor()
+    futures = [executor.submit(fn, subject, context) for fn, subject, context in portrait_requests]
+    batch_returned = {'value': False}
+    batch_lock = threading.Lock()
+
+    def _notify(index, future):
+        try:
+            result = future.result()
+        except Exception as e:
+            print(f"Error generating portrait: {e}")
+            result = _placeholder_result(str(e))
+        with batch_lock:
+            late = batch_returned['value']
+        if on_result:
+            try:
+                on_result(index, result, late)
+            except Exception as e:
+                print(f"Error handling portrait result: {e}")
+
+    # Hook callbacks before waiting so in-time results are reported as they land
+    for index, future in enumerate(futures):
+        future.add_done_callback(lambda f, i=index: _notify(i, f))
+
+    wait(futures, timeout=deadline)
+    with batch_lock:
+        batch_returned['value'] = True
+
+    results = []
+    pending = 0
+    for future in futures:
+        if future.done():
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append(_placeholder_result(str(e)))
+        else:
+            placeholder = _placeholder_result("Portrait still rendering")
+            placeholder['pending'] = True
+            results.append(placeholder)
+            pending += 1
+
+    if pending:
+        print(f"  ⏱️ {pending} portrait(s) still rendering after {deadline}s, using placeholders")
+    return results
+
+
 # ============================================================================
 # ASYNC IMAGE UPDATE FUNCTIONS (Background Threading)
 # ============================================================================
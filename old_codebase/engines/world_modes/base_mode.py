@@ -6,6 +6,8 @@ Each mode must implement specific methods for generating civilizations, factions
 geography, and other world elements.
 """
 
+import copy
+import random
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Tuple
 
@@ -13,6 +15,24 @@ from typing import Dict, List, Any, Tuple
 class WorldMode(ABC):
     """Abstract base class for world generation modes."""
 
+    # Random stream used for generation. WorldGenerator binds the game's
+    # 'worldgen' stream with with_rng() so generated worlds are reproducible.
+    rng = random.Random()
+
+    def with_rng(self, rng: random.Random) -> 'WorldMode':
+        """
+        Copy of this mode that draws from the given random stream.
+
+        Args:
+            rng: random.Random to use for generation
+
+        Returns:
+            WorldMode instance bound to rng
+        """
+        mode = copy.copy(self)
+        mode.rng = rng
+        return mode
+
     @abstractmethod
     def get_era_configs(self) -> Dict[str, Dict[str, Any]]:
         """
@@ -5,7 +5,6 @@ This mode provides randomized fantasy world generation with fictional civilizati
 cultures, and geography. This is the original world generation behavior.
 """
 
-import random
 from typing import Dict, List, Any
 from engines.world_modes.base_mode import WorldMode
 
@@ -192,7 +191,7 @@ class FantasyWorldMode(WorldMode):
     def get_starting_year(self, era: str) -> int:
         era_config = self.ERA_CONFIGS.get(era, self.ERA_CONFIGS["bronze_age"])
         year_min, year_max = era_config["year_range"]
-        return random.randint(year_min, year_max)
+        return self.rng.randint(year_min, year_max)
 
     def generate_civilization(self, config: Dict[str, Any]) -> Dict[str, Any]:
         era = config.get("starting_era", config.get("era", "bronze_age"))
@@ -209,7 +208,7 @@ class FantasyWorldMode(WorldMode):
             "large": (2000, 5000)
         }
         pop_min, pop_max = pop_ranges[population_size]
-        population = random.randint(
+        population = self.rng.randint(
             int(pop_min * era_config["population_multiplier"]),
             int(pop_max * era_config["population_multiplier"])
         )
@@ -221,7 +220,7 @@ class FantasyWorldMode(WorldMode):
         if not leader_name:
             leader_name = self._generate_leader_name()
 
-        leader_traits = random.sample([
+        leader_traits = self.rng.sample([
             "Wise", "Brave", "Diplomatic", "Strategic", "Charismatic",
             "Cautious", "Bold", "Spiritual", "Pragmatic", "Visionary"
         ], 3)
@@ -236,16 +235,16 @@ class FantasyWorldMode(WorldMode):
             },
             "leader": {
                 "name": leader_name,
-                "age": random.randint(25, 45),
-                "life_expectancy": random.randint(60, 80),
+                "age": self.rng.randint(25, 45),
+                "life_expectancy": self.rng.randint(60, 80),
                 "role": "Leader",
                 "traits": leader_traits,
                 "years_ruled": 0
             },
             "population": population,
             "resources": {
-                "food": population * random.randint(1, 3),
-                "wealth": population * random.randint(1, 2),
+                "food": population * self.rng.randint(1, 3),
+                "wealth": population * self.rng.randint(1, 2),
                 "tech_tier": era_config["tech_tier"]
             }
         }
@@ -258,14 +257,14 @@ class FantasyWorldMode(WorldMode):
 
         # Select values
         values = culture_template["values"].copy()
-        values.extend(random.sample([
+        values.extend(self.rng.sample([
             "Survival", "Community", "Respect for Elders", "Adaptation",
             "Craftsmanship", "Generosity", "Resilience"
         ], 3))
 
         # Select traditions
         traditions = culture_template["sample_traditions"].copy()
-        traditions.extend(random.sample([
+        traditions.extend(self.rng.sample([
             "Oral Storytelling", "Seasonal Celebrations", "Coming of Age Ceremonies",
             "Ancestral Veneration", "Crafting Competitions"
         ], 2))
@@ -273,7 +272,7 @@ class FantasyWorldMode(WorldMode):
         return {
             "values": values[:8],
             "traditions": traditions[:6],
-            "taboos": ["Harming Kin", random.choice(["Oath Breaking", "Sacrilege", "Betrayal", "Waste"])],
+            "taboos": ["Harming Kin", self.rng.choice(["Oath Breaking", "Sacrilege", "Betrayal", "Waste"])],
             "social_structure": self.SOCIAL_STRUCTURES[social_structure],
             "recent_changes": []
         }
@@ -296,12 +295,12 @@ class FantasyWorldMode(WorldMode):
             "none": ["Various Spirits", "Personal Beliefs", "Folk Traditions"]
         }
 
-        primary_deity = random.choice(deity_names.get(religion_type, ["The Unknown"]))
+        primary_deity = self.rng.choice(deity_names.get(religion_type, ["The Unknown"]))
 
         # Generate holy sites
         holy_sites = [
-            random.choice(["The Sacred Grove", "The Great Oak", "The Ancient Cave", "The Stone Circle"]),
-            random.choice(["The Mountain Peak", "The River Source", "The Ancestor's Tomb", "The First Settlement"])
+            self.rng.choice(["The Sacred Grove", "The Great Oak", "The Ancient Cave", "The Stone Circle"]),
+            self.rng.choice(["The Mountain Peak", "The River Source", "The Ancestor's Tomb", "The First Settlement"])
         ]
 
         return {
@@ -311,7 +310,7 @@ class FantasyWorldMode(WorldMode):
             "core_tenets": religion_config["tenets"],
             "practices": religion_config["practices"],
             "holy_sites": holy_sites,
-            "influence": random.choice(["dominant", "significant", "moderate"]),
+            "influence": self.rng.choice(["dominant", "significant", "moderate"]),
             "schisms": []
         }
 
@@ -340,22 +339,22 @@ class FantasyWorldMode(WorldMode):
         # Adjust resources based on abundance
         resources = terrain_config["resources"].copy()
         if resource_abundance == "abundant":
-            resources.extend(random.sample(["Medicinal Herbs", "Precious Stones", "Rare Woods", "Exotic Spices"], 2))
+            resources.extend(self.rng.sample(["Medicinal Herbs", "Precious Stones", "Rare Woods", "Exotic Spices"], 2))
         elif resource_abundance == "scarce":
             resources = resources[:max(2, len(resources) - 2)]
 
         # Adjust threats based on difficulty
         threats = terrain_config["threats"].copy()
         if difficulty == "challenging":
-            threats.extend(random.sample(["Hostile Neighbors", "Natural Disasters", "Resource Scarcity", "Disease"], 2))
+            threats.extend(self.rng.sample(["Hostile Neighbors", "Natural Disasters", "Resource Scarcity", "Disease"], 2))
         elif difficulty == "peaceful":
             threats = threats[:max(1, len(threats) - 1)]
 
         # Generate neighbors
         neighbor_counts = {
             "none": 0,
-            "few": random.randint(1, 2),
-            "several": random.randint(3, 4)
+            "few": self.rng.randint(1, 2),
+            "several": self.rng.randint(3, 4)
         }
 
         num_neighbors = neighbor_counts.get(neighbor_count, 1)
@@ -368,13 +367,13 @@ class FantasyWorldMode(WorldMode):
         ]
 
         for i in range(num_neighbors):
-            relationship = random.choice(["allied", "neutral", "wary", "hostile"]) if difficulty != "peaceful" else random.choice(["allied", "neutral", "friendly"])
+            relationship = self.rng.choice(["allied", "neutral", "wary", "hostile"]) if difficulty != "peaceful" else self.rng.choice(["allied", "neutral", "friendly"])
 
             neighbors.append({
-                "name": random.choice(neighbor_names),
+                "name": self.rng.choice(neighbor_names),
                 "relationship": relationship,
                 "strength": "unknown",
-                "distance": random.choice(["nearby", "several days journey", "distant"]),
+                "distance": self.rng.choice(["nearby", "several days journey", "distant"]),
                 "history": "Recently discovered" if i == 0 else "Known through tales and occasional contact"
             })
 
@@ -507,10 +506,10 @@ class FantasyWorldMode(WorldMode):
             traits = template["base_traits"].copy()
             cultural_traits = template["cultural_traits"].get(cultural_focus, [])
             if cultural_traits:
-                traits.extend(random.sample(cultural_traits, min(2, len(cultural_traits))))
+                traits.extend(self.rng.sample(cultural_traits, min(2, len(cultural_traits))))
 
             # Randomly shuffle and pick 4 unique traits
-            random.shuffle(traits)
+            self.rng.shuffle(traits)
             traits = traits[:4]
 
             # Find matching faction
@@ -523,7 +522,7 @@ class FantasyWorldMode(WorldMode):
 
             # If no match, use a random faction or None
             if not faction_link and factions:
-                faction_link = factions[random.randint(0, len(factions) - 1)]["name"]
+                faction_link = factions[self.rng.randint(0, len(factions) - 1)]["name"]
 
             # Generate a culturally appropriate name
             name = self._generate_advisor_name(cultural_focus, era, template["role_key"])
@@ -539,9 +538,9 @@ class FantasyWorldMode(WorldMode):
                 "dialogue_sample": dialogue,
                 "history": [f"Appointed to the council as {role}."],
                 "metrics": {
-                    "relationship": random.randint(45, 55),
-                    "influence": random.randint(40, 70),
-                    "loyalty": random.randint(55, 75)
+                    "relationship": self.rng.randint(45, 55),
+                    "influence": self.rng.randint(40, 70),
+                    "loyalty": self.rng.randint(55, 75)
                 },
                 "portrait": "placeholder.png"
             }
@@ -583,10 +582,10 @@ class FantasyWorldMode(WorldMode):
         pool = name_pools.get(cultural_focus, name_pools["spiritual"])
 
         # Determine gender based on role (mix of male/female)
-        gender = random.choice(["male", "female"])
+        gender = self.rng.choice(["male", "female"])
 
         # Select name
-        first_name = random.choice(pool[gender])
+        first_name = self.rng.choice(pool[gender])
 
         # Add title based on role
         titles_by_role = {
@@ -596,7 +595,7 @@ class FantasyWorldMode(WorldMode):
         }
 
         title_pool = titles_by_role.get(role_key, ["the Wise"])
-        title = random.choice(title_pool)
+        title = self.rng.choice(title_pool)
 
         return f"{first_name} {title}"
 
@@ -720,7 +719,7 @@ class FantasyWorldMode(WorldMode):
                 "Together, we shall guide our people to greatness."
             ]
 
-        return random.choice(dialogue_pool)
+        return self.rng.choice(dialogue_pool)
 
     def _generate_leader_name(self):
         """Generate a random leader name."""
@@ -733,7 +732,7 @@ class FantasyWorldMode(WorldMode):
             "the Builder", "the Diplomat", "the Warrior", "the Keeper", "the Guide"
         ]
 
-        return f"{random.choice(first_names)}, {random.choice(titles)}"
+        return f"{self.rng.choice(first_names)}, {self.rng.choice(titles)}"
 
     def generate(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Generate complete fantasy world."""
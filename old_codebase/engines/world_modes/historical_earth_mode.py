@@ -11,7 +11,6 @@ Features:
 - Timeline divergence scoring and alternate timeline naming
 """
 
-import random
 from typing import Dict, List, Any, Optional
 from engines.world_modes.base_mode import WorldMode
 
@@ -432,7 +431,7 @@ class HistoricalEarthMode(WorldMode):
     def get_starting_year(self, era: str) -> int:
         era_config = self.ERA_CONFIGS.get(era, self.ERA_CONFIGS["bronze_age"])
         year_min, year_max = era_config["year_range"]
-        return random.randint(year_min, year_max)
+        return self.rng.randint(year_min, year_max)
 
     def generate_civilization(self, config: Dict[str, Any]) -> Dict[str, Any]:
         era = config.get("starting_era", config.get("era", "bronze_age"))
@@ -448,7 +447,7 @@ class HistoricalEarthMode(WorldMode):
         if use_historical and era == "classical":
             # Use historical civilization name
             if region == "mediterranean":
-                faction_template = random.choice(["classical_rome", "classical_greece"])
+                faction_template = self.rng.choice(["classical_rome", "classical_greece"])
             else:
                 faction_template = "classical_rome"  # Default for now
 
@@ -467,7 +466,7 @@ class HistoricalEarthMode(WorldMode):
             "large": (2000, 5000)
         }
         pop_min, pop_max = pop_ranges[population_size]
-        population = random.randint(
+        population = self.rng.randint(
             int(pop_min * era_config["population_multiplier"]),
             int(pop_max * era_config["population_multiplier"])
         )
@@ -479,7 +478,7 @@ class HistoricalEarthMode(WorldMode):
         if era_config.get("butterfly_effects_enabled", False):
             self.butterfly_tracker = ButterflyEffectTracker(era, year)
 
-        leader_traits = random.sample([
+        leader_traits = self.rng.sample([
             "Wise", "Brave", "Diplomatic", "Strategic", "Charismatic",
             "Cautious", "Bold", "Pious", "Pragmatic", "Visionary"
         ], 3)
@@ -497,16 +496,16 @@ class HistoricalEarthMode(WorldMode):
             },
             "leader": {
                 "name": leader_name,
-                "age": random.randint(25, 45),
-                "life_expectancy": random.randint(50, 70),  # Realistic for ancient times
+                "age": self.rng.randint(25, 45),
+                "life_expectancy": self.rng.randint(50, 70),  # Realistic for ancient times
                 "role": "Leader",
                 "traits": leader_traits,
                 "years_ruled": 0
             },
             "population": population,
             "resources": {
-                "food": population * random.randint(1, 3),
-                "wealth": population * random.randint(1, 2),
+                "food": population * self.rng.randint(1, 3),
+                "wealth": population * self.rng.randint(1, 2),
                 "tech_tier": era_config["tech_tier"]
             }
         }
@@ -532,7 +531,7 @@ class HistoricalEarthMode(WorldMode):
         values.extend(regional_values.get(region, ["Community", "Tradition"]))
 
         traditions = culture_template["sample_traditions"].copy()
-        traditions.extend(random.sample([
+        traditions.extend(self.rng.sample([
             "Oral Storytelling", "Seasonal Celebrations", "Coming of Age Ceremonies",
             "Ancestral Veneration", "Crafting Competitions"
         ], 2))
@@ -540,7 +539,7 @@ class HistoricalEarthMode(WorldMode):
         return {
             "values": values[:8],
             "traditions": traditions[:6],
-            "taboos": ["Harming Kin", random.choice(["Breaking Oaths", "Sacrilege", "Betraying Trust"])],
+            "taboos": ["Harming Kin", self.rng.choice(["Breaking Oaths", "Sacrilege", "Betraying Trust"])],
             "social_structure": self.SOCIAL_STRUCTURES[social_structure],
             "recent_changes": []
         }
@@ -551,7 +550,7 @@ class HistoricalEarthMode(WorldMode):
 
         # Region-appropriate religions
         if era in ["stone_age", "bronze_age"]:
-            religion_type = random.choice(["animism", "polytheism", "ancestor_worship"])
+            religion_type = self.rng.choice(["animism", "polytheism", "ancestor_worship"])
         else:
             religion_type = config.get("religion_type", "polytheism")
 
@@ -578,11 +577,11 @@ class HistoricalEarthMode(WorldMode):
         }
 
         deity_options = regional_deities.get(region, {}).get(religion_type, ["The Great Spirit"])
-        primary_deity = random.choice(deity_options)
+        primary_deity = self.rng.choice(deity_options)
 
         holy_sites = [
-            f"The Sacred {random.choice(['Grove', 'Mountain', 'Temple', 'Spring'])}",
-            f"The Ancient {random.choice(['Shrine', 'Monument', 'Altar', 'Cave'])}"
+            f"The Sacred {self.rng.choice(['Grove', 'Mountain', 'Temple', 'Spring'])}",
+            f"The Ancient {self.rng.choice(['Shrine', 'Monument', 'Altar', 'Cave'])}"
         ]
 
         return {
@@ -592,7 +591,7 @@ class HistoricalEarthMode(WorldMode):
             "core_tenets": religion_config["tenets"],
             "practices": religion_config["practices"],
             "holy_sites": holy_sites,
-            "influence": random.choice(["dominant", "significant"]),
+            "influence": self.rng.choice(["dominant", "significant"]),
             "schisms": []
         }
 
@@ -624,17 +623,17 @@ class HistoricalEarthMode(WorldMode):
         neighbors = []
         for neighbor_name in neighbors_list[:3]:  # Limit to 3 neighbors
             if difficulty == "peaceful":
-                relationship = random.choice(["allied", "neutral", "friendly"])
+                relationship = self.rng.choice(["allied", "neutral", "friendly"])
             elif difficulty == "challenging":
-                relationship = random.choice(["neutral", "wary", "hostile"])
+                relationship = self.rng.choice(["neutral", "wary", "hostile"])
             else:
-                relationship = random.choice(["allied", "neutral", "wary"])
+                relationship = self.rng.choice(["allied", "neutral", "wary"])
 
             neighbors.append({
                 "name": neighbor_name,
                 "relationship": relationship,
                 "strength": "unknown",
-                "distance": random.choice(["nearby", "several days journey", "distant"]),
+                "distance": self.rng.choice(["nearby", "several days journey", "distant"]),
                 "history": f"Historical presence in the {region_config['region_name']}"
             })
 
@@ -657,7 +656,7 @@ class HistoricalEarthMode(WorldMode):
         # Use historical factions for Classical era
         if era_config.get("historical_factions_enabled", False) and era == "classical":
             if region == "mediterranean":
-                faction_key = random.choice(["classical_rome", "classical_greece", "classical_carthage"])
+                faction_key = self.rng.choice(["classical_rome", "classical_greece", "classical_carthage"])
             else:
                 faction_key = "classical_rome"
 
@@ -697,8 +696,8 @@ class HistoricalEarthMode(WorldMode):
             factions.append({
                 "name": template["name"],
                 "leader": template["leader"],
-                "approval": random.randint(55, 65),
-                "support_percentage": random.randint(20, 30),
+                "approval": self.rng.randint(55, 65),
+                "support_percentage": self.rng.randint(20, 30),
                 "status": "Neutral",
                 "goals": [
                     f"Advance {template['focus']}",
@@ -777,9 +776,9 @@ class HistoricalEarthMode(WorldMode):
                 "dialogue_sample": f"I serve our people with {traits[0].lower()} dedication.",
                 "history": [f"Appointed as {role}."],
                 "metrics": {
-                    "relationship": random.randint(45, 60),
-                    "influence": random.randint(40, 70),
-                    "loyalty": random.randint(55, 75)
+                    "relationship": self.rng.randint(45, 60),
+                    "influence": self.rng.randint(40, 70),
+                    "loyalty": self.rng.randint(55, 75)
                 },
                 "portrait": "placeholder.png"
             }
@@ -814,11 +813,11 @@ class HistoricalEarthMode(WorldMode):
         }
 
         region_names = names.get(region, names["mediterranean"])
-        gender = random.choice(["male", "female"])
-        name = random.choice(region_names[gender])
+        gender = self.rng.choice(["male", "female"])
+        name = self.rng.choice(region_names[gender])
 
         titles = ["the Great", "the Wise", "the Builder", "the Just", "the Bold"]
-        return f"{name} {random.choice(titles)}"
+        return f"{name} {self.rng.choice(titles)}"
 
     def generate(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """Generate complete historical Earth world."""
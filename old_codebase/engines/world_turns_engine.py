@@ -1,9 +1,21 @@
 import json
 from json import JSONDecodeError
 import google.generativeai as genai
-from model_config import TEXT_MODEL
+from model_config import TEXT_MODEL, WORLD_TURN_CONTEXT_TOKENS, ADVISOR_MEMORY_TOKENS
 from engines.bonus_engine import BonusEngine
 from engines.bonus_definitions import BonusType
+from engines.token_budget import fit_to_budget, truncate_text
+from engines.state_encoding import encode_state, with_state_legend
+from engines.prompt_session import session_for
+from engines.prompt_budget import render_prompt
+from engines.event_transcript import render_transcript
+from engines.memory_store import recall_memories
+
+# Advisor memories per advisor in the world-turn context when there is no memory store
+ADVISOR_MEMORY_LIMIT = 3
+
+# Context lists sorted most-important-first: encoding elides their tail, not their head
+WORLD_TURN_HEAD_LISTS = ('factions', 'advisors')
 
 class WorldTurnsEngine:
     def calculate_rates_with_bonus_engine(self, game_state):
@@ -40,6 +52,96 @@ class WorldTurnsEngine:
             'culture_sources': culture_bonuses['sources']
         }
 
+    def project_turn_context(self, game_state, last_action_details):
+        """
+        Select only the state the world-turn model needs to judge reactions.
+
+        Returns a dict of sections: the civilization headline, factions
+        (approval, status, goals), advisors (role, metrics, last memories),
+        neighbors (relationship), and the action with its outcome.
+        """
+        civ = game_state.civilization
+        meta = civ.get('meta', {})
+
+        if hasattr(game_state, 'faction_manager'):
+            factions = game_state.faction_manager.get_all()
+        else:
+            factions = game_state.factions if isinstance(game_state.factions, list) else []
+
+        if hasattr(game_state, 'inner_circle_manager'):
+            advisors = game_state.inner_circle_manager.get_all()
+        else:
+            advisors = game_state.inner_circle if isinstance(game_state.inner_circle, list) else []
+
+        known_peoples = game_state.world.get('known_peoples', [])
+        if not isinstance(known_peoples, list):
+            known_peoples = []
+
+        outcome = last_action_details.get('outcome', {})
+        situation = f"{last_action_details.get('action', '')} {outcome.get('narrative', '') if isinstance(outcome, dict) else outcome}"
+        if isinstance(outcome, dict):
+            outcome_summary = {
+                'narrative': truncate_text(outcome.get('narrative', ''), 400),
+                'updates': truncate_text(json.dumps(outcome.get('updates', {}), separators=(',', ':')), 200)
+            }
+        else:
+            outcome_summary = {'narrative': truncate_text(outcome, 400)}
+
+        return {
+            'civilization': {
+                'name': meta.get('name'),
+                'year': meta.get('year'),
+                'era': meta.get('era'),
+                'population': civ.get('population'),
+                'happiness': game_state.population_happiness,
+                'leader': civ.get('leader', {}).get('name')
+            },
+            'action': truncate_text(last_action_details.get('action', ''), 200),
+            'outcome': outcome_summary,
+            # Lowest-support factions trimmed first under budget pressure
+            'factions': [
+                {
+                    'name': f.get('name'),
+                    'approval': f.get('approval'),
+                    'status': f.get('status'),
+                    'goals': f.get('goals', [])[:3]
+                }
+                for f in sorted(factions, key=lambda f: f.get('support_percentage', 0), reverse=True)
+            ],
+            'advisors': [
+                {
+                    'name': a.get('name'),
+                    'role': a.get('role'),
+                    'metrics': a.get('metrics', {}),
+                    'memories': recall_memories(game_state, a, situation, ADVISOR_MEMORY_TOKENS,
+                                                fallback=ADVISOR_MEMORY_LIMIT)
+                }
+                for a in sorted(advisors, key=lambda a: a.get('metrics', {}).get('influence', 0), reverse=True)
+            ],
+            'neighbors': [
+                {'name': p.get('name'), 'relationship': p.get('relationship', 'neutral')}
+                for p in known_peoples
+            ]
+        }
+
+    def build_turn_context(self, game_state, last_action_details):
+        """
+        Encode the projected turn context compactly within the token budget.
+
+        Returns:
+            Canonical encoded state (see state_encoding) no larger than
+            WORLD_TURN_CONTEXT_TOKENS (estimated)
+        """
+        projection = self.project_turn_context(game_state, last_action_details)
+        context_json, tokens, _ = fit_to_budget(
+            projection,
+            WORLD_TURN_CONTEXT_TOKENS,
+            trim_order=['neighbors', 'advisors', 'factions', 'outcome'],
+            encoder=lambda sections: encode_state(sections, keep_head=WORLD_TURN_HEAD_LISTS)
+        )
+        print(f"  World turn context: ~{tokens} tokens")
+        return context_json
+
     def simulate_turn(self, game_state, last_action_details):
         """
         Calculates the resource rates for a turn based on the current game state.
@@ -52,118 +154,53 @@ class WorldTurnsEngine:
         # Check if this was a council meeting
         is_council = last_action_details.get('event_type') == 'council_meeting'
 
-        # Construct AI prompt for world changes
-        game_state_json = json.dumps(game_state.to_dict(), indent=2)
+        # Construct AI prompt for world changes from a budgeted projection of the state
+        turn_context = self.build_turn_context(game_state, last_action_details)
 
         if is_council:
             # COUNCIL MEETING: Analyze conversation to determine advisor reactions
             conversation = last_action_details.get('conversation', [])
-            conv_text = "\n".join([
-                f"Player: {entry['player']}\nAdvisor Response: {entry['ai']}"
-                for entry in conversation
-            ])
-
-            ai_prompt = f"""
-Given the current game state:
-{game_state_json}
-
-And this COUNCIL MEETING conversation:
-{conv_text}
-
-Player's final decision: {last_action_details['action']}
-Outcome: {last_action_details['outcome']}
-
-Analyze the DIALOGUE CHOICES the player made during the council meeting. Determine how each Inner Circle advisor would react based on:
-- Whether the player agreed with their position
-- Whether the final decision aligned with their stance
-- The tone of the player's questions/responses to them
-
-Generate balanced inner_circle_updates with:
-- Advisors aligned with player's choices: +3 to +8 loyalty/opinion_change
-- Advisors opposed by player's choices: -3 to -8 loyalty/opinion_change
-- Include a brief "memory" of this council meeting for each advisor
-
-Also determine faction and neighboring civilization reactions.
-
-Your response must be a valid JSON object with the following structure:
-{{
-  "faction_updates": [
-    {{
-      "name": "string",
-      "approval_change": "integer",
-      "reason": "Brief human-readable explanation for the change"
-    }}
-  ],
-  "inner_circle_updates": [
-    {{
-      "name": "string",
-      "loyalty_change": "integer (max ±8)",
-      "opinion_change": "integer (max ±8)",
-      "memory": "Brief description of this council meeting from their perspective"
-    }}
-  ],
-  "neighboring_civilization_updates": [
-    {{
-      "name": "string",
-      "relationship_change": "integer"
-    }}
-  ]
-}}
-"""
+            conv_text = render_transcript(conversation, "Player: {player}\nAdvisor Response: {ai}")
+
+            prompt_kind = 'council'
+            state_intro = "Given the current game state (including the player's final decision and its outcome):"
+            # Per-turn input and static instructions, each within its token budget
+            turn_input = render_prompt('world_turns/council_conversation', trim_order=['conversation'],
+                                       conversation=conv_text)
+            instructions = render_prompt('world_turns/council_reactions')
         else:
             # NON-COUNCIL EVENTS: Use existing logic
-            ai_prompt = f"""
-Given the current game state:
-{game_state_json}
-
-And the last player action:
-{last_action_details}
-
-Determine the indirect consequences of this action. Return a JSON object detailing subtle changes to the following:
-- Faction approval and support.
-- Inner Circle character metrics (loyalty, influence) and a new memory to add to their "history".
-- The relationship status of neighboring civilizations.
-
-Your response must be a valid JSON object with the following structure:
-{{
-  "faction_updates": [
-    {{
-      "name": "string",
-      "approval_change": "integer",
-      "reason": "Brief human-readable explanation for the change"
-    }}
-  ],
-  "inner_circle_updates": [
-    {{
-      "name": "string",
-      "loyalty_change": "integer",
-      "opinion_change": "integer"
-    }}
-  ],
-  "neighboring_civilization_updates": [
-    {{
-      "name": "string",
-      "relationship_change": "integer"
-    }}
-  ]
-}}
-"""
+            prompt_kind = 'standard'
+            state_intro = "Given the current game state (including the last player action and its outcome):"
+            turn_input = ''
+            instructions = render_prompt('world_turns/standard_consequences')
+
+        generation_config = {
+            "response_mime_type": "application/json",
+            "temperature": 0.7
+        }
 
         # Call Gemini API to get world updates
         try:
-            model = genai.GenerativeModel(TEXT_MODEL)
-            response = model.generate_content(
-                ai_prompt,
-                generation_config={
-                    "response_mime_type": "application/json",
-                    "temperature": 0.7
-                }
-            )
-            ai_updates = json.loads(response.text)
+            session = session_for(game_state, 'world_turns')
+            if session is not None:
+                # Session mode: full state once, then only what changed
+                response_text = session.send(
+                    game_state.turn_number, turn_context, instructions, prompt_kind,
+                    turn_input=turn_input, generation_config=generation_config
+                )
+            else:
+                ai_prompt = "\n\n".join(part for part in (state_intro, turn_context, turn_input, instructions) if part)
+                model = genai.GenerativeModel(TEXT_MODEL)
+                response_text = model.generate_content(
+                    with_state_legend(ai_prompt),
+                    generation_config=generation_config
+                ).text
+            ai_updates = json.loads(response_text)
             print(f"--- World Turn Simulation Complete ---")
         except JSONDecodeError as e:
             print(f"!!!!!!!!!! JSON PARSING ERROR (World Turn) !!!!!!!!!!!\n{e}")
-            print(f"Raw response: {response.text if 'response' in locals() else 'No response'}")
+            print(f"Raw response: {response_text if 'response_text' in locals() else 'No response'}")
             ai_updates = None
         except Exception as e:
             print(f"!!!!!!!!!! GEMINI API ERROR (World Turn) !!!!!!!!!!!\n{e}")
@@ -2,6 +2,7 @@ import json
 import os
 import tempfile
 import shutil
+import threading
 
 class GameState:
     """
@@ -37,10 +38,22 @@ class GameState:
             'inner_circle': os.path.join(context_dir, 'inner_circle.json'),
             'metadata': os.path.join(context_dir, 'game_metadata.json'),
             'buildings': os.path.join(context_dir, 'buildings.json'),
+            'advisor_memories': os.path.join(context_dir, 'advisor_memories.jsonl'),
         }
         self.factions = None
         self.inner_circle = None
 
+        # Monotonic state version (in-memory only). Bumped whenever the state
+        # changes so derived data (prompt contexts, tendencies) can be cached.
+        self.version = 0
+
+        # Held while saving; background jobs hand results back under it so
+        # nothing is mutated while the state is being serialized
+        self.save_lock = threading.RLock()
+
+        # Seeded random streams (engines/rng_service.py); persisted in metadata
+        self.rng = None
+
         # Add new state variables
         self.active_policy = None
         self.population_happiness = 70
@@ -60,36 +73,54 @@ class GameState:
         self.event_stage = 0
         self.event_conversation = []
 
-    def reset_to_defaults(self):
-        """Resets all game files to a fresh, randomized starting state."""
+    def bump_version(self):
+        """
+        Mark the state as changed. Call after mutating state outside of
+        load/save/apply_updates so cached derived data is rebuilt.
+
+        Returns:
+            The new version number
+        """
+        self.version += 1
+        return self.version
+
+    def reset_to_defaults(self, seed=None):
+        """
+        Resets all game files to a fresh, randomized starting state.
+
+        Args:
+            seed: Game seed (None = random); the same seed generates the same world
+        """
         self.turn_number = 0
         print("Generating new random civilization...")
 
         # Import WorldGenerator here to avoid circular imports
         from world_generator import WorldGenerator
-        import random
+        from engines.rng_service import GameRNG
 
         # Generate random configuration for a new game
         generator = WorldGenerator()
+        self.rng = GameRNG(seed)
+        rng = self.rng.stream('worldgen')
 
         # Randomize all starting parameters
         config = {
             "world_mode": "historical_earth",  # Default to historical_earth mode
-            "starting_era": random.choice(["stone_age", "bronze_age", "iron_age", "classical"]),
-            "earth_region": random.choice(["mediterranean", "mesopotamia", "nile_valley", "yellow_river", "indus_valley"]),
+            "starting_era": rng.choice(["stone_age", "bronze_age", "iron_age", "classical"]),
+            "earth_region": rng.choice(["mediterranean", "mesopotamia", "nile_valley", "yellow_river", "indus_valley"]),
             "civilization_name": self._generate_random_civ_name(),
-            "population_size": random.choice(["small", "medium", "large"]),
+            "population_size": rng.choice(["small", "medium", "large"]),
             "leader_name": "",  # Let the generator create a random leader name
-            "cultural_focus": random.choice(["martial", "spiritual", "agricultural", "mercantile", "scholarly", "artistic"]),
-            "religion_type": random.choice(["animism", "polytheism", "ancestor_worship"]),
-            "social_structure": random.choice(["egalitarian", "hierarchical", "tribal_council", "city_state"]),
+            "cultural_focus": rng.choice(["martial", "spiritual", "agricultural", "mercantile", "scholarly", "artistic"]),
+            "religion_type": rng.choice(["animism", "polytheism", "ancestor_worship"]),
+            "social_structure": rng.choice(["egalitarian", "hierarchical", "tribal_council", "city_state"]),
             "difficulty": "balanced",
-            "neighbor_count": random.choice(["few", "several"]),
+            "neighbor_count": rng.choice(["few", "several"]),
             "resource_abundance": "moderate"
         }
 
         # Generate fresh world data
-        world_data = generator.generate_world(config)
+        world_data = generator.generate_world(config, rng=self.rng)
 
         # Apply the new world data
         self.apply_custom_world(world_data)
@@ -100,7 +131,8 @@ class GameState:
 
     def _generate_random_civ_name(self):
         """Generate a random civilization name."""
-        import random
+        from engines.rng_service import get_rng
+        rng = get_rng(self).stream('worldgen')
 
         prefixes = [
             "The", "The Great", "The Ancient", "The Free", "The United",
@@ -118,7 +150,7 @@ class GameState:
             "Confederation", "Alliance", "League", "Union", "Society"
         ]
 
-        return f"{random.choice(prefixes)} {random.choice(names)} {random.choice(suffixes)}"
+        return f"{rng.choice(prefixes)} {rng.choice(names)} {rng.choice(suffixes)}"
 
     def apply_custom_world(self, world_data):
         """
@@ -129,6 +161,10 @@ class GameState:
         """
         print("Applying custom world configuration...")
 
+        # Continue the random streams the world was generated with
+        from engines.rng_service import GameRNG
+        self.rng = GameRNG.from_dict(world_data['rng']) if world_data.get('rng') else GameRNG()
+
         # Update in-memory state
         self.civilization = world_data.get('civilization', {})
         self.culture = world_data.get('culture', {})
@@ -150,7 +186,8 @@ class GameState:
         from engines.inner_circle_manager import InnerCircleManager
 
         self.faction_manager = FactionManager(self.factions)
-        self.inner_circle_manager = InnerCircleManager({'characters': self.inner_circle})
+        self.memory_store.reset()  # New world, new memories
+        self.inner_circle_manager = InnerCircleManager({'characters': self.inner_circle}, self.memory_store)
 
         print(f"  [OK] FactionManager reinitialized with {len(self.faction_manager)} factions")
         print(f"  [OK] InnerCircleManager reinitialized with {len(self.inner_circle_manager)} characters")
@@ -188,7 +225,9 @@ class GameState:
 
         # Create inner circle manager (new way)
         from engines.inner_circle_manager import InnerCircleManager
-        self.inner_circle_manager = InnerCircleManager(circle_data)
+        from engines.memory_store import AdvisorMemoryStore
+        self.memory_store = AdvisorMemoryStore(self.paths['advisor_memories'])
+        self.inner_circle_manager = InnerCircleManager(circle_data, self.memory_store)
         print(f"  [OK] FactionManager initialized with {len(self.faction_manager)} factions")
         print(f"  [OK] InnerCircleManager initialized with {len(self.inner_circle_manager)} characters")
 
@@ -209,6 +248,10 @@ class GameState:
         self.active_policy = metadata.get('active_policy', None)
         self.population_happiness = metadata.get('population_happiness', 70)
 
+        # Restore the seeded random streams (older saves get a fresh seed)
+        from engines.rng_service import GameRNG
+        self.rng = GameRNG.from_dict(metadata['rng']) if metadata.get('rng') else GameRNG()
+
         # Validate and fix leader data
         self._validate_leader()
 
@@ -221,6 +264,7 @@ class GameState:
         # Validate data integrity
         self._validate_data_integrity()
 
+        self.bump_version()
         print("Game state loaded successfully.")
 
     def _initialize_new_systems(self):
@@ -258,9 +302,8 @@ class GameState:
         # Ensure leader has traits (backwards compatibility)
         if 'traits' not in leader or not leader['traits']:
             # Assign default traits based on era/context
-            import random
             default_traits = ['Wise', 'Just', 'Brave']
-            leader['traits'] = random.sample(default_traits, 2)
+            leader['traits'] = self.rng.stream('succession').sample(default_traits, 2)
             print(f"  [OK] Assigned default traits to leader: {', '.join(leader['traits'])}")
         era = self.civilization.get('meta', {}).get('era', 'stone_age')
 
@@ -340,7 +383,13 @@ class GameState:
 
     def save(self):
         """Saves all in-memory game state back to their respective JSON files."""
+        with self.save_lock:
+            self._save_files()
+
+    def _save_files(self):
         print("Saving game state...")
+        # Everything that mutates state ends in a save, so treat it as a change
+        self.bump_version()
         self._save_atomic(self.paths['civilization'], self.civilization)
         self._save_atomic(self.paths['culture'], self.culture)
         self._save_atomic(self.paths['religion'], self.religion)
@@ -359,13 +408,18 @@ class GameState:
         else:
             self._save_atomic(self.paths['inner_circle'], {"characters": self.inner_circle})
 
+        # Append new advisor memories to the long-term log
+        if getattr(self, 'memory_store', None) is not None:
+            self.memory_store.flush()
+
         # Save buildings (Phase 4)
         self._save_atomic(self.paths['buildings'], self.buildings)
 
         self._save_atomic(self.paths['metadata'], {
             "turn_number": self.turn_number,
             "active_policy": self.active_policy,
-            "population_happiness": self.population_happiness
+            "population_happiness": self.population_happiness,
+            "rng": self.rng.to_dict() if self.rng is not None else None
         })
         print("Game state saved.")
 
@@ -1,7 +1,7 @@
 import os
 import json
 import threading
-from flask import Flask, jsonify, render_template, request
+from flask import Flask, Response, jsonify, render_template, request
 from dotenv import load_dotenv
 import google.generativeai as genai
 
@@ -13,6 +13,12 @@ from engines.state_updater import apply_world_turn_updates
 from engines.timeskip_engine import perform_timeskip, apply_updates as apply_timeskip_updates
 from engines.world_turns_engine import WorldTurnsEngine
 from engines import character_engine
+from engines.request_coalescer import get_coalescer, game_key
+from engines.idempotency_store import get_idempotency_store
+from engines.job_runner import get_job_runner
+from engines.succession_session import get_succession_sessions, find_candidate
+from engines.prompt_session import get_prompt_sessions
+from engines.history_summary import get_history_summarizer
 from world_generator import WorldGenerator
 
 # --- Initialization ---
@@ -27,6 +33,11 @@ app = Flask(__name__)
 
 # Global game instance - will be initialized when needed
 game = None
+# Serializes everything that mutates, saves or rebinds the global game: the
+# new/custom game and timeskip jobs and the turn-committing endpoints. Without
+# it a timeskip on a job worker could interleave with a second timeskip, an
+# action, or a new game rebinding `game` mid-run.
+game_lock = threading.RLock()
 world_turns_engine = WorldTurnsEngine()
 
 def initialize_game():
@@ -43,12 +54,20 @@ def initialize_game():
         print("ERROR: Context files not found. Make sure you have the 'context' directory with all JSON files.")
         return False
 
-def generate_advisor_portraits_sync(game_state):
+def generate_advisor_portraits_sync(game_state, progress=None, include_leader=False):
     """
-    Generate portraits for all advisors synchronously.
-    This ensures portraits are available immediately when the game loads.
+    Generate portraits for all advisors in one parallel batch.
+    This ensures portraits are available immediately when the game loads;
+    the wait is bounded by the slowest single portrait (or the batch deadline).
+    Portraits that miss the deadline keep placeholders and are filled in and
+    saved when they land.
+
+    Args:
+        game_state: GameState whose advisors need portraits
+        progress: Optional callback(done, total) called as portraits complete
+        include_leader: Also render the leader portrait in the same batch
     """
-    from engines.visual_engine import generate_advisor_portrait
+    from engines.visual_engine import generate_advisor_portrait, generate_leader_portrait, generate_portraits_parallel
 
     print("--- Starting advisor portrait generation ---")
 
@@ -66,19 +85,41 @@ def generate_advisor_portraits_sync(game_state):
     else:
         advisors = game_state.inner_circle.get('characters', [])
 
-    # Generate portrait for each advisor
-    for advisor in advisors:
-        try:
-            print(f"Generating portrait for {advisor.get('name', 'Unknown')}...")
-            portrait_result = generate_advisor_portrait(advisor, civ_context)
-
-            if portrait_result.get('success'):
-                advisor['portrait'] = portrait_result.get('filename', 'placeholder.png')
-                print(f"✓ Portrait generated for {advisor.get('name')}")
-            else:
-                print(f"✗ Portrait generation failed for {advisor.get('name')}")
-        except Exception as e:
-            print(f"Error generating portrait for {advisor.get('name', 'Unknown')}: {e}")
+    portrait_requests = [(generate_advisor_portrait, advisor, civ_context) for advisor in advisors]
+    if include_leader:
+        portrait_requests.append((generate_leader_portrait, game_state.civilization.get('leader', {}), civ_context))
+
+    total = len(portrait_requests)
+    completed = {'count': 0}
+    lock = threading.Lock()
+
+    def _on_result(index, portrait_result, late):
+        subject = portrait_requests[index][1]
+        if portrait_result.get('success'):
+            # Late stragglers only touch the in-memory record; the next normal
+            # save persists them (saving from this executor thread could
+            # overwrite a newer game's files)
+            with game_state.save_lock:
+                subject['portrait'] = portrait_result.get('filename', 'placeholder.png')
+            print(f"✓ Portrait generated for {subject.get('name')}")
+            if index == len(advisors):
+                # Initialize the image update tracker with the leader's initial state
+                from engines.image_update_manager import get_tracker
+                get_tracker().update_portrait_state(game_state)
+        else:
+            print(f"✗ Portrait generation failed for {subject.get('name')}")
+
+        if late:
+            return
+        with lock:
+            completed['count'] += 1
+            done = completed['count']
+        if progress:
+            progress(done, total)
+
+    if progress:
+        progress(0, total)
+    generate_portraits_parallel(portrait_requests, on_result=_on_result)
 
     print("--- Advisor portrait generation complete ---")
 
@@ -97,6 +138,92 @@ def generate_advisor_portraits_async(game_state):
     thread = threading.Thread(target=_generate, daemon=True)
     thread.start()
 
+def get_idempotency_key():
+    """
+    Returns the client-supplied idempotency key for the current request.
+    Accepts the 'Idempotency-Key' header or an 'idempotency_key' JSON field.
+    """
+    key = request.headers.get('Idempotency-Key')
+    if not key:
+        data = request.get_json(silent=True) or {}
+        key = data.get('idempotency_key')
+    return key
+
+def idempotency_store_key(scope):
+    """
+    Returns the idempotency store key for the current request,
+    or None when the client sent no idempotency key.
+    """
+    key = get_idempotency_key()
+    if not key:
+        return None
+    return (scope, game_key(game), key)
+
+def run_idempotent(scope, func):
+    """
+    Runs a turn-committing handler at most once per idempotency key.
+
+    Args:
+        scope: Endpoint name used to namespace keys
+        func: Zero-argument callable returning (payload, status_code)
+
+    Returns:
+        Flask response. Replays carry an 'Idempotent-Replayed: true' header.
+    """
+    store_key = idempotency_store_key(scope)
+    if store_key is None:
+        payload, status = func()
+        return jsonify(payload), status
+
+    payload, status, replayed = get_idempotency_store().run(store_key, func)
+    response = jsonify(payload)
+    response.status_code = status
+    if replayed:
+        response.headers['Idempotent-Replayed'] = 'true'
+    return response
+
+def generate_opening_portraits(game_state, job):
+    """
+    Generate the leader and advisor portraits for a freshly created game
+    in one parallel batch, reporting progress on the given job.
+    """
+    generate_advisor_portraits_sync(
+        game_state,
+        progress=lambda done, total: job.report("Painting portraits", done, total),
+        include_leader=True
+    )
+
+def accepted_job(job):
+    """Returns the 202 response body for a queued job."""
+    return {
+        "status": "accepted",
+        "job_id": job.id,
+        "status_url": f"/api/jobs/{job.id}",
+        "stream_url": f"/api/jobs/{job.id}/stream"
+    }
+
+def parse_seed(value):
+    """
+    Validates a client-supplied game seed.
+
+    Args:
+        value: The JSON 'seed' value (None = no seed)
+
+    Returns:
+        The seed as an int, or None
+
+    Raises:
+        ValueError: The seed is not an integer (or an integer string)
+    """
+    if value is None:
+        return None
+    if isinstance(value, bool) or not isinstance(value, (int, str)):
+        raise ValueError("Seed must be an integer")
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError("Seed must be an integer") from None
+
 # --- Web Routes ---
 @app.route('/')
 def index():
@@ -143,105 +270,119 @@ def check_save():
 
 @app.route('/api/new_game', methods=['POST'])
 def new_game():
-    """Creates a new game by resetting all context files to defaults."""
-    global game
+    """
+    Creates a new game by resetting all context files to defaults.
+    An optional JSON 'seed' makes the new game reproducible.
+    Runs as a background job; returns 202 with a job id to poll.
+    """
     try:
-        # Initialize if needed
-        if game is None:
-            if not initialize_game():
-                return jsonify({"status": "error", "message": "Failed to initialize game"}), 500
-
-        # Reset to defaults
-        game.reset_to_defaults()
-
-        # Reset event state
-        game.current_event = None
-        game.event_stage = 0
-        game.event_conversation = []
-
-        # Generate initial leader portrait
-        from engines.visual_engine import generate_leader_portrait
-        leader = game.civilization.get('leader', {})
-        civ_context = {
-            'era': game.civilization.get('meta', {}).get('era', 'stone_age'),
-            'culture_values': game.culture.get('values', [])
-        }
-        portrait_result = generate_leader_portrait(leader, civ_context)
-
-        # Store portrait path in leader data
-        if portrait_result.get('success'):
-            game.civilization['leader']['portrait'] = portrait_result.get('filename', 'placeholder.png')
-
-            # Initialize the image update tracker with initial state
-            from engines.image_update_manager import get_tracker
-            tracker = get_tracker()
-            tracker.update_portrait_state(game)
-
-        # Generate advisor portraits synchronously for immediate availability
-        generate_advisor_portraits_sync(game)
-
-        game.save()
-
-        return jsonify({"status": "success"})
-    except Exception as e:
-        print(f"Error creating new game: {e}")
-        return jsonify({"status": "error", "message": str(e)}), 500
+        seed = parse_seed((request.get_json(silent=True) or {}).get('seed'))
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
+
+    def _build_new_game(job):
+        global game
+        with game_lock:
+            # Initialize if needed
+            if game is None:
+                job.report("Loading world")
+                if not initialize_game():
+                    raise RuntimeError("Failed to initialize game")
+
+            # Reset to defaults
+            job.report("Resetting world to defaults")
+            game.reset_to_defaults(seed=seed)
+            get_prompt_sessions().end(game_key(game))
+
+            # Reset event state
+            game.current_event = None
+            game.event_stage = 0
+            game.event_conversation = []
+
+            generate_opening_portraits(game, job)
+
+            job.report("Saving")
+            game.save()
+        return {"status": "success"}
+
+    job = get_job_runner().submit('new_game', _build_new_game)
+    return jsonify(accepted_job(job)), 202
 
 @app.route('/api/custom_game', methods=['POST'])
 def custom_game():
-    """Creates a new game with custom world generation."""
-    global game
+    """
+    Creates a new game with custom world generation.
+    Runs as a background job; returns 202 with a job id to poll.
+    """
+    # Get custom configuration from request
+    config = request.get_json()
     try:
-        # Get custom configuration from request
-        config = request.get_json()
+        if 'seed' in config:
+            config['seed'] = parse_seed(config['seed'])
+    except ValueError as e:
+        return jsonify({"status": "error", "message": str(e)}), 400
 
+    def _build_custom_game(job):
+        global game
         # Initialize world generator
         generator = WorldGenerator()
 
         # Generate world data
+        job.report("Generating world")
         world_data = generator.generate_world(config)
 
-        # Initialize or reinitialize game
-        if game is None:
-            game = GameState()
+        with game_lock:
+            # Initialize or reinitialize game
+            if game is None:
+                game = GameState()
 
-        # Apply custom world data
-        game.apply_custom_world(world_data)
+            # Apply custom world data
+            game.apply_custom_world(world_data)
+            get_prompt_sessions().end(game_key(game))
 
-        # Generate opening description (optional)
-        description = generator.generate_ai_description(world_data)
+            # Generate opening description (optional)
+            job.report("Writing opening description")
+            description = generator.generate_ai_description(world_data)
 
-        # Generate leader portrait
-        from engines.visual_engine import generate_leader_portrait
-        leader = game.civilization.get('leader', {})
-        civ_context = {
-            'era': game.civilization.get('meta', {}).get('era', 'stone_age'),
-            'culture_values': game.culture.get('values', [])
-        }
-        portrait_result = generate_leader_portrait(leader, civ_context)
-
-        if portrait_result.get('success'):
-            game.civilization['leader']['portrait'] = portrait_result.get('filename', 'placeholder.png')
-
-            # Initialize the image update tracker with initial state
-            from engines.image_update_manager import get_tracker
-            tracker = get_tracker()
-            tracker.update_portrait_state(game)
-
-        # Generate advisor portraits synchronously for immediate availability
-        generate_advisor_portraits_sync(game)
+            generate_opening_portraits(game, job)
 
-        game.save()
+            job.report("Saving")
+            game.save()
 
-        return jsonify({
+        return {
             "status": "success",
             "description": description
-        })
-    except Exception as e:
-        print(f"Error creating custom game: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({"status": "error", "message": str(e)}), 500
+        }
+
+    job = get_job_runner().submit('custom_game', _build_custom_game)
+    return jsonify(accepted_job(job)), 202
+
+@app.route('/api/jobs/<job_id>')
+def get_job_status(job_id):
+    """Returns the status, progress and (when finished) result of a job."""
+    job = get_job_runner().get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "Unknown or expired job"}), 404
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/stream')
+def stream_job_status(job_id):
+    """Streams job progress as server-sent events until the job finishes."""
+    job = get_job_runner().get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "message": "Unknown or expired job"}), 404
+
+    def _events():
+        version = -1
+        while True:
+            version = job.wait_for_change(version)
+            snapshot = job.to_dict()
+            yield f"data: {json.dumps(snapshot)}\n\n"
+            if job.finished:
+                break
+
+    return Response(_events(), mimetype='text/event-stream',
+                    headers={'Cache-Control': 'no-cache'})
 
 @app.route('/api/game_state')
 def get_game_state():
@@ -269,34 +410,39 @@ def get_event():
     if game is None:
         return jsonify({"status": "error", "message": "Game not initialized"}), 500
 
-    try:
+    def _build_event_payload():
         # Check for victory or failure before generating event
         from engines.victory_engine import check_victory, check_failure
 
         # Check failure first (higher priority)
         is_failed, failure_type, failure_desc = check_failure(game)
         if is_failed:
-            return jsonify({
+            return {
                 "game_over": True,
                 "outcome": "defeat",
                 "type": failure_type,
                 "title": f"Civilization Fallen: {failure_type.replace('_', ' ').title()}",
                 "narrative": failure_desc
-            })
+            }
 
         # Check victory
         is_victory, victory_type, victory_desc = check_victory(game)
         if is_victory:
-            return jsonify({
+            return {
                 "game_over": True,
                 "outcome": "victory",
                 "type": victory_type,
                 "title": f"Victory Achieved: {victory_type.replace('_', ' ').title()}",
                 "narrative": victory_desc
-            })
+            }
 
         # No game over, generate normal event
-        event_data = generate_event(game)
+        return generate_event(game)
+
+    try:
+        # Concurrent requests for the same turn share one generation
+        key = ('event', game_key(game), game.turn_number)
+        event_data, _ = get_coalescer().do(key, _build_event_payload)
         return jsonify(event_data)
     except Exception as e:
         print(f"ERROR generating event: {e}")
@@ -325,13 +471,19 @@ def handle_event_interaction():
 
     print(f"--- Received event interaction: '{player_response}' (Stage {game.event_stage}) ---")
 
-    try:
+    def _build_stage_payload():
         stage_data = generate_event_stage(game, player_response)
-        return jsonify({
+        return {
             "status": "success",
             "stage": game.event_stage,
             "response": stage_data
-        })
+        }
+
+    try:
+        # Identical questions at the same stage share one generation
+        key = ('event_interaction', game_key(game), game.event_stage, player_response)
+        payload, _ = get_coalescer().do(key, _build_stage_payload)
+        return jsonify(payload)
     except Exception as e:
         print(f"Error in event interaction: {e}")
         return jsonify({"status": "error", "message": str(e)}), 500
@@ -358,44 +510,51 @@ def handle_action():
 
     print(f"--- Received FINAL action '{player_action}' for event '{event_title}' ---")
 
-    try:
-        outcome = process_player_action(game, player_action, event_title, event_narrative)
-
-        if outcome.get("status") == "error":
-            return jsonify({"status": "error", "message": outcome.get("narrative")})
-
-        # Capture event details before resetting (for world turn analysis)
-        event_type = game.current_event.get('event_type') if game.current_event else None
-        conversation = list(game.event_conversation)  # Copy before clearing
+    def _commit_action():
+        with game_lock:
+            return _apply_action()
 
-        # Reset event state after resolution
-        game.current_event = None
-        game.event_stage = 0
-        game.event_conversation = []
+    def _apply_action():
+        try:
+            outcome = process_player_action(game, player_action, event_title, event_narrative)
+
+            if outcome.get("status") == "error":
+                return {"status": "error", "message": outcome.get("narrative")}, 200
+
+            # Capture event details before resetting (for world turn analysis)
+            event_type = game.current_event.get('event_type') if game.current_event else None
+            conversation = list(game.event_conversation)  # Copy before clearing
+
+            # Reset event state after resolution
+            game.current_event = None
+            game.event_stage = 0
+            game.event_conversation = []
+
+            # Simulate the world's reaction to the player's action
+            world_updates = world_turns_engine.simulate_turn(game, {
+                "action": player_action,
+                "outcome": outcome,
+                "event_type": event_type,
+                "conversation": conversation
+            })
+            if world_updates:
+                apply_world_turn_updates(game, world_updates)
 
-        # Simulate the world's reaction to the player's action
-        world_updates = world_turns_engine.simulate_turn(game, {
-            "action": player_action,
-            "outcome": outcome,
-            "event_type": event_type,
-            "conversation": conversation
-        })
-        if world_updates:
-            apply_world_turn_updates(game, world_updates)
+            game.save()
+            return {"status": "success", "outcome": outcome}, 200
+        except Exception as e:
+            print(f"ERROR processing action: {e}")
+            import traceback
+            traceback.print_exc()
+            return {"status": "error", "message": f"Failed to process action: {str(e)}"}, 500
 
-        game.save()
-        return jsonify({"status": "success", "outcome": outcome})
-    except Exception as e:
-        print(f"ERROR processing action: {e}")
-        import traceback
-        traceback.print_exc()
-        return jsonify({"status": "error", "message": f"Failed to process action: {str(e)}"}), 500
+    return run_idempotent('action', _commit_action)
 
 @app.route('/api/timeskip', methods=['POST'])
 def handle_timeskip():
     """
-    Initiates a timeskip, processes the outcome, saves the game,
-    and returns the narrative.
+    Initiates a timeskip as a background job. The job processes the outcome,
+    saves the game and returns the narrative as its result.
     """
     global game
     if game is None:
@@ -404,18 +563,42 @@ def handle_timeskip():
         return jsonify({"status": "error", "message": "Game not initialized"}), 500
 
     print("--- Initiating Timeskip ---")
+    store_key = idempotency_store_key('timeskip')
 
-    timeskip_outcome = perform_timeskip(game)
+    def _run_timeskip(job):
+        try:
+            with game_lock:
+                return _apply_timeskip(job)
+        except Exception:
+            # The stored 202 points at this failed job: let a retry queue a new one
+            if store_key is not None:
+                get_idempotency_store().discard(store_key)
+            raise
+
+    def _apply_timeskip(job):
+        job.report("Chronicling the passing years")
+        timeskip_outcome = perform_timeskip(game)
+
+        if "updates" in timeskip_outcome and timeskip_outcome["updates"]:
+            job.report("Applying changes")
+            apply_timeskip_updates(game, timeskip_outcome["updates"], is_timeskip=True)
+
+        # Centuries closed at once: bring the story so far up to date in the background
+        get_history_summarizer().schedule(game, force=True)
+
+        job.report("Saving")
+        game.save()
 
-    if "updates" in timeskip_outcome and timeskip_outcome["updates"]:
-        apply_timeskip_updates(game, timeskip_outcome["updates"], is_timeskip=True)
+        return {
+            "status": "success",
+            "narrative": timeskip_outcome.get("narrative", "Time marches on.")
+        }
 
-    game.save()
+    def _commit_timeskip():
+        job = get_job_runner().submit('timeskip', _run_timeskip)
+        return accepted_job(job), 202
 
-    return jsonify({
-        "status": "success",
-        "narrative": timeskip_outcome.get("narrative", "Time marches on.")
-    })
+    return run_idempotent('timeskip', _commit_timeskip)
 
 @app.route('/api/die', methods=['POST'])
 def handle_death():
@@ -430,7 +613,7 @@ def handle_death():
 
     print("--- Player has chosen to abdicate. Triggering succession crisis. ---")
     from engines.leader_engine import trigger_succession_crisis, apply_legacy_bonus
-    from engines.visual_engine import generate_leader_portrait
+    from engines.visual_engine import generate_leader_portrait, generate_portraits_parallel
 
     leader = game.civilization.get('leader', {})
 
@@ -438,24 +621,38 @@ def handle_death():
     succession_data = trigger_succession_crisis(game)
     candidates = succession_data['candidates']
 
-    # Generate portraits for each candidate
+    # Generate portraits for all candidates in one parallel batch
     era = game.civilization.get('meta', {}).get('era', 'classical')
     culture_values = game.culture.get('values', [])
+    civ_context = {
+        'era': era,
+        'culture_values': culture_values
+    }
 
-    for candidate in candidates:
-        civ_context = {
-            'era': era,
-            'culture_values': culture_values
-        }
-        # Create a temporary leader dict for portrait generation
-        temp_leader = {
+    # Create temporary leader dicts for portrait generation
+    portrait_requests = [
+        (generate_leader_portrait, {
             'name': candidate['name'],
             'age': candidate['age'],
             'traits': candidate['traits'],
             'role': 'Candidate'
-        }
-        portrait_result = generate_leader_portrait(temp_leader, civ_context)
+        }, civ_context)
+        for candidate in candidates
+    ]
+
+    def _on_candidate_portrait(index, portrait_result, late):
+        # Late portraits land in the succession session and are reused on choice
+        candidate = candidates[index]
         candidate['portrait'] = portrait_result.get('filename', 'placeholder.png')
+        candidate['portrait_generated'] = bool(portrait_result.get('success'))
+
+    for candidate in candidates:
+        candidate['portrait'] = 'placeholder.png'
+        candidate['portrait_generated'] = False
+    generate_portraits_parallel(portrait_requests, on_result=_on_candidate_portrait)
+
+    # Keep the exact candidates and portraits for /api/choose_successor
+    get_succession_sessions().start(game_key(game), succession_data)
 
     # Create summary of current leader
     summary = (
@@ -478,98 +675,114 @@ def handle_death():
 def choose_successor():
     """
     Apply chosen successor and legacy bonuses, including faction approval changes.
+    Accepts 'successor_index' or the chosen 'successor' (candidate or name) and
+    resolves it against the candidates shown by /api/die.
     """
-    data = request.get_json()
-    chosen_index = data.get('successor_index')
+    data = request.get_json() or {}
 
-    if chosen_index is None:
+    if data.get('successor_index') is None and not data.get('successor'):
         return jsonify({"status": "error", "message": "No successor chosen"}), 400
 
-    from engines.leader_engine import trigger_succession_crisis, apply_legacy_bonus
-    from engines.timeskip_engine import calculate_life_expectancy
-
-    # Store old leader for legacy
-    old_leader = game.civilization['leader'].copy()
-
-    # Generate candidates again using trigger_succession_crisis (same logic as /api/die)
-    succession_data = trigger_succession_crisis(game)
-    candidates = succession_data['candidates']
-
-    if chosen_index < 0 or chosen_index >= len(candidates):
-        return jsonify({"status": "error", "message": "Invalid successor index"}), 400
-
-    chosen = candidates[chosen_index]
+    def _commit_successor():
+        with game_lock:
+            return _apply_successor()
+
+    def _apply_successor():
+        from engines.leader_engine import trigger_succession_crisis, apply_legacy_bonus
+        from engines.timeskip_engine import calculate_life_expectancy
+
+        # Store old leader for legacy
+        old_leader = game.civilization['leader'].copy()
+
+        # Resolve against the candidates generated by /api/die
+        sessions = get_succession_sessions()
+        chosen, succession_data = sessions.resolve(game_key(game), data)
+        if succession_data is None:
+            # Session expired or server restarted: fall back to a fresh crisis
+            print("  ⚠️ No open succession session, generating candidates again")
+            succession_data = trigger_succession_crisis(game)
+            chosen = find_candidate(succession_data['candidates'], data)
+
+        if chosen is None:
+            return {"status": "error", "message": "Invalid successor choice"}, 400
+
+        # Apply legacy bonuses
+        legacy = apply_legacy_bonus(game, old_leader)
+
+        # Apply faction approval changes from succession choice
+        approval_changes = chosen.get('approval_changes', {})
+        if hasattr(game, 'faction_manager'):
+            for faction_key, change in approval_changes.items():
+                # Find matching faction by id
+                factions = game.faction_manager.get_all()
+                for faction in factions:
+                    if faction_key in faction.get('id', '').lower():
+                        current_approval = faction.get('approval', 50)
+                        faction['approval'] = max(0, min(100, current_approval + change))
+                        print(f"  Faction {faction['name']} approval: {faction['approval']} ({change:+d})")
+
+        # Apply special effects (e.g., populist happiness boost)
+        if chosen.get('special') == 'happiness_boost':
+            game.population_happiness = min(100, game.population_happiness + 20)
+            legacy['bonuses_applied'].append("+20 immediate happiness (people's champion)")
+
+        # Set new leader
+        era = game.civilization['meta']['era']
+        game.civilization['leader'] = {
+            'name': chosen['name'],
+            'age': chosen.get('age', 30),
+            'life_expectancy': calculate_life_expectancy(era),
+            'role': 'Leader',
+            'traits': chosen['traits'],
+            'years_ruled': 0,
+            'archetype': chosen.get('archetype', 'Unknown'),
+            'backing_faction': chosen.get('backing_faction', 'None'),
+            'demands': chosen.get('demands', 'None')
+        }
 
-    # Apply legacy bonuses
-    legacy = apply_legacy_bonus(game, old_leader)
+        print(f"  👑 New leader: {chosen['name']} ({chosen.get('archetype', 'Unknown')})")
+        print(f"  Backed by: {chosen.get('backing_faction', 'None')}")
 
-    # Apply faction approval changes from succession choice
-    approval_changes = chosen.get('approval_changes', {})
-    if hasattr(game, 'faction_manager'):
-        for faction_key, change in approval_changes.items():
-            # Find matching faction by id
-            factions = game.faction_manager.get_all()
-            for faction in factions:
-                if faction_key in faction.get('id', '').lower():
-                    current_approval = faction.get('approval', 50)
-                    faction['approval'] = max(0, min(100, current_approval + change))
-                    print(f"  Faction {faction['name']} approval: {faction['approval']} ({change:+d})")
-
-    # Apply special effects (e.g., populist happiness boost)
-    if chosen.get('special') == 'happiness_boost':
-        game.population_happiness = min(100, game.population_happiness + 20)
-        legacy['bonuses_applied'].append("+20 immediate happiness (people's champion)")
-
-    # Set new leader
-    era = game.civilization['meta']['era']
-    game.civilization['leader'] = {
-        'name': chosen['name'],
-        'age': chosen.get('age', 30),
-        'life_expectancy': calculate_life_expectancy(era),
-        'role': 'Leader',
-        'traits': chosen['traits'],
-        'years_ruled': 0,
-        'archetype': chosen.get('archetype', 'Unknown'),
-        'backing_faction': chosen.get('backing_faction', 'None'),
-        'demands': chosen.get('demands', 'None')
-    }
+        # Reuse the candidate portrait rendered by /api/die, generate only if missing
+        if chosen.get('portrait_generated'):
+            portrait_result = {'success': True, 'filename': chosen['portrait']}
+        else:
+            from engines.visual_engine import generate_leader_portrait
+            civ_context = {
+                'era': era,
+                'culture_values': game.culture.get('values', [])
+            }
+            portrait_result = generate_leader_portrait(game.civilization['leader'], civ_context)
 
-    print(f"  👑 New leader: {chosen['name']} ({chosen.get('archetype', 'Unknown')})")
-    print(f"  Backed by: {chosen.get('backing_faction', 'None')}")
+        if portrait_result.get('success'):
+            game.civilization['leader']['portrait'] = portrait_result.get('filename', 'placeholder.png')
 
-    # Generate portrait for new leader
-    from engines.visual_engine import generate_leader_portrait
-    civ_context = {
-        'era': era,
-        'culture_values': game.culture.get('values', [])
-    }
-    portrait_result = generate_leader_portrait(game.civilization['leader'], civ_context)
+            # Reset the image update tracker for the new leader
+            from engines.image_update_manager import get_tracker
+            tracker = get_tracker()
+            tracker.update_portrait_state(game)
 
-    if portrait_result.get('success'):
-        game.civilization['leader']['portrait'] = portrait_result.get('filename', 'placeholder.png')
+        # Store succession crisis state for future events (rival claimants, etc.)
+        if not hasattr(game, 'succession_state'):
+            game.succession_state = {}
+        game.succession_state['recent_succession'] = True
+        game.succession_state['chosen_candidate'] = chosen['name']
+        game.succession_state['rival_claimant_chance'] = succession_data.get('rival_claimant_chance', 0.40)
+        game.succession_state['transition_crisis_duration'] = succession_data.get('transition_crisis_duration', 10)
+        game.succession_state['turns_since_succession'] = 0
 
-        # Reset the image update tracker for the new leader
-        from engines.image_update_manager import get_tracker
-        tracker = get_tracker()
-        tracker.update_portrait_state(game)
+        sessions.end(game_key(game))
+        game.save()
 
-    # Store succession crisis state for future events (rival claimants, etc.)
-    if not hasattr(game, 'succession_state'):
-        game.succession_state = {}
-    game.succession_state['recent_succession'] = True
-    game.succession_state['chosen_candidate'] = chosen['name']
-    game.succession_state['rival_claimant_chance'] = succession_data.get('rival_claimant_chance', 0.40)
-    game.succession_state['transition_crisis_duration'] = succession_data.get('transition_crisis_duration', 10)
-    game.succession_state['turns_since_succession'] = 0
+        return {
+            "status": "success",
+            "new_leader": game.civilization['leader'],
+            "legacy": legacy,
+            "faction_changes": approval_changes
+        }, 200
 
-    game.save()
+    return run_idempotent('choose_successor', _commit_successor)
 
-    return jsonify({
-        "status": "success",
-        "new_leader": game.civilization['leader'],
-        "legacy": legacy,
-        "faction_changes": approval_changes
-    })
 @app.route('/api/context/culture')
 def get_culture():
     """Returns the culture context."""
@@ -604,7 +817,8 @@ def get_dashboard():
     if game is None:
         return jsonify({"status": "error", "message": "Game not initialized"}), 500
 
-    from engines.tendency_analyzer import analyze_player_tendency, get_tendency_description
+    from engines.tendency_analyzer import get_tendency_description
+    from engines.context_builder import get_player_tendency
     from engines.bonus_engine import BonusEngine
 
     # Combine recent history from both sources
@@ -613,7 +827,7 @@ def get_dashboard():
         recent_events = game.history_long['events'][-10:]  # Last 10 events
 
     # Analyze player tendency for dashboard display
-    primary_tendency, secondary_tendency = analyze_player_tendency(game.history_long, num_events=10)
+    primary_tendency, secondary_tendency = get_player_tendency(game, 10)
     tendency_desc = get_tendency_description(primary_tendency, secondary_tendency)
 
     # Calculate active bonuses for display
@@ -634,7 +848,7 @@ def get_dashboard():
     # Calculate faction bonuses for UI display
     faction_bonuses = {}
     if hasattr(game, 'faction_manager'):
-        raw_bonuses = game.faction_manager.get_faction_bonuses(game)
+        raw_bonuses = bonus_engine.get_faction_bonuses(game)
 
         # Format for frontend display
         faction_bonuses = {
@@ -700,6 +914,30 @@ def get_victory_status():
     status = get_victory_status_summary(game)
     return jsonify(status)
 
+@app.route('/api/turn_timings')
+def get_turn_timings():
+    """Returns per-phase turn pipeline timings: running stats and the last turn's breakdown."""
+    from engines.turn_pipeline import get_turn_pipeline_stats
+    from engines.action_processor import ACTION_PIPELINE
+
+    stats = get_turn_pipeline_stats()
+    return jsonify({
+        "phases": ACTION_PIPELINE.phase_names(),
+        "stats": stats.get_stats(),
+        "last_turn": stats.last_report(ACTION_PIPELINE.name)
+    })
+
+@app.route('/api/crisis_telemetry')
+def get_crisis_telemetry_route():
+    """Returns how often each crisis rule fired and the most recent rule explanations."""
+    from engines.crisis_rules import get_crisis_telemetry
+
+    telemetry = get_crisis_telemetry()
+    return jsonify({
+        "stats": telemetry.get_stats(),
+        "recent": telemetry.recent(request.args.get('limit', 10, type=int))
+    })
+
 @app.route('/api/settlement_gallery')
 def get_settlement_gallery():
     """Returns list of settlement evolution images."""
@@ -756,9 +994,14 @@ def get_buildings():
 
 @app.route('/api/technologies')
 def get_technologies():
-    """Returns discovered technologies."""
+    """Returns discovered technologies, the techs researchable now and current research."""
+    from engines.tech_tree import get_research_frontier
+
     return jsonify({
         "discovered": game.civilization.get('discovered_technologies', []),
+        "available": get_research_frontier(game).available(),
+        "current_research_id": game.technology.get('current_research_id'),
+        "research_progress": game.technology.get('research_progress', 0),
         "era": game.civilization.get('meta', {}).get('era', 'stone_age')
     })
 
@@ -19,6 +19,10 @@ TIMESKIP_MODEL = 'gemini-2.5-flash-lite'
 # Options: 'gemini-2.5-flash-lite', 'gemini-2.5-flash'
 WORLD_GEN_MODEL = 'gemini-2.5-flash-lite'
 
+# Summary model for background condensation (investigation transcripts)
+# Options: 'gemini-2.5-flash-lite', 'gemini-2.0-flash-lite'
+SUMMARY_MODEL = 'gemini-2.5-flash-lite'
+
 # Visual generation model for portraits, crisis art, settlement evolution
 # Options: 'gemini-2.5-flash-image' (recommended - fast, affordable, good quality)
 VISUAL_MODEL = 'gemini-2.5-flash-image'
@@ -26,3 +30,73 @@ VISUAL_MODEL = 'gemini-2.5-flash-image'
 # API Configuration
 API_VERSION = 'v1beta'  # Required for Gemini 2.x models
 
+
+# Prompt Context Budgets (estimated tokens, ~4 characters per token)
+# Hard ceilings for the game-state context embedded in recurring prompts
+WORLD_TURN_CONTEXT_TOKENS = 2000
+COUNCIL_CONTEXT_TOKENS = 1500
+
+# Prompt Budgets (estimated tokens, whole prompt including the template)
+# Prompts over budget have their variable fields trimmed by priority before
+# dispatch and are logged (see engines/prompt_budget.py)
+DEFAULT_PROMPT_BUDGET = 4000
+PROMPT_BUDGETS = {
+    'events/generate_event': 3500,
+    'events/generate_event_stage_council': 2000,
+    'events/generate_event_stage_regular': 2500,
+    'actions/process_player_action': 3000,
+    'council/council_meeting': 2000,
+    'council/council_meeting_turn': 2800,
+    'factions/faction_audience': 3200,
+    'timeskip/timeskip_500_years': 4000,
+    'council/first_turn_briefing': 6000,
+    'characters/character_vignette': 2500,
+    'world_turns/council_reactions': 800,
+    'world_turns/standard_consequences': 800,
+    'world_turns/council_conversation': 1000,
+    'crises/famine': 1500,
+    'crises/food_shortage': 1500,
+    'crises/severe_food_shortage': 1500,
+    'crises/economic_collapse': 1500,
+    'crises/economic_crisis': 1500,
+    'crises/economic_warning': 1500,
+    'crises/succession_crisis': 1500,
+    'crises/compound_crisis': 1500,
+    'callbacks/broken_promise': 1500,
+    'callbacks/enemy_revenge': 1500,
+    'callbacks/ally_request': 1500,
+    'callbacks/debt_collection': 1500,
+    'history/summarize_decade': 2000,
+    'history/summarize_era': 1200,
+    'events/summarize_investigation': 2000,
+    'world/ai_description': 1000,
+    'events/building_proposal': 1500,
+}
+
+# Prompt Sessions
+# When enabled, world turns and council meetings keep a rolling chat session per
+# game: seeded once with the full state, then sent only state deltas per turn.
+# The session is re-seeded once its transcript exceeds the token budget.
+PROMPT_SESSION_MODE = False
+PROMPT_SESSION_MAX_TOKENS = 12000
+
+# Investigation Transcripts
+# Multi-stage events keep the last few exchanges verbatim; older exchanges are
+# folded into a rolling summary written in the background by SUMMARY_MODEL.
+TRANSCRIPT_VERBATIM_EXCHANGES = 2
+TRANSCRIPT_EXCHANGE_TOKENS = 250
+TRANSCRIPT_SUMMARY_TOKENS = 250
+
+# History Retrieval
+# Number of chronicle entries (events, eras, decrees) retrieved by relevance
+HISTORY_RETRIEVAL_K = 4
+
+# Advisor Memory Recall
+# Token budget for an advisor's recalled memories in a prompt
+ADVISOR_MEMORY_TOKENS = 120
+
+# Rolling History Summary
+# Decade and era summaries are refreshed in the background every N turns and
+# combined into a fixed-size "story so far" for prompts.
+HISTORY_SUMMARY_INTERVAL = 5
+STORY_SO_FAR_TOKENS = 400
@@ -0,0 +1,26 @@
+// --- Background Job Polling ---
+// Long operations (new game, custom world, timeskip) return 202 with a job id.
+// waitForJob polls /api/jobs/<id> until the job finishes and resolves with its result.
+async function waitForJob(accepted, onProgress, intervalMs = 1000) {
+    const statusUrl = accepted.status_url || `/api/jobs/${accepted.job_id}`;
+
+    while (true) {
+        const response = await fetch(statusUrl);
+        if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`);
+        const job = await response.json();
+
+        if (onProgress) onProgress(job);
+        if (job.status === 'succeeded') return job.result;
+        if (job.status === 'failed') throw new Error(job.error || 'Job failed');
+
+        await new Promise(resolve => setTimeout(resolve, intervalMs));
+    }
+}
+
+// Formats a job's current stage for display, e.g. "Painting advisor portraits (3/6)"
+function describeJobProgress(job) {
+    if (job.progress && job.progress.total) {
+        return `${job.stage} (${job.progress.done}/${job.progress.total})`;
+    }
+    return job.stage;
+}
@@ -0,0 +1,147 @@
+"""
+Test the vectorized balance simulator: agreement with the scalar turn
+pipeline, bonus rates taken from a game, reproducibility, report shape and
+throughput.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import numpy  # noqa: F401
+except ImportError:
+    print("[SKIP] NumPy is not installed (poetry install -E balance)")
+    sys.exit(0)
+
+from engines.turn_simulator import TurnSimulator
+from engines.balance_simulator import BalanceSimulator, format_balance_report
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+def test_matches_turn_simulator():
+    """Without outcome noise every civilization follows the scalar pipeline exactly"""
+    print("\n=== Test: Agreement with TurnSimulator ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.civilization['population'] = 300
+    game_state.civilization['resources'].update(food=600, wealth=3000)
+    game_state.technology['infrastructure'] = ['Granary', 'Marketplace', 'Walls']
+
+    # TurnSimulator leaves successions to the game's crisis events
+    balance = BalanceSimulator.from_game_state(game_state, 5, params={'succession_age_margin': 10 ** 6}, noise=False)
+    mismatches, compared = [], 0
+    for turn in range(100):
+        report = sim.run(1)[0]
+        balance.step()
+        if not balance.alive[0]:
+            break
+        scalar = (report['population'], report['food'], report['wealth'], report['happiness'])
+        vector = {(int(balance.population[i]), int(balance.food[i]), int(balance.wealth[i]), int(balance.happiness[i]))
+                  for i in range(balance.n)}
+        compared += 1
+        if vector != {scalar}:
+            mismatches.append((turn, scalar, vector))
+    sim.close()
+
+    if compared >= 5 and not mismatches:
+        print(f"[SUCCESS] {compared} turns identical to the scalar pipeline")
+        return True
+    print(f"[FAIL] Compared {compared} turns, mismatches: {mismatches[:3]}")
+    return False
+
+
+def test_bonus_rates_from_game_state():
+    """Constant plus per-building rates reproduce BonusEngine's starting totals"""
+    print("\n=== Test: Bonus rates from a game ===")
+    from engines.bonus_engine import BonusEngine
+    from engines.bonus_definitions import BonusType
+
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.buildings.setdefault('constructed_buildings', []).extend(
+        [{'id': 'building_library_001', 'name': 'Library'}] * 2 + [{'id': 'building_market_001', 'name': 'Market'}])
+    game_state.technology['infrastructure'] = ['Granary']
+
+    balance = BalanceSimulator.from_game_state(game_state, 1)
+    engine = BonusEngine()
+    buildings = len(game_state.buildings['constructed_buildings'])
+    mismatched = [
+        bonus_type for bonus_type, constant, per_building in (
+            (BonusType.FOOD_PER_TURN, 'food_bonus', 'food_bonus_per_building'),
+            (BonusType.WEALTH_PER_TURN, 'wealth_bonus', 'wealth_bonus_per_building'),
+            (BonusType.SCIENCE_PER_TURN, 'science_bonus', 'science_per_building'),
+            (BonusType.CULTURE_PER_TURN, 'culture_bonus', 'culture_per_building'))
+        if balance.params[constant] + balance.params[per_building] * buildings
+        != engine.calculate_bonuses(game_state, bonus_type)['total']
+    ]
+    sim.close()
+
+    if not mismatched and balance.params['science_per_building'] > 0:
+        print(f"[SUCCESS] Starting totals kept; +{balance.params['science_per_building']} science per new building")
+        return True
+    print(f"[FAIL] Mismatched {mismatched}, params {balance.params}")
+    return False
+
+
+def test_seeded_runs_reproducible():
+    """The same seed gives the same report; a different seed does not"""
+    print("\n=== Test: Seeded reproducibility ===")
+    start = {'population': 150, 'food': 200, 'wealth': 300, 'infrastructure': 2}
+
+    def run(seed):
+        report = BalanceSimulator(2000, start=start, seed=seed).run(80)
+        report.pop('seconds')
+        return report
+
+    first, second, other = run(7), run(7), run(8)
+    checks = [first == second, first != other]
+    if all(checks):
+        print(f"[SUCCESS] Seed 7 reproduced; survival at turn 80: {first['survival_curve'][-1] * 100:.1f}%")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_report_and_throughput():
+    """10^4 civilizations x 200 turns run in seconds and produce a full report"""
+    print("\n=== Test: Report and throughput ===")
+    start = {'population': 150, 'food': 200, 'wealth': 300, 'infrastructure': 2}
+    report = BalanceSimulator(10000, start=start, seed=1).run(200)
+    text = format_balance_report(report)
+
+    checks = [
+        report['seconds'] < 30,
+        len(report['survival_curve']) == 201,
+        report['survival_curve'][0] == 1.0,
+        all(a >= b for a, b in zip(report['survival_curve'], report['survival_curve'][1:])),
+        sum(report['failures'].values()) + sum(report['victories'].values()) <= 10000,
+        set(report['crisis_frequency']) == set(report['crisis_reach']),
+        'Survival curve' in text and 'Failures:' in text,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] 10,000 x 200 turns in {report['seconds']:.2f}s")
+        print(text)
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("BALANCE SIMULATOR TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_matches_turn_simulator(),
+        test_bonus_rates_from_game_state(),
+        test_seeded_runs_reproducible(),
+        test_report_and_throughput(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
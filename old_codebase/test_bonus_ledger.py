@@ -0,0 +1,125 @@
+"""
+Test the cached bonus ledger: one build per set of inputs, reuse across
+resource changes and turns, and invalidation when bonus inputs change.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.bonus_engine import BonusEngine
+from engines.bonus_definitions import BonusType, ALL_BONUS_TYPES
+from engines.state_updater import apply_updates
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+class LedgerBuildCounter:
+    """Counts ledger builds made by any BonusEngine."""
+
+    def __init__(self):
+        self.builds = 0
+        self._original = BonusEngine._build_ledger
+
+    def __enter__(self):
+        counter = self
+
+        def counting_build(engine, game_state, signature):
+            counter.builds += 1
+            return counter._original(engine, game_state, signature)
+
+        BonusEngine._build_ledger = counting_build
+        return self
+
+    def __exit__(self, *exc):
+        BonusEngine._build_ledger = self._original
+
+
+def test_ledger_reused_across_turns():
+    """Turns that only move resources reuse one ledger for every bonus lookup"""
+    print("\n=== Test: Ledger reuse across turns ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.civilization['resources'].update(food=100000, wealth=100000)
+    # Keep the leader young so aging adds no traits during the run
+    game_state.civilization['leader'].update(age=20, life_expectancy=1000)
+
+    with LedgerBuildCounter() as counter:
+        sim.run(1)
+        builds_after_first = counter.builds
+        sim.run(10)
+        with sim._silenced(True):
+            apply_updates(game_state, {'civilization.resources.food': 5}, visual_updates=False)
+        engine = BonusEngine()
+        for bonus_type in ALL_BONUS_TYPES:
+            engine.calculate_bonuses(game_state, bonus_type)
+        engine.get_all_active_bonuses(game_state)
+    sim.close()
+
+    checks = [
+        builds_after_first == 1,
+        counter.builds == 1,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] 11 turns and {len(ALL_BONUS_TYPES)} lookups served by one ledger build")
+        return True
+    print(f"[FAIL] Checks: {checks} (builds: {counter.builds})")
+    return False
+
+
+def test_ledger_invalidated_by_inputs():
+    """Characters, buildings, discoveries, traits and approvals each rebuild the ledger"""
+    print("\n=== Test: Ledger invalidation ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    engine = BonusEngine()
+
+    with LedgerBuildCounter() as counter:
+        food_before = engine.calculate_bonuses(game_state, BonusType.FOOD_PER_TURN)['total']
+        science_before = engine.calculate_bonuses(game_state, BonusType.SCIENCE_PER_TURN)['total']
+
+        game_state.buildings.setdefault('constructed_buildings', []).append(
+            {'id': 'building_granary_001', 'name': 'Granary'})
+        food_after = engine.calculate_bonuses(game_state, BonusType.FOOD_PER_TURN)['total']
+
+        game_state.inner_circle_manager.get_all().append({'name': 'Test Scholar', 'role': 'Scholar'})
+        science_after = engine.calculate_bonuses(game_state, BonusType.SCIENCE_PER_TURN)['total']
+
+        game_state.technology['discoveries'].append('Test Discovery')
+        engine.get_ledger(game_state)
+        game_state.civilization['leader']['traits'].append('Test Trait')
+        engine.get_ledger(game_state)
+        faction = next(iter(game_state.faction_manager))
+        game_state.faction_manager.update_approval(faction.get('id') or faction.get('name'), -5)
+        engine.get_ledger(game_state)
+        engine.get_ledger(game_state)
+    sim.close()
+
+    checks = [
+        food_after > food_before,
+        science_after == science_before + 5,
+        counter.builds == 6,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Granary food {food_before} -> {food_after}, Scholar +5 science; 6 builds for 6 input sets")
+        return True
+    print(f"[FAIL] Checks: {checks} (builds: {counter.builds})")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("BONUS LEDGER TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_ledger_reused_across_turns(),
+        test_ledger_invalidated_by_inputs(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
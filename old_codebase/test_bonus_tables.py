@@ -0,0 +1,122 @@
+"""
+Test the compiled bonus tables: rows match bonus_definitions, the diminishing
+returns prefix table matches the per-building formula, and dense aggregation
+agrees with BonusEngine.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.bonus_engine import BonusEngine
+from engines.bonus_definitions import (
+    BUILDING_BONUSES, CHARACTER_ROLE_BONUSES, ALL_BONUS_TYPES, BonusType
+)
+from engines.bonus_tables import (
+    ROLE_TABLE, BUILDING_TABLE, TECHNOLOGY_TABLE, TRAIT_TABLE, BONUS_TYPE_INDEX,
+    DIMINISHING_PREFIX, diminishing_total, building_row, aggregate_totals
+)
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+def test_compiled_rows():
+    """Rows hold each source's positive values in bonus type order"""
+    print("\n=== Test: Compiled rows ===")
+    food = BONUS_TYPE_INDEX[BonusType.FOOD_PER_TURN]
+    science = BONUS_TYPE_INDEX[BonusType.SCIENCE_PER_TURN]
+    market = BUILDING_TABLE.row('building_market_001')
+
+    checks = [
+        len(BUILDING_TABLE.rows) == len(BUILDING_BONUSES),
+        len(ROLE_TABLE.rows) == len(CHARACTER_ROLE_BONUSES),
+        all(len(row) == len(ALL_BONUS_TYPES) for row in BUILDING_TABLE.rows),
+        market[BONUS_TYPE_INDEX[BonusType.WEALTH_PER_TURN]] == BUILDING_BONUSES['building_market_001']['wealth_per_turn'],
+        ROLE_TABLE.row('Scholar')[science] == 5,
+        # Non-positive values never count as bonuses
+        ROLE_TABLE.row('Grand Marshal')[food] == 0,
+        BUILDING_TABLE.row('Unknown Hut') is None,
+        BUILDING_TABLE.count_vector(['building_market_001', 'building_market_001', 'Unknown Hut'])[
+            BUILDING_TABLE.index['building_market_001']] == 2,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] {len(BUILDING_TABLE.rows)} buildings, {len(ROLE_TABLE.rows)} roles, "
+              f"{len(TRAIT_TABLE.rows)} traits, {len(TECHNOLOGY_TABLE.rows)} technologies compiled")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_diminishing_prefix():
+    """Prefix sums match the per-copy formula, inside and beyond the table"""
+    print("\n=== Test: Diminishing returns prefix ===")
+
+    def loop_total(base, count):
+        return int(sum(base * (1.0 / (1 + i * 0.3)) for i in range(count)))
+
+    mismatches = [
+        (base, count) for base in (1, 3, 5, 8, 10, 15, 25) for count in range(0, 100)
+        if building_row([base], count)[0] != loop_total(base, count)
+    ]
+    checks = [
+        not mismatches,
+        DIMINISHING_PREFIX[0] == 0.0,
+        DIMINISHING_PREFIX[1] == 1.0,
+        abs(diminishing_total(200) - sum(1.0 / (1 + i * 0.3) for i in range(200))) < 1e-9,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Prefix table matches the loop; 3 copies = {DIMINISHING_PREFIX[3]:.3f}x")
+        return True
+    print(f"[FAIL] Checks: {checks}, mismatches: {mismatches[:5]}")
+    return False
+
+
+def test_aggregate_matches_engine():
+    """Dense aggregation over count vectors gives the BonusEngine totals"""
+    print("\n=== Test: Dense aggregation ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.buildings.setdefault('constructed_buildings', []).extend(
+        [{'id': 'building_library_001', 'name': 'Library'}] * 3)
+    game_state.inner_circle_manager.get_all().append({'name': 'Test Scholar', 'role': 'Scholar'})
+    game_state.civilization['leader']['traits'].append('Wise')
+
+    leader = game_state.civilization['leader']
+    roles = [leader.get('role')] + [c.get('role') for c in game_state.inner_circle_manager]
+    buildings = [b.get('id') for b in game_state.buildings['constructed_buildings']]
+    buildings += game_state.technology.get('infrastructure', [])
+    totals = aggregate_totals(
+        ROLE_TABLE.count_vector(roles),
+        BUILDING_TABLE.count_vector(buildings),
+        TECHNOLOGY_TABLE.count_vector(game_state.technology.get('discoveries', [])),
+        TRAIT_TABLE.count_vector(leader.get('traits', [])),
+    )
+    engine = BonusEngine()
+    expected = [engine.calculate_bonuses(game_state, bonus_type)['total'] for bonus_type in ALL_BONUS_TYPES]
+    sim.close()
+
+    if totals == expected:
+        print(f"[SUCCESS] Totals match BonusEngine: science {totals[BONUS_TYPE_INDEX[BonusType.SCIENCE_PER_TURN]]}, "
+              f"culture {totals[BONUS_TYPE_INDEX[BonusType.CULTURE_PER_TURN]]}")
+        return True
+    print(f"[FAIL] {totals} != {expected}")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("BONUS TABLES TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_compiled_rows(),
+        test_diminishing_prefix(),
+        test_aggregate_matches_engine(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,206 @@
+"""
+Test the building registry: one load per process, era/technology indexes,
+incremental availability matching a full scan, and construction checks
+backed by the constructed/in-progress ID sets.
+"""
+
+import sys
+import os
+import json
+import random
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.building_manager import BuildingManager
+from engines.building_registry import (
+    ERA_ORDER, BuildingAvailability, era_index, get_building_registry, get_building_availability
+)
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+TECHS = ['tech_writing', 'tech_metalworking', 'tech_currency', 'tech_masonry', 'tech_agriculture']
+
+
+class FakeGame:
+    """Just the state building availability reads."""
+
+    def __init__(self, era, techs, constructed=()):
+        self.civilization = {'meta': {'era': era}, 'discovered_technologies': list(techs)}
+        self.buildings = {
+            'constructed_buildings': [{'id': b} for b in constructed],
+            'available_buildings': []
+        }
+
+
+def _write_building_types(rng, count):
+    buildings = [{
+        'id': f'building_test_{i:03d}',
+        'name': f'Test Building {i}',
+        'cost': {'wealth': 10, 'turns': 1},
+        'requirements': {
+            'era': rng.choice(ERA_ORDER),
+            'technologies': rng.sample(TECHS, rng.randint(0, 2))
+        }
+    } for i in range(count)]
+    handle, path = tempfile.mkstemp(suffix='.json')
+    with os.fdopen(handle, 'w', encoding='utf-8') as f:
+        json.dump({'buildings': buildings}, f)
+    return path
+
+
+def _scan_available(building_types, game_state):
+    """Reference: the original linear scan over every definition."""
+    era = game_state.civilization['meta']['era']
+    current = ERA_ORDER.index(era) if era in ERA_ORDER else 0
+    techs = game_state.civilization['discovered_technologies']
+    constructed = [b.get('id') for b in game_state.buildings['constructed_buildings']]
+    available = []
+    for building_id, building in building_types.items():
+        required = building['requirements'].get('era', 'stone_age')
+        if building_id in constructed or current < ERA_ORDER.index(required):
+            continue
+        if all(tech in techs for tech in building['requirements'].get('technologies', [])):
+            available.append(building)
+    return available
+
+
+def test_registry_loaded_once():
+    """Managers share one registry; its indexes cover every definition"""
+    print("\n=== Test: Shared registry and indexes ===")
+    registry = get_building_registry()
+    first, second = BuildingManager(), BuildingManager()
+
+    indexed_by_era = sorted(b for ids in registry.by_era.values() for b in ids)
+    checks = [
+        first.registry is registry and second.registry is registry,
+        first.building_types is second.building_types,
+        indexed_by_era == sorted(registry.building_types),
+        'building_library_001' in registry.by_technology.get('tech_writing', []),
+        registry.required_era['building_market_001'] == ERA_ORDER.index('bronze_age'),
+    ]
+    if all(checks):
+        print(f"[SUCCESS] {len(registry.building_types)} buildings, "
+              f"{len(registry.by_era)} eras, {len(registry.by_technology)} technologies indexed")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_incremental_matches_scan():
+    """Era and technology changes keep availability equal to a full scan"""
+    print("\n=== Test: Incremental availability ===")
+    rng = random.Random(3)
+    path = _write_building_types(rng, 60)
+    try:
+        manager = BuildingManager(path)
+        game_state = FakeGame('stone_age', [], constructed=['building_test_000'])
+        mismatches = []
+        for step in range(300):
+            change = rng.random()
+            civ = game_state.civilization
+            if change < 0.4:
+                civ['discovered_technologies'].append(rng.choice(TECHS))
+            elif change < 0.7:
+                civ['meta']['era'] = ERA_ORDER[min(len(ERA_ORDER) - 1, era_index(civ['meta']['era']) + 1)]
+            elif change < 0.8:
+                # Losses rebuild: an older era, or a fresh tech list
+                civ['meta']['era'] = rng.choice(ERA_ORDER + ['unknown_age'])
+                civ['discovered_technologies'] = rng.sample(TECHS, rng.randint(0, 3))
+            else:
+                game_state.buildings['constructed_buildings'].append(
+                    {'id': rng.choice(list(manager.building_types))})
+            if manager.get_available(game_state) != _scan_available(manager.building_types, game_state):
+                mismatches.append(step)
+    finally:
+        os.remove(path)
+
+    if not mismatches:
+        print("[SUCCESS] 300 random era/technology/construction changes match the full scan")
+        return True
+    print(f"[FAIL] Mismatches at steps {mismatches[:10]}")
+    return False
+
+
+def test_construction_uses_id_sets():
+    """Construction checks see queued and finished buildings"""
+    print("\n=== Test: Construction checks ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    manager = BuildingManager()
+    game_state.civilization['meta']['era'] = 'bronze_age'
+    game_state.civilization['resources']['wealth'] = 10000
+    game_state.buildings['constructed_buildings'] = []
+
+    locked, _ = manager.can_construct('building_library_001', game_state)
+    game_state.civilization.setdefault('discovered_technologies', []).append('tech_writing')
+    started, _ = manager.start_construction('building_library_001', game_state)
+    queued, queued_reason = manager.can_construct('building_library_001', game_state)
+    for _ in range(4):
+        manager.process_turn(game_state)
+    built, built_reason = manager.can_construct('building_library_001', game_state)
+    availability = get_building_availability(game_state)
+    sim.close()
+
+    checks = [
+        not locked,
+        started,
+        not queued and 'under construction' in queued_reason,
+        not built and 'already constructed' in built_reason,
+        'building_library_001' in availability.constructed_ids,
+        not availability.in_progress_ids,
+    ]
+    if all(checks):
+        print("[SUCCESS] Locked -> queued -> constructed")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_replaced_lists_refresh():
+    """Replacement lists of the same length (new game, reload) are never taken for the old ones"""
+    print("\n=== Test: Replaced lists ===")
+    availability = BuildingAvailability(get_building_registry())
+    game_state = FakeGame('bronze_age', ['tech_fire'], constructed=['building_market_001'])
+    availability.refresh(game_state)
+
+    stale = []
+    for attempt in range(200):
+        # Freed lists may hand their id to the replacements
+        game_state.civilization['discovered_technologies'] = ['tech_fire']
+        game_state.civilization['discovered_technologies'] = ['tech_writing']
+        game_state.buildings['constructed_buildings'] = [{'id': 'building_library_001'}]
+        availability.refresh(game_state)
+        if ('building_library_001' not in availability.unlocked
+                or availability.constructed_ids != {'building_library_001'}):
+            stale.append(attempt)
+        game_state.civilization['discovered_technologies'] = ['tech_fire']
+        game_state.buildings['constructed_buildings'] = [{'id': 'building_market_001'}]
+        availability.refresh(game_state)
+        if 'building_library_001' in availability.unlocked or availability.constructed_ids != {'building_market_001'}:
+            stale.append(attempt)
+
+    if not stale:
+        print("[SUCCESS] 400 list replacements refreshed the sets")
+        return True
+    print(f"[FAIL] Stale sets after {len(stale)} replacements")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("BUILDING REGISTRY TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_registry_loaded_once(),
+        test_incremental_matches_scan(),
+        test_construction_uses_id_sets(),
+        test_replaced_lists_refresh(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,80 @@
+"""
+Test script for state-versioned context memoization.
+Verifies that context builders are served from cache until the state changes.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from game_state import GameState
+from engines.context_builder import (
+    build_event_context, build_action_context, get_civilization_snapshot,
+    get_player_tendency, cached_for_version
+)
+from engines.state_updater import apply_updates
+
+
+def test_repeated_calls_hit_cache():
+    """Calls at the same version return the same built context."""
+    print("\n=== Testing cache hits ===")
+    game = GameState()
+
+    first = build_event_context(game)
+    assert build_event_context(game) is first, "Same version should reuse the event context"
+    assert get_civilization_snapshot(game) is first['civilization'], "Snapshots should be shared between builders"
+    assert build_action_context(game)['culture'] is first['culture']
+    assert get_player_tendency(game) == get_player_tendency(game)
+    print(f"  ✓ Contexts reused at version {game.version}")
+
+
+def test_mutation_invalidates_cache():
+    """Bumping the version (directly, via apply_updates or save) rebuilds contexts."""
+    print("\n=== Testing invalidation ===")
+    game = GameState()
+
+    before = build_event_context(game)
+    population = game.civilization['population']
+    apply_updates(game, {'civilization.population': 10})
+    after = build_event_context(game)
+    assert after is not before, "apply_updates should invalidate cached contexts"
+    assert after['civilization']['population'] == population + 10, "Rebuilt context should see the change"
+
+    version = game.version
+    game.bump_version()
+    assert game.version == version + 1
+    assert build_event_context(game) is not after, "bump_version should invalidate cached contexts"
+    print("  ✓ Contexts rebuilt after state changes")
+
+
+def test_objects_without_version_are_not_cached():
+    """Test doubles without a version attribute always recompute."""
+    print("\n=== Testing unversioned objects ===")
+    calls = {'n': 0}
+
+    class Plain:
+        pass
+
+    def compute():
+        calls['n'] += 1
+        return calls['n']
+
+    plain = Plain()
+    assert cached_for_version(plain, 'k', compute) == 1
+    assert cached_for_version(plain, 'k', compute) == 2
+    print("  ✓ No caching without a version")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("CONTEXT CACHE TEST")
+    print("=" * 60)
+
+    try:
+        test_repeated_calls_hit_cache()
+        test_mutation_invalidates_cache()
+        test_objects_without_version_are_not_cached()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,209 @@
+"""
+Test the declarative crisis rules: detect_crisis matching the original
+threshold/cascade chain, batch evaluation matching single-state evaluation,
+and the fired rule recorded for telemetry.
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from engines.turn_simulator import TurnSimulator
+from engines.crisis_engine import detect_crisis, should_generate_crisis
+from engines.crisis_rules import CRISIS_RULES, CRISIS_TYPES, CrisisRules, get_crisis_telemetry
+from engines.rng_service import GameRNG
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+class FakeGame:
+    """Just the state crisis detection reads and writes."""
+
+    def __init__(self, seed):
+        self.civilization = {'population': 100, 'resources': {'food': 0, 'wealth': 0},
+                             'leader': {'age': 40, 'life_expectancy': 60}}
+        self.population_happiness = 70
+        self.crisis_momentum = 0
+        self.crisis_recovery_timer = 0
+        self.rng = GameRNG(seed)
+
+
+def _legacy_detect(game_state, rng):
+    """Reference: the original if/elif chain of detect_crisis."""
+    population = game_state.civilization['population']
+    food = game_state.civilization['resources']['food']
+    wealth = game_state.civilization['resources']['wealth']
+    food_per_capita = food / max(population, 1)
+
+    crisis_type = None
+    if food <= 0 or food_per_capita < 0.5:
+        crisis_type = 'famine'
+    elif wealth <= 0:
+        crisis_type = 'economic_collapse'
+    elif food_per_capita < 0.8:
+        crisis_type = 'severe_food_shortage'
+    elif food_per_capita < 1.8:
+        crisis_type = 'food_shortage'
+    elif wealth < 100:
+        crisis_type = 'economic_crisis'
+    elif wealth < 300:
+        crisis_type = 'economic_warning'
+    leader = game_state.civilization.get('leader', {})
+    if leader.get('age', 0) > leader.get('life_expectancy', 60) + 10:
+        crisis_type = 'succession_crisis'
+    if crisis_type:
+        game_state.crisis_momentum += 1
+        game_state.crisis_recovery_timer = 0
+        return crisis_type
+
+    active_crises = [name for name, flag in (('food', food_per_capita < 1.8), ('economic', wealth < 300),
+                                             ('happiness', game_state.population_happiness < 40)) if flag]
+    if len(active_crises) >= 2:
+        if 'food' in active_crises and wealth < 500 and rng.random() < 0.40:
+            return 'economic_crisis'
+        if 'economic' in active_crises and food_per_capita < 2.0 and rng.random() < 0.30:
+            return 'food_shortage'
+        if rng.random() < 0.25:
+            game_state.crisis_momentum += 1
+            game_state.crisis_recovery_timer = 0
+            return 'compound_crisis'
+
+    if game_state.crisis_recovery_timer < 5:
+        game_state.crisis_recovery_timer += 1
+    else:
+        game_state.crisis_momentum = 0
+    return None
+
+
+def _randomize(game_state, rng):
+    civ = game_state.civilization
+    civ['population'] = rng.randint(0, 400)
+    civ['resources']['food'] = rng.randint(-20, 1000)
+    civ['resources']['wealth'] = rng.randint(-20, 700)
+    civ['leader']['age'] = rng.randint(20, 90)
+    game_state.population_happiness = rng.randint(0, 100)
+
+
+def test_matches_legacy_chain():
+    """Crisis type, momentum and recovery timer match the original chain"""
+    print("\n=== Test: Rules match the original detect_crisis ===")
+    rng = random.Random(4)
+    game, reference = FakeGame(11), FakeGame(11)
+    mismatches = []
+    seen = set()
+    for step in range(3000):
+        if step % 4 == 0:
+            # Runs of calm turns exercise the recovery timer
+            _randomize(game, random.Random(step))
+            _randomize(reference, random.Random(step))
+            if rng.random() < 0.5:
+                for g in (game, reference):
+                    g.civilization['resources'].update(food=5000, wealth=5000)
+                    g.civilization['leader']['age'] = 30
+        crisis = detect_crisis(game)
+        expected = _legacy_detect(reference, reference.rng.stream('crisis'))
+        seen.add(crisis)
+        if (crisis, game.crisis_momentum, game.crisis_recovery_timer) != (
+                expected, reference.crisis_momentum, reference.crisis_recovery_timer):
+            mismatches.append(step)
+
+    if not mismatches and len(seen) >= 7:
+        print(f"[SUCCESS] 3000 evaluations identical ({len(seen) - 1} crisis types seen)")
+        return True
+    print(f"[FAIL] Mismatches at steps {mismatches[:10]}, seen {seen}")
+    return False
+
+
+def test_batch_matches_scalar():
+    """evaluate_batch gives the same crisis per row as evaluate"""
+    print("\n=== Test: Batch evaluation ===")
+    if np is None:
+        print("[SKIP] NumPy is not installed (poetry install -E balance)")
+        return True
+    r = np.random.default_rng(5)
+    n = 5000
+    base = {
+        'population': r.integers(0, 400, n), 'food': r.integers(-20, 1000, n),
+        'wealth': r.integers(-20, 700, n), 'happiness': r.integers(0, 100, n),
+        'leader_age': r.integers(20, 90, n), 'life_expectancy': np.full(n, 60),
+    }
+    rows = [{key: int(values[i]) for key, values in base.items()} for i in range(n)]
+
+    # Default rules, plus cascade-only rules with certain/impossible chances (no rolls to line up)
+    cascade_only = [rule for rule in CRISIS_RULES if rule['stage'] == 'cascade']
+    rule_sets = [CrisisRules()] + [
+        CrisisRules(cascade_only, {'cascade_economic_chance': economic, 'cascade_food_chance': food,
+                                   'compound_crisis_chance': 1.0})
+        for economic, food in ((1.0, 1.0), (0.0, 1.0), (0.0, 0.0))
+    ]
+    mismatched = []
+    for number, rules in enumerate(rule_sets):
+        batch = rules.evaluate_batch(base, np.random.default_rng(0))
+        scalar = [rules.evaluate(row, random.Random(0))['crisis'] for row in rows]
+        if [CRISIS_TYPES[i] if i >= 0 else None for i in batch] != scalar:
+            mismatched.append(number)
+
+    if not mismatched:
+        print(f"[SUCCESS] {len(rule_sets)} rule sets x {n} rows identical")
+        return True
+    print(f"[FAIL] Rule sets {mismatched} differ")
+    return False
+
+
+def test_explanation_recorded():
+    """The fired rule, its clauses and the metrics reach the telemetry"""
+    print("\n=== Test: Explanations in telemetry ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.civilization['resources']['food'] = 0
+    game_state.civilization.setdefault('leader', {})['age'] = 30
+
+    telemetry = get_crisis_telemetry()
+    telemetry.reset()
+    triggered, crisis_type = should_generate_crisis(game_state)
+    explanation = telemetry.recent(1)[0]
+    sim.close()
+
+    try:
+        CrisisRules([{'name': 'typo', 'crisis': 'famin', 'stage': 'threshold'}])
+        rejected = False
+    except ValueError:
+        rejected = True
+
+    checks = [
+        triggered and crisis_type == 'famine',
+        explanation['rule'] == 'famine' and 'food <= 0' in explanation['matched'],
+        explanation['metrics']['food'] == 0,
+        explanation['turn'] == game_state.turn_number,
+        telemetry.get_stats() == {'evaluations': 1, 'rules': {'famine': 1}},
+        rejected,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Recorded: {explanation['rule']} ({', '.join(explanation['matched'])})")
+        return True
+    print(f"[FAIL] Checks: {checks} ({explanation})")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("CRISIS RULES TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_matches_legacy_chain(),
+        test_batch_matches_scalar(),
+        test_explanation_recorded(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,93 @@
+"""
+Test script for bounded investigation transcripts.
+Verifies that long investigations keep a flat prompt size and that older
+exchanges are folded into a background summary.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.event_transcript import TranscriptSummaries, render_transcript, local_digest
+from engines.token_budget import estimate_tokens
+from model_config import TRANSCRIPT_SUMMARY_TOKENS, TRANSCRIPT_EXCHANGE_TOKENS
+
+
+def make_conversation(n):
+    return [
+        {'player': f'Question {i} about the caravans?', 'ai': f'Reply {i}: ' + 'The merchants speak of bandits on the river road. ' * 30}
+        for i in range(n)
+    ]
+
+
+def test_transcript_size_stays_flat():
+    """Rendered size must not grow with the number of exchanges."""
+    print("\n=== Testing flat transcript size ===")
+    summaries = TranscriptSummaries(summarize=lambda previous, exchanges: "Bandits threaten the river road.")
+    sizes = []
+    for n in (3, 6, 12, 24):
+        text = render_transcript(make_conversation(n), "Player: {player}\nResponse: {ai}", summaries=summaries)
+        sizes.append(estimate_tokens(text))
+    ceiling = TRANSCRIPT_SUMMARY_TOKENS + 2 * (TRANSCRIPT_EXCHANGE_TOKENS + 60) + 50
+    assert max(sizes) <= ceiling, f"Transcript exceeded {ceiling} tokens: {sizes}"
+    assert sizes[-1] - sizes[-2] < 20, f"Transcript kept growing: {sizes}"
+    full = estimate_tokens(str(make_conversation(24)))
+    print(f"  ✓ Rendered ~{sizes} tokens (full 24-exchange transcript ~{full})")
+
+
+def test_background_summary_is_incremental():
+    """prefetch folds older exchanges; each new stage folds only one more."""
+    print("\n=== Testing incremental background summaries ===")
+    calls = []
+
+    def summarize(previous, exchanges):
+        calls.append((previous, len(exchanges)))
+        return f"summary of {len(exchanges)} new on top of [{previous}]"
+
+    summaries = TranscriptSummaries(summarize=summarize)
+    conversation = make_conversation(3)
+    summaries.prefetch(conversation, keep=2).result(timeout=5)
+    conversation.append(make_conversation(4)[-1])
+    summaries.prefetch(conversation, keep=2).result(timeout=5)
+
+    assert calls[0] == (None, 1), f"First fold should summarize one exchange: {calls}"
+    assert calls[1][0] is not None and calls[1][1] == 1, f"Second fold should build on the first: {calls}"
+
+    text = render_transcript(conversation, "{player}: {ai}", keep=2, summaries=summaries)
+    assert 'on top of [summary of 1' in text, "Rendering should use the finished summary"
+    assert 'Question 3' in text and 'Question 0' not in text
+    print(f"  ✓ {len(calls)} single-exchange folds, summary used in prompt")
+
+
+def test_fallback_without_model():
+    """A failing summarizer falls back to the local digest and never blocks rendering."""
+    print("\n=== Testing local fallback ===")
+
+    def broken(previous, exchanges):
+        raise RuntimeError("no API key")
+
+    summaries = TranscriptSummaries(summarize=broken)
+    older = make_conversation(10)
+    digest = local_digest(older)
+    assert estimate_tokens(digest) <= TRANSCRIPT_SUMMARY_TOKENS + 20
+    assert '(' in digest and 'omitted' in digest
+
+    summaries.schedule(older).result(timeout=5)
+    assert summaries.get(older) == digest, "Failed summaries are replaced by the digest"
+    assert render_transcript([], "{player}", empty_text="This is the first question.") == "This is the first question."
+    print("  ✓ Local digest used when the model is unavailable")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("EVENT TRANSCRIPT TEST")
+    print("=" * 60)
+
+    try:
+        test_transcript_size_stays_flat()
+        test_background_summary_is_incremental()
+        test_fallback_without_model()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
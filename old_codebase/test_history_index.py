@@ -0,0 +1,95 @@
+"""
+Test script for the BM25 history index.
+Verifies relevance ranking, incremental updates and relevance-selected context.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from game_state import GameState
+from engines.history_index import BM25Index, get_history_index, tokenize
+from engines.context_builder import get_relevant_history
+
+
+def filler_events(n, start_year=0):
+    return [
+        {'year': start_year + i, 'title': f'Harvest Festival {i}', 'action': 'Celebrate the harvest',
+         'narrative': 'The people danced in the fields and gave thanks for the grain.'}
+        for i in range(n)
+    ]
+
+
+def test_bm25_ranking():
+    print("\n=== Testing BM25 ranking ===")
+    index = BM25Index()
+    index.add('a', "The river flooded the lower farms", {'id': 'a'})
+    index.add('b', "Merchants from the east brought silk", {'id': 'b'})
+    index.add('c', "A great flood: the river burst its banks and the river god was angered", {'id': 'c'})
+
+    hits = index.search("river flood", k=2)
+    assert [h[1] for h in hits] == ['c', 'a'], f"Unexpected ranking: {hits}"
+    assert index.search("dragons", k=3) == []
+    assert tokenize("The River's flood!") == ['river', 'flood']
+
+    index.remove('c')
+    assert [h[1] for h in index.search("river", k=3)] == ['a']
+    print("  ✓ Relevant documents ranked first")
+
+
+def test_old_relevant_event_is_retrieved():
+    """An old event beyond any last-N window is found by relevance."""
+    print("\n=== Testing relevance-selected history ===")
+    game = GameState()
+    game.load()
+    game.history_long['events'] = (
+        [{'year': 10, 'title': 'The Copper Mines Collapse', 'action': 'Send miners back into the copper mines',
+          'narrative': 'Forty miners died when the copper mine tunnels collapsed.'}]
+        + filler_events(200, start_year=20)
+    )
+
+    related = get_relevant_history(game, "Miners demand safety in the copper mine", k=3, recent=2)['events']
+    titles = [e.get('title') for e in related]
+    assert 'The Copper Mines Collapse' in titles, f"Old relevant event missing: {titles}"
+    assert titles[-2:] == ['Harvest Festival 198', 'Harvest Festival 199'], "Recent events come last"
+    assert len(related) <= 5
+    print(f"  ✓ Retrieved {titles}")
+
+
+def test_incremental_updates():
+    """Appends are indexed without rebuilding; replaced lists are re-indexed."""
+    print("\n=== Testing incremental indexing ===")
+    game = GameState()
+    game.load()
+    game.history_long['events'] = filler_events(50)
+    game.civilization['permanent_decrees'] = [{
+        'id': 'decree_1', 'title': 'The Iron Law of Tribute', 'type': 'constitutional',
+        'declared_year': 5, 'declaration_text': 'All vassals shall pay tribute in iron.'
+    }]
+
+    index = get_history_index(game)
+    size = len(index.index)
+    game.history_long['events'].append({'year': 99, 'title': 'Comet Sighted', 'action': 'Consult the astronomers',
+                                        'narrative': 'A comet blazed over the capital.'})
+    assert len(get_history_index(game).index) == size + 1, "Append should add exactly one document"
+    assert get_history_index(game).search("comet astronomers", k=1)[0]['title'] == 'Comet Sighted'
+    assert get_history_index(game).search("tribute iron vassals", k=1)[0]['decree'] == 'The Iron Law of Tribute'
+
+    game.history_long['events'] = filler_events(3)
+    assert get_history_index(game).search("comet", k=1) == [], "Replaced history must be re-indexed"
+    print(f"  ✓ {size} documents indexed, appends and resets tracked")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("HISTORY INDEX TEST")
+    print("=" * 60)
+
+    try:
+        test_bm25_ranking()
+        test_old_relevant_event_is_retrieved()
+        test_incremental_updates()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,143 @@
+"""
+Test script for the rolling history summary.
+Verifies incremental decade/era summaries and the fixed-size story so far.
+"""
+
+import sys
+import os
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.history_summary import HistorySummarizer, build_story_so_far, get_story_so_far
+from engines.token_budget import estimate_tokens
+from model_config import STORY_SO_FAR_TOKENS
+
+
+class FakeGame:
+    def __init__(self, events, year, era='bronze_age', turn=10):
+        self.civilization = {'meta': {'name': 'Akkad', 'era': era, 'year': year}}
+        self.history_long = {'events': events}
+        self.history_compressed = {'eras': []}
+        self.turn_number = turn
+
+
+def make_events(first_year, last_year):
+    return [{'year': y, 'title': f'Event of {y}', 'action': 'Act', 'narrative': 'Things happened.'}
+            for y in range(first_year, last_year + 1)]
+
+
+def make_summarizer(calls):
+    def decade(civ, start, end, events):
+        calls.append(('decade', start))
+        return f"Decade {start}: {len(events)} events"
+
+    def era(civ, name, start, end, decades):
+        calls.append(('era', name))
+        return f"{name}: " + " / ".join(decades)
+
+    return HistorySummarizer(summarize_decade=decade, summarize_era=era, interval=5)
+
+
+def test_only_closed_decades_are_summarized_once():
+    print("\n=== Testing incremental decade summaries ===")
+    calls = []
+    summarizer = make_summarizer(calls)
+    game = FakeGame(make_events(100, 125), year=126)
+
+    summarizer.schedule(game, force=True).result(timeout=5)
+    rolling = game.history_compressed['rolling_summary']
+    assert [d['start_year'] for d in rolling['decades']] == [100, 110], "Open decade 120s must wait"
+    assert calls.count(('era', 'bronze_age')) == 1
+
+    # Five more turns: the 120s close; earlier decades are not re-summarized
+    game.history_long['events'] += make_events(126, 131)
+    game.civilization['meta']['year'] = 132
+    game.turn_number = 15
+    calls.clear()
+    summarizer.schedule(game).result(timeout=5)
+    assert [c for c in calls if c[0] == 'decade'] == [('decade', 120)], f"Unexpected calls: {calls}"
+    assert 'Decade 100' in get_story_so_far(game)
+    print(f"  ✓ {len(game.history_compressed['rolling_summary']['decades'])} decades, one new call per closed decade")
+
+
+def test_interval_and_eras():
+    print("\n=== Testing interval and era hierarchy ===")
+    calls = []
+    summarizer = make_summarizer(calls)
+    game = FakeGame(make_events(0, 19), year=20, turn=7)
+    assert summarizer.schedule(game) is None, "Off-interval turns do not schedule"
+
+    game.turn_number = 10
+    summarizer.schedule(game).result(timeout=5)
+    game.civilization['meta'].update({'era': 'iron_age', 'year': 40})
+    game.history_long['events'] += make_events(20, 39)
+    summarizer.schedule(game, force=True).result(timeout=5)
+
+    eras = game.history_compressed['rolling_summary']['eras']
+    assert [e['era'] for e in eras] == ['bronze_age', 'iron_age'], f"Unexpected eras: {eras}"
+    assert eras[1]['decades'] == 2 and eras[1]['start_year'] == 20
+    print("  ✓ Decades grouped into eras")
+
+
+def test_timeskip_keeps_decade_eras():
+    print("\n=== Testing eras after a timeskip ===")
+    calls = []
+    summarizer = make_summarizer(calls)
+    # Older events carry no era; newer ones were logged with theirs
+    game = FakeGame(make_events(0, 19), year=20, turn=10)
+    summarizer.schedule(game).result(timeout=5)
+    game.history_long['events'] += [dict(e, era='bronze_age') for e in make_events(20, 44)]
+    game.history_long['events'] += [dict(e, era='iron_age') for e in make_events(45, 52)]
+
+    # Centuries pass: the forced run closes every decade under a much later era
+    game.civilization['meta'].update({'era': 'classical', 'year': 560})
+    summarizer.schedule(game, force=True).result(timeout=5)
+
+    rolling = game.history_compressed['rolling_summary']
+    decade_eras = [(d['start_year'], d['era']) for d in rolling['decades']]
+    assert decade_eras == [(0, 'bronze_age'), (10, 'bronze_age'), (20, 'bronze_age'), (30, 'bronze_age'),
+                           (40, 'iron_age'), (50, 'iron_age')], f"Unexpected decade eras: {decade_eras}"
+    assert [e['era'] for e in rolling['eras']] == ['bronze_age', 'iron_age']
+    assert [e['era'] for e in rolling['era_timeline']] == ['bronze_age', 'classical']
+    assert 'summarized_turn' not in rolling
+    print("  ✓ Decades keep the era they happened in")
+
+
+def test_story_so_far_is_fixed_size():
+    print("\n=== Testing story size ===")
+    eras = [{'era': f'Age {i}', 'start_year': i * 100, 'end_year': i * 100 + 99,
+             'summary': 'A long age of kings and floods. ' * 12} for i in range(30)]
+    story = build_story_so_far(eras)
+    assert estimate_tokens(story) <= STORY_SO_FAR_TOKENS, f"Story too long: {estimate_tokens(story)}"
+    assert story.startswith('Age 0') and 'Age 29' in story and 'omitted' in story
+    assert get_story_so_far(FakeGame([], 0), "none yet") == "none yet"
+    print(f"  ✓ 30 eras told in ~{estimate_tokens(story)} tokens")
+
+
+def test_failed_model_falls_back():
+    print("\n=== Testing local fallback ===")
+
+    def broken(*args):
+        raise RuntimeError("no API key")
+
+    summarizer = HistorySummarizer(summarize_decade=broken, summarize_era=broken)
+    game = FakeGame(make_events(0, 9), year=10)
+    summarizer.schedule(game, force=True).result(timeout=5)
+    assert 'Event of 0' in get_story_so_far(game), "Local digest should be used"
+    print("  ✓ Local digest used when the model is unavailable")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("HISTORY SUMMARY TEST")
+    print("=" * 60)
+
+    try:
+        test_only_closed_decades_are_summarized_once()
+        test_interval_and_eras()
+        test_timeskip_keeps_decade_eras()
+        test_story_so_far_is_fixed_size()
+        test_failed_model_falls_back()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
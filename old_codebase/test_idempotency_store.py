@@ -0,0 +1,135 @@
+"""
+Test script for idempotency keys on turn-committing endpoints.
+Verifies that retried requests replay the committed response instead of re-running the turn.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.idempotency_store import IdempotencyStore
+
+
+def test_retry_replays_committed_turn():
+    """A retry with the same key must not run the turn again."""
+    print("\n=== Testing retry replay ===")
+    store = IdempotencyStore()
+    turns = {'n': 0}
+
+    def commit_turn():
+        turns['n'] += 1
+        return {"status": "success", "turn": turns['n']}, 200
+
+    first = store.run(('action', 'context', 'key-1'), commit_turn)
+    retry = store.run(('action', 'context', 'key-1'), commit_turn)
+
+    assert turns['n'] == 1, "Retry should not re-run the turn"
+    assert first == ({"status": "success", "turn": 1}, 200, False)
+    assert retry == ({"status": "success", "turn": 1}, 200, True)
+
+    store.run(('action', 'context', 'key-2'), commit_turn)
+    assert turns['n'] == 2, "A new key is a new submission"
+    print("  ✓ Same key replayed, new key executed")
+
+
+def test_failures_are_not_committed():
+    """Errors (HTTP or payload-level) must allow a clean retry."""
+    print("\n=== Testing failed requests ===")
+    store = IdempotencyStore()
+    attempts = {'n': 0}
+
+    def flaky_turn():
+        attempts['n'] += 1
+        if attempts['n'] == 1:
+            return {"status": "error", "message": "boom"}, 500
+        if attempts['n'] == 2:
+            return {"status": "error", "message": "model refused"}, 200
+        return {"status": "success"}, 200
+
+    assert store.run('k', flaky_turn)[1] == 500
+    assert store.run('k', flaky_turn)[0]["status"] == "error"
+    assert store.run('k', flaky_turn)[0]["status"] == "success"
+    assert store.run('k', flaky_turn)[2] is True, "Success should now be replayed"
+    assert attempts['n'] == 3
+    print("  ✓ Failures retried, success stored")
+
+
+def test_concurrent_retry_waits_for_original():
+    """A retry arriving while the original is in flight shares its result."""
+    print("\n=== Testing concurrent retry ===")
+    store = IdempotencyStore()
+    turns = {'n': 0}
+    results = []
+
+    def slow_turn():
+        turns['n'] += 1
+        time.sleep(0.2)
+        return {"status": "success"}, 200
+
+    def request():
+        results.append(store.run(('timeskip', 'context', 'k'), slow_turn))
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert turns['n'] == 1, "Concurrent retries should not run the turn again"
+    assert sum(1 for r in results if not r[2]) == 1, "Exactly one request should execute"
+    print("  ✓ 3 concurrent submissions, 1 turn")
+
+
+def test_discard_allows_retry():
+    """A discarded response (e.g. a queued job that failed) must run again on retry."""
+    print("\n=== Testing discard ===")
+    store = IdempotencyStore()
+    submissions = {'n': 0}
+
+    def queue_job():
+        submissions['n'] += 1
+        return {"status": "accepted", "job_id": submissions['n']}, 202
+
+    key = ('timeskip', 'context', 'key-1')
+    store.run(key, queue_job)
+    assert store.run(key, queue_job)[2], "Accepted job should replay"
+
+    store.discard(key)
+    payload, status, replayed = store.run(key, queue_job)
+    assert not replayed and payload['job_id'] == 2, "Retry after discard should queue a new job"
+    store.discard(('timeskip', 'context', 'unknown'))
+    print("  ✓ Discarded key executed again")
+
+
+def test_expiry_and_size_cap():
+    """Entries expire after the TTL and the store stays bounded."""
+    print("\n=== Testing expiry and size cap ===")
+    store = IdempotencyStore(ttl_seconds=0.1, max_entries=3)
+    for i in range(5):
+        store.put(i, {"status": "success"})
+    assert len(store) == 3, "Store should evict the oldest entries"
+    assert store.get(0) is None and store.get(4) is not None
+
+    time.sleep(0.15)
+    assert store.get(4) is None, "Expired entries should not be replayed"
+    assert len(store) == 0
+    print("  ✓ Bounded and time-limited")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("IDEMPOTENCY STORE TEST")
+    print("=" * 60)
+
+    try:
+        test_retry_replays_committed_turn()
+        test_failures_are_not_committed()
+        test_concurrent_retry_waits_for_original()
+        test_discard_allows_retry()
+        test_expiry_and_size_cap()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
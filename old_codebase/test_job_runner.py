@@ -0,0 +1,90 @@
+"""
+Test script for the background job runner.
+Verifies that long operations run off the request thread and report progress.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.job_runner import JobRunner
+
+
+def wait_until_finished(job, timeout=5):
+    deadline = time.time() + timeout
+    while not job.finished and time.time() < deadline:
+        job.wait_for_change(job.version, timeout=0.5)
+    return job
+
+
+def test_job_reports_progress_and_result():
+    """Jobs move through stages and expose their result once finished."""
+    print("\n=== Testing job progress ===")
+    runner = JobRunner()
+    release = threading.Event()
+
+    def build_world(job):
+        job.report("Generating world")
+        job.report("Painting advisor portraits", 3, 6)
+        release.wait(2)
+        return {"status": "success", "description": "A river valley"}
+
+    job = runner.submit('custom_game', build_world)
+
+    # Submitting must not block on the work itself
+    deadline = time.time() + 2
+    while job.progress is None and time.time() < deadline:
+        time.sleep(0.01)
+    snapshot = runner.get(job.id).to_dict()
+    assert snapshot['status'] == 'running', f"Expected running, got {snapshot['status']}"
+    assert snapshot['progress'] == {'done': 3, 'total': 6}
+    assert 'result' not in snapshot
+    print(f"  ✓ In progress: {snapshot['stage']} {snapshot['progress']}")
+
+    release.set()
+    wait_until_finished(job)
+    snapshot = job.to_dict()
+    assert snapshot['status'] == 'succeeded'
+    assert snapshot['result']['description'] == "A river valley"
+    assert snapshot['stages'] == ["Generating world", "Painting advisor portraits"]
+    print("  ✓ Finished with result and stage history")
+
+
+def test_failed_job_reports_error():
+    """An exception in the job marks it failed with the message."""
+    print("\n=== Testing failed job ===")
+    runner = JobRunner()
+
+    def failing(job):
+        job.report("Generating world")
+        raise RuntimeError("model unavailable")
+
+    job = wait_until_finished(runner.submit('new_game', failing))
+    snapshot = job.to_dict()
+    assert snapshot['status'] == 'failed'
+    assert snapshot['error'] == "model unavailable"
+    print("  ✓ Failure surfaced to pollers")
+
+
+def test_unknown_job():
+    """Unknown ids return None so the API can answer 404."""
+    print("\n=== Testing unknown job ===")
+    assert JobRunner().get('missing') is None
+    print("  ✓ Unknown job not found")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("JOB RUNNER TEST")
+    print("=" * 60)
+
+    try:
+        test_job_reports_progress_and_result()
+        test_failed_job_reports_error()
+        test_unknown_job()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
@@ -0,0 +1,114 @@
+"""
+Test script for the long-term advisor memory store.
+Verifies append-only persistence, the hot window and relevance-based recall.
+"""
+
+import sys
+import os
+import tempfile
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.memory_store import AdvisorMemoryStore, score_importance, recall_memories
+from engines.inner_circle_manager import InnerCircleManager
+
+
+def make_manager(store):
+    return InnerCircleManager({'characters': [
+        {'name': 'Ramesses', 'role': 'War Chief', 'history': ['Turn 1: Swore an oath to defend the river forts']}
+    ]}, store)
+
+
+def test_memories_survive_hot_window():
+    """Every memory is kept in the store while the record keeps only a few."""
+    print("\n=== Testing hot window and persistence ===")
+    path = os.path.join(tempfile.mkdtemp(), 'advisor_memories.jsonl')
+    store = AdvisorMemoryStore(path)
+    manager = make_manager(store)
+
+    for turn in range(2, 40):
+        manager.add_memory('Ramesses', f"Routine muster of the guard number {turn}", turn)
+
+    record = manager.get_by_name('Ramesses')
+    assert len(record['history']) == 3, f"Hot window should keep 3, kept {len(record['history'])}"
+    assert len(store.get_all('Ramesses')) == 39, "Store keeps every memory (including the imported one)"
+
+    store.flush()
+    reloaded = AdvisorMemoryStore(path)
+    assert len(reloaded.get_all('Ramesses')) == 39, "Memories must persist across loads"
+    assert reloaded.get_all('Ramesses')[0]['text'] == 'Swore an oath to defend the river forts'
+
+    store.flush()  # nothing pending: file must not grow
+    assert len(AdvisorMemoryStore(path).get_all('Ramesses')) == 39
+    print("  ✓ 39 memories stored, 3 kept on the character record")
+
+
+def test_reset_waits_for_save():
+    """A reset keeps the old log on disk until the new game is flushed."""
+    print("\n=== Testing deferred reset ===")
+    path = os.path.join(tempfile.mkdtemp(), 'advisor_memories.jsonl')
+    store = AdvisorMemoryStore(path)
+    make_manager(store)
+    store.flush()
+
+    store.reset()
+    assert store.get_all('Ramesses') == [], "Reset forgets memories in memory"
+    assert len(AdvisorMemoryStore(path).get_all('Ramesses')) == 1, "Old log must survive until the next save"
+
+    store.add('Nefertari', 'Took the oath of the new court', 0)
+    store.flush()
+    reloaded = AdvisorMemoryStore(path)
+    assert reloaded.get_all('Ramesses') == [] and len(reloaded.get_all('Nefertari')) == 1
+
+    store.reset()
+    store.flush()  # nothing pending: the log is still cleared
+    assert AdvisorMemoryStore(path).get_all('Nefertari') == []
+    print("  ✓ Log rewritten on the first flush after a reset")
+
+
+def test_recall_prefers_relevant_and_important():
+    """An old, important, relevant memory beats recent routine ones."""
+    print("\n=== Testing recall ranking ===")
+    store = AdvisorMemoryStore()
+    store.add('Ramesses', 'The leader betrayed our alliance with the river people', 3)
+    for turn in range(4, 30):
+        store.add('Ramesses', f'Inspected the barracks on day {turn}', turn)
+
+    recalled = store.recall('Ramesses', 'Envoys from the river people seek a new alliance', max_tokens=60, current_turn=30)
+    assert any('betrayed our alliance' in m for m in recalled), f"Relevant memory missing: {recalled}"
+    assert sum(len(m) for m in recalled) <= 60 * 4, "Recall must respect the token budget"
+    turns = [int(m.split(':')[0].split()[1]) for m in recalled]
+    assert turns == sorted(turns), "Recalled memories are returned oldest first"
+
+    assert score_importance('They betrayed us during the war', 8) > score_importance('Routine inspection')
+    print(f"  ✓ Recalled {recalled}")
+
+
+def test_fallback_without_store():
+    print("\n=== Testing fallback without a store ===")
+
+    class Plain:
+        pass
+
+    character = {'name': 'X', 'history': ['Turn 1: a', 'Turn 2: b', 'Turn 3: c', 'Turn 4: d']}
+    assert recall_memories(Plain(), character, 'anything', 100) == ['Turn 2: b', 'Turn 3: c', 'Turn 4: d']
+    manager = InnerCircleManager({'characters': [dict(character)]})
+    for turn in range(5, 20):
+        manager.add_memory('X', 'more', turn)
+    assert len(manager.get_by_name('X')['history']) == 10, "Without a store the legacy cap applies"
+    print("  ✓ Last history entries used without a store")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("ADVISOR MEMORY STORE TEST")
+    print("=" * 60)
+
+    try:
+        test_memories_survive_hot_window()
+        test_reset_waits_for_save()
+        test_recall_prefers_relevant_and_important()
+        test_fallback_without_store()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
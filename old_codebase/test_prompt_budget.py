@@ -0,0 +1,163 @@
+"""
+Test per-template prompt budgets: measurement, priority trimming and logging.
+"""
+
+import sys
+import os
+import re
+import glob
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.token_budget import estimate_tokens
+from engines.prompt_budget import (
+    shrink_text, fit_prompt, render_prompt, get_budget, get_prompt_budget_log, BUDGET_EXEMPT_PROMPTS
+)
+from model_config import PROMPT_BUDGETS, DEFAULT_PROMPT_BUDGET
+
+TEMPLATE = "INSTRUCTIONS: respond in JSON.\nHISTORY:\n{history}\nNOTES: {notes}\nACTION: {action}\n"
+
+
+def test_shrink_text():
+    """Multi-line text keeps its first and last lines; single lines are truncated"""
+    print("\n=== Test: shrink_text ===")
+    lines = ["<HISTORY>"] + [f"- Year {i}: a long and eventful year in the river valley" for i in range(100)] + ["</HISTORY>"]
+    text = "\n".join(lines)
+    shrunk = shrink_text(text, 100)
+
+    checks = [
+        estimate_tokens(shrunk) <= 100,
+        shrunk.startswith("<HISTORY>"),
+        shrunk.endswith("</HISTORY>"),
+        "line(s) omitted" in shrunk,
+        "Year 98" in shrunk,
+        shrink_text("short", 100) == "short",
+        estimate_tokens(shrink_text("word " * 200, 30)) <= 30,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Shrunk {estimate_tokens(text)} -> {estimate_tokens(shrunk)} tokens keeping both ends")
+        return True
+    print(f"[FAIL] Checks: {checks}\n{shrunk}")
+    return False
+
+
+def test_fit_prompt_trims_by_priority():
+    """Lowest-priority fields are trimmed first; untrimmable fields and the template are kept"""
+    print("\n=== Test: fit_prompt priority trimming ===")
+    get_prompt_budget_log().reset()
+    values = {
+        'history': "\n".join(f"- Year {i}: the harvest failed again" for i in range(200)),
+        'notes': "x" * 400,
+        'action': "Build a granary",
+    }
+
+    # Small overflow: only the lowest-priority field needs trimming
+    prompt, tokens, cut = fit_prompt('test/sample', TEMPLATE, values, ['history', 'notes'], budget=500)
+    checks = [
+        tokens <= 500,
+        cut == ['history'],
+        "INSTRUCTIONS: respond in JSON." in prompt,
+        "ACTION: Build a granary" in prompt,
+        "x" * 400 in prompt,
+    ]
+
+    # Nothing to trim: the prompt is sent as is but the violation is logged
+    _, over_tokens, none_trimmed = fit_prompt('test/sample', TEMPLATE, values, [], budget=100)
+    checks += [over_tokens > 100, none_trimmed == []]
+
+    stats = get_prompt_budget_log().get_stats()['test/sample']
+    checks += [stats['violations'] == 2, stats['still_over'] == 1, stats['trimmed_fields'] == {'history': 1}]
+
+    # Within budget: untouched and not logged
+    small = {'history': "- Year 1", 'notes': "none", 'action': "Wait"}
+    prompt, _, trimmed = fit_prompt('test/small', TEMPLATE, small, ['history'], budget=500)
+    checks += [prompt == TEMPLATE.format(**small), trimmed == [], 'test/small' not in get_prompt_budget_log().get_stats()]
+
+    if all(checks):
+        print(f"[SUCCESS] Trimmed to ~{tokens} tokens via {cut}; violations logged")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_render_prompt_real_template():
+    """A bloated real prompt is brought back under its configured budget"""
+    print("\n=== Test: render_prompt on a real template ===")
+    budget = get_budget('events/generate_event_stage_regular')
+    conversation = "\n".join(f"Player: question {i}\nResponse: {'a detailed answer ' * 40}" for i in range(40))
+    prompt = render_prompt(
+        'events/generate_event_stage_regular',
+        trim_order=['conversation_history', 'event_narrative', 'player_response'],
+        event_title="The Flood", event_narrative="The river rose. " * 50, current_stage=3,
+        leader_name="Ama", leader_age=40, population="1,000", resource_mood="cautious stability prevails",
+        food="900", wealth="300", tech_tier="bronze", culture_values="harmony",
+        religion_name="Sun Cult", religion_influence="moderate",
+        conversation_history=conversation, player_response="Ask the elders"
+    )
+    checks = [
+        budget == PROMPT_BUDGETS.get('events/generate_event_stage_regular', DEFAULT_PROMPT_BUDGET),
+        estimate_tokens(prompt) <= budget,
+        "Ask the elders" in prompt,
+        "The Flood" in prompt,
+        get_budget('unknown/template') == DEFAULT_PROMPT_BUDGET,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] ~{estimate_tokens(prompt)} tokens (budget {budget})")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_first_briefing_and_coverage():
+    """The first turn briefing's full state is trimmed; no template skips its budget unlisted"""
+    print("\n=== Test: First turn briefing budget and template coverage ===")
+    budget = get_budget('council/first_turn_briefing')
+    state = '{"civ":{"hist":[' + ",".join(f'"Year {i}: a long and eventful year"' for i in range(3000)) + ']}}'
+    prompt = render_prompt(
+        'council/first_turn_briefing',
+        trim_order=['game_state_json', 'culture_values'],
+        leader_name="Ama", civ_name="Akkad", era="bronze_age", culture_values="harmony",
+        game_state_json=state, population="1,000", food="900", wealth="300"
+    )
+
+    # Templates filled with load_prompt().format() instead of render_prompt()
+    root = os.path.dirname(os.path.abspath(__file__))
+    sources = glob.glob(os.path.join(root, 'engines', '*.py')) + [os.path.join(root, 'main.py'),
+                                                                   os.path.join(root, 'world_generator.py')]
+    unbudgeted = set()
+    for source in sources:
+        if os.path.basename(source) in ('prompt_loader.py', 'prompt_budget.py'):
+            continue
+        with open(source, encoding='utf-8') as f:
+            unbudgeted.update(re.findall(r"load_prompt\(\s*'([^']+)'", f.read()))
+    unbudgeted -= set(BUDGET_EXEMPT_PROMPTS)
+
+    checks = [
+        estimate_tokens(prompt) <= budget,
+        "<GAME_STATE>" in prompt and "Ama" in prompt,
+        not unbudgeted,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Briefing ~{estimate_tokens(prompt)} tokens (budget {budget}); "
+              f"{len(BUDGET_EXEMPT_PROMPTS)} exempt templates, none unlisted")
+        return True
+    print(f"[FAIL] Checks: {checks}, unbudgeted templates: {sorted(unbudgeted)}")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("PROMPT BUDGET TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_shrink_text(),
+        test_fit_prompt_trims_by_priority(),
+        test_render_prompt_real_template(),
+        test_first_briefing_and_coverage(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
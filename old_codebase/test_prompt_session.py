@@ -0,0 +1,136 @@
+"""
+Test script for delta prompts over persistent chat sessions.
+Verifies seeding, per-turn deltas, re-seeding on size budget or game reset,
+and that council meetings send fresh per-turn details on every turn.
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.prompt_session import PromptSession, state_delta
+from engines.token_budget import estimate_tokens
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+class RecordingChat:
+    """Stands in for a model chat; records every message sent."""
+
+    def __init__(self, log):
+        self.log = log
+
+    def send_message(self, message, generation_config=None):
+        self.log.append(message)
+        return type('Reply', (), {'text': '{"faction_updates": []}'})()
+
+
+class RecordingSession(PromptSession):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log = []
+
+    def start_chat(self, model_name=None):
+        return RecordingChat(self.log)
+
+
+def make_state(turn, food=100):
+    return json.dumps({
+        'action': f'Action of turn {turn}',
+        'civ': {'name': 'Akkad', 'res': {'food': food, 'wealth': 50}, 'lore': 'Ancient river kingdom ' * 40},
+        'facs': [{'name': 'Priests', 'appr': 60}, {'name': 'Warriors', 'appr': 40}],
+    }, sort_keys=True, separators=(',', ':'))
+
+
+def test_state_delta():
+    print("\n=== Testing state delta ===")
+    previous = {'civ': {'pop': 100, 'res': {'food': 5}}, 'facs': [{'name': 'A', 'appr': 1}, {'name': 'B', 'appr': 2}], 'gone': 1}
+    current = {'civ': {'pop': 100, 'res': {'food': 7}}, 'facs': [{'name': 'A', 'appr': 1}, {'name': 'B', 'appr': 3}]}
+    delta = state_delta(previous, current)
+    assert delta == {'civ': {'res': {'food': 7}}, 'facs': {'B': {'appr': 3}}, 'gone': None}, f"Unexpected delta: {delta}"
+    assert state_delta(current, current) == {}
+    print(f"  ✓ Delta: {delta}")
+
+
+def test_deltas_after_seed():
+    """Only the first turn carries the full state and instructions."""
+    print("\n=== Testing seed then deltas ===")
+    session = RecordingSession('world_turns', max_tokens=100000)
+    instructions = "Determine the indirect consequences. " * 30
+
+    session.send(1, make_state(1), instructions, 'standard')
+    session.send(2, make_state(2, food=120), instructions, 'standard')
+
+    seed, delta = session.log
+    assert 'CURRENT STATE' in seed and instructions in seed
+    assert 'STATE CHANGES' in delta and instructions not in delta
+    assert 'Ancient river kingdom' not in delta, "Unchanged state must not be re-sent"
+    assert '"food":120' in delta and 'Action of turn 2' in delta
+    print(f"  ✓ Seed ~{estimate_tokens(seed)} tokens, delta ~{estimate_tokens(delta)} tokens")
+
+    session.send(3, make_state(3), "Council instructions", 'council', turn_input="Conversation")
+    assert 'Council instructions' in session.log[-1], "New request kinds get their instructions once"
+    assert 'Conversation' in session.log[-1]
+    print("  ✓ Instructions sent once per request kind")
+
+
+def test_reseed():
+    """Size budget and turn regression start a fresh session."""
+    print("\n=== Testing re-seeding ===")
+    session = RecordingSession('council', max_tokens=400)
+    for turn in range(1, 6):
+        session.send(turn, make_state(turn, food=turn), "Instructions", 'council_meeting')
+    assert session.seeds > 1, "Exceeding the size budget should re-seed"
+
+    session = RecordingSession('council', max_tokens=100000)
+    session.send(5, make_state(5), "Instructions", 'council_meeting')
+    session.send(1, make_state(1), "Instructions", 'council_meeting')
+    assert session.seeds == 2 and 'CURRENT STATE' in session.log[-1], "Going back in turns should re-seed"
+    print("  ✓ Re-seeded on budget and on game reset")
+
+
+def test_council_turns_carry_fresh_details():
+    """Council instructions go once; memories and state notes go every turn."""
+    print("\n=== Testing council session turns ===")
+    from engines import council_engine
+    from engines.turn_simulator import TurnSimulator
+
+    session = RecordingSession('council', max_tokens=100000)
+    original_session_for = council_engine.session_for
+    council_engine.session_for = lambda game_state, engine: session
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    try:
+        game_state = sim.game_state
+        advisor = game_state.inner_circle_manager.get_all()[0]
+        for turn, memory in ((1, 'Watched the granary burn'), (2, 'Brokered peace at the ford')):
+            game_state.turn_number = turn
+            advisor.setdefault('history', []).append(memory)
+            game_state.civilization['resources']['food'] = 1000 * turn
+            council_engine.generate_council_meeting(game_state)
+    finally:
+        council_engine.session_for = original_session_for
+        sim.close()
+
+    first, second = session.log
+    assert '<TASK>' in first and '<TASK>' not in second, "Static instructions should be sent once"
+    assert 'Brokered peace at the ford' in second, "Later turns must carry fresh advisor memories"
+    assert 'Food: 2,000' in second and 'Food: 1,000' not in second, "Later turns must carry fresh state notes"
+    assert advisor['name'] in second
+    print("  ✓ Instructions once, memories and state notes every turn")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("PROMPT SESSION TEST")
+    print("=" * 60)
+
+    try:
+        test_state_delta()
+        test_deltas_after_seed()
+        test_reseed()
+        test_council_turns_carry_fresh_details()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
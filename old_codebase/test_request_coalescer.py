@@ -0,0 +1,99 @@
+"""
+Test script for single-flight request coalescing.
+Verifies that concurrent identical requests share one generation.
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.insert(0, os.path.dirname(__file__))
+
+from engines.request_coalescer import SingleFlight
+
+
+def test_concurrent_calls_share_result():
+    """Concurrent callers with the same key should trigger exactly one call."""
+    print("\n=== Testing concurrent coalescing ===")
+    coalescer = SingleFlight()
+    call_count = {'n': 0}
+    results = []
+
+    def slow_generation():
+        call_count['n'] += 1
+        time.sleep(0.2)
+        return {"title": f"Event #{call_count['n']}"}
+
+    def request():
+        result, shared = coalescer.do(('event', 'context', 3), slow_generation)
+        results.append((result, shared))
+
+    threads = [threading.Thread(target=request) for _ in range(5)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    print(f"  Model calls: {call_count['n']}, responses: {len(results)}")
+    assert call_count['n'] == 1, "Duplicate requests should not call the model again"
+    assert all(r[0] is results[0][0] for r in results), "All callers should get the same event"
+    assert sum(1 for r in results if not r[1]) == 1, "Exactly one caller should lead"
+    print("  ✓ 5 concurrent requests, 1 generation")
+
+
+def test_sequential_calls_not_coalesced():
+    """Once a call finishes, the next request starts a new one."""
+    print("\n=== Testing sequential calls ===")
+    coalescer = SingleFlight()
+    call_count = {'n': 0}
+
+    def generation():
+        call_count['n'] += 1
+        return call_count['n']
+
+    first, _ = coalescer.do('key', generation)
+    second, _ = coalescer.do('key', generation)
+    assert (first, second) == (1, 2), "Sequential calls must not reuse old results"
+    assert coalescer.in_flight() == [], "No keys should remain in flight"
+    print("  ✓ Sequential requests generate independently")
+
+
+def test_errors_propagate_to_waiters():
+    """An error in the leading call is raised in every attached caller."""
+    print("\n=== Testing error propagation ===")
+    coalescer = SingleFlight()
+    errors = []
+
+    def failing_generation():
+        time.sleep(0.1)
+        raise ValueError("model unavailable")
+
+    def request():
+        try:
+            coalescer.do('failing', failing_generation)
+        except ValueError as e:
+            errors.append(str(e))
+
+    threads = [threading.Thread(target=request) for _ in range(3)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == ["model unavailable"] * 3, f"Expected 3 errors, got {errors}"
+    print("  ✓ All waiters received the error")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("REQUEST COALESCER TEST")
+    print("=" * 60)
+
+    try:
+        test_concurrent_calls_share_result()
+        test_sequential_calls_not_coalesced()
+        test_errors_propagate_to_waiters()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
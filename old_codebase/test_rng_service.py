@@ -0,0 +1,151 @@
+"""
+Test the seeded RNG service: reproducible and independent streams, stream
+positions persisted through save/load, and seeded world generation.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.rng_service import GameRNG, get_rng
+from engines.consequence_engine import check_for_callback_opportunity
+from world_generator import WorldGenerator
+from game_state import GameState
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+def _draws(stream, count=5):
+    return [stream.random() for _ in range(count)]
+
+
+def test_streams_reproducible_and_independent():
+    """Same seed gives the same draws; one stream's use doesn't shift another"""
+    print("\n=== Test: Reproducible, independent streams ===")
+    quiet, busy = GameRNG(42), GameRNG(42)
+    _draws(busy.stream('crisis'), 100)
+
+    try:
+        GameRNG(42).stream('crisiss')
+        rejected = False
+    except ValueError:
+        rejected = True
+
+    checks = [
+        _draws(quiet.stream('laws')) == _draws(busy.stream('laws')),
+        _draws(GameRNG(42).stream('crisis')) == _draws(GameRNG(42).stream('crisis')),
+        _draws(GameRNG(42).stream('crisis')) != _draws(GameRNG(43).stream('crisis')),
+        _draws(GameRNG(42).stream('crisis')) != _draws(GameRNG(42).stream('laws')),
+        rejected,
+    ]
+    if all(checks):
+        print("[SUCCESS] Streams replay per seed and don't interfere")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_state_persisted_in_save():
+    """A saved and reloaded game continues every stream where it left off"""
+    print("\n=== Test: Stream state survives save/load ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.rng = GameRNG(7)
+    _draws(get_rng(game_state).stream('succession'), 13)
+    _draws(get_rng(game_state).stream('callbacks'), 3)
+    expected = _draws(GameRNG.from_dict(game_state.rng.to_dict()).stream('succession'))
+
+    with sim._silenced(True):
+        game_state.save()
+        reloaded = GameState(game_state.context_dir)
+    sim.close()
+
+    checks = [
+        reloaded.rng.seed == 7,
+        _draws(reloaded.rng.stream('succession')) == expected,
+        _draws(reloaded.rng.stream('succession')) == _draws(game_state.rng.stream('succession'), 10)[5:],
+        # Streams never used before the save start from the seed
+        _draws(reloaded.rng.stream('laws')) == _draws(GameRNG(7).stream('laws')),
+    ]
+    if all(checks):
+        print("[SUCCESS] Seed and stream positions restored from game_metadata.json")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_seeded_world_generation():
+    """Worlds generated from the same seed are identical"""
+    print("\n=== Test: Seeded world generation ===")
+    generator = WorldGenerator()
+
+    def world(mode, seed):
+        config = {
+            "world_mode": mode,
+            "starting_era": "bronze_age",
+            "earth_region": "mediterranean",
+            "civilization_name": "The Seeded People",
+            "population_size": "medium",
+            "cultural_focus": "agricultural",
+            "religion_type": "animism",
+            "social_structure": "tribal_council",
+            "difficulty": "balanced",
+            "neighbor_count": "few",
+            "resource_abundance": "moderate",
+            "seed": seed,
+        }
+        return generator.generate_world(config)
+
+    checks = []
+    for mode in ('fantasy', 'historical_earth'):
+        first, second, other = world(mode, 11), world(mode, 11), world(mode, 12)
+        checks += [first == second, first != other, first['rng']['seed'] == 11]
+    if all(checks):
+        print("[SUCCESS] Fantasy and historical worlds replay from their seed")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_callback_rolls_replay():
+    """Consequence callback rolls repeat for the same seed"""
+    print("\n=== Test: Callback rolls replay ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.civilization.setdefault('consequences', {})
+    check_for_callback_opportunity(game_state)  # initialize consequence tracking
+    game_state.civilization['consequences']['enemies'] = [{'name': 'Test Raiders', 'hostility': 90}]
+
+    def rolls(seed):
+        game_state.rng = GameRNG(seed)
+        return [check_for_callback_opportunity(game_state)[0] for _ in range(40)]
+
+    first, second = rolls(5), rolls(5)
+    sim.close()
+
+    checks = [first == second, any(first), not all(first)]
+    if all(checks):
+        print(f"[SUCCESS] {sum(first)}/40 revenge callbacks, identical on replay")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("RNG SERVICE TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_streams_reproducible_and_independent(),
+        test_state_persisted_in_save(),
+        test_seeded_world_generation(),
+        test_callback_rolls_replay(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
@@ -127,6 +127,43 @@ def test_old_function_deprecated():
     print("\n✅ TEST PASSED: Old function is properly deprecated")
     return True
 
+def test_succession_session_reuses_candidates():
+    """Verify that the choice resolves against the candidates shown by /api/die"""
+    print("\n=== TEST 4: Succession session keeps candidates and portraits ===")
+    from engines.succession_session import SuccessionSessions
+
+    game = GameState()
+    succession_data = trigger_succession_crisis(game)
+    for candidate in succession_data['candidates']:
+        candidate['portrait'] = f"{candidate['name']}.png"
+        candidate['portrait_generated'] = True
+
+    sessions = SuccessionSessions()
+    sessions.start('game', succession_data)
+
+    shown = succession_data['candidates'][1]
+    chosen, data = sessions.resolve('game', {'successor': dict(shown)})
+    assert chosen is shown, "Choice by candidate object should return the stored candidate"
+    assert chosen['portrait'] == f"{shown['name']}.png", "Stored portrait should be reused"
+
+    chosen, _ = sessions.resolve('game', {'successor_index': 0})
+    assert chosen is succession_data['candidates'][0], "Choice by index should work"
+
+    chosen, _ = sessions.resolve('game', {'successor': 'Nobody'})
+    assert chosen is None, "Unknown candidate should not resolve"
+
+    sessions.end('game')
+    assert sessions.resolve('game', {'successor_index': 0}) == (None, None), "Closed session should not resolve"
+
+    expiring = SuccessionSessions(ttl_seconds=-1)
+    expiring.start('game', succession_data)
+    assert expiring.get('game') is None, "Expired session should not resolve"
+
+    print("\n✓ Candidates resolved by object, index and name")
+    print("✓ Closed and expired sessions rejected")
+    print("\n✅ TEST PASSED: Succession session reuses candidates")
+    return True
+
 def run_all_tests():
     """Run all succession crisis tests"""
     print("\n" + "="*80)
@@ -136,7 +173,8 @@ def run_all_tests():
     tests = [
         test_trigger_succession_crisis,
         test_crisis_engine_succession,
-        test_old_function_deprecated
+        test_old_function_deprecated,
+        test_succession_session_reuses_candidates
     ]
 
     passed = 0
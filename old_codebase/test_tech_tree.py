@@ -0,0 +1,172 @@
+"""
+Test the tech tree DAG: indexes and topological order, the incrementally
+maintained research frontier, and research completion on a real save.
+"""
+
+import sys
+import os
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator, advance_research
+from engines.tech_tree import TechTree, get_tech_tree, get_research_frontier
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+class FakeGame:
+    """Just the state the research frontier reads."""
+
+    def __init__(self):
+        self.civilization = {'discovered_technologies': []}
+
+
+def _random_tree(rng, count):
+    """Random DAG: each tech may require up to 3 earlier techs (file order shuffled)."""
+    technologies = []
+    for i in range(count):
+        earlier = [f'tech_{j:03d}' for j in range(i)]
+        technologies.append({
+            'id': f'tech_{i:03d}',
+            'name': f'Tech {i}',
+            'prerequisites': rng.sample(earlier, min(len(earlier), rng.randint(0, 3))),
+            'unlocks_buildings': [f'building_{i % 7}'],
+        })
+    rng.shuffle(technologies)
+    return TechTree(technologies)
+
+
+def test_dag_indexes():
+    """Topological order, reverse indexes and cycle detection"""
+    print("\n=== Test: DAG indexes ===")
+    tree = _random_tree(random.Random(1), 80)
+    ordered = all(tree.position[p] < tree.position[t] for t, prereqs in tree.prerequisites.items() for p in prereqs)
+    dependents_match = all(t in tree.dependents[p] for t, prereqs in tree.prerequisites.items() for p in prereqs)
+
+    try:
+        TechTree([
+            {'id': 'tech_a', 'name': 'A', 'prerequisites': ['tech_b']},
+            {'id': 'tech_b', 'name': 'B', 'prerequisites': ['tech_a']},
+        ])
+        cycle_rejected = False
+    except ValueError:
+        cycle_rejected = True
+
+    real = get_tech_tree()
+    checks = [
+        len(tree.order) == 80 and ordered,
+        dependents_match,
+        sorted(tree.unlocked_by['building_3']) == sorted(f'tech_{i:03d}' for i in range(80) if i % 7 == 3),
+        cycle_rejected,
+        real is get_tech_tree(),
+        real.unlocked_by.get('building_library_001') == ['tech_writing'],
+    ]
+    if all(checks):
+        print("[SUCCESS] 80-node DAG ordered and indexed; cycle rejected")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_frontier_incremental():
+    """Discoveries update the frontier like a full recompute; losses rebuild it"""
+    print("\n=== Test: Incremental research frontier ===")
+    rng = random.Random(2)
+    tree = _random_tree(rng, 120)
+    game_state = FakeGame()
+    discovered = game_state.civilization['discovered_technologies']
+    mismatches = []
+
+    for step in range(200):
+        frontier = get_research_frontier(game_state, tree)
+        if step % 50 == 49:
+            # Lose a discovery (e.g. a reload): fresh list without one tech
+            game_state.civilization['discovered_technologies'] = discovered = discovered[:-1]
+        elif frontier.frontier:
+            # Research something researchable now
+            discovered.append(rng.choice(sorted(frontier.frontier)))
+        frontier = get_research_frontier(game_state, tree)
+        if frontier.frontier != tree.researchable(set(discovered)):
+            mismatches.append(step)
+
+    available = get_research_frontier(game_state, tree).available()
+    checks = [
+        not mismatches,
+        [t['id'] for t in available] == tree.sorted_ids(tree.researchable(set(discovered))),
+    ]
+    if all(checks):
+        print(f"[SUCCESS] {len(discovered)} discoveries, frontier of {len(available)} matches a full recompute")
+        return True
+    print(f"[FAIL] Checks: {checks}, mismatches at {mismatches[:10]}")
+    return False
+
+
+def test_replaced_list_refreshes():
+    """A replacement discovery list of the same length is never taken for the old one"""
+    print("\n=== Test: Replaced discovery list ===")
+    tree = get_tech_tree()
+    game_state = FakeGame()
+    stale = 0
+    for _ in range(200):
+        game_state.civilization['discovered_technologies'] = ['tech_writing']
+        get_research_frontier(game_state, tree)
+        # Freed lists may hand their id to the replacements
+        game_state.civilization['discovered_technologies'] = ['tech_writing']
+        game_state.civilization['discovered_technologies'] = ['tech_masonry']
+        frontier = get_research_frontier(game_state, tree).frontier
+        if 'tech_masonry' in frontier or frontier != tree.researchable({'tech_masonry'}):
+            stale += 1
+
+    if not stale:
+        print("[SUCCESS] 200 list replacements refreshed the frontier")
+        return True
+    print(f"[FAIL] Stale frontier after {stale} of 200 replacements")
+    return False
+
+
+def test_research_completion():
+    """Finishing research records the tech id and advances the frontier"""
+    print("\n=== Test: Research completion ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.civilization['discovered_technologies'] = []
+    game_state.technology.update(current_research_id='tech_writing', research_progress=0)
+
+    before = {t['id'] for t in get_research_frontier(game_state).available()}
+    outcome = {}
+    with sim._silenced(True):
+        advance_research(game_state, 2000, outcome)
+    after = {t['id'] for t in get_research_frontier(game_state).available()}
+    sim.close()
+
+    checks = [
+        'tech_writing' in before,
+        outcome.get('tech_unlocked') == 'Writing',
+        game_state.civilization['discovered_technologies'] == ['tech_writing'],
+        after == before - {'tech_writing'},
+        game_state.technology['current_research_id'] is None,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Writing researched; {len(after)} techs still researchable")
+        return True
+    print(f"[FAIL] Checks: {checks} ({before} -> {after}, {outcome})")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("TECH TREE TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_dag_indexes(),
+        test_frontier_incremental(),
+        test_replaced_list_refreshes(),
+        test_research_completion(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
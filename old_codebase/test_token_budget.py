@@ -0,0 +1,146 @@
+"""
+Test script for token-budgeted prompt context.
+Verifies that world-turn context stays inside its budget as a game ages.
+"""
+
+import sys
+import os
+import json
+sys.path.insert(0, os.path.dirname(__file__))
+
+from game_state import GameState
+from engines.token_budget import estimate_tokens, fit_to_budget, truncate_text
+from engines.world_turns_engine import WorldTurnsEngine
+from engines.council_engine import build_council_context, advisor_focus
+from engines.state_encoding import encode_state, STATE_LEGEND
+from model_config import WORLD_TURN_CONTEXT_TOKENS
+
+
+def test_fit_to_budget_trims_lowest_priority_first():
+    """Nested lists, then list tails, then whole sections are cut."""
+    print("\n=== Testing budget trimming order ===")
+    sections = {
+        'action': 'Hold a feast',
+        'advisors': [{'name': f'Advisor {i}', 'memories': [f'memory {j} ' * 5 for j in range(10)]} for i in range(4)],
+        'neighbors': [{'name': f'People {i}', 'relationship': 'neutral'} for i in range(20)]
+    }
+    encoded, tokens, trimmed = fit_to_budget(sections, 200, trim_order=['neighbors', 'advisors'])
+
+    data = json.loads(encoded)
+    assert tokens <= 200, f"Expected <= 200 tokens, got {tokens}"
+    assert data['action'] == 'Hold a feast', "Untrimmable sections must survive"
+    assert len(sections['neighbors']) == 20, "Input must not be mutated"
+    assert trimmed, "Trimming should be reported"
+    print(f"  ✓ Fit to {tokens} tokens with {len(trimmed)} cuts")
+
+
+def test_truncate_text():
+    print("\n=== Testing text truncation ===")
+    assert truncate_text("short", 10) == "short"
+    cut = truncate_text("word " * 100, 10)
+    assert estimate_tokens(cut) <= 10 and cut.endswith("…")
+    print("  ✓ Long text cut to budget")
+
+
+def test_world_turn_context_is_bounded():
+    """A long-running game must not grow the world-turn prompt without bound."""
+    print("\n=== Testing world turn projection ===")
+    game = GameState()
+    game.load()
+
+    # Age the game: long history, many memories and neighbors
+    game.history_long['events'] = [{'year': i, 'event': 'Something happened ' * 10} for i in range(500)]
+    for advisor in game.inner_circle_manager.get_all():
+        advisor['history'] = [f"Memory {i}: " + "details " * 20 for i in range(50)]
+    game.world['known_peoples'] = [{'name': f'People {i}', 'relationship': 'neutral', 'history': 'x' * 500} for i in range(40)]
+
+    full_state_tokens = estimate_tokens(json.dumps(game.to_dict(), indent=2))
+    context = WorldTurnsEngine().build_turn_context(game, {
+        'action': 'Build a granary',
+        'outcome': {'narrative': 'The granary rises. ' * 200, 'updates': {'resources': {'food': 10}}}
+    })
+    data = json.loads(context)
+
+    assert estimate_tokens(context) <= WORLD_TURN_CONTEXT_TOKENS, "Context must respect the hard budget"
+    assert 'history_long' not in data, "Full history must not be embedded"
+    assert data['action'] == 'Build a granary'
+    assert all(len(a.get('mem', [])) <= 3 for a in data.get('advs', [])), "Only last memories included"
+
+    # Past the list limit, the most-supported factions are the ones kept
+    game.faction_manager.get_all().extend(
+        {'name': f'Minor Guild {i}', 'approval': 50, 'support_percentage': 0.1} for i in range(15))
+    top_faction = max(game.faction_manager.get_all(), key=lambda f: f.get('support_percentage', 0))['name']
+    factions = json.loads(WorldTurnsEngine().build_turn_context(game, {'action': 'Feast'}))['facs']
+    assert factions[0]['name'] == top_faction and factions[-1].startswith('…+'), f"Unexpected factions: {factions}"
+    print(f"  ✓ Full state ~{full_state_tokens} tokens -> projection ~{estimate_tokens(context)} tokens")
+
+
+def test_council_context_slices():
+    """Council context carries per-advisor slices and respects its ceiling."""
+    print("\n=== Testing council context slices ===")
+    game = GameState()
+    game.load()
+    for advisor in game.inner_circle_manager.get_all():
+        advisor['history'] = [f"Memory {i}: " + "details " * 20 for i in range(50)]
+    game.history_long['events'] = [{'year': i, 'title': f'Event {i}', 'narrative': 'Long tale ' * 50} for i in range(300)]
+
+    data = json.loads(build_council_context(game))
+    assert 'history_long' not in data, "Full history must not be embedded"
+    assert len(data['recent']) <= 3
+    for advisor in data['advs']:
+        assert advisor['stats'], f"{advisor['name']} should have role-relevant stats"
+        assert len(advisor['mem']) <= 3
+    print(f"  ✓ {len(data['advs'])} advisor slices with stats, memories and faction standing")
+
+    small = build_council_context(game, max_tokens=300)
+    assert estimate_tokens(small) <= 300, "Configurable ceiling must be enforced"
+    print(f"  ✓ Ceiling of 300 tokens enforced (~{estimate_tokens(small)} tokens)")
+
+    assert advisor_focus('War Chief') == 'military'
+    assert advisor_focus('High Priestess') == 'spiritual'
+    assert advisor_focus('Court Jester') == 'general'
+    print("  ✓ Role titles mapped to focus areas")
+
+
+def test_canonical_encoding():
+    """Stable order, abbreviated keys, elided lists, rounded numbers."""
+    print("\n=== Testing canonical state encoding ===")
+    advisor = {
+        'name': 'Ramesses',
+        'portrait': 'advisor_ramesses.png',
+        'metrics': {'loyalty': 58, 'influence': 47.123456},
+        'history': [f'memory {i}' for i in range(12)],
+    }
+    encoded = encode_state(advisor, list_limits={'history': 3})
+    assert ' ' not in encoded.replace('memory ', ''), "No whitespace outside values"
+    data = json.loads(encoded)
+    assert 'portrait' not in data, "Portrait filenames are dropped"
+    assert data['m'] == {'inf': 47.1, 'loy': 58}, f"Unexpected metrics: {data['m']}"
+    assert data['hist'] == ['…+9', 'memory 9', 'memory 10', 'memory 11'], f"Unexpected elision: {data['hist']}"
+
+    ranked = encode_state({'factions': [f'faction {i}' for i in range(12)], 'history': list(range(12))},
+                          list_limit=2, keep_head=('factions',))
+    assert json.loads(ranked) == {'facs': ['faction 0', 'faction 1', '…+10'], 'hist': ['…+10', 10, 11]}, \
+        f"Importance-sorted lists keep their head: {ranked}"
+
+    reordered = dict(reversed(list(advisor.items())))
+    assert encode_state(reordered, list_limits={'history': 3}) == encoded, "Key order must be canonical"
+    assert 'loy=loyalty' in STATE_LEGEND and 'hist=history' in STATE_LEGEND
+    print(f"  ✓ {len(json.dumps(advisor, indent=2))} chars pretty -> {len(encoded)} chars canonical")
+
+
+if __name__ == '__main__':
+    print("=" * 60)
+    print("TOKEN BUDGET TEST")
+    print("=" * 60)
+
+    try:
+        test_fit_to_budget_trims_lowest_priority_first()
+        test_truncate_text()
+        test_world_turn_context_is_bounded()
+        test_council_context_slices()
+        test_canonical_encoding()
+        print("\n[SUCCESS] ALL TESTS PASSED!")
+    except AssertionError as e:
+        print(f"\n[FAIL] TEST FAILED: {e}")
+        sys.exit(1)
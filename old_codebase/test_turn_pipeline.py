@@ -0,0 +1,238 @@
+"""
+Test the phased turn pipeline: ordering, conditions and skips, concurrent
+phase groups, halts and error handling, per-phase stats, and the player
+action pipeline's post-outcome phases on a real save.
+"""
+
+import sys
+import os
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.turn_pipeline import TurnPipeline, Phase, PipelineHalt, get_turn_pipeline_stats
+from engines.action_processor import ACTION_PIPELINE
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+# Phases that prompt or call out to the model (or start background image/summary work)
+MODEL_PHASES = ('build_context', 'conversation_summary', 'relevant_history', 'build_prompt',
+                'request_outcome', 'schedule_summary', 'portrait_check')
+
+
+def _append(name):
+    def run(ctx):
+        ctx['order'].append(name)
+    return run
+
+
+def test_order_conditions_and_stats():
+    """Phases run in order; false conditions and caller skips are reported and counted"""
+    print("\n=== Test: Order, conditions, skips and stats ===")
+    get_turn_pipeline_stats().reset()
+    pipeline = TurnPipeline('test_order', [
+        Phase('first', _append('first'), reads=['order']),
+        Phase('conditional', _append('conditional'), when=lambda ctx: ctx['flag']),
+        Phase('skippable', _append('skippable')),
+        Phase('last', _append('last')),
+    ], inputs=['order', 'flag'])
+
+    ctx = {'order': [], 'flag': False}
+    report = pipeline.run(ctx, skip=('skippable',))
+    pipeline.run({'order': [], 'flag': True})
+    stats = get_turn_pipeline_stats().get_stats()
+
+    statuses = [(entry['phase'], entry['status']) for entry in report['phases']]
+    checks = [
+        ctx['order'] == ['first', 'last'],
+        statuses == [('first', 'ran'), ('conditional', 'skipped'), ('skippable', 'skipped'), ('last', 'ran')],
+        stats['test_order.first']['runs'] == 2,
+        stats['test_order.conditional']['runs'] == 1 and stats['test_order.conditional']['skipped'] == 1,
+        get_turn_pipeline_stats().last_report('test_order')['halted_by'] is None,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] {statuses}")
+        return True
+    print(f"[FAIL] Checks: {checks} ({statuses}, {ctx['order']})")
+    return False
+
+
+def test_concurrent_groups():
+    """Independent concurrent phases overlap; conflicting ones stay sequential"""
+    print("\n=== Test: Concurrent phase groups ===")
+
+    def sleeper(key):
+        def run(ctx):
+            time.sleep(0.2)
+            ctx[key] = True
+        return run
+
+    independent = TurnPipeline('test_concurrent', [
+        Phase(f'slow_{i}', sleeper(f'out_{i}'), writes=[f'out_{i}'], concurrent=True) for i in range(3)
+    ])
+    conflicting = TurnPipeline('test_conflicting', [
+        Phase('writer', sleeper('shared'), writes=['state.factions'], concurrent=True),
+        Phase('reader', sleeper('other'), reads=['state.*'], concurrent=True),
+    ])
+
+    ctx = {}
+    report = independent.run(ctx)
+    checks = [
+        len(independent.groups) == 1,
+        all(ctx.get(f'out_{i}') for i in range(3)),
+        report['total_ms'] < 500,
+        len(conflicting.groups) == 2,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] 3 x 200ms phases in {report['total_ms']:.0f}ms; conflicting phases split")
+        return True
+    print(f"[FAIL] Checks: {checks} ({report})")
+    return False
+
+
+def test_halts_and_errors():
+    """Halts end the run with a result; guarded errors go to on_error, unguarded ones propagate"""
+    print("\n=== Test: Halts and errors ===")
+
+    def halt(ctx):
+        raise PipelineHalt({'status': 'halted'})
+
+    def fail(ctx):
+        raise RuntimeError("boom")
+
+    handled = []
+
+    def on_error(ctx, phase, e):
+        handled.append((phase.name, str(e)))
+        return {'status': 'error'}
+
+    halting = TurnPipeline('test_halt', [Phase('halt', halt), Phase('after', _append('after'))])
+    guarded = TurnPipeline('test_guarded', [Phase('fail', fail), Phase('after', _append('after'))],
+                           on_error=on_error)
+    unguarded = TurnPipeline('test_unguarded', [Phase('fail', fail, guarded=False)], on_error=on_error)
+
+    halt_ctx, guarded_ctx = {'order': []}, {'order': []}
+    halt_report = halting.run(halt_ctx)
+    guarded_report = guarded.run(guarded_ctx)
+    try:
+        unguarded.run({})
+        propagated = False
+    except RuntimeError:
+        propagated = True
+
+    try:
+        TurnPipeline('test_invalid', [Phase('needs_prompt', _append('x'), reads=['prompt'])])
+        validated = False
+    except ValueError:
+        validated = True
+
+    checks = [
+        halt_ctx['result'] == {'status': 'halted'} and halt_ctx['order'] == [],
+        halt_report['halted_by'] == 'halt',
+        guarded_ctx['result'] == {'status': 'error'} and handled == [('fail', 'boom')],
+        guarded_report['phases'][-1]['status'] == 'failed',
+        propagated,
+        validated,
+    ]
+    if all(checks):
+        print("[SUCCESS] Halt, guarded error, propagated error and read validation behave")
+        return True
+    print(f"[FAIL] Checks: {checks}")
+    return False
+
+
+def test_action_pipeline_post_outcome():
+    """The action pipeline's post-outcome phases apply a model outcome to a save"""
+    print("\n=== Test: Action pipeline after the outcome ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    history_before = len(game_state.history_long['events'])
+    version_before = game_state.version
+
+    ctx = {
+        'game_state': game_state,
+        'action': 'We hold a quiet feast',
+        'event_title': 'A Quiet Season',
+        'event_narrative': 'Nothing stirs.',
+        'outcome': {'narrative': 'The people feast.', 'updates': {}},
+    }
+    report = ACTION_PIPELINE.run(ctx, skip=MODEL_PHASES)
+    sim.close()
+
+    ran = [entry['phase'] for entry in report['phases'] if entry['status'] == 'ran']
+    checks = [
+        report['halted_by'] is None,
+        'turn_mechanics' in ran and 'victory_progress' in ran,
+        'start_construction' not in ran and 'council_policy' not in ran,
+        len(game_state.history_long['events']) == history_before + 1,
+        game_state.version > version_before,
+        'aging_changes' in ctx['mechanics'],
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Ran {len(ran)} phases in {report['total_ms']:.0f}ms")
+        return True
+    print(f"[FAIL] Checks: {checks} ({report})")
+    return False
+
+
+def test_invalid_skips_rejected():
+    """Skips that starve a later phase are rejected before any state changes"""
+    print("\n=== Test: Skip validation ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    history_before = len(game_state.history_long['events'])
+
+    def attempt(skip, **extra):
+        ctx = {
+            'game_state': game_state,
+            'action': 'We hold a quiet feast',
+            'event_title': 'A Quiet Season',
+            'event_narrative': 'Nothing stirs.',
+            'outcome': {'narrative': 'The people feast.', 'updates': {}},
+            **extra,
+        }
+        try:
+            ACTION_PIPELINE.run(ctx, skip=skip)
+        except ValueError as e:
+            return str(e)
+        return None
+
+    starved = attempt(MODEL_PHASES[:-1] + ('turn_mechanics',))   # portrait_check reads 'mechanics'
+    no_context = attempt(('build_context',))                      # build_prompt reads 'context'
+    unknown = attempt(MODEL_PHASES + ('no_such_phase',))
+    history_after = len(game_state.history_long['events'])
+    provided = attempt(MODEL_PHASES[:-1] + ('turn_mechanics',), mechanics={})
+    sim.close()
+
+    checks = [
+        starved is not None and 'portrait_check' in starved,
+        no_context is not None and "'context'" in no_context,
+        unknown is not None and 'no_such_phase' in unknown,
+        history_after == history_before,
+        provided is None,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Rejected: {starved}")
+        return True
+    print(f"[FAIL] Checks: {checks} ({starved}, {no_context}, {unknown})")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("TURN PIPELINE TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_order_conditions_and_stats(),
+        test_concurrent_groups(),
+        test_halts_and_errors(),
+        test_action_pipeline_post_outcome(),
+        test_invalid_skips_rejected(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
@@ -0,0 +1,143 @@
+"""
+Test incremental victory tracking: per-input updates, version-gated reads and
+milestone events.
+"""
+
+import sys
+import os
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from engines.turn_simulator import TurnSimulator
+from engines.victory_engine import (
+    VictoryTracker, get_victory_tracker, calculate_victory_progress, check_victory,
+    get_victory_status_summary
+)
+
+CONTEXT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'context')
+
+
+def _fresh_progress(game_state):
+    """Progress computed from scratch by a new tracker."""
+    tracker = VictoryTracker()
+    tracker.sync(game_state)
+    return dict(tracker.progress)
+
+
+def test_incremental_matches_full():
+    """Changing inputs one at a time gives the same progress as a full recompute"""
+    print("\n=== Test: Incremental updates match a full recompute ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    progress = calculate_victory_progress(game_state)
+    cultural_before = progress['cultural']
+
+    mismatches = []
+    consequences = game_state.civilization.setdefault('consequences', {})
+    changes = [
+        lambda: game_state.culture.setdefault('values', []).extend(['Test Value A', 'Test Value B']),
+        lambda: game_state.technology.setdefault('discoveries', []).append('Test Discovery'),
+        lambda: game_state.civilization['meta'].update(era='bronze_age'),
+        lambda: game_state.religion.setdefault('holy_sites', []).append('Test Grove'),
+        lambda: consequences.setdefault('reputation', {}).update(diplomatic=40),
+        lambda: consequences.setdefault('alliances', []).append({'name': 'Test Ally', 'strength': 90}),
+        lambda: consequences.setdefault('broken_promises', []).extend([{}] * 9),
+    ]
+    for change in changes:
+        change()
+        progress = calculate_victory_progress(game_state)
+        if progress != _fresh_progress(game_state):
+            mismatches.append((dict(progress), _fresh_progress(game_state)))
+    sim.close()
+
+    checks = [
+        not mismatches,
+        progress['diplomatic'] == 0,  # Broken promises floor the track at 0
+        progress['cultural'] > cultural_before,
+        game_state.civilization['victory_progress'] is progress,
+    ]
+    if all(checks):
+        print(f"[SUCCESS] {len(changes)} incremental updates match; final {progress}")
+        return True
+    print(f"[FAIL] Checks: {checks}, mismatches: {mismatches[:2]}")
+    return False
+
+
+def test_reads_gated_by_version():
+    """Victory checks read tracked progress until the state version changes"""
+    print("\n=== Test: Version-gated reads ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.culture['traditions'] = []
+    tracker = get_victory_tracker(game_state)
+    before = dict(tracker.refresh(game_state))
+
+    game_state.culture.setdefault('traditions', []).extend(['Test Tradition'] * 3)
+    stale = dict(tracker.refresh(game_state))
+    is_victory, _, _ = check_victory(game_state)
+    game_state.bump_version()
+    fresh = dict(tracker.refresh(game_state))
+    sim.close()
+
+    checks = [
+        stale == before,
+        not is_victory,
+        fresh['cultural'] > before['cultural'],
+        fresh == _fresh_progress(game_state),
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Cultural {before['cultural']} -> {fresh['cultural']} only after the version bump")
+        return True
+    print(f"[FAIL] Checks: {checks} ({before} / {stale} / {fresh})")
+    return False
+
+
+def test_milestone_events():
+    """Crossing a milestone emits reached/lost events to listeners and the status summary"""
+    print("\n=== Test: Milestone events ===")
+    sim = TurnSimulator.from_save(CONTEXT_DIR)
+    game_state = sim.game_state
+    game_state.culture['values'] = []
+    game_state.culture['traditions'] = []
+    tracker = get_victory_tracker(game_state)
+    received = []
+    tracker.add_listener(received.append)
+
+    baseline_events = tracker.sync(game_state)
+    game_state.culture['traditions'] = [f"Tradition {i}" for i in range(10)]  # +40
+    reached = tracker.sync(game_state)
+    game_state.culture['traditions'] = []
+    lost = tracker.sync(game_state)
+    summary = get_victory_status_summary(game_state)
+    sim.close()
+
+    reached_levels = [(e['track'], e['threshold'], e['direction']) for e in reached]
+    checks = [
+        baseline_events == [],
+        ('cultural', 25, 'reached') in reached_levels,
+        all(e['direction'] == 'lost' for e in lost) and len(lost) == len(reached),
+        received == reached + lost,
+        len(summary['milestones']) == len(reached) + len(lost),
+    ]
+    if all(checks):
+        print(f"[SUCCESS] Events: {reached_levels} then {len(lost)} lost")
+        return True
+    print(f"[FAIL] Checks: {checks} ({reached_levels}, {lost})")
+    return False
+
+
+if __name__ == "__main__":
+    print("\n" + "=" * 70)
+    print("VICTORY TRACKER TEST SUITE")
+    print("=" * 70)
+
+    results = [
+        test_incremental_matches_full(),
+        test_reads_gated_by_version(),
+        test_milestone_events(),
+    ]
+
+    print("\n" + "=" * 70)
+    print(f"RESULTS: {sum(results)}/{len(results)} passed")
+    print("=" * 70)
+    sys.exit(0 if all(results) else 1)
@@ -153,6 +153,53 @@ def test_settlement_evolution_function():
         return False
 
 
+def test_parallel_portrait_fanout():
+    """Test that portrait batches run concurrently and placeholder stragglers."""
+    print("\n" + "=" * 60)
+    print("TEST 7: Parallel Portrait Fan-out")
+    print("=" * 60)
+
+    try:
+        import time
+        import threading
+        from engines.visual_engine import generate_portraits_parallel
+
+        def fake_portrait(subject, civ_context):
+            time.sleep(subject['delay'])
+            return {"filename": f"{subject['name']}.png", "success": True}
+
+        subjects = [{'name': f'advisor_{i}', 'delay': 0.3} for i in range(4)]
+        subjects.append({'name': 'straggler', 'delay': 1.0})
+        late = []
+        landed = threading.Event()
+
+        def on_result(index, result, is_late):
+            if is_late:
+                late.append(result['filename'])
+                landed.set()
+
+        start = time.time()
+        results = generate_portraits_parallel(
+            [(fake_portrait, subject, {}) for subject in subjects],
+            on_result=on_result,
+            deadline=0.6
+        )
+        elapsed = time.time() - start
+
+        assert elapsed < 0.9, f"Batch should be bounded by the deadline, took {elapsed:.2f}s"
+        assert all(r['success'] for r in results[:4]), "In-time portraits should be returned"
+        assert results[4].get('pending') and results[4]['filename'] == 'placeholder.png', \
+            "Straggler should get a placeholder"
+        assert landed.wait(2) and late == ['straggler.png'], "Straggler should be filled in when it lands"
+
+        print(f"[PASS] 5 portraits in {elapsed:.2f}s (sequential would take 2.2s)")
+        print("  - Straggler placeholdered, then filled in")
+        return True
+    except Exception as e:
+        print(f"[FAIL] {e}")
+        return False
+
+
 def run_live_test():
     """Optional: Run actual API test (costs money)."""
     print("\n" + "=" * 60)
@@ -213,6 +260,7 @@ def main():
         test_leader_portrait_generation,
         test_crisis_illustration_function,
         test_settlement_evolution_function,
+        test_parallel_portrait_fanout,
     ]
 
     results = []
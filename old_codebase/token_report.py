@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Prompt Token Report
+Compares the state embedded in each engine's prompt under the legacy encoding
+(pretty-printed JSON dumps) and the canonical compact encoding.
+
+Usage:
+    python token_report.py [context_dir]
+
+Counts are local estimates (~4 characters per token, see engines/token_budget.py).
+"""
+
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from game_state import GameState
+from engines.token_budget import estimate_tokens
+from engines.state_encoding import encode_state, STATE_LEGEND
+from engines.world_turns_engine import WorldTurnsEngine
+from engines.council_engine import build_council_context, FIRST_BRIEFING_LIST_LIMITS
+
+SAMPLE_ACTION = {
+    'action': 'Order the construction of a granary',
+    'outcome': {'narrative': 'The granary rises beside the river.', 'updates': {'civilization.resources.food': 20}},
+    'event_type': 'standard'
+}
+
+
+def pretty(data):
+    """Legacy prompt encoding: indented JSON."""
+    return json.dumps(data, indent=2)
+
+
+def collect_rows(game):
+    """Returns (engine, legacy_text, pretty_projection_text, canonical_text) for each engine."""
+    full_state = game.to_dict()
+    engine = WorldTurnsEngine()
+    world_projection = engine.project_turn_context(game, SAMPLE_ACTION)
+
+    advisors = game.inner_circle_manager.get_all()
+    character = advisors[0] if advisors else game.civilization.get('leader', {})
+
+    return [
+        ('world_turns', pretty(full_state), pretty(world_projection), engine.build_turn_context(game, SAMPLE_ACTION)),
+        ('council_meeting', pretty(full_state), None, build_council_context(game)),
+        ('first_turn_briefing', pretty(full_state), None, encode_state(full_state, list_limits=FIRST_BRIEFING_LIST_LIMITS)),
+        ('character_vignette', pretty(character), None, encode_state(character, list_limits={'history': 5})),
+    ]
+
+
+def main():
+    context_dir = sys.argv[1] if len(sys.argv) > 1 else 'context'
+    game = GameState(context_dir)
+
+    print("\n" + "=" * 72)
+    print(f"PROMPT STATE TOKENS  (turn {game.turn_number}, {len(game.history_long.get('events', []))} history events)")
+    print("=" * 72)
+    print(f"{'Engine':<22}{'Legacy':>10}{'Projection':>12}{'Canonical':>11}{'Saved':>10}")
+    print("-" * 72)
+
+    total_legacy = total_canonical = 0
+    for name, legacy, projection, canonical in collect_rows(game):
+        legacy_tokens = estimate_tokens(legacy)
+        canonical_tokens = estimate_tokens(canonical)
+        projection_col = f"{estimate_tokens(projection):>12}" if projection else f"{'-':>12}"
+        saved = 100 * (1 - canonical_tokens / max(legacy_tokens, 1))
+        print(f"{name:<22}{legacy_tokens:>10}{projection_col}{canonical_tokens:>11}{saved:>9.0f}%")
+        total_legacy += legacy_tokens
+        total_canonical += canonical_tokens
+
+    print("-" * 72)
+    saved = 100 * (1 - total_canonical / max(total_legacy, 1))
+    print(f"{'Total':<22}{total_legacy:>10}{'':>12}{total_canonical:>11}{saved:>9.0f}%")
+    print(f"\nLegend prefix: {estimate_tokens(STATE_LEGEND)} tokens per prompt (static, identical across engines)")
+    print("Projection = selected fields pretty-printed, to separate projection and encoding savings.\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,7 +1,5 @@
-import random
 import os
 import google.generativeai as genai
-from engines.prompt_loader import load_prompt
 from engines.world_modes.fantasy_mode import FantasyWorldMode
 from engines.world_modes.historical_earth_mode import HistoricalEarthMode
 
@@ -183,7 +181,7 @@ class WorldGenerator:
         """Initialize the world generator."""
         pass
 
-    def generate_world(self, config):
+    def generate_world(self, config, rng=None):
         """
         Generate a complete world based on configuration.
 
@@ -191,15 +189,24 @@ class WorldGenerator:
 
         Args:
             config: Dictionary containing all customization choices
+                    (an optional 'seed' makes the world reproducible)
+            rng: GameRNG to draw from (default: a new one seeded from config['seed'])
 
         Returns:
-            Dictionary containing all game state files
+            Dictionary containing all game state files, plus 'rng' (the
+            GameRNG state the new game continues from)
         """
+        from engines.rng_service import GameRNG
+
+        if rng is None:
+            rng = GameRNG(config.get("seed"))
+
         # Determine world mode (default to historical_earth)
         world_mode = config.get("world_mode", "historical_earth")
 
-        # Get the appropriate mode instance
+        # Get the appropriate mode instance, drawing from the game's worldgen stream
         mode = self.WORLD_MODES.get(world_mode, self.WORLD_MODES["historical_earth"])
+        mode = mode.with_rng(rng.stream('worldgen'))
 
         # Normalize config keys for compatibility
         if "era" in config and "starting_era" not in config:
@@ -207,574 +214,10 @@ class WorldGenerator:
 
         # Generate world using the selected mode
         world_data = mode.generate(config)
+        world_data['rng'] = rng.to_dict()
 
         return world_data
 
-    def _generate_civilization(self, era, civ_name, population_size, leader_name):
-        """Generate civilization state."""
-        era_config = self.ERA_CONFIGS[era]
-
-        # Population calculation
-        pop_ranges = {
-            "small": (100, 500),
-            "medium": (500, 2000),
-            "large": (2000, 5000)
-        }
-        pop_min, pop_max = pop_ranges[population_size]
-        population = random.randint(int(pop_min * era_config["population_multiplier"]),
-                                   int(pop_max * era_config["population_multiplier"]))
-
-        # Year calculation
-        year_min, year_max = era_config["year_range"]
-        year = random.randint(year_min, year_max)
-
-        # Leader generation
-        if not leader_name:
-            leader_name = self._generate_leader_name()
-
-        leader_traits = random.sample([
-            "Wise", "Brave", "Diplomatic", "Strategic", "Charismatic",
-            "Cautious", "Bold", "Spiritual", "Pragmatic", "Visionary"
-        ], 3)
-
-        return {
-            "meta": {
-                "name": civ_name,
-                "year": year,
-                "era": era_config["era"],
-                "founding_date": year
-            },
-            "leader": {
-                "name": leader_name,
-                "age": random.randint(25, 45),
-                "life_expectancy": random.randint(60, 80),
-                "role": "Leader",
-                "traits": leader_traits,
-                "years_ruled": 0
-            },
-            "population": population,
-            "resources": {
-                "food": population * random.randint(1, 3),
-                "wealth": population * random.randint(1, 2),
-                "tech_tier": era_config["tech_tier"]
-            }
-        }
-
-    def _generate_culture(self, cultural_focus, social_structure):
-        """Generate culture context."""
-        culture_template = self.CULTURE_TEMPLATES[cultural_focus]
-
-        # Select values
-        values = culture_template["values"].copy()
-        values.extend(random.sample([
-            "Survival", "Community", "Respect for Elders", "Adaptation",
-            "Craftsmanship", "Generosity", "Resilience"
-        ], 3))
-
-        # Select traditions
-        traditions = culture_template["sample_traditions"].copy()
-        traditions.extend(random.sample([
-            "Oral Storytelling", "Seasonal Celebrations", "Coming of Age Ceremonies",
-            "Ancestral Veneration", "Crafting Competitions"
-        ], 2))
-
-        return {
-            "values": values[:8],  # Keep it manageable
-            "traditions": traditions[:6],
-            "taboos": ["Harming Kin", random.choice(["Oath Breaking", "Sacrilege", "Betrayal", "Waste"])],
-            "social_structure": self.SOCIAL_STRUCTURES[social_structure],
-            "recent_changes": []
-        }
-
-    def _generate_religion(self, religion_type):
-        """Generate religion context."""
-        if religion_type not in self.RELIGION_CONFIGS:
-            religion_type = "animism"
-
-        religion_config = self.RELIGION_CONFIGS[religion_type]
-
-        # Generate deity name based on type
-        deity_names = {
-            "animism": ["The Great Spirit", "The Wild Soul", "The Earth Mother"],
-            "polytheism": ["The Pantheon of Stars", "The Divine Court", "The Ancient Gods"],
-            "monotheism": ["The Eternal One", "The Supreme Creator", "The Divine Light"],
-            "ancestor_worship": ["The First Ancestor", "The Ancient Fathers", "The Founding Lineage"],
-            "nature_worship": ["The Forest Spirit", "The Mountain Guardian", "The River Mother"],
-            "none": ["Various Spirits", "Personal Beliefs", "Folk Traditions"]
-        }
-
-        primary_deity = random.choice(deity_names.get(religion_type, ["The Unknown"]))
-
-        # Generate holy sites
-        holy_sites = [
-            random.choice(["The Sacred Grove", "The Great Oak", "The Ancient Cave", "The Stone Circle"]),
-            random.choice(["The Mountain Peak", "The River Source", "The Ancestor's Tomb", "The First Settlement"])
-        ]
-
-        return {
-            "name": religion_config["name"],
-            "type": religion_config["type"],
-            "primary_deity": primary_deity,
-            "core_tenets": religion_config["tenets"],
-            "practices": religion_config["practices"],
-            "holy_sites": holy_sites,
-            "influence": random.choice(["dominant", "significant", "moderate"]),
-            "schisms": []
-        }
-
-    def _generate_technology(self, era):
-        """Generate technology context."""
-        era_config = self.ERA_CONFIGS[era]
-
-        return {
-            "current_tier": era_config["tech_tier"],
-            "discoveries": era_config["base_discoveries"].copy(),
-            "in_progress": [],
-            "infrastructure": era_config["base_infrastructure"].copy()
-        }
-
-    def _generate_world_context(self, terrain, difficulty, neighbor_count, resource_abundance):
-        """Generate world context."""
-        terrain_config = self.TERRAIN_CONFIGS[terrain]
-
-        # Adjust resources based on abundance
-        resources = terrain_config["resources"].copy()
-        if resource_abundance == "abundant":
-            resources.extend(random.sample(["Medicinal Herbs", "Precious Stones", "Rare Woods", "Exotic Spices"], 2))
-        elif resource_abundance == "scarce":
-            resources = resources[:max(2, len(resources) - 2)]
-
-        # Adjust threats based on difficulty
-        threats = terrain_config["threats"].copy()
-        if difficulty == "challenging":
-            threats.extend(random.sample(["Hostile Neighbors", "Natural Disasters", "Resource Scarcity", "Disease"], 2))
-        elif difficulty == "peaceful":
-            threats = threats[:max(1, len(threats) - 1)]
-
-        # Generate neighbors
-        neighbor_counts = {
-            "none": 0,
-            "few": random.randint(1, 2),
-            "several": random.randint(3, 4)
-        }
-
-        num_neighbors = neighbor_counts.get(neighbor_count, 1)
-        neighbors = []
-
-        neighbor_names = [
-            "The River Clan", "The Mountain Folk", "The Desert Wanderers",
-            "The Forest Tribes", "The Sea People", "The Plains Riders",
-            "The Stone Circle Clans", "The Sun Worshippers"
-        ]
-
-        for i in range(num_neighbors):
-            relationship = random.choice(["allied", "neutral", "wary", "hostile"]) if difficulty != "peaceful" else random.choice(["allied", "neutral", "friendly"])
-
-            neighbors.append({
-                "name": random.choice(neighbor_names),
-                "relationship": relationship,
-                "strength": "unknown",
-                "distance": random.choice(["nearby", "several days journey", "distant"]),
-                "history": "Recently discovered" if i == 0 else "Known through tales and occasional contact"
-            })
-
-        return {
-            "known_peoples": neighbors,
-            "geography": {
-                "terrain": terrain_config["terrain"],
-                "climate": terrain_config["climate"],
-                "resources": resources,
-                "threats": threats
-            }
-        }
-
-    def _generate_factions(self):
-        """Generates the default starting factions."""
-        return {
-            "factions": [
-                {
-                    "name": "The Merchant's Guild",
-                    "leader": "Lysander the Wealthy",
-                    "approval": 60,
-                    "support_percentage": 25,
-                    "status": "Neutral",
-                    "goals": ["Establish new trade routes", "Increase city wealth by 20%", "Reduce tariffs on luxury goods"]
-                },
-                {
-                    "name": "The Elder Council",
-                    "leader": "Elder Maeve",
-                    "approval": 60,
-                    "support_percentage": 20,
-                    "status": "Neutral",
-                    "goals": ["Preserve ancient traditions", "Maintain social stability", "Construct a monument to the founders"]
-                },
-                {
-                    "name": "The Warrior's Caste",
-                    "leader": "Warlord Gorok",
-                    "approval": 60,
-                    "support_percentage": 30,
-                    "status": "Neutral",
-                    "goals": ["Expand our borders", "Recruit and train more soldiers", "Vanquish our rivals"]
-                },
-                {
-                    "name": "The Priesthood of the Sun",
-                    "leader": "High Priestess Elara",
-                    "approval": 60,
-                    "support_percentage": 25,
-                    "status": "Neutral",
-                    "goals": ["Spread the faith to new lands", "Build a Grand Temple", "Achieve spiritual enlightenment for the people"]
-                }
-            ]
-        }
-
-    def _generate_inner_circle(self, cultural_focus=None, era=None, factions=None):
-        """
-        Generates culturally grounded inner circle members.
-
-        Args:
-            cultural_focus: The civilization's cultural focus (martial, spiritual, etc.)
-            era: The civilization's era (stone_age, bronze_age, etc.)
-            factions: The faction data to link advisors to
-        """
-        # Extract faction names if factions provided
-        faction_list = factions.get('factions', []) if factions else []
-
-        # Define role templates with cultural variations
-        role_templates = [
-            {
-                "role_key": "military",
-                "roles": {
-                    "stone_age": "War Chief",
-                    "bronze_age": "Commander",
-                    "iron_age": "Grand Marshal",
-                    "classical": "Strategos",
-                    "medieval": "Lord Commander",
-                    "renaissance": "Marshal General"
-                },
-                "base_traits": ["Disciplined", "Direct", "Stern"],
-                "cultural_traits": {
-                    "martial": ["Aggressive", "Tactical"],
-                    "spiritual": ["Devoted", "Honorable"],
-                    "agricultural": ["Protective", "Patient"],
-                    "mercantile": ["Strategic", "Pragmatic"],
-                    "scholarly": ["Analytical", "Methodical"],
-                    "artistic": ["Charismatic", "Inspiring"]
-                },
-                "faction_preference": "warrior"
-            },
-            {
-                "role_key": "intelligence",
-                "roles": {
-                    "stone_age": "Scout Master",
-                    "bronze_age": "Eyes of the Throne",
-                    "iron_age": "Spymaster",
-                    "classical": "Master of Whispers",
-                    "medieval": "Lord of Secrets",
-                    "renaissance": "Intelligence Minister"
-                },
-                "base_traits": ["Cunning", "Discreet", "Observant"],
-                "cultural_traits": {
-                    "martial": ["Ruthless", "Efficient"],
-                    "spiritual": ["Mysterious", "Intuitive"],
-                    "agricultural": ["Patient", "Meticulous"],
-                    "mercantile": ["Pragmatic", "Shrewd"],
-                    "scholarly": ["Analytical", "Insightful"],
-                    "artistic": ["Subtle", "Persuasive"]
-                },
-                "faction_preference": "merchant"
-            },
-            {
-                "role_key": "spiritual",
-                "roles": {
-                    "stone_age": "Shaman",
-                    "bronze_age": "High Priest",
-                    "iron_age": "High Priestess",
-                    "classical": "Hierophant",
-                    "medieval": "Grand Cleric",
-                    "renaissance": "Archbishop"
-                },
-                "base_traits": ["Pious", "Serene", "Compassionate"],
-                "cultural_traits": {
-                    "martial": ["Militant", "Resolute"],
-                    "spiritual": ["Mystic", "Devoted"],
-                    "agricultural": ["Nurturing", "Harmonious"],
-                    "mercantile": ["Diplomatic", "Wise"],
-                    "scholarly": ["Philosophical", "Learned"],
-                    "artistic": ["Expressive", "Inspiring"]
-                },
-                "faction_preference": "priest"
-            }
-        ]
-
-        # Set defaults
-        if not cultural_focus:
-            cultural_focus = "spiritual"
-        if not era:
-            era = "bronze_age"
-
-        characters = []
-
-        for template in role_templates:
-            # Get era-appropriate role title
-            role = template["roles"].get(era, template["roles"]["bronze_age"])
-
-            # Build personality traits
-            traits = template["base_traits"].copy()
-            cultural_traits = template["cultural_traits"].get(cultural_focus, [])
-            if cultural_traits:
-                traits.extend(random.sample(cultural_traits, min(2, len(cultural_traits))))
-
-            # Randomly shuffle and pick 4 unique traits
-            random.shuffle(traits)
-            traits = traits[:4]
-
-            # Find matching faction
-            faction_link = None
-            faction_pref = template["faction_preference"]
-            for faction in faction_list:
-                if faction_pref in faction["name"].lower():
-                    faction_link = faction["name"]
-                    break
-
-            # If no match, randomly assign from available factions
-            # Use a weighted random to ensure better distribution
-            if not faction_link and faction_list:
-                # Try to avoid assigning the same faction to consecutive advisors
-                available_factions = faction_list.copy()
-                if idx > 0 and inner_circle_characters:
-                    # Get the last assigned faction
-                    last_faction = inner_circle_characters[-1].get("faction_link")
-                    # Filter out the last faction if possible
-                    other_factions = [f for f in available_factions if f["name"] != last_faction]
-                    if other_factions:
-                        available_factions = other_factions
-
-                faction_link = random.choice(available_factions)["name"]
-
-            # Generate a culturally appropriate name (will be implemented)
-            name = self._generate_advisor_name(cultural_focus, era, template["role_key"])
-
-            # Generate dialogue sample based on role and culture
-            dialogue = self._generate_advisor_dialogue(role, cultural_focus, traits)
-
-            character = {
-                "name": name,
-                "role": role,
-                "faction_link": faction_link,
-                "personality_traits": traits,
-                "dialogue_sample": dialogue,
-                "history": [f"Appointed to the council as {role}."],
-                "metrics": {
-                    "relationship": random.randint(45, 55),
-                    "influence": random.randint(40, 70),
-                    "loyalty": random.randint(55, 75)
-                },
-                "portrait": "placeholder.png"  # Will be generated async
-            }
-            characters.append(character)
-
-        return {"characters": characters}
-
-    def _generate_advisor_name(self, cultural_focus, era, role_key):
-        """
-        Generate a culturally appropriate advisor name.
-
-        Args:
-            cultural_focus: The civilization's cultural focus
-            era: The civilization's era
-            role_key: The advisor's role type (military, intelligence, spiritual)
-        """
-        # Name pools based on cultural focus
-        name_pools = {
-            "martial": {
-                "male": ["Theron", "Kaelen", "Marcus", "Gorak", "Brutus", "Ragnar", "Sigurd", "Ajax"],
-                "female": ["Athena", "Valeria", "Brienne", "Astrid", "Cassandra", "Freya", "Hippolyta"]
-            },
-            "spiritual": {
-                "male": ["Zephyr", "Elias", "Aurelius", "Soren", "Alaric", "Caelum", "Thaddeus"],
-                "female": ["Seraphina", "Lyra", "Celestia", "Miriam", "Isolde", "Vesta", "Aria"]
-            },
-            "agricultural": {
-                "male": ["Gareth", "Alden", "Borin", "Cedric", "Ewan", "Jasper", "Thorne"],
-                "female": ["Ceres", "Flora", "Autumn", "Gaia", "Hazel", "Ivy", "Rowan"]
-            },
-            "mercantile": {
-                "male": ["Lorenzo", "Darius", "Cassius", "Lucien", "Marcellus", "Silvio", "Titus"],
-                "female": ["Portia", "Octavia", "Lavinia", "Aurelia", "Livia", "Cordelia", "Emilia"]
-            },
-            "scholarly": {
-                "male": ["Ptolemy", "Archimedes", "Cyrus", "Thales", "Plato", "Solon", "Pytheas"],
-                "female": ["Hypatia", "Minerva", "Aspasia", "Diotima", "Eudocia", "Theano", "Arete"]
-            },
-            "artistic": {
-                "male": ["Apollo", "Orpheus", "Lysander", "Thalia", "Perseus", "Damon", "Leander"],
-                "female": ["Calliope", "Clio", "Erato", "Melpomene", "Sappho", "Terpsichore", "Urania"]
-            }
-        }
-
-        # Get appropriate name pool
-        pool = name_pools.get(cultural_focus, name_pools["spiritual"])
-
-        # Determine gender based on role (mix of male/female)
-        gender = random.choice(["male", "female"])
-
-        # Select name
-        first_name = random.choice(pool[gender])
-
-        # Add title based on role
-        titles_by_role = {
-            "military": ["the Valiant", "the Shield", "Ironfist", "the Unyielding", "Stormborn", "the Defender"],
-            "intelligence": ["the Shadow", "the Whisper", "Silvertongue", "the Watcher", "the Veiled", "Nighteye"],
-            "spiritual": ["the Blessed", "the Seer", "Lightbearer", "the Faithful", "Stargazer", "the Pure"]
-        }
-
-        title_pool = titles_by_role.get(role_key, ["the Wise"])
-        title = random.choice(title_pool)
-
-        return f"{first_name} {title}"
-
-    def _generate_advisor_dialogue(self, role, cultural_focus, traits):
-        """
-        Generate a sample dialogue line that reflects the advisor's role and personality.
-
-        Args:
-            role: The advisor's role title
-            cultural_focus: The civilization's cultural focus
-            traits: List of personality traits
-        """
-        # Dialogue templates based on role and culture
-        dialogue_templates = {
-            "military": {
-                "martial": [
-                    "Strength is the only currency that matters on the battlefield.",
-                    "A sharp blade and sharper mind win wars.",
-                    "Our warriors must be ready to strike at a moment's notice."
-                ],
-                "spiritual": [
-                    "The gods favor those who fight with honor.",
-                    "Our armies must be blessed before they march.",
-                    "Victory comes to the righteous, not merely the strong."
-                ],
-                "agricultural": [
-                    "Protect the harvest, protect the people.",
-                    "A strong defense ensures our fields remain fertile.",
-                    "Our warriors are shepherds of peace, not wolves of war."
-                ],
-                "mercantile": [
-                    "Military might secures profitable trade routes.",
-                    "A merchant's coin is worth nothing without a soldier's sword.",
-                    "Strategic positioning is as valuable as gold."
-                ],
-                "scholarly": [
-                    "Knowledge of terrain and tactics wins battles.",
-                    "Study our enemies before we engage them.",
-                    "Military science is an art form unto itself."
-                ],
-                "artistic": [
-                    "There is beauty in the perfect formation.",
-                    "War is a terrible art, but art nonetheless.",
-                    "Our banners shall inspire both fear and awe."
-                ]
-            },
-            "intelligence": {
-                "martial": [
-                    "Information is the first casualty of war—and our greatest weapon.",
-                    "Know your enemy before they know themselves.",
-                    "Every secret is a dagger waiting to be wielded."
-                ],
-                "spiritual": [
-                    "The spirits reveal truths to those who listen.",
-                    "Not all battles are fought with steel, my lord.",
-                    "Hidden knowledge is sacred knowledge."
-                ],
-                "agricultural": [
-                    "Even the smallest rumor can blight a harvest.",
-                    "Patience and observation yield the ripest fruit.",
-                    "Trust must be cultivated like any crop."
-                ],
-                "mercantile": [
-                    "Information is a currency more valuable than gold.",
-                    "Every transaction reveals something about the buyer.",
-                    "The market whispers secrets to those who listen."
-                ],
-                "scholarly": [
-                    "Knowledge without discretion is dangerous.",
-                    "I study what others dare not speak aloud.",
-                    "The archive of secrets grows daily."
-                ],
-                "artistic": [
-                    "Deception is an art, and I am its master.",
-                    "Every lie must be beautiful to be believed.",
-                    "The truth is canvas; manipulation is the brush."
-                ]
-            },
-            "spiritual": {
-                "martial": [
-                    "The gods demand strength in body and spirit.",
-                    "Pray for victory, prepare for battle.",
-                    "Our faith is our armor."
-                ],
-                "spiritual": [
-                    "May the divine light guide your path.",
-                    "The spirits speak—we must listen.",
-                    "Faith is the foundation of all things."
-                ],
-                "agricultural": [
-                    "As we sow, so shall we reap—in this life and the next.",
-                    "The earth is sacred, and we its humble stewards.",
-                    "Give thanks for the harvest, for it is blessed."
-                ],
-                "mercantile": [
-                    "Prosperity flows from divine favor.",
-                    "The gods smile upon fair trade and honest dealings.",
-                    "Wealth without virtue is worthless."
-                ],
-                "scholarly": [
-                    "Wisdom and faith are two paths to the same truth.",
-                    "The divine mysteries are written in ancient texts.",
-                    "Knowledge of the sacred is the highest knowledge."
-                ],
-                "artistic": [
-                    "Beauty is the divine made manifest.",
-                    "Our ceremonies are poems written in ritual.",
-                    "The gods appreciate elegance as much as devotion."
-                ]
-            }
-        }
-
-        # Determine role category
-        role_category = "military"
-        if "spy" in role.lower() or "whisper" in role.lower() or "eyes" in role.lower() or "secret" in role.lower() or "scout" in role.lower():
-            role_category = "intelligence"
-        elif "priest" in role.lower() or "shaman" in role.lower() or "cleric" in role.lower() or "hierophant" in role.lower():
-            role_category = "spiritual"
-
-        # Get appropriate dialogue pool
-        dialogue_pool = dialogue_templates.get(role_category, {}).get(cultural_focus, [])
-
-        # If no specific dialogue, use generic
-        if not dialogue_pool:
-            dialogue_pool = [
-                "I serve at your pleasure, my lord.",
-                "My counsel is yours to consider.",
-                "Together, we shall guide our people to greatness."
-            ]
-
-        return random.choice(dialogue_pool)
-
-    def _generate_leader_name(self):
-        """Generate a random leader name."""
-        first_names = [
-            "Anya", "Kael", "Theron", "Lyra", "Darius", "Mira", "Orin", "Sera",
-            "Aldric", "Elara", "Bran", "Nyx", "Finn", "Rhea", "Cassius", "Aria"
-        ]
-        titles = [
-            "the Wise", "the Bold", "the Just", "the Strong", "the Seer",
-            "the Builder", "the Diplomat", "the Warrior", "the Keeper", "the Guide"
-        ]
-
-        return f"{random.choice(first_names)}, {random.choice(titles)}"
-
     def generate_ai_description(self, world_data):
         """
         Use AI to generate a unique opening description for the world.
@@ -787,10 +230,11 @@ class WorldGenerator:
         """
         try:
             from model_config import WORLD_GEN_MODEL
-            from engines.prompt_loader import load_prompt
+            from engines.prompt_budget import render_prompt
             model = genai.GenerativeModel(WORLD_GEN_MODEL)
 
-            prompt = load_prompt('world/ai_description').format(
+            prompt = render_prompt(
+                'world/ai_description',
                 civ_name=world_data['civilization']['meta']['name'],
                 era=world_data['civilization']['meta']['era'],
                 terrain=world_data['world']['geography']['terrain'],